@@ -0,0 +1,167 @@
+# bench_common.py
+# Gemeinsame, bpy-freie Hilfen für die Benchmarks: Ratenmessung, synthetische Böden/Streupunkte,
+# Laden des nativen Moduls ohne Blender und JSON-Ergebnisse (eine Datei pro Lauf oder .jsonl zum Anhängen).
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import importlib.util
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ADDON_PACKAGE_DIR = os.path.join(REPO_ROOT, "physical_layout_tool", "physical_layout_tool")
+RESULTS_SCHEMA_VERSION = 1
+
+_COUNT_SUFFIXES = {"k": 1_000, "m": 1_000_000}
+
+
+def parse_count(text):
+    """'1k' -> 1000, '4M' -> 4000000, '250' -> 250."""
+    text = str(text).strip().lower()
+    factor = _COUNT_SUFFIXES.get(text[-1:], 1)
+    number = text[:-1] if factor != 1 else text
+    return int(float(number) * factor)
+
+
+def parse_count_list(text):
+    return [parse_count(part) for part in str(text).split(",") if part.strip()]
+
+
+def measure_rate(func, items, repeat=3, warmup=False, setup=None):
+    """
+    Führt func() repeat-mal aus (func verarbeitet jeweils `items` Elemente), optional mit setup() davor
+    (nicht gemessen). Gibt ein dict mit bester/medianer Zeit und Elementen pro Sekunde (aus der besten Zeit) zurück.
+    """
+    if warmup:
+        if setup: setup()
+        func()
+    durations = []
+    for _ in range(max(1, repeat)):
+        if setup: setup()
+        t0 = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - t0)
+    best = min(durations)
+    return {
+        "items": int(items),
+        "repeat": len(durations),
+        "best_s": best,
+        "median_s": statistics.median(durations),
+        "rate_per_s": (items / best) if best > 0 else math.inf,
+    }
+
+
+def synthetic_ground_arrays(triangle_count, size=100.0, amplitude=2.0, seed=0):
+    """
+    Gewelltes Gitter mit ungefähr triangle_count Dreiecken (zwei pro Zelle).
+    Gibt (vertices float32 (V,3), triangles int32 (T,3)) zurück.
+    """
+    cells = max(1, int(math.ceil(math.sqrt(max(2, triangle_count) / 2.0))))
+    axis = np.linspace(-size * 0.5, size * 0.5, cells + 1, dtype=np.float32)
+    xs, ys = np.meshgrid(axis, axis, indexing="xy")
+    rng = np.random.default_rng(seed)
+    phase = rng.uniform(0.0, 2.0 * math.pi, size=2)
+    freq = 2.0 * math.pi / size
+    zs = amplitude * (np.sin(xs * freq * 3.0 + phase[0]) * np.cos(ys * freq * 2.0 + phase[1]))
+    zs += rng.normal(0.0, amplitude * 0.02, size=zs.shape)
+    vertices = np.stack([xs, ys, zs.astype(np.float32)], axis=-1).reshape(-1, 3)
+
+    row = cells + 1
+    cell_x, cell_y = np.meshgrid(np.arange(cells), np.arange(cells), indexing="xy")
+    v00 = (cell_y * row + cell_x).ravel()
+    v10, v01, v11 = v00 + 1, v00 + row, v00 + row + 1
+    triangles = np.concatenate([
+        np.stack([v00, v10, v11], axis=1),
+        np.stack([v00, v11, v01], axis=1),
+    ]).astype(np.int32)
+    return vertices, triangles
+
+
+def random_ground_points(count, size=100.0, margin=0.05, seed=1):
+    """(count, 2) XY-Positionen innerhalb des Bodens (mit Randabstand)."""
+    rng = np.random.default_rng(seed)
+    half = size * 0.5 * (1.0 - margin)
+    return rng.uniform(-half, half, size=(count, 2))
+
+
+def result_row(name, variant, size, measurement=None, status="ok", **extra):
+    row = {"name": name, "variant": variant, "size": size, "status": status}
+    if measurement:
+        row.update(measurement)
+    row.update(extra)
+    return row
+
+
+def load_addon_module_standalone(module_name):
+    """Lädt ein einzelnes bpy-freies Addon-Modul (ohne relative Imports) direkt aus der Datei, ohne das Paket."""
+    spec = importlib.util.spec_from_file_location(f"plt_{module_name}", os.path.join(ADDON_PACKAGE_DIR, module_name + ".py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_native_module_standalone(native_dir=None, module_name="scatter_accel"):
+    """
+    Lädt scatter_accel ohne Blender über loader.py des Addons (bpy-frei).
+    native_dir: Ordner mit dem Build (Default: Addon-Ordner bzw. dessen native/). Gibt das Modul oder None zurück.
+    """
+    loader = load_addon_module_standalone("loader")
+    try:
+        return loader.load_native_module(module_name, native_dir or ADDON_PACKAGE_DIR)
+    except ImportError as e:
+        print(f"INFO [bench]: Natives Modul nicht verfügbar: {e}")
+        return None
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_metadata(extra=None):
+    meta = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "git": git_revision(),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+    if extra:
+        meta.update(extra)
+    return meta
+
+
+def write_results(path, suite, results, meta):
+    """
+    Schreibt {"schema", "suite", "meta", "results"} als JSON. Endet path auf .jsonl, wird eine Zeile angehängt
+    (Verlauf über viele Läufe); ist path ein Ordner, wird eine Datei mit Zeitstempel angelegt.
+    """
+    document = {"schema": RESULTS_SCHEMA_VERSION, "suite": suite, "meta": meta, "results": results}
+    if os.path.isdir(path):
+        path = os.path.join(path, f"{suite}_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    if path.endswith(".jsonl"):
+        with open(path, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(document) + "\n")
+    else:
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(document, handle, indent=2)
+    return path
+
+
+def print_results(results):
+    for row in results:
+        rate = row.get("rate_per_s")
+        rate_text = f"{rate:>14,.1f}/s" if isinstance(rate, (int, float)) and math.isfinite(rate) else f"{'-':>16}"
+        print(f"  {row['name']:<34} {str(row.get('variant', '')):<10} {str(row.get('size', '')):>10} {rate_text}  {row.get('status', 'ok')}")
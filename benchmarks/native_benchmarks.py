@@ -0,0 +1,517 @@
+# native_benchmarks.py
+# Mikrobenchmarks für das native Modul allein: jede exportierte scatter_accel-Funktion und jede
+# GpuInstancer-Methode, getrennt nach Aufruf-Overhead (winzige Eingaben, viele Aufrufe -> ns/Aufruf)
+# und Kernel-Zeit (realistische Größen: Mesh-Prep 10k..10M Dreiecke, Instanzen 1k..1M, Record-/Dict-Batches).
+# Jedes Kernel-Ergebnis wird gegen das NumPy-/Python-Backend des Addons geprüft (numpy_kernels.py,
+# record_kernels.py), das dabei mitgemessen wird (Paritätstest + Geschwindigkeitsvergleich). Läuft ohne Blender, nur flush_marked_objects_cpp und
+# configure_batch_rigidbody_properties_cpp brauchen bpy und werden als "needs_blender" geführt.
+# Exporte ohne Benchmark erscheinen als "not_covered"; Abweichungen als "mismatch" (Exit-Code 1).
+#
+#   python benchmarks/native_benchmarks.py --native-dir build/Release --out bench_results/native.jsonl
+#   python benchmarks/native_benchmarks.py --mesh-sizes 10k --instance-counts 1k --record-counts 10k   (schnell)
+import argparse
+import itertools
+import math
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_common import (  # noqa: E402
+    REPO_ROOT,
+    measure_rate,
+    parse_count_list,
+    synthetic_ground_arrays,
+    load_addon_module_standalone,
+    load_native_module_standalone,
+    result_row as _row,
+    run_metadata,
+    write_results,
+    print_results,
+)
+import numpy as np  # noqa: E402
+
+SUITE_NAME = "native"
+INSTANCER_SHADER_NAME = "BENCH_INSTANCER"
+BENCH_COLLECTION_COUNT = 8  # Collections in den synthetischen Records (Bits 0..7)
+
+# Brauchen bpy.data (Objekte löschen bzw. Rigid-Body-Properties setzen) -> nur in Blender sinnvoll
+NEEDS_BLENDER = ("flush_marked_objects_cpp", "configure_batch_rigidbody_properties_cpp")
+
+PROCESSING_SETTINGS = {
+    "mode_is_instancing": True,
+    "apply_rigidbody_static": False,
+    "instance_collection_name": "BENCH_Instances",
+    "static_collection_name": "BENCH_Static",
+    "instance_name_base_suffix": "_inst",
+}
+RANDOM_TRANSFORM_SETTINGS = {
+    "rot_x_min_deg": -10.0, "rot_x_max_deg": 10.0,
+    "rot_y_min_deg": -10.0, "rot_y_max_deg": 10.0,
+    "rot_z_min_deg": 0.0, "rot_z_max_deg": 360.0,
+    "scale_min": 0.8, "scale_max": 1.2,
+}
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Physical Layout Tool native module microbenchmarks")
+    parser.add_argument("--out", default=os.path.join(REPO_ROOT, "bench_results", "native.jsonl"),
+                        help="JSON file, .jsonl file (append) or directory")
+    parser.add_argument("--native-dir", default=None, help="directory of the scatter_accel build")
+    parser.add_argument("--mesh-sizes", default="10k,1M,10M", help="triangle counts for mesh preparation")
+    parser.add_argument("--instance-counts", default="1k,10k,100k,1M", help="GpuInstancer instance counts")
+    parser.add_argument("--record-counts", default="10k,100k,1M", help="object record batch sizes")
+    parser.add_argument("--dict-counts", default="1k,10k,100k", help="dict-based analyzer batch sizes")
+    parser.add_argument("--marker-segments", default="64,64k", help="circle marker segment counts")
+    parser.add_argument("--garbage-count", type=int, default=5000, help="names for the garbage list (O(n^2) dedupe)")
+    parser.add_argument("--calls", type=int, default=20000, help="calls per call-overhead measurement")
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser.parse_args(argv[1:])
+
+
+def _verified(row, ok):
+    row["verified"] = bool(ok)
+    if not ok:
+        row["status"] = "mismatch"
+    return row
+
+
+def _guarded(name, variant, size, func):
+    """Führt eine Benchmark-Funktion aus; native Exceptions werden als Status-Zeile festgehalten statt abzubrechen."""
+    try:
+        return func()
+    except Exception as e:
+        return _row(name, variant, size, status=f"error: {type(e).__name__}: {e}")
+
+
+# --- Referenzimplementierungen ---
+# Die NumPy-/Python-Referenzen sind das Backend des Addons selbst (numpy_kernels.py, record_kernels.py):
+# jede "verified"-Zeile ist damit zugleich der Paritätstest zwischen nativem und NumPy-Backend.
+def _mesh_arrays(data):
+    return np.asarray(data.positions), np.asarray(data.indices)
+
+
+def _same_bounds_and_normals(data, expected, source_cos, source_tris):
+    """Normalen/Bounds wie im NumPy-Backend, Positionen/Indizes als Views auf die Eingabe (keine Kopie)."""
+    return (np.allclose(np.asarray(data.normals), expected.normals, atol=1e-4)
+            and np.allclose(data.bbox_min, expected.bbox_min) and np.allclose(data.bbox_max, expected.bbox_max)
+            and np.allclose(data.sphere_center, expected.sphere_center)
+            and np.isclose(data.sphere_radius, expected.sphere_radius, rtol=1e-5)
+            and np.shares_memory(np.asarray(data.positions), source_cos)
+            and np.shares_memory(np.asarray(data.indices), source_tris))
+
+
+def _setting(settings, key, default):
+    value = settings.get(key)
+    return default if value is None else value
+
+
+def analyze_objects_reference(objects, enable_rigidbody):
+    suffix = " [RigidBody]" if enable_rigidbody else ""
+    return [f"Processed: {_setting(o, 'name', '[Name N/A]')} with mesh: "
+            f"{_setting(o, 'mesh_name', _setting(o, 'mesh', '[Mesh N/A]'))}{suffix}" for o in objects]
+
+
+# --- Synthetische Eingaben ---
+def random_matrices(count, seed=0):
+    """(count, 16) float32 Weltmatrizen (zufällige Translation, Rotation um Z, Skalierung)."""
+    rng = np.random.default_rng(seed)
+    angle = rng.uniform(0.0, 2.0 * math.pi, count)
+    scale = rng.uniform(0.5, 1.5, count)
+    matrices = np.zeros((count, 4, 4), dtype=np.float32)
+    matrices[:, 0, 0] = matrices[:, 1, 1] = np.cos(angle) * scale
+    matrices[:, 0, 1] = -np.sin(angle) * scale
+    matrices[:, 1, 0] = np.sin(angle) * scale
+    matrices[:, 2, 2] = scale
+    matrices[:, :3, 3] = rng.uniform(-50.0, 50.0, (count, 3))
+    matrices[:, 3, 3] = 1.0
+    return matrices.reshape(count, 16)
+
+
+def random_records(record_kernels, count, seed=0):
+    """Records mit gemischten Flags, geteilten Meshes und 1-2 Collection-Bits pro Objekt."""
+    rng = np.random.default_rng(seed)
+    records = np.zeros(count, dtype=record_kernels.OBJECT_RECORD_DTYPE)
+    records["matrix_world"] = random_matrices(count, seed).reshape(count, 4, 4)
+    is_mesh = rng.random(count) < 0.95
+    records["mesh_index"] = np.where(is_mesh, rng.integers(0, 64, count), -1)
+    records["users"] = np.where(is_mesh, rng.integers(1, 4, count), 0)
+    flags = np.where(is_mesh, record_kernels.RECORD_IS_MESH, 0)
+    has_rb = rng.random(count) < 0.5
+    flags |= np.where(has_rb, record_kernels.RECORD_HAS_RIGIDBODY | record_kernels.RECORD_RB_ENABLED, 0)
+    records["flags"] = flags
+    records["rb_type"] = np.where(has_rb, record_kernels.RB_TYPE_ACTIVE, record_kernels.RB_TYPE_NONE)
+    bits = np.uint64(1) << rng.integers(0, BENCH_COLLECTION_COUNT, count).astype(np.uint64)
+    extra = np.uint64(1) << rng.integers(0, BENCH_COLLECTION_COUNT, count).astype(np.uint64)
+    records["collection_mask"] = np.where(rng.random(count) < 0.2, bits | extra, bits)
+    return records
+
+
+def object_dicts(count, seed=0):
+    matrices = random_matrices(count, seed).reshape(count, 4, 4).tolist()
+    return [{"name": f"Rock.{i:06d}", "mesh_name": f"RockMesh.{i % 7}", "matrix_world": matrices[i],
+             "has_rigidbody": i % 5 == 0} for i in range(count)]
+
+
+def tiny_mesh_arrays():
+    cos = np.array([0, 0, 0, 1, 0, 0, 0, 1, 0], dtype=np.float32)
+    uvs = np.array([0, 0, 1, 0, 0, 1], dtype=np.float32)
+    tris = np.array([0, 1, 2], dtype=np.int32)
+    return cos, uvs, tris
+
+
+def new_instancer(native, capacity):
+    cos, uvs, tris = tiny_mesh_arrays()
+    instancer = native.GpuInstancer(INSTANCER_SHADER_NAME)
+    instancer.setup_master_mesh(native.prepare_master_mesh_data_from_py_arrays_cpp(cos, uvs, tris, 3, 1), capacity)
+    return instancer
+
+
+# --- Aufruf-Overhead: winzige Eingaben, viele Aufrufe ---
+def _overhead_row(name, variant, func, args):
+    calls = args.calls
+
+    def run():
+        for _ in itertools.repeat(None, calls):
+            func()
+    measurement = measure_rate(run, calls, args.repeat, warmup=True)
+    return _row(name, variant, 1, measurement, mode="call_overhead", ns_per_call=measurement["best_s"] / calls * 1e9)
+
+
+def bench_call_overhead(native, record_kernels, args):
+    results = [_overhead_row("python_noop", "python", lambda: None, args)]
+    if native is None:
+        return results
+    cos, uvs, tris = tiny_mesh_arrays()
+    empty_records = np.zeros(0, dtype=record_kernels.OBJECT_RECORD_DTYPE)
+    identity = np.eye(4, dtype=np.float32).ravel()
+    instancer = new_instancer(native, 1)
+    instancer.add_instance(identity)
+    calls = {
+        "analyze_objects": lambda: native.analyze_objects([], False),
+        "calculate_random_transforms_cpp": lambda: native.calculate_random_transforms_cpp({}),
+        "analyze_scatter_objects_for_processing": lambda: native.analyze_scatter_objects_for_processing([], {}),
+        "analyze_single_object_for_processing": lambda: native.analyze_single_object_for_processing({}, {}),
+        "analyze_static_bake_records_cpp": lambda: native.analyze_static_bake_records_cpp(empty_records, 0),
+        "analyze_rb_setup_records_cpp": lambda: native.analyze_rb_setup_records_cpp(empty_records, 0),
+        "mark_for_deletion_cpp": lambda: native.mark_for_deletion_cpp("BENCH_Marker"),
+        "get_marked_garbage_cpp": native.get_marked_garbage_cpp,
+        "clear_garbage_cpp": native.clear_garbage_cpp,
+        "generate_circle_marker_gpu_data_cpp": lambda: native.generate_circle_marker_gpu_data_cpp(1.0, 3),
+        "prepare_mesh_gpu_data_from_flat_arrays_cpp": lambda: native.prepare_mesh_gpu_data_from_flat_arrays_cpp(cos, tris, 3, 1),
+        "prepare_master_mesh_data_from_py_arrays_cpp": lambda: native.prepare_master_mesh_data_from_py_arrays_cpp(cos, uvs, tris, 3, 1),
+        "GpuInstancer.__init__": lambda: native.GpuInstancer(INSTANCER_SHADER_NAME),
+        "GpuInstancer.setup_master_mesh": lambda: new_instancer(native, 1),
+        "GpuInstancer.update_instance_transforms": lambda: instancer.update_instance_transforms(identity, 1),
+        "GpuInstancer.update_instance": lambda: instancer.update_instance(0, identity),
+        "GpuInstancer.get_all_instance_matrices": instancer.get_all_instance_matrices,
+        "GpuInstancer.draw": lambda: instancer.draw(1, identity, identity, 0.0, None, None),
+        "GpuInstancer.set_ghost_mode": lambda: instancer.set_ghost_mode(False, -1),
+        "GpuInstancer.upload_transforms_to_gpu": instancer.upload_transforms_to_gpu,
+        "GpuInstancer.get_instance_count": instancer.get_instance_count,
+        "GpuInstancer.is_ghost_mode_enabled": instancer.is_ghost_mode_enabled,
+        "GpuInstancer.get_ghost_instance_index": instancer.get_ghost_instance_index,
+    }
+    if hasattr(native, "capabilities"):
+        calls["capabilities"] = native.capabilities
+    for name, func in calls.items():
+        results.append(_guarded(name, "native", 1, lambda: _overhead_row(name, "native", func, args)))
+    native.clear_garbage_cpp()
+
+    # add_instance/clear_instances/cleanup verändern den Zustand -> paarweise gemessen
+    def add_then_clear():
+        instancer.add_instance(identity)
+        instancer.clear_instances()
+    results.append(_guarded("GpuInstancer.add_instance", "native", 1,
+                            lambda: _overhead_row("GpuInstancer.add_instance+clear_instances", "native", add_then_clear, args)))
+    results.append(_guarded("GpuInstancer.cleanup", "native", 1,
+                            lambda: _overhead_row("GpuInstancer.cleanup", "native", instancer.cleanup, args)))
+    return results
+
+
+# --- Kernel-Zeit ---
+def bench_mesh_prep(native, numpy_kernels, args):
+    results = []
+    for size in parse_count_list(args.mesh_sizes):
+        vertices, triangles = synthetic_ground_arrays(size)
+        n_verts, n_tris = len(vertices), len(triangles)
+        flat_cos, flat_tris = vertices.ravel(), triangles.ravel()
+        flat_uvs = ((vertices[:, :2] - vertices[:, :2].min(axis=0)) / np.ptp(vertices[:, :2], axis=0)).astype(np.float32).ravel()
+        expected_data = numpy_kernels.prepare_mesh_gpu_data_np(flat_cos, flat_tris, n_verts, n_tris)
+        expected = _mesh_arrays(expected_data)
+        results.append(_row("prepare_mesh_gpu_data_from_flat_arrays_cpp", "numpy", n_tris, measure_rate(
+            lambda: numpy_kernels.prepare_mesh_gpu_data_np(flat_cos, flat_tris, n_verts, n_tris), n_tris, args.repeat), mode="kernel"))
+        results.append(_row("prepare_master_mesh_data_from_py_arrays_cpp", "numpy", n_tris, measure_rate(
+            lambda: numpy_kernels.prepare_master_mesh_data_np(flat_cos, flat_uvs, flat_tris, n_verts, n_tris), n_tris, args.repeat), mode="kernel"))
+        if native is None:
+            continue
+
+        def gpu_prep():
+            out = {}
+            row = _row("prepare_mesh_gpu_data_from_flat_arrays_cpp", "native", n_tris, measure_rate(
+                lambda: out.setdefault("data", native.prepare_mesh_gpu_data_from_flat_arrays_cpp(flat_cos, flat_tris, n_verts, n_tris)),
+                n_tris, args.repeat), mode="kernel")
+            data = out["data"]
+            return _verified(row, np.array_equal(np.asarray(data.positions), expected[0])
+                             and np.array_equal(np.asarray(data.indices), expected[1])
+                             and _same_bounds_and_normals(data, expected_data, flat_cos, flat_tris))
+
+        def master_prep():
+            out = {}
+            row = _row("prepare_master_mesh_data_from_py_arrays_cpp", "native", n_tris, measure_rate(
+                lambda: out.setdefault("data", native.prepare_master_mesh_data_from_py_arrays_cpp(flat_cos, flat_uvs, flat_tris, n_verts, n_tris)),
+                n_tris, args.repeat), mode="kernel")
+            data = out["data"]
+            return _verified(row, np.array_equal(np.asarray(data.positions), expected[0])
+                             and np.array_equal(np.asarray(data.uvs), flat_uvs.reshape(n_verts, 2))
+                             and np.array_equal(np.asarray(data.indices), expected[1])
+                             and _same_bounds_and_normals(data, expected_data, flat_cos, flat_tris))
+        results.append(_guarded("prepare_mesh_gpu_data_from_flat_arrays_cpp", "native", n_tris, gpu_prep))
+        results.append(_guarded("prepare_master_mesh_data_from_py_arrays_cpp", "native", n_tris, master_prep))
+    return results
+
+
+def bench_circle_marker(native, numpy_kernels, args):
+    results = []
+    for segments in parse_count_list(args.marker_segments):
+        expected = _mesh_arrays(numpy_kernels.generate_circle_marker_gpu_data_np(1.0, segments))
+        results.append(_row("generate_circle_marker_gpu_data_cpp", "numpy", segments, measure_rate(
+            lambda: numpy_kernels.generate_circle_marker_gpu_data_np(1.0, segments), segments, args.repeat), mode="kernel"))
+        if native is None:
+            continue
+
+        def run():
+            data = native.generate_circle_marker_gpu_data_cpp(1.0, segments)
+            row = _row("generate_circle_marker_gpu_data_cpp", "native", segments, measure_rate(
+                lambda: native.generate_circle_marker_gpu_data_cpp(1.0, segments), segments, args.repeat), mode="kernel")
+            return _verified(row, np.allclose(np.asarray(data.positions), expected[0], atol=1e-5)
+                             and np.array_equal(np.asarray(data.indices), expected[1]))
+        results.append(_guarded("generate_circle_marker_gpu_data_cpp", "native", segments, run))
+    return results
+
+
+def bench_instancer(native, args):
+    results = []
+    for count in parse_count_list(args.instance_counts):
+        matrices = random_matrices(count, seed=1)
+        updated = random_matrices(count, seed=2)
+        rows, updated_rows = list(matrices), list(updated)
+        flat = matrices.ravel()
+
+        # Referenz: dieselben Speicheroperationen auf einem NumPy-Puffer (pro Instanz bzw. gebündelt)
+        store = np.empty_like(matrices)
+
+        def store_rows():
+            for index, row in enumerate(rows):
+                store[index] = row
+        results.append(_row("GpuInstancer.add_instance", "numpy", count, measure_rate(store_rows, count, args.repeat), mode="kernel"))
+        results.append(_row("GpuInstancer.update_instance_transforms", "numpy", count, measure_rate(
+            lambda: np.copyto(store, matrices), count, args.repeat), mode="kernel"))
+        results.append(_row("GpuInstancer.get_all_instance_matrices", "numpy", count, measure_rate(
+            store.copy, count, args.repeat), mode="kernel"))
+        if native is None:
+            continue
+        instancer = new_instancer(native, count)
+
+        def add():
+            add_one = instancer.add_instance
+            row = _row("GpuInstancer.add_instance", "native", count, measure_rate(
+                lambda: [add_one(m) for m in rows], count, args.repeat, setup=instancer.clear_instances), mode="kernel")
+            return _verified(row, instancer.get_instance_count() == count
+                             and np.array_equal(instancer.get_all_instance_matrices(), matrices))
+
+        def update():
+            update_one = instancer.update_instance
+            row = _row("GpuInstancer.update_instance", "native", count, measure_rate(
+                lambda: [update_one(i, m) for i, m in enumerate(updated_rows)], count, args.repeat), mode="kernel")
+            return _verified(row, np.array_equal(instancer.get_all_instance_matrices(), updated))
+
+        def update_bulk():
+            row = _row("GpuInstancer.update_instance_transforms", "native", count, measure_rate(
+                lambda: instancer.update_instance_transforms(flat, count), count, args.repeat), mode="kernel")
+            return _verified(row, np.array_equal(instancer.get_all_instance_matrices(), matrices))
+
+        def get_all():
+            out = {}
+            row = _row("GpuInstancer.get_all_instance_matrices", "native", count, measure_rate(
+                lambda: out.__setitem__("matrices", instancer.get_all_instance_matrices()), count, args.repeat), mode="kernel")
+            return _verified(row, np.array_equal(out["matrices"], matrices))
+
+        def clear():
+            row = _row("GpuInstancer.clear_instances", "native", count, measure_rate(
+                instancer.clear_instances, count, args.repeat, setup=lambda: instancer.update_instance_transforms(flat, count)),
+                mode="kernel")
+            return _verified(row, instancer.get_instance_count() == 0)
+
+        results.append(_guarded("GpuInstancer.add_instance", "native", count, add))
+        results.append(_guarded("GpuInstancer.update_instance", "native", count, update))
+        results.append(_guarded("GpuInstancer.update_instance_transforms", "native", count, update_bulk))
+        results.append(_guarded("GpuInstancer.get_all_instance_matrices", "native", count, get_all))
+        results.append(_guarded("GpuInstancer.clear_instances", "native", count, clear))
+        instancer.cleanup()
+    return results
+
+
+def bench_record_analyzers(native, record_kernels, args):
+    results = []
+    static_mask = 1 << 3
+    managed_mask = (1 << 1) | (1 << 2)
+    analyzers = (
+        ("analyze_static_bake_records_cpp", record_kernels.analyze_static_bake_records_np, static_mask),
+        ("analyze_rb_setup_records_cpp", record_kernels.analyze_rb_setup_records_np, managed_mask),
+    )
+    for count in parse_count_list(args.record_counts):
+        records = random_records(record_kernels, count)
+        for name, reference, mask in analyzers:
+            expected = reference(records, mask)
+            results.append(_row(name, "numpy", count, measure_rate(lambda: reference(records, mask), count, args.repeat), mode="kernel"))
+            if native is None:
+                continue
+
+            def run():
+                native_func = getattr(native, name)
+                row = _row(name, "native", count, measure_rate(lambda: native_func(records, mask), count, args.repeat), mode="kernel")
+                return _verified(row, np.array_equal(np.asarray(native_func(records, mask), dtype=np.uint8), expected))
+            results.append(_guarded(name, "native", count, run))
+    return results
+
+
+def bench_dict_analyzers(native, numpy_kernels, args):
+    results = []
+    for count in parse_count_list(args.dict_counts):
+        objects = object_dicts(count)
+        singles = [{"original_marker_name": o["name"], "source_mesh_name": o["mesh_name"], "matrix_world": o["matrix_world"]}
+                   for o in objects]
+        cases = (
+            ("analyze_scatter_objects_for_processing",
+             lambda: numpy_kernels.analyze_scatter_objects_for_processing_py(objects, PROCESSING_SETTINGS),
+             lambda: native.analyze_scatter_objects_for_processing(objects, PROCESSING_SETTINGS)),
+            ("analyze_single_object_for_processing",
+             lambda: [numpy_kernels.analyze_single_object_for_processing_py(data, PROCESSING_SETTINGS) for data in singles],
+             lambda: [native.analyze_single_object_for_processing(data, PROCESSING_SETTINGS) for data in singles]),
+            ("analyze_objects",
+             lambda: analyze_objects_reference(objects, True),
+             lambda: native.analyze_objects(objects, True)),
+        )
+        for name, reference, native_call in cases:
+            expected = reference()
+            results.append(_row(name, "python", count, measure_rate(reference, count, args.repeat), mode="kernel"))
+            if native is None:
+                continue
+
+            def run():
+                row = _row(name, "native", count, measure_rate(native_call, count, args.repeat), mode="kernel")
+                return _verified(row, [dict(item) for item in native_call()] == expected
+                                 if isinstance(expected[0], dict) else list(native_call()) == expected)
+            results.append(_guarded(name, "native", count, run))
+
+        # Zufallswerte: geprüft wird der Wertebereich, nicht Gleichheit
+        transform_variants = [("python", numpy_kernels.calculate_random_transforms_py)]
+        if native is not None:
+            transform_variants.append(("native", native.calculate_random_transforms_cpp))
+        for variant, transform_func in transform_variants:
+            def transforms():
+                out = []
+                row = _row("calculate_random_transforms_cpp", variant, count, measure_rate(
+                    lambda: out.extend(transform_func(RANDOM_TRANSFORM_SETTINGS) for _ in range(count)),
+                    count, args.repeat, setup=out.clear), mode="kernel")
+                return _verified(row, _transforms_in_range(out, RANDOM_TRANSFORM_SETTINGS))
+            results.append(_guarded("calculate_random_transforms_cpp", variant, count, transforms))
+    return results
+
+
+def _transforms_in_range(results, s):
+    rotations = np.degrees(np.array([item["rotation_euler_rad"] for item in results]))
+    scales = np.array([item["scale_uniform"] for item in results])
+    lower = np.array([s["rot_x_min_deg"], s["rot_y_min_deg"], s["rot_z_min_deg"]]) - 1e-3
+    upper = np.array([s["rot_x_max_deg"], s["rot_y_max_deg"], s["rot_z_max_deg"]]) + 1e-3
+    return bool(np.all((rotations >= lower) & (rotations <= upper))
+                and np.all((scales >= s["scale_min"] - 1e-6) & (scales <= s["scale_max"] + 1e-6)))
+
+
+def bench_garbage_list(native, args):
+    count = args.garbage_count
+    names = [f"BENCH_Marker.{i:06d}" for i in range(count)]
+    if native is None:
+        return []
+
+    def mark():
+        row = _row("mark_for_deletion_cpp", "native", count, measure_rate(
+            lambda: [native.mark_for_deletion_cpp(name) for name in names], count, args.repeat,
+            setup=native.clear_garbage_cpp), mode="kernel")
+        return _verified(row, list(native.get_marked_garbage_cpp()) == names)
+
+    def get():
+        row = _row("get_marked_garbage_cpp", "native", count, measure_rate(native.get_marked_garbage_cpp, count, args.repeat), mode="kernel")
+        return _verified(row, list(native.get_marked_garbage_cpp()) == names)
+
+    def clear():
+        row = _row("clear_garbage_cpp", "native", count, measure_rate(
+            native.clear_garbage_cpp, count, args.repeat, setup=lambda: [native.mark_for_deletion_cpp(n) for n in names]), mode="kernel")
+        return _verified(row, len(native.get_marked_garbage_cpp()) == 0)
+    return [_guarded("mark_for_deletion_cpp", "native", count, mark),
+            _guarded("get_marked_garbage_cpp", "native", count, get),
+            _guarded("clear_garbage_cpp", "native", count, clear)]
+
+
+def check_capabilities(native):
+    """capabilities() muss für jeden gemeldeten Kernel eine existierende Funktion und eine native Stufe nennen."""
+    if native is None or not hasattr(native, "capabilities"):
+        return []
+    entries = list(native.capabilities())
+    ok = bool(entries) and all(hasattr(native, function_name) and backend in ("NATIVE", "NATIVE_THREADED")
+                               for _kernel, function_name, backend in entries)
+    row = _row("capabilities", "native", len(entries), mode="check",
+               api_version=getattr(native, "NATIVE_API_VERSION", None),
+               kernels=sorted({kernel for kernel, _function_name, _backend in entries}))
+    return [_verified(row, ok)]
+
+
+def exported_names(native):
+    """Alle öffentlichen Funktionen des Moduls plus GpuInstancer-Methoden ("GpuInstancer.<name>")."""
+    names = [name for name in dir(native)
+             if not name.startswith("_") and callable(getattr(native, name)) and not isinstance(getattr(native, name), type)]
+    instancer_type = getattr(native, "GpuInstancer", None)
+    if instancer_type is not None:
+        names += [f"GpuInstancer.{name}" for name in dir(instancer_type)
+                  if not name.startswith("_") and callable(getattr(instancer_type, name))]
+        names.append("GpuInstancer.__init__")
+    return names
+
+
+def coverage_rows(native, results):
+    covered = {row["name"].split("+")[0] for row in results}
+    rows = [_row(name, "native", None, status="needs_blender") for name in NEEDS_BLENDER]
+    covered.update(NEEDS_BLENDER)
+    rows += [_row(name, "native", None, status="not_covered") for name in exported_names(native) if name not in covered]
+    return rows
+
+
+def main(argv):
+    args = parse_args(argv)
+    native = load_native_module_standalone(args.native_dir)
+    record_kernels = load_addon_module_standalone("record_kernels")
+    numpy_kernels = load_addon_module_standalone("numpy_kernels")
+    results = bench_call_overhead(native, record_kernels, args)
+    results += bench_mesh_prep(native, numpy_kernels, args)
+    results += bench_circle_marker(native, numpy_kernels, args)
+    results += bench_instancer(native, args)
+    results += bench_record_analyzers(native, record_kernels, args)
+    results += bench_dict_analyzers(native, numpy_kernels, args)
+    results += bench_garbage_list(native, args)
+    results += check_capabilities(native)
+    if native is None:
+        results.append(_row("all", "native", None, status="unavailable"))
+    else:
+        results += coverage_rows(native, results)
+    print_results(results)
+    path = write_results(args.out, SUITE_NAME, results, run_metadata({"native_available": native is not None}))
+    print(f"[bench] Ergebnisse geschrieben: {path}")
+    mismatches = [row for row in results if row["status"] == "mismatch"]
+    if mismatches:
+        print(f"[bench] {len(mismatches)} Abweichung(en) gegenüber der Referenz: {', '.join(row['name'] for row in mismatches)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
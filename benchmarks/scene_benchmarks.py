@@ -0,0 +1,440 @@
+# scene_benchmarks.py
+# Headless-Benchmark-Suite mit synthetischen Szenen (Böden 1k..4M Dreiecke, Streulisten aus Icospheres).
+# Misst Platzierungen/s, Overlap-Checks/s, Drop-Ticks/s, Instanz-Konvertierung/s und Bake-to-Static/s,
+# jeweils mit und ohne natives Modul, über die echten Addon-Funktionen (PlacementTransaction,
+# check_overlap_bvh, ScatterPointBuffer, rigidbody_bulk, static_bake ...). Ergebnisse als JSON.
+#
+# In Blender:
+#   blender --background --factory-startup --python benchmarks/scene_benchmarks.py -- --out bench/scene.jsonl
+# Ohne Blender (nur bpy-freie Teile: Bodengenerierung, native und NumPy-Kernels):
+#   python benchmarks/scene_benchmarks.py --out bench/scene.jsonl --native-dir path/to/build
+import argparse
+import contextlib
+import math
+import os
+import random
+import sys
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_common import (  # noqa: E402
+    REPO_ROOT,
+    measure_rate,
+    parse_count_list,
+    synthetic_ground_arrays,
+    random_ground_points,
+    load_native_module_standalone,
+    load_addon_module_standalone,
+    result_row as _row,
+    run_metadata,
+    write_results,
+    print_results,
+)
+import numpy as np  # noqa: E402
+
+try:
+    import bpy
+    import bmesh
+    from mathutils import Euler, Matrix, Vector
+except ImportError:
+    bpy = None
+
+SUITE_NAME = "scene"
+ADDON_PACKAGE = "physical_layout_tool.physical_layout_tool"
+BENCH_COLLECTION_PREFIX = "BENCH_"
+DROP_START_HEIGHT = 20.0
+DROP_STEP = 0.5
+
+
+def parse_args(argv):
+    if "--" in argv:
+        argv = argv[argv.index("--") + 1:]
+    elif bpy is not None:
+        argv = []
+    else:
+        argv = argv[1:]
+    parser = argparse.ArgumentParser(description="Physical Layout Tool scene benchmarks")
+    parser.add_argument("--out", default=os.path.join(REPO_ROOT, "bench_results", "scene.jsonl"),
+                        help="JSON file, .jsonl file (append) or directory")
+    parser.add_argument("--ground-sizes", default="1k,16k,256k,1M,4M", help="ground triangle counts, e.g. 1k,1M")
+    parser.add_argument("--placements", type=int, default=2000)
+    parser.add_argument("--overlap-population", type=int, default=500)
+    parser.add_argument("--overlap-checks", type=int, default=200)
+    parser.add_argument("--drop-objects", type=int, default=500)
+    parser.add_argument("--drop-ticks", type=int, default=40)
+    parser.add_argument("--instances", type=int, default=5000)
+    parser.add_argument("--bake-objects", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--native", choices=("both", "on", "off"), default="both")
+    parser.add_argument("--native-dir", default=None, help="directory of the scatter_accel build (outside Blender)")
+    return parser.parse_args(argv)
+
+
+# --- Ohne Blender: bpy-freie Teile ---
+def run_kernel_benchmarks(args):
+    results = []
+    native = load_native_module_standalone(args.native_dir)
+    numpy_kernels = load_addon_module_standalone("numpy_kernels")
+    for size in parse_count_list(args.ground_sizes):
+        arrays = {}
+
+        def generate():
+            arrays["ground"] = synthetic_ground_arrays(size)
+        results.append(_row("ground_generation", "numpy", size, measure_rate(generate, size, args.repeat)))
+
+        vertices, triangles = arrays["ground"]
+        flat_cos, flat_tris = vertices.ravel(), triangles.ravel()
+        if native is None:
+            results.append(_row("mesh_gpu_prep", "native", size, status="unavailable"))
+        else:
+            results.append(_row("mesh_gpu_prep", "native", size, measure_rate(
+                lambda: native.prepare_mesh_gpu_data_from_flat_arrays_cpp(flat_cos, flat_tris, len(vertices), len(triangles)),
+                len(triangles), args.repeat)))
+        # NumPy-Backend des Kernels (gpu.mesh_data), bpy-frei wie in native_benchmarks
+        results.append(_row("mesh_gpu_prep", "numpy", size, measure_rate(
+            lambda: numpy_kernels.prepare_mesh_gpu_data_np(flat_cos, flat_tris, len(vertices), len(triangles)),
+            len(triangles), args.repeat)))
+    return results, {"blender": None, "native_available": native is not None}
+
+
+# --- In Blender ---
+def load_addon():
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+    import importlib
+    addon = importlib.import_module(ADDON_PACKAGE)
+    if not hasattr(bpy.types.Scene, "mouse_scatter_settings"):
+        addon.register()
+    return addon
+
+
+@contextlib.contextmanager
+def native_mode(addon, enabled):
+    """Schaltet NATIVE_MODULE_AVAILABLE in allen Addon-Modulen um (ohne das Modul zu entladen)."""
+    modules = [mod for name, mod in sys.modules.items()
+               if name.startswith(addon.__name__) and mod is not None and hasattr(mod, "NATIVE_MODULE_AVAILABLE")]
+    saved = [(mod, mod.NATIVE_MODULE_AVAILABLE) for mod in modules]
+    try:
+        for mod, available in saved:
+            mod.NATIVE_MODULE_AVAILABLE = bool(available and enabled)
+        yield
+    finally:
+        for mod, available in saved:
+            mod.NATIVE_MODULE_AVAILABLE = available
+
+
+def variants_for(args, addon):
+    variants = []
+    if args.native in ("both", "on"):
+        variants.append(("native", bool(addon.NATIVE_MODULE_AVAILABLE and addon.scatter_accel)))
+    if args.native in ("both", "off"):
+        variants.append(("python", True))
+    return variants
+
+
+def clear_bench_data():
+    scene = bpy.context.scene
+    if scene.rigidbody_world is not None:
+        bpy.ops.rigidbody.world_remove()
+    bpy.data.batch_remove(list(bpy.data.objects))
+    bpy.data.batch_remove([mesh for mesh in bpy.data.meshes if mesh.users == 0])
+    bpy.data.batch_remove([col for col in bpy.data.collections])
+
+
+def bench_collection(name):
+    col = bpy.data.collections.get(name)
+    if col is None:
+        col = bpy.data.collections.new(name)
+        bpy.context.scene.collection.children.link(col)
+    return col
+
+
+def clear_collection(col):
+    objects = list(col.objects)
+    if objects:
+        bpy.data.batch_remove(objects)
+
+
+def build_ground(vertices, triangles):
+    mesh = bpy.data.meshes.new(BENCH_COLLECTION_PREFIX + "Ground")
+    mesh.vertices.add(len(vertices))
+    mesh.vertices.foreach_set("co", vertices.ravel())
+    mesh.loops.add(triangles.size)
+    mesh.loops.foreach_set("vertex_index", triangles.ravel())
+    mesh.polygons.add(len(triangles))
+    mesh.polygons.foreach_set("loop_start", np.arange(0, triangles.size, 3, dtype=np.int32))
+    mesh.update()
+    ground = bpy.data.objects.new(BENCH_COLLECTION_PREFIX + "Ground", mesh)
+    bpy.context.scene.collection.objects.link(ground)
+    return ground
+
+
+def build_scatter_sources(settings, count=3):
+    col = bench_collection(BENCH_COLLECTION_PREFIX + "Sources")
+    settings.scatter_objects_list.clear()
+    sources = []
+    for i in range(count):
+        mesh = bpy.data.meshes.new(f"{BENCH_COLLECTION_PREFIX}Rock{i}")
+        bm = bmesh.new()
+        bmesh.ops.create_icosphere(bm, subdivisions=1 + i % 3, radius=0.3 + 0.1 * i)
+        bm.to_mesh(mesh)
+        bm.free()
+        obj = bpy.data.objects.new(mesh.name, mesh)
+        col.objects.link(obj)
+        obj.hide_set(True)
+        settings.scatter_objects_list.add().obj = obj
+        sources.append(obj)
+    return sources
+
+
+def random_transform_matrix(addon, settings, location, normal):
+    # Entspricht der Ghost-Berechnung im Scatter-Modal (native Zufallswerte bzw. Python-Fallback)
+    scatter_mod = addon.physics_cursor_scatter
+    rot = None
+    if scatter_mod.NATIVE_MODULE_AVAILABLE and scatter_mod.scatter_accel:
+        data = scatter_mod.scatter_accel.calculate_random_transforms_cpp(
+            scatter_mod.OBJECT_OT_mouse_scatter._get_random_transform_settings_dict(None, settings))
+        rot, scale = Euler(data["rotation_euler_rad"], 'XYZ'), float(data["scale_uniform"])
+    if rot is None:
+        rot = Euler((math.radians(random.uniform(settings.rot_x_min, settings.rot_x_max)),
+                     math.radians(random.uniform(settings.rot_y_min, settings.rot_y_max)),
+                     math.radians(random.uniform(settings.rot_z_min, settings.rot_z_max))), 'XYZ')
+        scale = random.uniform(settings.scale_min, settings.scale_max)
+    align = normal.to_track_quat('Z', 'Y')
+    matrix = (align @ rot.to_quaternion()).to_matrix().to_4x4() @ Matrix.Scale(scale, 4)
+    matrix.translation = location
+    return matrix
+
+
+def processing_settings(im_settings):
+    return {
+        "mode_is_instancing": True,
+        "apply_rigidbody_static": False,
+        "instance_collection_name": im_settings.instance_collection_name,
+        "static_collection_name": im_settings.static_collection_name,
+        "instance_name_base_suffix": "_inst",
+    }
+
+
+def place_objects(addon, context, sources, points, target_col):
+    """Raycast + Zufallstransform (+ native Analyse) + Objekt anlegen und verlinken, gebündelt in einer Transaktion."""
+    scene = context.scene
+    settings = scene.mouse_scatter_settings
+    proc_settings = processing_settings(scene.instance_manager_settings)
+    scatter_mod = addon.physics_cursor_scatter
+    use_native = scatter_mod.NATIVE_MODULE_AVAILABLE and scatter_mod.scatter_accel
+    depsgraph = context.evaluated_depsgraph_get()
+    placed = []
+    with addon.placement_transaction.PlacementTransaction(context):
+        for x, y in points.tolist():
+            hit, location, normal, _index, _obj, _m = scene.ray_cast(depsgraph, (x, y, 100.0), (0.0, 0.0, -1.0))
+            if not hit:
+                continue
+            source = sources[len(placed) % len(sources)]
+            matrix = random_transform_matrix(addon, settings, location, normal)
+            if use_native:
+                instruction = scatter_mod.scatter_accel.analyze_single_object_for_processing({
+                    "original_marker_name": source.name,
+                    "source_mesh_name": source.data.name,
+                    "matrix_world": [list(row) for row in matrix],
+                }, proc_settings)
+                matrix = Matrix(instruction.get("matrix_world", [list(row) for row in matrix]))
+            obj = bpy.data.objects.new(source.name + "_inst", source.data)
+            obj.matrix_world = matrix
+            addon.placement_transaction.transaction_link(obj, target_col)
+            placed.append(obj)
+    return placed
+
+
+def bench_placement(addon, context, sources, size, variant, args):
+    target = bench_collection(context.scene.instance_manager_settings.instance_collection_name)
+    points = random_ground_points(args.placements)
+    measurement = measure_rate(lambda: place_objects(addon, context, sources, points, target),
+                               args.placements, args.repeat, setup=lambda: clear_collection(target))
+    clear_collection(target)
+    return _row("placements", variant, size, measurement)
+
+
+def bench_overlap(addon, context, sources, size, variant, args):
+    target = bench_collection(context.scene.instance_manager_settings.instance_collection_name)
+    clear_collection(target)
+    place_objects(addon, context, sources, random_ground_points(args.overlap_population, seed=7), target)
+    candidate = bpy.data.objects.new(BENCH_COLLECTION_PREFIX + "Candidate", sources[0].data.copy())
+    context.scene.collection.objects.link(candidate)
+    positions = random_ground_points(args.overlap_checks, seed=11)
+    settings = context.scene.mouse_scatter_settings
+    # Zustand, den check_overlap_bvh vom Operator liest
+    operator_state = types.SimpleNamespace(_session_source_collection=None, report=lambda *a, **k: None)
+    check = addon.physics_cursor_scatter.OBJECT_OT_mouse_scatter.check_overlap_bvh
+
+    def run():
+        for x, y in positions.tolist():
+            candidate.location = (x, y, 0.0)
+            context.view_layer.update()
+            check(operator_state, candidate, context, settings, ignore_obj=candidate)
+    measurement = measure_rate(run, args.overlap_checks, args.repeat)
+    bpy.data.objects.remove(candidate)
+    clear_collection(target)
+    return _row("overlap_checks", variant, size, measurement, population=args.overlap_population)
+
+
+def bench_drop_ticks(addon, context, sources, size, variant, args):
+    target = bench_collection(BENCH_COLLECTION_PREFIX + "Falling")
+    scene = context.scene
+    points = random_ground_points(args.drop_objects, seed=3)
+    state = {}
+
+    def setup():
+        clear_collection(target)
+        objects = []
+        for i, (x, y) in enumerate(points.tolist()):
+            obj = bpy.data.objects.new(f"{BENCH_COLLECTION_PREFIX}Drop", sources[i % len(sources)].data)
+            obj.location = (x, y, DROP_START_HEIGHT)
+            target.objects.link(obj)
+            objects.append(obj)
+        context.view_layer.update()
+        state["objects"] = objects
+
+    def run():
+        # Pro Tick: Raycast nach unten je fallendem Objekt, Schritt oder Landung, ein Depsgraph-Update
+        falling = list(state["objects"])
+        for _tick in range(args.drop_ticks):
+            depsgraph = context.evaluated_depsgraph_get()
+            still_falling = []
+            for obj in falling:
+                origin = obj.location.copy()
+                hit, location, _n, _i, _o, _m = scene.ray_cast(depsgraph, origin, Vector((0.0, 0.0, -1.0)), distance=DROP_STEP)
+                if hit:
+                    obj.location = location
+                else:
+                    obj.location.z -= DROP_STEP
+                    still_falling.append(obj)
+            falling = still_falling
+            context.view_layer.update()
+    measurement = measure_rate(run, args.drop_ticks, args.repeat, setup=setup)
+    clear_collection(target)
+    return _row("drop_ticks", variant, size, measurement, falling_objects=args.drop_objects)
+
+
+def bench_instancing(addon, context, sources, variant, args):
+    scene = context.scene
+    im_settings = scene.instance_manager_settings
+    session = bench_collection(im_settings.source_collection_basename + "_BENCH")
+    target = bench_collection(im_settings.instance_collection_name)
+    points = random_ground_points(args.instances, seed=5)
+    scatter_mod = addon.instance_operator
+
+    def setup():
+        clear_collection(session)
+        clear_collection(target)
+        for i, (x, y) in enumerate(points.tolist()):
+            obj = bpy.data.objects.new(f"{BENCH_COLLECTION_PREFIX}Marker", sources[i % len(sources)].data)
+            obj.location = (x, y, 0.0)
+            session.objects.link(obj)
+        context.view_layer.update()
+
+    def run():
+        # Wie OBJECT_OT_process_source_for_instancing_modal: Records -> (native Analyse) -> Instanzen in Batches
+        objects = list(session.objects)
+        record_set = addon.object_metadata.extract_object_records(context, objects)
+        matrices = record_set.records["matrix_world"].tolist()
+        mesh_names = [record_set.mesh_names[i] for i in record_set.records["mesh_index"].tolist()]
+        if scatter_mod.NATIVE_MODULE_AVAILABLE and scatter_mod.scatter_accel:
+            scatter_mod.scatter_accel.analyze_scatter_objects_for_processing([
+                {"name": obj.name, "mesh_name": mesh_names[i], "matrix_world": matrices[i], "has_rigidbody": False}
+                for i, obj in enumerate(record_set.objects)], processing_settings(im_settings))
+        with addon.placement_transaction.PlacementTransaction(context):
+            for obj, matrix, mesh_name in zip(record_set.objects, matrices, mesh_names):
+                instance = bpy.data.objects.new(obj.name + "_inst", bpy.data.meshes[mesh_name])
+                instance.matrix_world = Matrix(matrix)
+                addon.placement_transaction.transaction_link(instance, target)
+        bpy.data.batch_remove(objects)
+
+    rows = [_row("instancing_objects", variant, None, measure_rate(run, args.instances, args.repeat, setup=setup))]
+
+    def run_points():
+        buffer = addon.point_instancing.ScatterPointBuffer(BENCH_COLLECTION_PREFIX + "Points")
+        for obj in list(session.objects):
+            buffer.add([list(row) for row in obj.matrix_world], obj.data.name, marker_name=obj.name)
+        buffer.flush(context, target)
+
+    def setup_points():
+        setup()
+        points_obj = bpy.data.objects.get(BENCH_COLLECTION_PREFIX + "Points")
+        if points_obj is not None:
+            bpy.data.objects.remove(points_obj)
+    rows.append(_row("instancing_points", variant, None, measure_rate(run_points, args.instances, args.repeat, setup=setup_points)))
+    clear_collection(session)
+    clear_collection(target)
+    return rows
+
+
+def bench_bake_to_static(addon, context, sources, variant, args):
+    im_settings = context.scene.instance_manager_settings
+    session = bench_collection(BENCH_COLLECTION_PREFIX + "Bake")
+    static_col = bench_collection(im_settings.static_collection_name)
+    points = random_ground_points(args.bake_objects, seed=9)
+    state = {}
+
+    def setup():
+        clear_collection(session)
+        clear_collection(static_col)
+        objects = []
+        for i, (x, y) in enumerate(points.tolist()):
+            obj = bpy.data.objects.new(f"{BENCH_COLLECTION_PREFIX}Baked", sources[i % len(sources)].data)
+            obj.location = (x, y, 1.0)
+            session.objects.link(obj)
+            objects.append(obj)
+        addon.rigidbody_bulk.bulk_add_rigid_bodies(context, objects, addon.rigidbody_bulk.build_rigid_body_settings(None, 'ACTIVE'))
+        state["objects"] = objects
+
+    def run():
+        addon.static_bake.bake_objects_to_static(context, state["objects"], static_col)
+    measurement = measure_rate(run, args.bake_objects, args.repeat, setup=setup)
+    clear_collection(session)
+    clear_collection(static_col)
+    return _row("bake_to_static", variant, None, measurement)
+
+
+def run_blender_benchmarks(args):
+    addon = load_addon()
+    context = bpy.context
+    results = []
+    random.seed(0)
+    for variant, available in variants_for(args, addon):
+        if not available:
+            results.append(_row("all", variant, None, status="unavailable"))
+            continue
+        with native_mode(addon, variant == "native"):
+            for size in parse_count_list(args.ground_sizes):
+                clear_bench_data()
+                sources = build_scatter_sources(context.scene.mouse_scatter_settings)
+                vertices, triangles = synthetic_ground_arrays(size)
+                build_ground(vertices, triangles)
+                context.view_layer.update()
+                print(f"[bench] {variant}: ground {len(triangles):,} tris")
+                results.append(bench_placement(addon, context, sources, size, variant, args))
+                results.append(bench_drop_ticks(addon, context, sources, size, variant, args))
+                results.append(bench_overlap(addon, context, sources, size, variant, args))
+            clear_bench_data()
+            sources = build_scatter_sources(context.scene.mouse_scatter_settings)
+            results.extend(bench_instancing(addon, context, sources, variant, args))
+            results.append(bench_bake_to_static(addon, context, sources, variant, args))
+            clear_bench_data()
+    meta = {"blender": bpy.app.version_string, "native_available": bool(addon.NATIVE_MODULE_AVAILABLE)}
+    return results, meta
+
+
+def main(argv):
+    args = parse_args(argv)
+    if bpy is None:
+        results, meta = run_kernel_benchmarks(args)
+    else:
+        results, meta = run_blender_benchmarks(args)
+    print_results(results)
+    path = write_results(args.out, SUITE_NAME, results, run_metadata(meta))
+    print(f"[bench] Ergebnisse geschrieben: {path}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
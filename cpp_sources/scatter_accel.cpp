@@ -339,90 +339,36 @@ py::dict analyze_single_object_for_processing(
     return instruction;
 }
 
-// === BESTEHENDE FUNKTION: ANALYZE OBJECTS FOR STATIC BAKE ===
-py::list analyze_objects_for_static_bake(
-    const py::list& python_object_names,
-    const std::string& target_static_collection_name) {
-    py::list instructions;
-    py::module_ bpy_data_module; 
-    py::object bpy_data_objects;
-
-    try {
-        bpy_data_module = py::module_::import("bpy.data");
-        bpy_data_objects = bpy_data_module.attr("objects");
-    } catch (const py::error_already_set& e) {
-        if (PyErr_Occurred()) PyErr_Clear(); 
-        return instructions; 
+// === ANALYSE AUF OBJEKT-RECORDS: STATIC BAKE ===
+// Arbeitet nur auf dem Record-Array aus object_metadata.extract_object_records, kein Zugriff auf bpy.
+py::array_t<uint8_t> analyze_static_bake_records_cpp(
+    py::array_t<ObjectRecord, py::array::c_style | py::array::forcecast> records,
+    uint64_t static_collection_mask) {
+    if (records.ndim() != 1) {
+        throw std::runtime_error("analyze_static_bake_records_cpp: records must be a 1D array.");
     }
-
-    for (const auto& name_handle : python_object_names) {
-        std::string obj_name;
-        try {
-            obj_name = name_handle.cast<std::string>();
-        } catch (const py::cast_error&) {
-            continue; 
-        }
-
-        py::object obj;
-        try {
-            obj = bpy_data_objects.attr("get")(obj_name);
-        } catch (const py::error_already_set& e) {
-            if (PyErr_Occurred()) PyErr_Clear();
-            continue; 
-        }
-        
-        if (obj.is_none()) continue; 
-
-        py::dict instruction;
-        instruction["name"] = obj_name;
-
-        bool needs_single_user = false;
-        try {
-            py::object obj_data = obj.attr("data");
-            if (!obj_data.is_none()) { 
-                py::object users_attr = obj_data.attr("users"); 
-                if (!users_attr.is_none() && users_attr.cast<int>() > 1) {
-                    needs_single_user = true;
-                }
-            }
-        } catch (const py::error_already_set& e) { if (PyErr_Occurred()) PyErr_Clear(); }
-        catch (const std::exception&) {} 
-        instruction["needs_make_single_user"] = needs_single_user;
-
-        bool has_rigidbody = false;
-        try {
-            py::object rb = obj.attr("rigid_body");
-            if (!rb.is_none()) {
-                has_rigidbody = true;
+    const py::ssize_t count = records.shape(0);
+    py::array_t<uint8_t> actions(count);
+    const ObjectRecord* in = records.data();
+    uint8_t* out = actions.mutable_data();
+    {
+        py::gil_scoped_release release;
+        for (py::ssize_t i = 0; i < count; ++i) {
+            const ObjectRecord& rec = in[i];
+            if (!(rec.flags & RECORD_IS_MESH)) {
+                out[i] = BAKE_SKIP;
+                continue;
             }
-        } catch (const py::error_already_set& e) { if (PyErr_Occurred()) PyErr_Clear(); }
-        catch (const std::exception&) {}
-        instruction["has_rigidbody"] = has_rigidbody;
-
-        instruction["target_collection"] = target_static_collection_name;
-
-        py::list current_collections_py;
-        try {
-            py::object users_collection_attr = obj.attr("users_collection");
-            if(!users_collection_attr.is_none()){
-                for (const auto& col_handle : users_collection_attr) {
-                    try {
-                        py::object col = col_handle.cast<py::object>();
-                        if (!col.is_none()) {
-                            current_collections_py.append(col.attr("name").cast<std::string>());
-                        }
-                    } catch (const py::error_already_set& e) { if (PyErr_Occurred()) PyErr_Clear(); }
-                    catch (const std::exception&) {}
-                }
-            }
-        } catch (const py::error_already_set& e) { if (PyErr_Occurred()) PyErr_Clear(); }
-        catch (const std::exception&) {}
-        instruction["current_collections"] = current_collections_py;
-
-        instructions.append(instruction);
+            uint8_t action = 0;
+            if (rec.users > 1) action |= BAKE_NEEDS_SINGLE_USER;
+            if (rec.flags & RECORD_HAS_RIGIDBODY) action |= BAKE_REMOVE_RIGIDBODY;
+            const bool in_static = (rec.collection_mask & static_collection_mask) != 0;
+            const bool in_other = (rec.collection_mask & ~static_collection_mask) != 0;
+            if (in_other || !in_static) action |= BAKE_MOVE_COLLECTION;
+            out[i] = action;
+        }
     }
-
-    return instructions;
+    return actions;
 }
 
 // === START: GARBAGE COLLECTION FUNKTIONEN ===
@@ -461,109 +407,33 @@ void flush_marked_objects_cpp(py::object bpy_data_objects_param) {
 // === ENDE: GARBAGE COLLECTION FUNKTIONEN ===
 
 // === START: FUNKTIONEN FÜR ENHANCED PHYSICS BAKE ===
-py::list analyze_objects_for_rb_setup_cpp(const py::list& object_names_py) {
-    py::list analysis_results_py;
-    py::module_ bpy_data;
-    py::object bpy_data_objects;
-    try {
-        bpy_data = py::module_::import("bpy.data");
-        bpy_data_objects = bpy_data.attr("objects");
-    } catch (const py::error_already_set& e) {
-        if (PyErr_Occurred()) PyErr_Clear();
-        return analysis_results_py; 
+// managed_collection_mask: nur Objekte in diesen Collections brauchen eigene Mesh-Daten (0 = alle).
+py::array_t<uint8_t> analyze_rb_setup_records_cpp(
+    py::array_t<ObjectRecord, py::array::c_style | py::array::forcecast> records,
+    uint64_t managed_collection_mask) {
+    if (records.ndim() != 1) {
+        throw std::runtime_error("analyze_rb_setup_records_cpp: records must be a 1D array.");
     }
-
-    for (const auto& name_handle : object_names_py) {
-        std::string obj_name;
-        try {
-            obj_name = name_handle.cast<std::string>();
-        } catch (const py::cast_error& e) {
-            continue; 
-        }
-
-        py::object obj;
-        try {
-            obj = bpy_data_objects.attr("get")(obj_name);
-        } catch (const py::error_already_set& e) { 
-            if (PyErr_Occurred()) PyErr_Clear();
-            continue; 
-        }
-        
-        if (obj.is_none()) {
-            continue; 
-        }
-
-        py::dict result_dict;
-        result_dict["name"] = obj_name;
-
-        bool needs_single_user = false;
-        try {
-            py::object obj_data = obj.attr("data");
-            if (!obj_data.is_none()) {
-                py::object users_val = obj_data.attr("users");
-                if (!users_val.is_none()) { 
-                    if (users_val.cast<int>() > 1) {
-                        needs_single_user = true;
-                    }
-                }
+    const py::ssize_t count = records.shape(0);
+    py::array_t<uint8_t> actions(count);
+    const ObjectRecord* in = records.data();
+    uint8_t* out = actions.mutable_data();
+    {
+        py::gil_scoped_release release;
+        for (py::ssize_t i = 0; i < count; ++i) {
+            const ObjectRecord& rec = in[i];
+            if (!(rec.flags & RECORD_IS_MESH)) {
+                out[i] = RB_SETUP_SKIP;
+                continue;
             }
-        } catch (const py::error_already_set& e) { if (PyErr_Occurred()) PyErr_Clear(); }
-        catch (const std::exception& )   { }
-        result_dict["needs_make_single_user"] = needs_single_user;
-
-        py::object rb = py::none(); 
-        try {
-            if (py::hasattr(obj, "rigid_body")) { 
-                rb = obj.attr("rigid_body"); 
-            }
-        } catch (const py::error_already_set& e) { if (PyErr_Occurred()) PyErr_Clear(); }
-        catch (const std::exception& )   {}
-
-        if (rb.is_none()) {
-            result_dict["has_rigidbody_component"] = false;
-            result_dict["original_rb_settings"] = py::none();
-        } else {
-            result_dict["has_rigidbody_component"] = true;
-            py::dict original_settings_dict;
-            try {
-                auto get_attr_safe_str = [&](const py::object& o, const char* attr_name, const std::string& def_val) {
-                    if (py::hasattr(o, attr_name)) {
-                        py::object attr_val = o.attr(attr_name);
-                        if (!attr_val.is_none()) return attr_val.cast<std::string>();
-                    } return def_val; };
-                auto get_attr_safe_float = [&](const py::object& o, const char* attr_name, float def_val) {
-                    if (py::hasattr(o, attr_name)) {
-                        py::object attr_val = o.attr(attr_name);
-                        if (!attr_val.is_none()) return attr_val.cast<float>();
-                    } return def_val; };
-                auto get_attr_safe_bool = [&](const py::object& o, const char* attr_name, bool def_val) {
-                    if (py::hasattr(o, attr_name)) {
-                        py::object attr_val = o.attr(attr_name);
-                        if (!attr_val.is_none()) return attr_val.cast<bool>();
-                    } return def_val; };
-                
-                original_settings_dict["type"] = get_attr_safe_str(rb, "type", "ACTIVE");
-                original_settings_dict["mass"] = get_attr_safe_float(rb, "mass", 1.0f);
-                original_settings_dict["collision_shape"] = get_attr_safe_str(rb, "collision_shape", "CONVEX_HULL");
-                original_settings_dict["collision_margin"] = get_attr_safe_float(rb, "collision_margin", 0.04f);
-                original_settings_dict["linear_damping"] = get_attr_safe_float(rb, "linear_damping", 0.1f);
-                original_settings_dict["angular_damping"] = get_attr_safe_float(rb, "angular_damping", 0.1f);
-                original_settings_dict["kinematic"] = get_attr_safe_bool(rb, "kinematic", false);
-                original_settings_dict["enabled"] = get_attr_safe_bool(rb, "enabled", true); 
-                original_settings_dict["use_deactivation"] = get_attr_safe_bool(rb, "use_deactivation", true);
-                original_settings_dict["use_start_deactivated"] = get_attr_safe_bool(rb, "use_start_deactivated", false);
-                if (py::hasattr(rb, "friction")) original_settings_dict["friction"] = get_attr_safe_float(rb, "friction", 0.5f);
-                if (py::hasattr(rb, "restitution")) original_settings_dict["restitution"] = get_attr_safe_float(rb, "restitution", 0.5f);
-
-            } catch (const py::error_already_set& e) { if (PyErr_Occurred()) PyErr_Clear(); original_settings_dict.clear(); }
-            catch (const std::exception& ) { original_settings_dict.clear(); }
-            
-            if (!original_settings_dict.empty()) { result_dict["original_rb_settings"] = original_settings_dict; }
-            else { result_dict["original_rb_settings"] = py::none(); }
+            uint8_t action = 0;
+            const bool managed = managed_collection_mask == 0 || (rec.collection_mask & managed_collection_mask) != 0;
+            if (managed && rec.users > 1) action |= RB_SETUP_NEEDS_SINGLE_USER;
+            if (rec.flags & RECORD_HAS_RIGIDBODY) action |= RB_SETUP_HAS_COMPONENT;
+            out[i] = action;
         }
-        analysis_results_py.append(result_dict);
     }
-    return analysis_results_py;
+    return actions;
 }
 
 bool configure_batch_rigidbody_properties_cpp(
@@ -696,66 +566,149 @@ GpuVertexData generate_circle_marker_gpu_data_cpp(float radius, int segments) {
     return {positions_py, indices_py};
 }
 
+// === GPU-DATENAUFBEREITUNG (GpuVertexData / MasterMeshData): ein Durchlauf statt Kopie + Einzelprüfung ===
+// Positionen und Indizes werden nicht kopiert: forcecast reicht float32/int32-Arrays, die bereits C-contiguous
+// sind (foreach_get-Puffer), unverändert durch; die Ergebnisse sind (N,3)-Views mit dem Eingabe-Array als base.
+// Die Indizes werden einmal per min/max geprüft; danach sind alle >= 0 und die int32-Daten lassen sich als
+// uint32 lesen. AABB, Bounding Sphere und flächengewichtete Vertex-Normalen entstehen im selben Durchlauf.
+namespace {
+
+void validate_index_range(const int* indices, size_t count, size_t num_vertices, bool check_upper) {
+    if (count == 0) return;
+    int lowest = indices[0];
+    int highest = indices[0];
+    for (size_t i = 1; i < count; ++i) {
+        lowest = std::min(lowest, indices[i]);
+        highest = std::max(highest, indices[i]);
+    }
+    if (lowest < 0) {
+        throw std::runtime_error("Negative vertex index found: " + std::to_string(lowest));
+    }
+    if (check_upper && static_cast<size_t>(highest) >= num_vertices) {
+        throw std::runtime_error("Vertex index " + std::to_string(highest) +
+                                 " is out of bounds for " + std::to_string(num_vertices) + " vertices.");
+    }
+}
+
+template <typename T>
+py::array_t<T> rows_view(const T* data, size_t rows, size_t cols, py::handle base) {
+    // Kein Kopieren: base hält das Eingabe-Array am Leben, solange die View existiert
+    return py::array_t<T>(
+        std::vector<py::ssize_t>{static_cast<py::ssize_t>(rows), static_cast<py::ssize_t>(cols)},
+        std::vector<py::ssize_t>{static_cast<py::ssize_t>(cols * sizeof(T)), static_cast<py::ssize_t>(sizeof(T))},
+        data, base);
+}
+
+py::array_t<float> empty_rows(py::ssize_t cols) {
+    return py::array_t<float>(std::vector<py::ssize_t>{0, cols});
+}
+
+void compute_bounds_and_normals(const float* positions, size_t num_vertices,
+                                const int* indices, size_t num_triangles,
+                                MeshBounds& bounds, py::array_t<float>& normals_out)
+{
+    normals_out = py::array_t<float>(std::vector<py::ssize_t>{static_cast<py::ssize_t>(num_vertices), 3});
+    if (num_vertices == 0) return;
+    float* normals = normals_out.mutable_data();
+    std::fill(normals, normals + num_vertices * 3, 0.0f);
+
+    // AABB
+    for (int k = 0; k < 3; ++k) {
+        bounds.bbox_min[k] = bounds.bbox_max[k] = positions[k];
+    }
+    for (size_t v = 1; v < num_vertices; ++v) {
+        const float* p = positions + v * 3;
+        for (int k = 0; k < 3; ++k) {
+            bounds.bbox_min[k] = std::min(bounds.bbox_min[k], p[k]);
+            bounds.bbox_max[k] = std::max(bounds.bbox_max[k], p[k]);
+        }
+    }
+
+    // Unnormiertes Kreuzprodukt = doppelte Dreiecksfläche -> große Dreiecke gewichten stärker
+    for (size_t t = 0; t < num_triangles; ++t) {
+        const int a = indices[t * 3], b = indices[t * 3 + 1], c = indices[t * 3 + 2];
+        const float* pa = positions + static_cast<size_t>(a) * 3;
+        const float* pb = positions + static_cast<size_t>(b) * 3;
+        const float* pc = positions + static_cast<size_t>(c) * 3;
+        const float e1[3] = {pb[0] - pa[0], pb[1] - pa[1], pb[2] - pa[2]};
+        const float e2[3] = {pc[0] - pa[0], pc[1] - pa[1], pc[2] - pa[2]};
+        const float n[3] = {e1[1] * e2[2] - e1[2] * e2[1],
+                            e1[2] * e2[0] - e1[0] * e2[2],
+                            e1[0] * e2[1] - e1[1] * e2[0]};
+        for (const int vi : {a, b, c}) {
+            float* dst = normals + static_cast<size_t>(vi) * 3;
+            dst[0] += n[0]; dst[1] += n[1]; dst[2] += n[2];
+        }
+    }
+
+    // Normieren + Radius der Bounding Sphere um die AABB-Mitte
+    for (int k = 0; k < 3; ++k) {
+        bounds.sphere_center[k] = 0.5f * (bounds.bbox_min[k] + bounds.bbox_max[k]);
+    }
+    float max_dist_sq = 0.0f;
+    for (size_t v = 0; v < num_vertices; ++v) {
+        float* n = normals + v * 3;
+        const float length = std::sqrt(n[0] * n[0] + n[1] * n[1] + n[2] * n[2]);
+        if (length > 0.0f) {
+            n[0] /= length; n[1] /= length; n[2] /= length;
+        }
+        const float* p = positions + v * 3;
+        const float dx = p[0] - bounds.sphere_center[0];
+        const float dy = p[1] - bounds.sphere_center[1];
+        const float dz = p[2] - bounds.sphere_center[2];
+        max_dist_sq = std::max(max_dist_sq, dx * dx + dy * dy + dz * dz);
+    }
+    bounds.sphere_radius = std::sqrt(max_dist_sq);
+}
+
+} // namespace
+
 GpuVertexData prepare_mesh_gpu_data_from_flat_arrays_cpp(
     py::array_t<float, py::array::c_style | py::array::forcecast> flat_vertex_cos_py,
     py::array_t<int, py::array::c_style | py::array::forcecast> flat_loop_triangle_indices_py,
     size_t num_actual_vertices,
     size_t num_loop_triangles)
 {
-    py::buffer_info co_buf_info = flat_vertex_cos_py.request();
-    py::buffer_info idx_buf_info = num_loop_triangles > 0 ? flat_loop_triangle_indices_py.request() : py::buffer_info();
-    
+    GpuVertexData data;
+
     // Fall: Keine Vertices
     if (num_actual_vertices == 0) {
-        py::array_t<float> empty_pos(std::vector<py::ssize_t>{0, static_cast<py::ssize_t>(3)}); // KORRIGIERT
-        py::array_t<unsigned int> empty_idx(std::vector<py::ssize_t>{0, static_cast<py::ssize_t>(3)}); // KORRIGIERT
-        return {empty_pos, empty_idx};
+        data.positions = empty_rows(3);
+        data.indices = py::array_t<unsigned int>(std::vector<py::ssize_t>{0, 3});
+        data.normals = empty_rows(3);
+        return data;
     }
 
     // Überprüfe die Größe des Koordinaten-Buffers
-    if (co_buf_info.ndim != 1 || static_cast<size_t>(co_buf_info.shape[0]) != num_actual_vertices * 3) { 
+    py::buffer_info co_buf_info = flat_vertex_cos_py.request();
+    if (co_buf_info.ndim != 1 || static_cast<size_t>(co_buf_info.shape[0]) != num_actual_vertices * 3) {
         throw std::runtime_error("Mismatch: num_actual_vertices*3 (" + std::to_string(num_actual_vertices * 3) +
                                  ") != coordinate array size (" + std::to_string(co_buf_info.shape[0]) + ") or not 1D.");
     }
-
-    // Positionen erstellen
-    py::array_t<float> positions_py_shaped(std::vector<py::ssize_t>{static_cast<py::ssize_t>(num_actual_vertices), static_cast<py::ssize_t>(3)}); // KORRIGIERT
-    float* pos_shaped_ptr = static_cast<float*>(positions_py_shaped.request().ptr);
     const float* co_src_ptr = static_cast<const float*>(co_buf_info.ptr);
-    std::memcpy(pos_shaped_ptr, co_src_ptr, num_actual_vertices * 3 * sizeof(float));
-
 
-    // Indizes erstellen
-    py::array_t<unsigned int> indices_py_shaped_typed;
+    // Indizes prüfen (einmal min/max) und als uint32-View weiterreichen
+    const int* idx_src_ptr = nullptr;
     if (num_loop_triangles > 0) {
-        // Überprüfe die Größe des Index-Buffers (nur wenn idx_buf_info gültig ist)
-        if (idx_buf_info.ndim != 1 || static_cast<size_t>(idx_buf_info.shape[0]) != num_loop_triangles * 3) { 
+        py::buffer_info idx_buf_info = flat_loop_triangle_indices_py.request();
+        if (idx_buf_info.ndim != 1 || static_cast<size_t>(idx_buf_info.shape[0]) != num_loop_triangles * 3) {
             throw std::runtime_error("Mismatch: num_loop_triangles*3 (" + std::to_string(num_loop_triangles * 3) +
                                      ") != index array size (" + std::to_string(idx_buf_info.shape[0]) + ") or not 1D.");
         }
-        const int* idx_src_ptr = static_cast<const int*>(idx_buf_info.ptr);
-
-        indices_py_shaped_typed = py::array_t<unsigned int>(std::vector<py::ssize_t>{static_cast<py::ssize_t>(num_loop_triangles), static_cast<py::ssize_t>(3)}); // KORRIGIERT
-        unsigned int* idx_shaped_ptr = static_cast<unsigned int*>(indices_py_shaped_typed.request().ptr);
-
-        for (size_t i = 0; i < num_loop_triangles * 3; ++i) {
-            if (idx_src_ptr[i] < 0) {
-                throw std::runtime_error("Negative vertex index found: " + std::to_string(idx_src_ptr[i]));
-            }
-            if (static_cast<size_t>(idx_src_ptr[i]) >= num_actual_vertices) {
-                 throw std::runtime_error("Vertex index " + std::to_string(idx_src_ptr[i]) +
-                                         " is out of bounds for " + std::to_string(num_actual_vertices) + " vertices.");
-            }
-            idx_shaped_ptr[i] = static_cast<unsigned int>(idx_src_ptr[i]);
-        }
-    } else { 
-        indices_py_shaped_typed = py::array_t<unsigned int>(std::vector<py::ssize_t>{0, static_cast<py::ssize_t>(3)}); // KORRIGIERT
+        idx_src_ptr = static_cast<const int*>(idx_buf_info.ptr);
+        validate_index_range(idx_src_ptr, num_loop_triangles * 3, num_actual_vertices, true);
+        data.indices = rows_view(reinterpret_cast<const unsigned int*>(idx_src_ptr), num_loop_triangles, 3,
+                                 flat_loop_triangle_indices_py);
+    } else {
+        data.indices = py::array_t<unsigned int>(std::vector<py::ssize_t>{0, 3});
     }
 
-    return {positions_py_shaped, indices_py_shaped_typed};
+    data.positions = rows_view(co_src_ptr, num_actual_vertices, 3, flat_vertex_cos_py);
+    compute_bounds_and_normals(co_src_ptr, num_actual_vertices, idx_src_ptr,
+                               idx_src_ptr ? num_loop_triangles : 0, data.bounds, data.normals);
+    return data;
 }
 
-// === NEUE FUNKTION FÜR GPU-DATENAUFBEREITUNG (MasterMeshData) ===
 MasterMeshData prepare_master_mesh_data_from_py_arrays_cpp(
     py::array_t<float, py::array::c_style | py::array::forcecast> flat_vertex_cos_py,
     py::array_t<float, py::array::c_style | py::array::forcecast> flat_vertex_uvs_py,
@@ -766,57 +719,53 @@ MasterMeshData prepare_master_mesh_data_from_py_arrays_cpp(
     MasterMeshData data;
 
     // Positions
-    py::buffer_info co_buf_info = flat_vertex_cos_py.request();
+    const float* co_src_ptr = nullptr;
     if (num_actual_vertices > 0) {
+        py::buffer_info co_buf_info = flat_vertex_cos_py.request();
         if (co_buf_info.ndim != 1 || static_cast<size_t>(co_buf_info.shape[0]) != num_actual_vertices * 3) {
-            throw std::runtime_error("Position data size mismatch. Expected " + 
-                                     std::to_string(num_actual_vertices * 3) + " floats, got " + 
+            throw std::runtime_error("Position data size mismatch. Expected " +
+                                     std::to_string(num_actual_vertices * 3) + " floats, got " +
                                      std::to_string(co_buf_info.shape[0]));
         }
-        data.positions = py::array_t<float>(std::vector<py::ssize_t>{static_cast<py::ssize_t>(num_actual_vertices), 3});
-        std::memcpy(data.positions.mutable_data(), co_buf_info.ptr, num_actual_vertices * 3 * sizeof(float));
+        co_src_ptr = static_cast<const float*>(co_buf_info.ptr);
+        data.positions = rows_view(co_src_ptr, num_actual_vertices, 3, flat_vertex_cos_py);
     } else {
-        data.positions = py::array_t<float>(std::vector<py::ssize_t>{0, 3});
+        data.positions = empty_rows(3);
     }
 
-    // UVs
+    // UVs (View, wenn gültig; sonst (0,0))
     if (num_actual_vertices > 0) {
         py::buffer_info uv_buf_info = flat_vertex_uvs_py.request();
-        // Check if the UV array contains valid data or is empty/invalid
-        if (uv_buf_info.ptr != nullptr && uv_buf_info.ndim == 1 && 
+        if (uv_buf_info.ptr != nullptr && uv_buf_info.ndim == 1 &&
             static_cast<size_t>(uv_buf_info.shape[0]) == num_actual_vertices * 2) {
-            data.uvs = py::array_t<float>(std::vector<py::ssize_t>{static_cast<py::ssize_t>(num_actual_vertices), 2});
-            std::memcpy(data.uvs.mutable_data(), uv_buf_info.ptr, num_actual_vertices * 2 * sizeof(float));
-        } else { 
-            // py::print("ScatterAccel Warning: UV data is missing or has incorrect dimensions for master mesh. Using default (0,0) UVs.");
+            data.uvs = rows_view(static_cast<const float*>(uv_buf_info.ptr), num_actual_vertices, 2, flat_vertex_uvs_py);
+        } else {
             data.uvs = py::array_t<float>(std::vector<py::ssize_t>{static_cast<py::ssize_t>(num_actual_vertices), 2});
             std::memset(data.uvs.mutable_data(), 0, num_actual_vertices * 2 * sizeof(float));
         }
-    } else { 
-        data.uvs = py::array_t<float>(std::vector<py::ssize_t>{0, 2});
+    } else {
+        data.uvs = empty_rows(2);
     }
 
     // Indices
-    py::buffer_info idx_buf_info = flat_loop_triangle_indices_py.request();
+    const int* idx_src_ptr = nullptr;
     if (num_loop_triangles > 0) {
+        py::buffer_info idx_buf_info = flat_loop_triangle_indices_py.request();
         if (idx_buf_info.ndim != 1 || static_cast<size_t>(idx_buf_info.shape[0]) != num_loop_triangles * 3) {
-            throw std::runtime_error("Index data size mismatch. Expected " + 
-                                     std::to_string(num_loop_triangles * 3) + " ints, got " + 
+            throw std::runtime_error("Index data size mismatch. Expected " +
+                                     std::to_string(num_loop_triangles * 3) + " ints, got " +
                                      std::to_string(idx_buf_info.shape[0]));
         }
-        data.indices = py::array_t<unsigned int>(std::vector<py::ssize_t>{static_cast<py::ssize_t>(num_loop_triangles), 3});
-        unsigned int* out_idx_ptr = data.indices.mutable_data();
-        const int* in_idx_ptr = static_cast<const int*>(idx_buf_info.ptr);
-        for (size_t i = 0; i < num_loop_triangles * 3; ++i) {
-            if (in_idx_ptr[i] < 0 || (num_actual_vertices > 0 && static_cast<size_t>(in_idx_ptr[i]) >= num_actual_vertices) ) {
-                 throw std::runtime_error("Invalid vertex index " + std::to_string(in_idx_ptr[i]) + 
-                                         " for " + std::to_string(num_actual_vertices) + " vertices.");
-            }
-            out_idx_ptr[i] = static_cast<unsigned int>(in_idx_ptr[i]);
-        }
+        idx_src_ptr = static_cast<const int*>(idx_buf_info.ptr);
+        validate_index_range(idx_src_ptr, num_loop_triangles * 3, num_actual_vertices, num_actual_vertices > 0);
+        data.indices = rows_view(reinterpret_cast<const unsigned int*>(idx_src_ptr), num_loop_triangles, 3,
+                                 flat_loop_triangle_indices_py);
     } else {
         data.indices = py::array_t<unsigned int>(std::vector<py::ssize_t>{0, 3});
     }
+
+    compute_bounds_and_normals(co_src_ptr, num_actual_vertices, idx_src_ptr,
+                               (co_src_ptr && idx_src_ptr) ? num_loop_triangles : 0, data.bounds, data.normals);
     return data;
 }
 
@@ -1039,18 +988,56 @@ void GpuInstancer::set_ghost_mode(bool enabled, int ghost_instance_index) {
     // implementiert (z.B. Alpha-Blending für die Ghost-Instance)
 }
 
+// === VERSION UND FÄHIGKEITEN ===
+// Die Python-Seite (kernel_backends.py) wählt pro Kernel das schnellste verfügbare Backend. Das Modul meldet
+// hier, welche Kernel es mit welcher Funktion und Stufe bereitstellt ("NATIVE" oder "NATIVE_THREADED").
+// Neue oder parallelisierte Kernel brauchen nur einen Eintrag hier, keine Änderung an den Python-Aufrufstellen.
+py::list capabilities() {
+    static const char* const table[][3] = {
+        {"processing.analyze_batch", "analyze_scatter_objects_for_processing", "NATIVE"},
+        {"processing.analyze_single", "analyze_single_object_for_processing", "NATIVE"},
+        {"transforms.random", "calculate_random_transforms_cpp", "NATIVE"},
+        {"records.static_bake", "analyze_static_bake_records_cpp", "NATIVE"},
+        {"records.rb_setup", "analyze_rb_setup_records_cpp", "NATIVE"},
+        {"rigidbody.configure_batch", "configure_batch_rigidbody_properties_cpp", "NATIVE"},
+        {"gpu.circle_marker", "generate_circle_marker_gpu_data_cpp", "NATIVE"},
+        {"gpu.mesh_data", "prepare_mesh_gpu_data_from_flat_arrays_cpp", "NATIVE"},
+    };
+    py::list result;
+    for (const auto& row : table) {
+        result.append(py::make_tuple(row[0], row[1], row[2]));
+    }
+    return result;
+}
+
 } // namespace ScatterAccelImpl
 
+// MeshBounds-Felder als Tupel (x, y, z) für Python
+static py::tuple bounds_vec3(const float (&v)[3]) {
+    return py::make_tuple(v[0], v[1], v[2]);
+}
+
 // Modul-Definition
 PYBIND11_MODULE(scatter_accel, m) {
     m.doc() = "Native C++ acceleration module for Physical Layout Tool (EXEGET Addon)";
+    m.attr("NATIVE_API_VERSION") = ScatterAccelImpl::NATIVE_API_VERSION;
+    m.def("capabilities", &ScatterAccelImpl::capabilities,
+        "Returns (kernel, function_name, backend) tuples for every kernel this build provides (see kernel_backends.py).");
+
+    PYBIND11_NUMPY_DTYPE(ScatterAccelImpl::ObjectRecord, matrix_world, mesh_index, users, collection_mask, flags, rb_type);
 
     // Binding for GpuVertexData (existing)
     py::class_<ScatterAccelImpl::GpuVertexData>(m, "GpuVertexData", "Container for GPU-ready vertex and index data.")
         .def_property_readonly("positions", [](const ScatterAccelImpl::GpuVertexData &s) { return s.positions; }, 
                             "NumPy array (float32, Nx3) of vertex positions.")
         .def_property_readonly("indices", [](const ScatterAccelImpl::GpuVertexData &s) { return s.indices; },
-                            "NumPy array (uint32, MxK) of vertex indices (K=2 for lines, K=3 for triangles).");
+                            "NumPy array (uint32, MxK) of vertex indices (K=2 for lines, K=3 for triangles).")
+        .def_property_readonly("normals", [](const ScatterAccelImpl::GpuVertexData &s) { return s.normals; },
+                            "NumPy array (float32, Nx3) of area-weighted unit vertex normals (mesh data only).")
+        .def_property_readonly("bbox_min", [](const ScatterAccelImpl::GpuVertexData &s) { return bounds_vec3(s.bounds.bbox_min); })
+        .def_property_readonly("bbox_max", [](const ScatterAccelImpl::GpuVertexData &s) { return bounds_vec3(s.bounds.bbox_max); })
+        .def_property_readonly("sphere_center", [](const ScatterAccelImpl::GpuVertexData &s) { return bounds_vec3(s.bounds.sphere_center); })
+        .def_property_readonly("sphere_radius", [](const ScatterAccelImpl::GpuVertexData &s) { return s.bounds.sphere_radius; });
 
     // Existing function bindings
     m.def("analyze_objects", &ScatterAccelImpl::analyze_objects, 
@@ -1069,9 +1056,9 @@ PYBIND11_MODULE(scatter_accel, m) {
         py::arg("single_object_data"), py::arg("processing_settings"),
         "Analyzes a single scatter object's data for on-the-fly processing and returns an instruction dict.");
 
-    m.def("analyze_objects_for_static_bake", &ScatterAccelImpl::analyze_objects_for_static_bake, 
-        py::arg("object_names"), py::arg("target_static_collection_name"),
-        "Analyzes specified Blender objects for static baking, checking data users and Rigid Body status.");
+    m.def("analyze_static_bake_records_cpp", &ScatterAccelImpl::analyze_static_bake_records_cpp,
+        py::arg("records"), py::arg("static_collection_mask"),
+        "Analyzes object records (object_metadata.OBJECT_RECORD_DTYPE) for static baking. Returns uint8 BAKE_* action bits per record.");
 
     m.def("mark_for_deletion_cpp", &ScatterAccelImpl::mark_for_deletion_cpp, 
         py::arg("marker_name"), 
@@ -1084,9 +1071,9 @@ PYBIND11_MODULE(scatter_accel, m) {
         py::arg("bpy_data_objects"),
         "Deletes all objects in Blender that were previously marked by mark_for_deletion_cpp. Requires bpy.data.objects.");
 
-    m.def("analyze_objects_for_rb_setup_cpp", &ScatterAccelImpl::analyze_objects_for_rb_setup_cpp, 
-        py::arg("object_names_py"),
-        "Analyzes specified Blender objects for Rigid Body setup, returning their current RB state and data user count.");
+    m.def("analyze_rb_setup_records_cpp", &ScatterAccelImpl::analyze_rb_setup_records_cpp,
+        py::arg("records"), py::arg("managed_collection_mask") = 0,
+        "Analyzes object records (object_metadata.OBJECT_RECORD_DTYPE) for Rigid Body setup. Returns uint8 RB_SETUP_* action bits per record.");
     m.def("configure_batch_rigidbody_properties_cpp", &ScatterAccelImpl::configure_batch_rigidbody_properties_cpp, 
         py::arg("object_names_py"), py::arg("target_rb_settings_py"),
         "Configures Rigid Body properties for a batch of specified Blender objects based on target settings.");
@@ -1100,7 +1087,7 @@ PYBIND11_MODULE(scatter_accel, m) {
         py::arg("flat_loop_triangle_indices_py").noconvert(), 
         py::arg("num_actual_vertices"), 
         py::arg("num_loop_triangles"),
-        "Prepares mesh data from flat Blender C-contiguous NumPy arrays into GPU-ready shaped NumPy arrays (positions Nx3, indices Mx3). Returns GpuVertexData.");
+        "Prepares mesh data from flat Blender C-contiguous NumPy arrays into GPU-ready shaped views (positions Nx3, indices Mx3; no copy) plus vertex normals and bounds. Returns GpuVertexData.");
 
     // New binding for prepare_master_mesh_data_from_py_arrays_cpp
     m.def("prepare_master_mesh_data_from_py_arrays_cpp", &ScatterAccelImpl::prepare_master_mesh_data_from_py_arrays_cpp,
@@ -1116,7 +1103,12 @@ PYBIND11_MODULE(scatter_accel, m) {
         .def(py::init<>()) 
         .def_readwrite("positions", &ScatterAccelImpl::MasterMeshData::positions)
         .def_readwrite("uvs", &ScatterAccelImpl::MasterMeshData::uvs)
-        .def_readwrite("indices", &ScatterAccelImpl::MasterMeshData::indices);
+        .def_readwrite("indices", &ScatterAccelImpl::MasterMeshData::indices)
+        .def_readonly("normals", &ScatterAccelImpl::MasterMeshData::normals)
+        .def_property_readonly("bbox_min", [](const ScatterAccelImpl::MasterMeshData &s) { return bounds_vec3(s.bounds.bbox_min); })
+        .def_property_readonly("bbox_max", [](const ScatterAccelImpl::MasterMeshData &s) { return bounds_vec3(s.bounds.bbox_max); })
+        .def_property_readonly("sphere_center", [](const ScatterAccelImpl::MasterMeshData &s) { return bounds_vec3(s.bounds.sphere_center); })
+        .def_property_readonly("sphere_radius", [](const ScatterAccelImpl::MasterMeshData &s) { return s.bounds.sphere_radius; });
 
     // New binding for GpuInstancer Klasse
     py::class_<ScatterAccelImpl::GpuInstancer>(m, "GpuInstancer", "Manages GPU resources for instanced drawing.")
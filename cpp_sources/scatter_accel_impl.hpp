@@ -5,6 +5,7 @@
 #include <pybind11/stl.h>
 #include <pybind11/numpy.h>
 #include <vector>
+#include <cstdint>
 #include <string>
 #include <stdexcept> // Für std::runtime_error
 
@@ -24,10 +25,20 @@ namespace py = pybind11;
 
 namespace ScatterAccelImpl {
 
+// --- BOUNDS AUS DER MESH-AUFBEREITUNG (im selben Durchlauf wie Index-Prüfung und Normalen) ---
+struct MeshBounds {
+    float bbox_min[3] = {0.0f, 0.0f, 0.0f};
+    float bbox_max[3] = {0.0f, 0.0f, 0.0f};
+    float sphere_center[3] = {0.0f, 0.0f, 0.0f}; // AABB-Mitte
+    float sphere_radius = 0.0f;                  // größter Abstand eines Vertex zur Mitte
+};
+
 // --- BESTEHENDE STRUKTUREN ---
 struct GpuVertexData { // Deine bestehende Struktur
-    py::array_t<float> positions;
-    py::array_t<unsigned int> indices;
+    py::array_t<float> positions;       // Nx3, View auf das Eingabe-Array (keine Kopie bei float32/C-contiguous)
+    py::array_t<unsigned int> indices;  // Mx3, View auf das (geprüfte) int32-Eingabe-Array
+    py::array_t<float> normals;         // Nx3, flächengewichtete Vertex-Normalen (leer bei Linien-Daten)
+    MeshBounds bounds;
 };
 
 // --- NEUE STRUKTUR für Master Mesh Daten (inkl. UVs) ---
@@ -35,8 +46,35 @@ struct MasterMeshData {
     py::array_t<float> positions; // Nx3 (x,y,z)
     py::array_t<float> uvs;       // Nx2 (u,v)
     py::array_t<unsigned int> indices; // Mx3 (Dreiecks-Indizes)
+    py::array_t<float> normals;   // Nx3
+    MeshBounds bounds;
+};
+
+// --- OBJEKT-METADATEN (Record-Layout identisch zu object_metadata.OBJECT_RECORD_DTYPE, align=True) ---
+struct ObjectRecord {
+    float matrix_world[4][4];
+    int32_t mesh_index;
+    int32_t users;
+    uint64_t collection_mask;
+    uint8_t flags;
+    uint8_t rb_type;
 };
 
+// Record-Flags (object_metadata.RECORD_*)
+constexpr uint8_t RECORD_IS_MESH = 1;
+constexpr uint8_t RECORD_HAS_RIGIDBODY = 2;
+constexpr uint8_t RECORD_RB_ENABLED = 4;
+constexpr uint8_t RECORD_RB_KINEMATIC = 8;
+
+// Ergebnis-Bits (object_metadata.BAKE_* / RB_SETUP_*)
+constexpr uint8_t BAKE_NEEDS_SINGLE_USER = 1;
+constexpr uint8_t BAKE_REMOVE_RIGIDBODY = 2;
+constexpr uint8_t BAKE_MOVE_COLLECTION = 4;
+constexpr uint8_t BAKE_SKIP = 8;
+constexpr uint8_t RB_SETUP_NEEDS_SINGLE_USER = 1;
+constexpr uint8_t RB_SETUP_HAS_COMPONENT = 2;
+constexpr uint8_t RB_SETUP_SKIP = 8;
+
 // --- GPU HANDLES STRUKTUR für interne GPU Objekte (Modernisiert) ---
 // Note: Disabled due to linking complexity. GPU functionality will be implemented
 // through Python API when running in Blender.
@@ -58,6 +96,11 @@ struct GpuHandles {
     bool uses_indices = false;
 };
 
+// --- VERSION UND FÄHIGKEITEN (für kernel_backends.py) ---
+// Bei neuen/geänderten Kernel-Signaturen erhöhen.
+constexpr int NATIVE_API_VERSION = 3;
+py::list capabilities();
+
 // --- BESTEHENDE FUNKTIONSDEKLARATIONEN ---
 std::vector<std::string> analyze_objects(const std::vector<py::dict>& objects, bool enable_rigidbody);
 py::dict calculate_random_transforms_cpp(const py::dict& settings);
@@ -67,14 +110,16 @@ py::list analyze_scatter_objects_for_processing(
 py::dict analyze_single_object_for_processing(
     const py::dict& python_single_object_data,
     const py::dict& python_processing_settings);
-py::list analyze_objects_for_static_bake(
-    const py::list& python_object_names,
-    const std::string& target_static_collection_name);
+py::array_t<uint8_t> analyze_static_bake_records_cpp(
+    py::array_t<ObjectRecord, py::array::c_style | py::array::forcecast> records,
+    uint64_t static_collection_mask);
 void mark_for_deletion_cpp(const std::string& marker_name);
 py::list get_marked_garbage_cpp();
 void clear_garbage_cpp();
 void flush_marked_objects_cpp(py::object bpy_data_objects_param);
-py::list analyze_objects_for_rb_setup_cpp(const py::list& object_names_py);
+py::array_t<uint8_t> analyze_rb_setup_records_cpp(
+    py::array_t<ObjectRecord, py::array::c_style | py::array::forcecast> records,
+    uint64_t managed_collection_mask);
 bool configure_batch_rigidbody_properties_cpp(
     const py::list& object_names_py,
     const py::dict& target_rb_settings_py);
@@ -13,58 +13,44 @@ bl_info = {
 
 import bpy
 import traceback
-import os 
 
-# --- Globale Paketvariablen für C++ Modul und Verfügbarkeitsflag ---
-NATIVE_MODULE_AVAILABLE = False
-scatter_accel = None 
-# --- Ende globale Paketvariablen ---
+# --- Natives C++ Modul: lazy über native_access ---
+# scatter_accel und NATIVE_MODULE_AVAILABLE sind Proxys; gesucht und geladen wird erst beim ersten Gebrauch
+# (Scatter, Bake, Instanzierung), nicht beim Blender-Start. Status/Ladezeit: Addon-Einstellungen.
+from .native_access import NATIVE_MODULE_AVAILABLE, scatter_accel
+# --- Ende natives Modul ---
 
-def _internal_load_cpp_logic():
-    global NATIVE_MODULE_AVAILABLE, scatter_accel
-    addon_root_path = os.path.dirname(os.path.realpath(__file__))
-    module_name_to_load = "scatter_accel"
-    original_bl_warning = bl_info.get("warning", "")
-    try:
-        from .loader import load_native_module 
-        print(f"[{bl_info.get('name')} Init] Versuche, natives Modul '{module_name_to_load}' zu laden aus Addon-Pfad: {addon_root_path}")
-        scatter_accel = load_native_module(module_name_to_load, addon_root_path)
-        NATIVE_MODULE_AVAILABLE = True # Wird True, wenn load_native_module keinen Fehler wirft
-        print(f"[{bl_info.get('name')} Init] ✅ Natives C++ Modul '{module_name_to_load}' erfolgreich geladen und global zugewiesen.")
-        if bl_info.get("warning", "").startswith("Natives C++ Modul") or bl_info.get("warning", "").startswith("Fehler beim Laden"):
-            bl_info["warning"] = "" 
-        elif original_bl_warning :
-             bl_info["warning"] = original_bl_warning
-    except ImportError as e_imp:
-        NATIVE_MODULE_AVAILABLE = False
-        scatter_accel = None
-        warning_msg = f"Natives C++ Modul '{module_name_to_load}' nicht geladen (ImportError). Addon läuft im reinen Python-Modus."
-        print(f"[{bl_info.get('name')} Init] ⚠️ {warning_msg}")
-        print(f"  ImportError Details: {e_imp}")
-        bl_info["warning"] = warning_msg
-    except Exception as e:
-        NATIVE_MODULE_AVAILABLE = False
-        scatter_accel = None
-        warning_msg = f"Fehler beim Laden des C++ Moduls '{module_name_to_load}'. Siehe Konsole."
-        print(f"[{bl_info.get('name')} Init] 💥 Ein unerwarteter Fehler (Typ: {type(e).__name__}) ist beim Laden des nativen Moduls '{module_name_to_load}' aufgetreten:")
-        traceback.print_exc()
-        bl_info["warning"] = warning_msg
-    if not NATIVE_MODULE_AVAILABLE and original_bl_warning and not bl_info.get("warning","").startswith("Natives C++ Modul") and not bl_info.get("warning","").startswith("Fehler beim Laden"):
-        bl_info["warning"] = original_bl_warning
-
-_internal_load_cpp_logic()
-
-print(f"[{bl_info.get('name')} Init] Importiere Submodule... (Paket-Status: NATIVE_MODULE_AVAILABLE={NATIVE_MODULE_AVAILABLE}, scatter_accel is None: {scatter_accel is None})")
 from . import physical_layout_tool
 from . import instance_operator
 from . import physics_cursor_scatter
 from . import scatter_draw_helper # <<<<<< HIER HINZUGEFÜGT
+from . import point_instancing
+from . import placement_transaction
+from . import rigidbody_bulk
+from . import selection_utils
+from . import job_scheduler
+from . import record_kernels
+from . import numpy_kernels
+from . import object_metadata
+from . import static_bake
+from . import simulation_bake
+from . import progressive_freeze
+from . import settle_cache
+from . import mesh_profile
+from . import spawn_batch
+from . import layout_snapshot
+from . import loader
+from . import native_access
+from . import kernel_backends
+from . import perf_trace
+from . import perf_timing
 
 print(f"[{bl_info.get('name')} Init] Submodule importiert.")
 
 _register_ordered = [
     physical_layout_tool,
     instance_operator,
+    mesh_profile, # depsgraph/load_post-Handler für die Invalidierung des MeshProfile-Caches
     physics_cursor_scatter,
     # scatter_draw_helper kommt hier NICHT rein, da es keine eigene register()-Funktion hat
 ]
@@ -72,10 +58,6 @@ _register_ordered = [
 def register():
     # ... (deine register Funktion bleibt gleich) ...
     print(f"Attempting to register addon: {bl_info.get('name')} - Version {bl_info.get('version')}")
-    if not NATIVE_MODULE_AVAILABLE:
-        print(f"WARNUNG [{bl_info.get('name')}] Register: Natives C++ Modul ('{scatter_accel if scatter_accel else 'N/A'}') ist nicht verfügbar!")
-    else:
-        print(f"INFO [{bl_info.get('name')}] Register: Natives C++ Modul ist verfügbar.")
     for module in _register_ordered:
         if hasattr(module, "register"):
             try:
@@ -112,9 +94,6 @@ def unregister():
                 traceback.print_exc()
         else:
             print(f"Module {module.__name__} has no unregister function.")
-    global scatter_accel, NATIVE_MODULE_AVAILABLE
-    scatter_accel = None
-    NATIVE_MODULE_AVAILABLE = False
     print(f"{bl_info.get('name')}: Unregistered successfully.")
 
 __all__ = [
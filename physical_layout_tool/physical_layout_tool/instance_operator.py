@@ -10,57 +10,27 @@ bl_info = {
 }
 
 import bpy
+import time
 import traceback
-from bpy.props import StringProperty, PointerProperty, BoolProperty, IntProperty, FloatProperty
+from bpy_extras.io_utils import ExportHelper, ImportHelper
+from bpy.props import StringProperty, PointerProperty, BoolProperty, IntProperty, FloatProperty, EnumProperty
 from mathutils import Matrix
+import numpy as np
+
+from .point_instancing import create_point_buffer_if_enabled, realize_points_to_objects, POINTS_SOURCES_PROP
+from .placement_transaction import (
+    PlacementTransaction,
+    transaction_link,
+    transaction_unlink,
+    transaction_add_rigid_body,
+)
+from .rigidbody_bulk import build_rigid_body_settings, make_data_single_user
+from .selection_utils import SelectionSnapshot
+from .job_scheduler import ScatterJob, submit_job, cancel_job, draw_job_status, JOB_DONE
+from .object_metadata import extract_object_records, RECORD_HAS_RIGIDBODY
+from .layout_snapshot import export_layout_snapshot, import_layout_snapshot, LAYOUT_SNAPSHOT_EXTENSION
 
-# --- Globale Variablen für C++ Modul und Flag (werden durch Import aus __init__.py gefüllt) ---
-# Diese werden am Anfang des Moduls definiert, damit sie immer existieren,
-# auch wenn der Import aus dem Paket fehlschlägt oder die __init__.py nicht korrekt arbeitet.
-# Die tatsächlichen Werte kommen dann aus dem Import.
-# Name angepasst an die __init__.py Version (scatter_accel statt ext_scatter_accel)
-scatter_accel = None
-NATIVE_MODULE_AVAILABLE = False
-# ---
-
-# Import für das C++ Modul und das Verfügbarkeits-Flag aus dem Hauptpaket
-try:
-    # Diese Zeilen versuchen, die Variablen zu importieren, die in __init__.py des Pakets
-    # (also im Ordner darüber, repräsentiert durch '..') definiert und initialisiert wurden.
-    # Name angepasst an die __init__.py Version
-    from . import scatter_accel as pkg_scatter_accel
-    from . import NATIVE_MODULE_AVAILABLE as pkg_NATIVE_MODULE_AVAILABLE
-
-    # Weise die importierten Werte den modulglobalen Variablen zu.
-    scatter_accel = pkg_scatter_accel # Name angepasst
-    NATIVE_MODULE_AVAILABLE = pkg_NATIVE_MODULE_AVAILABLE
-
-    _module_name = __name__
-    if NATIVE_MODULE_AVAILABLE and scatter_accel: # Name angepasst
-        print(f"INFO [{_module_name}]: Native C++ Modul 'scatter_accel' und Flag 'NATIVE_MODULE_AVAILABLE' erfolgreich über Paket-Namespace bezogen.")
-    elif NATIVE_MODULE_AVAILABLE and not scatter_accel: # Name angepasst
-        print(f"WARNUNG [{_module_name}]: 'NATIVE_MODULE_AVAILABLE' ist True aus Paket, aber 'scatter_accel' ist None. Problem in __init__.py? Setze lokal auf nicht verfügbar.")
-        NATIVE_MODULE_AVAILABLE = False
-        scatter_accel = None
-    elif not NATIVE_MODULE_AVAILABLE:
-        print(f"INFO [{_module_name}]: Native C++ Modul NICHT verfügbar (gemäß Paket-Namespace: 'NATIVE_MODULE_AVAILABLE' ist False).")
-        if scatter_accel is not None: # Name angepasst
-            print(f"WARNUNG [{_module_name}]: 'NATIVE_MODULE_AVAILABLE' ist False, aber 'scatter_accel' war nicht None. Wird auf None gesetzt.")
-            scatter_accel = None
-
-except ImportError as e_imp:
-    _module_name = __name__
-    print(f"KRITISCH [{_module_name}]: ImportError beim Versuch, 'scatter_accel' oder 'NATIVE_MODULE_AVAILABLE' aus dem Hauptpaket ('..') zu importieren: {e_imp}.") # Name angepasst
-    print(f"  [{_module_name}]: Dies bedeutet wahrscheinlich, dass das Haupt-Addon (__init__.py) diese Variablen nicht korrekt im Paket-Namespace bereitstellt oder ein Strukturproblem vorliegt.")
-    print(f"  [{_module_name}]: C++ Beschleunigung wird für dieses Modul DEAKTIVIERT.")
-    scatter_accel = None # Name angepasst
-    NATIVE_MODULE_AVAILABLE = False
-except Exception as e_gen_imp:
-    _module_name = __name__
-    print(f"KRITISCH [{_module_name}]: Allgemeiner Fehler (Typ: {type(e_gen_imp).__name__}) beim Import von 'scatter_accel' oder 'NATIVE_MODULE_AVAILABLE' aus dem Hauptpaket: {e_gen_imp}.") # Name angepasst
-    print(f"  [{_module_name}]: C++ Beschleunigung wird für dieses Modul DEAKTIVIERT.")
-    scatter_accel = None # Name angepasst
-    NATIVE_MODULE_AVAILABLE = False
+from .kernel_backends import KERNELS, KERNEL_ANALYZE_BATCH
 
 # --- Helper function to get or create collection (Updated for Robustness) ---
 def get_or_create_collection(collection_name, context, parent_collection_obj=None):
@@ -129,6 +99,20 @@ class InstanceManagerSettings(bpy.types.PropertyGroup):
         default=False,
         update=instancing_toggle_callback
     )
+    output_backend: EnumProperty(
+        name="Instance Output",
+        description="How instanced placements are written to the scene",
+        items=[
+            ('OBJECTS', "Objects", "One linked-duplicate object per scattered item"),
+            ('POINTS', "Point Cloud (GN)", "All placements as point attributes on one object, instanced via Geometry Nodes 'Instance on Points'"),
+        ],
+        default='OBJECTS'
+    )
+    points_object_name: StringProperty(
+        name="Points Object",
+        description="Object that receives the placements when the point cloud backend is active",
+        default="SCATTER_POINTS"
+    )
     enable_instancing_on_scatter_finish: BoolProperty(
         name="Enable Instancing on Scatter Finish",
         description="If enabled, processes the session's Source Collection when scatter mode is finished",
@@ -141,13 +125,20 @@ class InstanceManagerSettings(bpy.types.PropertyGroup):
     )
     batch_size: IntProperty(
         name="Batch Size (Instancing)",
-        description="Number of objects/instructions to process per step",
+        description="Initial number of objects/instructions per step (adapted to the time budget while running)",
         default=10,
         min=1
     )
+    time_budget_ms: FloatProperty(
+        name="Time Budget (ms)",
+        description="Processing time per UI tick. Higher = faster, lower = more responsive UI",
+        default=12.0,
+        min=1.0,
+        max=200.0
+    )
     timer_interval: FloatProperty(
         name="Timer Interval (Instancing)",
-        description="Delay between processing batches (seconds)",
+        description="How often the modal operators poll and report job progress (seconds)",
         default=0.01,
         min=0.001,
         subtype='TIME',
@@ -159,11 +150,10 @@ class OBJECT_OT_instance_modal_base(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     _timer = None
-    _current_instruction_index = 0
+    _job = None
     _instructions_from_cpp: list = []
 
-    _initial_selected_names = set()
-    _initial_active_name = None
+    _selection_snapshot = None
     _im_settings_ref = None
 
     def process_single_object(self, context, obj_identifier):
@@ -178,19 +168,39 @@ class OBJECT_OT_instance_modal_base(bpy.types.Operator):
             self.report({'ERROR'}, "InstanceManagerSettings nicht gefunden.")
             return {'CANCELLED'}
 
-        self._initial_selected_names = {obj.name for obj in context.selected_objects if obj}
-        self._initial_active_name = context.view_layer.objects.active.name if context.view_layer.objects.active else None
-        self._current_instruction_index = 0
+        self._selection_snapshot = SelectionSnapshot(context)
 
         return {'RUNNING_MODAL'}
 
+    def _start_job(self, context, items, process_batch):
+        """Übergibt die Verarbeitung an den Job-Scheduler und startet den Modal-Loop (nur Fortschritt/ESC)."""
+        settings = self._im_settings_ref
+        self._job = submit_job(ScatterJob(
+            self.bl_label, items, process_batch,
+            initial_batch_size=settings.batch_size,
+            time_budget=settings.time_budget_ms / 1000.0,
+            window=context.window,
+        ))
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(settings.timer_interval, window=context.window)
+        wm.modal_handler_add(self)
+        context.window.cursor_modal_set('WAIT')
+        return {'RUNNING_MODAL'}
+
     def modal(self, context, event):
         if event.type == 'ESC':
             self.report({'INFO'}, f"{self.bl_label} cancelled by user.")
+            if self._job: cancel_job(self._job)
             return self._finish_modal(context, cancelled=True)
 
         if event.type == 'TIMER':
-            pass
+            job = self._job
+            if job is None or job.is_finished:
+                if job is not None and job.state == JOB_DONE:
+                    self.report({'INFO'}, f"Alle {job.total} Elemente verarbeitet ({job.throughput:.0f}/s).")
+                return self._finish_modal(context, cancelled=(job is None or job.state != JOB_DONE))
+            try: context.workspace.status_text_set(job.status_text())
+            except (AttributeError, ReferenceError): pass
 
         return {'RUNNING_MODAL'}
 
@@ -200,23 +210,15 @@ class OBJECT_OT_instance_modal_base(bpy.types.Operator):
             self._timer = None
 
         context.window.cursor_modal_restore()
+        try: context.workspace.status_text_set(None)
+        except (AttributeError, ReferenceError): pass
+        if self._job and not self._job.is_finished:
+            cancel_job(self._job)
+        self._job = None
 
-        original_active_obj = bpy.data.objects.get(self._initial_active_name) if self._initial_active_name else None
-        original_selected_objs = [bpy.data.objects.get(name) for name in self._initial_selected_names]
-        original_selected_objs = [obj for obj in original_selected_objs if obj and obj.name in context.view_layer.objects]
-
-        bpy.ops.object.select_all(action='DESELECT')
-        for obj_to_reselect in original_selected_objs:
-            try: obj_to_reselect.select_set(True)
-            except ReferenceError: pass
-
-        if original_active_obj and original_active_obj.name in context.view_layer.objects:
-            try: context.view_layer.objects.active = original_active_obj
-            except ReferenceError: pass
-        elif original_selected_objs:
-            try: context.view_layer.objects.active = original_selected_objs[0]
-            except (IndexError, ReferenceError): pass
-
+        if self._selection_snapshot:
+            self._selection_snapshot.restore(context)
+            self._selection_snapshot = None
 
         if context.area:
             try: context.area.tag_redraw()
@@ -240,6 +242,7 @@ class OBJECT_OT_process_source_for_instancing_modal(OBJECT_OT_instance_modal_bas
     )
     _instance_collection_ref = None
     _static_collection_ref = None
+    _point_buffer = None
 
     def _apply_rigid_body_active(self, context, obj):
         if not obj or obj.rigid_body:
@@ -248,77 +251,12 @@ class OBJECT_OT_process_source_for_instancing_modal(OBJECT_OT_instance_modal_bas
         phys_settings = getattr(context.scene, 'physical_tool_settings', None)
         if not phys_settings:
             self.report({'WARNING'}, f"PhysicalToolSettings nicht gefunden für RB auf '{obj.name}'. Standardwerte verwendet.")
-            default_mass, default_shape, default_margin = 1.0, 'CONVEX_HULL', 0.001
-        else:
-            default_mass = phys_settings.mass
-            default_shape = phys_settings.collision_shape
-            default_margin = phys_settings.collision_margin
-
-        current_active = context.view_layer.objects.active
-        current_selected_names = {o.name for o in context.selected_objects if o}
-
-        original_hide_viewport = obj.hide_get(view_layer=context.view_layer)
-        original_hide_select = obj.hide_select
-
-        if original_hide_viewport: obj.hide_set(False, view_layer=context.view_layer)
-        if original_hide_select: obj.hide_select = False
-
-        bpy.ops.object.select_all(action='DESELECT')
         try:
-            obj.select_set(True)
-            context.view_layer.objects.active = obj
-            bpy.ops.rigidbody.object_add()
-
-            if obj.rigid_body:
-                obj.rigid_body.type = 'ACTIVE'
-                obj.rigid_body.mass = default_mass
-                obj.rigid_body.collision_shape = default_shape
-                obj.rigid_body.use_margin = True
-                obj.rigid_body.collision_margin = default_margin
-                obj.rigid_body.linear_damping = 0.04
-                obj.rigid_body.angular_damping = 0.1
-                obj.rigid_body.use_deactivation = True
-                obj.rigid_body.use_start_deactivated = False
-                context.view_layer.update()
-            else:
-                self.report({'WARNING'}, f"RB konnte nicht zu '{obj.name}' hinzugefügt werden (nach ops.call).")
+            # Gebündelt mit der Batch-Transaktion: ein RBW-Link pro Objekt, ein Update + Konfiguration pro Batch
+            transaction_add_rigid_body(context, obj, build_rigid_body_settings(phys_settings, 'ACTIVE'))
         except Exception as e:
             self.report({'WARNING'}, f"Konnte RB nicht zu '{obj.name}' hinzufügen/konfigurieren: {e}")
             traceback.print_exc()
-        finally:
-            bpy.ops.object.select_all(action='DESELECT')
-            for name in current_selected_names:
-                sel_obj = bpy.data.objects.get(name)
-                if sel_obj and sel_obj.name in context.view_layer.objects:
-                    try:
-                        sel_obj.select_set(True)
-                    except ReferenceError:
-                        pass
-
-            # --- START MODIFIED BLOCK (endgültige Korrektur) ---
-            active_obj_restored = bpy.data.objects.get(current_active.name) if current_active else None
-            if active_obj_restored and active_obj_restored.name in context.view_layer.objects:
-                try:
-                    context.view_layer.objects.active = active_obj_restored
-                except ReferenceError:
-                    pass
-            elif current_selected_names:
-                first_selected_name = next(iter(current_selected_names), None)
-                if first_selected_name:
-                    first_sel_obj_restored = bpy.data.objects.get(first_selected_name)
-                    if first_sel_obj_restored and first_sel_obj_restored.name in context.view_layer.objects:
-                        try:
-                            context.view_layer.objects.active = first_sel_obj_restored
-                        except ReferenceError:
-                            pass
-            # --- END MODIFIED BLOCK ---
-
-            if obj and obj.name in bpy.data.objects:
-                if original_hide_viewport:
-                    obj.hide_set(True, view_layer=context.view_layer)
-                if original_hide_select:
-                    obj.hide_select = True
-
 
     @classmethod
     def poll(cls, context):
@@ -330,6 +268,7 @@ class OBJECT_OT_process_source_for_instancing_modal(OBJECT_OT_instance_modal_bas
 
         self._instance_collection_ref = get_or_create_collection(self._im_settings_ref.instance_collection_name, context)
         self._static_collection_ref = get_or_create_collection(self._im_settings_ref.static_collection_name, context)
+        self._point_buffer = create_point_buffer_if_enabled(self._im_settings_ref)
 
         if self._im_settings_ref.use_instancing and not self._instance_collection_ref:
             self.report({'ERROR'}, f"Instancing AN, aber Collection '{self._im_settings_ref.instance_collection_name}' nicht erstellbar.")
@@ -350,19 +289,20 @@ class OBJECT_OT_process_source_for_instancing_modal(OBJECT_OT_instance_modal_bas
             self.report({'INFO'}, "Keine validen Objekte für C++-Verarbeitung vorbereitet.")
             return {'FINISHED'}
 
-        # Verwende die modulglobalen Variablen NATIVE_MODULE_AVAILABLE und scatter_accel
-        if NATIVE_MODULE_AVAILABLE and scatter_accel:
+        # Batch-Analyse über die Backend-Registry (schnellstes verfügbares Backend)
+        if KERNELS.available(KERNEL_ANALYZE_BATCH):
+            backend = KERNELS.selected_backend(KERNEL_ANALYZE_BATCH)
             try:
-                print(f"IM_INFO: Sende {len(objects_data_for_cpp)} Objekte an C++ zur Analyse...")
-                self._instructions_from_cpp = scatter_accel.analyze_scatter_objects_for_processing(objects_data_for_cpp, settings_for_cpp) # Name angepasst
-                self.report({'INFO'}, f"C++ Analyse abgeschlossen. {len(self._instructions_from_cpp)} Anweisungen erhalten.")
+                print(f"IM_INFO: Sende {len(objects_data_for_cpp)} Objekte zur Analyse ({backend})...")
+                self._instructions_from_cpp = KERNELS.call(KERNEL_ANALYZE_BATCH, objects_data_for_cpp, settings_for_cpp)
+                self.report({'INFO'}, f"Analyse ({backend}) abgeschlossen. {len(self._instructions_from_cpp)} Anweisungen erhalten.")
             except Exception as e:
-                self.report({'ERROR'}, f"Fehler bei C++ Analyse: {e}. Siehe Konsole.")
+                self.report({'ERROR'}, f"Fehler bei der Analyse ({backend}): {e}. Siehe Konsole.")
                 traceback.print_exc()
                 self._instructions_from_cpp = []
                 return {'CANCELLED'}
         else:
-            self.report({'ERROR'}, "Natives C++ Modul nicht verfügbar. Operation kann nicht fortgesetzt werden.")
+            self.report({'ERROR'}, "Keine Implementierung der Batch-Analyse verfügbar (natives C++ Modul fehlt). Operation kann nicht fortgesetzt werden.")
             return {'CANCELLED'}
 
         if not self._instructions_from_cpp:
@@ -370,13 +310,8 @@ class OBJECT_OT_process_source_for_instancing_modal(OBJECT_OT_instance_modal_bas
              return {'CANCELLED'}
 
 
-        self._current_instruction_index = 0
-        wm = context.window_manager
-        self._timer = wm.event_timer_add(self._im_settings_ref.timer_interval, window=context.window)
-        wm.modal_handler_add(self)
-        context.window.cursor_modal_set('WAIT')
         self.report({'INFO'}, f"Starting: {self.bl_label} für {len(self._instructions_from_cpp)} Anweisungen.")
-        return {'RUNNING_MODAL'}
+        return self._start_job(context, self._instructions_from_cpp, self._process_instruction_batch)
 
     def gather_objects_to_process(self, context):
         if not self.source_collection_to_process:
@@ -396,19 +331,26 @@ class OBJECT_OT_process_source_for_instancing_modal(OBJECT_OT_instance_modal_bas
         return collected_names
 
     def _prepare_data_for_cpp(self, context, object_names_to_process):
-        objects_to_analyze_cpp = []
+        objects_found = []
         for obj_name in object_names_to_process:
             obj = bpy.data.objects.get(obj_name)
             if obj and obj.data:
-                 objects_to_analyze_cpp.append({
-                    "name": obj.name,
-                    "mesh_name": obj.data.name,
-                    "matrix_world": [list(row) for row in obj.matrix_world],
-                    "has_rigidbody": (obj.rigid_body is not None)
-                })
+                objects_found.append(obj)
             else:
                 print(f"IM_WARN: Objekt '{obj_name}' nicht gefunden oder hat keine Mesh-Daten beim Vorbereiten für C++ (nach gather).")
 
+        # Matrizen/Mesh/RB-Status in einem Durchgang über die Extraktionsschicht statt einzeln pro Objekt
+        record_set = extract_object_records(context, objects_found)
+        records = record_set.records
+        matrices = records["matrix_world"].tolist()
+        has_rigidbody = ((records["flags"] & RECORD_HAS_RIGIDBODY) != 0).tolist()
+        objects_to_analyze_cpp = [{
+                "name": obj.name,
+                "mesh_name": record_set.mesh_names[mesh_index],
+                "matrix_world": matrices[i],
+                "has_rigidbody": has_rigidbody[i],
+            } for i, (obj, mesh_index) in enumerate(zip(record_set.objects, records["mesh_index"].tolist()))]
+
         settings = self._im_settings_ref
         processing_settings_cpp = {
             "mode_is_instancing": settings.use_instancing,
@@ -419,32 +361,14 @@ class OBJECT_OT_process_source_for_instancing_modal(OBJECT_OT_instance_modal_bas
         }
         return objects_to_analyze_cpp, processing_settings_cpp
 
-    def modal(self, context, event):
-        if event.type == 'ESC':
-            self.report({'INFO'}, f"{self.bl_label} cancelled by user.")
-            return self._finish_modal(context, cancelled=True)
-
-        if event.type == 'TIMER':
-            if self._current_instruction_index >= len(self._instructions_from_cpp):
-                self.report({'INFO'}, f"Alle {len(self._instructions_from_cpp)} Anweisungen verarbeitet.")
-                return self._finish_modal(context)
-
-            processed_in_batch = 0
-            batch_size = self._im_settings_ref.batch_size
-
-            for _ in range(batch_size):
-                if self._current_instruction_index >= len(self._instructions_from_cpp):
-                    break
-
-                instruction = self._instructions_from_cpp[self._current_instruction_index]
+    def _process_instruction_batch(self, context, instructions):
+        # Ein Commit (Links + view_layer.update) pro Batch statt pro Anweisung
+        with PlacementTransaction(context):
+            for instruction in instructions:
                 self.execute_instruction(context, instruction)
-                self._current_instruction_index += 1
-                processed_in_batch +=1
 
-            if processed_in_batch > 0:
-                self.report({'INFO'}, f"Processed {self._current_instruction_index}/{len(self._instructions_from_cpp)} instructions...")
-
-        return {'RUNNING_MODAL'}
+            if self._point_buffer is not None:
+                self._point_buffer.flush(context, self._instance_collection_ref)
 
     def execute_instruction(self, context, instruction_dict):
         action = instruction_dict.get("action")
@@ -468,6 +392,17 @@ class OBJECT_OT_process_source_for_instancing_modal(OBJECT_OT_instance_modal_bas
                 self.report({'ERROR'}, "Instanz-Collection Referenz ist None in CREATE_INSTANCE. Breche für dieses Objekt ab.")
                 return
 
+            if self._point_buffer is not None:
+                # Punkt-Backend: nur Transform + Quell-Mesh puffern, Schreiben erfolgt gebündelt pro Batch
+                matrix_data = instruction_dict.get("matrix_world")
+                # Der Marker wird erst nach dem Flush entfernt, damit sein Mesh bis dahin nicht verwaist
+                self._point_buffer.add(matrix_data if matrix_data else [list(row) for row in obj_marker.matrix_world],
+                                       mesh_data.name, marker_name=obj_marker.name)
+                if source_collection and obj_marker.name in source_collection.objects:
+                    try: source_collection.objects.unlink(obj_marker)
+                    except Exception as e_unlink: self.report({'WARNING'}, f"Konnte '{obj_marker.name}' nicht aus Quell-Col '{source_collection.name}' entlinken: {e_unlink}")
+                return
+
             py_instance_name_base = instruction_dict.get("new_instance_name_base", f"{original_name}_inst")
             final_py_instance_name = py_instance_name_base
             i = 0
@@ -481,7 +416,7 @@ class OBJECT_OT_process_source_for_instancing_modal(OBJECT_OT_instance_modal_bas
 
             try:
                 for col in list(new_instance.users_collection): col.objects.unlink(new_instance)
-                self._instance_collection_ref.objects.link(new_instance)
+                transaction_link(new_instance, self._instance_collection_ref)
             except Exception as e:
                 self.report({'WARNING'}, f"Fehler Verlinken Instanz '{new_instance.name}' in '{self._instance_collection_ref.name}': {e}")
                 if new_instance.name in bpy.data.objects: bpy.data.objects.remove(new_instance, do_unlink=True)
@@ -511,11 +446,9 @@ class OBJECT_OT_process_source_for_instancing_modal(OBJECT_OT_instance_modal_bas
                 self._apply_rigid_body_active(context, obj_marker)
 
             try:
-                if source_collection and obj_marker.name in source_collection.objects:
-                    source_collection.objects.unlink(obj_marker)
-
-                if obj_marker.name not in self._static_collection_ref.objects:
-                    self._static_collection_ref.objects.link(obj_marker)
+                if source_collection:
+                    transaction_unlink(obj_marker, source_collection)
+                transaction_link(obj_marker, self._static_collection_ref)
 
             except Exception as e: self.report({'WARNING'}, f"Fehler Verschieben '{obj_marker.name}' nach Static Collection '{self._static_collection_ref.name}': {e}")
 
@@ -528,6 +461,9 @@ class OBJECT_OT_process_source_for_instancing_modal(OBJECT_OT_instance_modal_bas
             self.report({'WARNING'}, f"Unbekannte C++ Aktion '{action}' für Objekt '{original_name}'.")
 
     def _finish_modal(self, context, cancelled=False):
+        if self._point_buffer is not None:
+            self._point_buffer.flush(context, self._instance_collection_ref)
+            self._point_buffer = None
         base_result = super()._finish_modal(context, cancelled)
 
         settings = self._im_settings_ref
@@ -569,7 +505,6 @@ class OBJECT_OT_prepare_managed_instances_modal(OBJECT_OT_instance_modal_base):
 
     _instance_collection_name_cache = None
     _objects_to_process_names: list = []
-    _current_object_index: int = 0
 
     @classmethod
     def poll(cls, context):
@@ -593,13 +528,8 @@ class OBJECT_OT_prepare_managed_instances_modal(OBJECT_OT_instance_modal_base):
             self.report({'INFO'}, "Keine zu bearbeitenden Instanzen ausgewählt oder gefunden.")
             return {'FINISHED'}
 
-        self._current_object_index = 0
-        wm = context.window_manager
-        self._timer = wm.event_timer_add(self._im_settings_ref.timer_interval, window=context.window)
-        wm.modal_handler_add(self)
-        context.window.cursor_modal_set('WAIT')
         self.report({'INFO'}, f"Starting: {self.bl_label} für {len(self._objects_to_process_names)} Instanzen.")
-        return {'RUNNING_MODAL'}
+        return self._start_job(context, self._objects_to_process_names, self._process_name_batch)
 
 
     def gather_objects_to_process(self, context):
@@ -615,98 +545,152 @@ class OBJECT_OT_prepare_managed_instances_modal(OBJECT_OT_instance_modal_base):
             self.report({'ERROR'}, f"Instance Collection '{self._instance_collection_name_cache}' nicht gefunden.")
             return []
 
-        return [obj.name for obj in context.selected_objects
-                if obj and obj.type == 'MESH' and obj.data and obj.data.users > 1 and obj.name in instance_collection.objects]
-
-    def modal(self, context, event):
-        if event.type == 'ESC':
-            self.report({'INFO'}, f"{self.bl_label} cancelled by user.")
-            return self._finish_modal(context, cancelled=True)
+        objects = [obj for obj in context.selected_objects
+                   if obj and obj.type == 'MESH' and obj.data and obj.data.users > 1 and obj.name in instance_collection.objects]
+        # Nach Quell-Mesh sortieren, damit Gruppen in den Job-Batches zusammenhängend bleiben
+        objects.sort(key=lambda obj: obj.data.name)
+        return [obj.name for obj in objects]
 
-        if event.type == 'TIMER':
-            if self._current_object_index >= len(self._objects_to_process_names):
-                self.report({'INFO'}, f"Alle {len(self._objects_to_process_names)} Instanzen bearbeitet.")
-                return self._finish_modal(context)
+    def _process_name_batch(self, context, obj_names):
+        # Ein Durchgang pro Batch: eigene Mesh-Daten per direkter Zuweisung (gruppiert nach Quell-Mesh),
+        # ohne ops.make_single_user, ohne Auswahl-/Sichtbarkeitswechsel. matrix_world bleibt unberührt.
+        instance_collection = bpy.data.collections.get(self._instance_collection_name_cache) if self._instance_collection_name_cache else None
+        if not instance_collection:
+            self.report({'WARNING'}, f"Instanz-Collection '{self._instance_collection_name_cache}' nicht gefunden. Batch übersprungen.")
+            return
 
-            processed_in_batch = 0
-            batch_size = self._im_settings_ref.batch_size if self._im_settings_ref else 1
+        objects = []
+        for obj_name in obj_names:
+            obj = bpy.data.objects.get(obj_name)
+            if not obj or obj.type != 'MESH' or not obj.data or obj.data.users <= 1:
+                continue
+            if obj.name not in instance_collection.objects:
+                print(f"WARNUNG [{__name__}]: Objekt '{obj.name}' nicht (mehr) in Instanz-Collection '{instance_collection.name}'. Übersprungen.")
+                continue
+            objects.append(obj)
+
+        if objects:
+            make_data_single_user(objects)
+
+
+# --- Operator: Punkte des Punkt-Backends in echte Objekte umwandeln ---
+class OBJECT_OT_realize_scatter_points(bpy.types.Operator):
+    bl_idname = "object.realize_scatter_points"
+    bl_label = "Realize Points to Objects"
+    bl_description = "Converts points of the scatter point cloud into real objects (e.g. for physics). Uses the vertex selection of the points object"
+    bl_options = {'REGISTER', 'UNDO'}
 
-            for _ in range(batch_size):
-                if self._current_object_index >= len(self._objects_to_process_names):
-                    break
+    only_selected_points: BoolProperty(
+        name="Only Selected Points",
+        description="Realize only points selected in Edit Mode. If disabled, all points are realized",
+        default=True
+    )
 
-                obj_name = self._objects_to_process_names[self._current_object_index]
-                self.process_single_object(context, obj_name)
-                self._current_object_index += 1
-                processed_in_batch +=1
+    @classmethod
+    def poll(cls, context):
+        settings = getattr(context.scene, 'instance_manager_settings', None)
+        if not settings or not settings.points_object_name: return False
+        points_obj = bpy.data.objects.get(settings.points_object_name)
+        return bool(points_obj and points_obj.type == 'MESH' and POINTS_SOURCES_PROP in points_obj)
+
+    def execute(self, context):
+        settings = context.scene.instance_manager_settings
+        points_obj = bpy.data.objects.get(settings.points_object_name)
+        if points_obj.mode == 'EDIT':
+            points_obj.update_from_editmode()
+
+        point_count = len(points_obj.data.vertices)
+        if point_count == 0:
+            self.report({'INFO'}, f"'{points_obj.name}' enthält keine Punkte.")
+            return {'CANCELLED'}
 
-            if processed_in_batch > 0:
-                self.report({'INFO'}, f"Prepared {self._current_object_index}/{len(self._objects_to_process_names)} instances...")
+        if self.only_selected_points:
+            mask = np.zeros(point_count, dtype=bool)
+            points_obj.data.vertices.foreach_get("select", mask)
+            if not mask.any():
+                self.report({'INFO'}, "Keine Punkte ausgewählt (Edit Mode). Nichts umgewandelt.")
+                return {'CANCELLED'}
+        else:
+            mask = np.ones(point_count, dtype=bool)
 
-        return {'RUNNING_MODAL'}
+        target_collection = get_or_create_collection(settings.static_collection_name, context)
+        if not target_collection:
+            self.report({'ERROR'}, f"Ziel-Collection '{settings.static_collection_name}' nicht erstellbar.")
+            return {'CANCELLED'}
 
-    def process_single_object(self, context, obj_name):
-        obj = bpy.data.objects.get(obj_name)
-        if not obj or obj.type != 'MESH' or not obj.data or obj.data.users <= 1:
-            return
+        was_edit_mode = points_obj.mode == 'EDIT'
+        if was_edit_mode:
+            bpy.ops.object.mode_set(mode='OBJECT')
+        try:
+            created = realize_points_to_objects(context, points_obj, mask, target_collection)
+        except Exception as e:
+            self.report({'ERROR'}, f"Fehler beim Umwandeln der Punkte: {e}")
+            traceback.print_exc()
+            return {'CANCELLED'}
 
-        if self._instance_collection_name_cache:
-            instance_collection = bpy.data.collections.get(self._instance_collection_name_cache)
-            if not instance_collection or obj.name not in instance_collection.objects:
-                self.report({'WARNING'}, f"Objekt '{obj.name}' nicht (mehr) in Instanz-Collection '{self._instance_collection_name_cache}'. Übersprungen.")
-                return
-        else:
-            self.report({'WARNING'}, f"Instanz-Collection-Name nicht gecached für '{obj.name}'. Übersprungen.")
-            return
+        for obj in context.selected_objects:
+            obj.select_set(False)
+        for obj in created:
+            obj.select_set(True)
+        if created:
+            context.view_layer.objects.active = created[0]
 
+        self.report({'INFO'}, f"{len(created)} Punkte in Objekte umgewandelt ('{target_collection.name}').")
+        return {'FINISHED'}
 
-        current_matrix = obj.matrix_world.copy()
-        original_active_in_loop = context.view_layer.objects.active
+# --- Operatoren: Binärer Layout-Snapshot (Export/Import) ---
+class OBJECT_OT_export_layout_snapshot(bpy.types.Operator, ExportHelper):
+    bl_idname = "object.export_layout_snapshot"
+    bl_label = "Export Layout Snapshot"
+    bl_description = "Writes names, source meshes, world matrices and flags of all objects in the instance, static and session collections to a compact binary file"
 
-        original_hide_viewport = obj.hide_get(view_layer=context.view_layer)
-        original_hide_select = obj.hide_select
+    filename_ext = LAYOUT_SNAPSHOT_EXTENSION
+    filter_glob: StringProperty(default="*" + LAYOUT_SNAPSHOT_EXTENSION, options={'HIDDEN'})
 
-        if original_hide_viewport: obj.hide_set(False, view_layer=context.view_layer)
-        if original_hide_select: obj.hide_select = False
+    @classmethod
+    def poll(cls, context):
+        return getattr(context.scene, 'instance_manager_settings', None) is not None
 
-        bpy.ops.object.select_all(action='DESELECT')
+    def execute(self, context):
+        settings = context.scene.instance_manager_settings
+        t0 = time.perf_counter()
         try:
-            obj.select_set(True)
-            context.view_layer.objects.active = obj
-            bpy.ops.object.make_single_user(object=False, obdata=True, animation=False, obdata_animation=False)
-            obj.matrix_world = current_matrix
-        except RuntimeError as e:
-            self.report({'WARNING'}, f"Konnte '{obj.name}' nicht zu Single User machen (RuntimeError): {e}")
-        except Exception as e_gen:
-            self.report({'ERROR'}, f"Generischer Fehler bei Make Single User für '{obj.name}': {e_gen}")
+            exported = export_layout_snapshot(context, settings, self.filepath)
+        except Exception as e:
+            self.report({'ERROR'}, f"Fehler beim Export des Layout-Snapshots: {e}")
             traceback.print_exc()
-        finally:
-            # --- START MODIFIED BLOCK ---
-            original_active_name_in_loop = original_active_in_loop.name if original_active_in_loop else None
-            if original_active_name_in_loop:
-                obj_to_restore_as_active = bpy.data.objects.get(original_active_name_in_loop)
-                if obj_to_restore_as_active and obj_to_restore_as_active.name in context.view_layer.objects and \
-                   context.view_layer.objects.active != obj_to_restore_as_active: # Nur ändern, wenn nötig
-                    try:
-                        context.view_layer.objects.active = obj_to_restore_as_active
-                    except ReferenceError:
-                        pass
-            elif obj and obj.name in context.view_layer.objects: # Fallback: das gerade bearbeitete Objekt aktiv lassen, wenn nichts anderes da war
-                if context.view_layer.objects.active != obj:
-                    try:
-                        context.view_layer.objects.active = obj
-                    except ReferenceError:
-                        pass
-            # --- END MODIFIED BLOCK ---
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"{exported} Objekt(e) in {time.perf_counter() - t0:.2f}s nach '{self.filepath}' exportiert.")
+        return {'FINISHED'}
 
-            if obj and obj.name in bpy.data.objects:
-                if original_hide_viewport: obj.hide_set(True, view_layer=context.view_layer)
-                if original_hide_select: obj.hide_select = True
 
-            if obj and obj.select_get():
-                try: obj.select_set(False)
-                except ReferenceError: pass
+class OBJECT_OT_import_layout_snapshot(bpy.types.Operator, ImportHelper):
+    bl_idname = "object.import_layout_snapshot"
+    bl_label = "Import Layout Snapshot"
+    bl_description = "Rebuilds a layout snapshot in the current scene as instances of the stored source meshes"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    filename_ext = LAYOUT_SNAPSHOT_EXTENSION
+    filter_glob: StringProperty(default="*" + LAYOUT_SNAPSHOT_EXTENSION, options={'HIDDEN'})
+    replace_existing: BoolProperty(
+        name="Replace Existing",
+        description="Remove the objects currently in the snapshot's collections before importing",
+        default=False
+    )
 
+    def execute(self, context):
+        phys_settings = getattr(context.scene, 'physical_tool_settings', None)
+        t0 = time.perf_counter()
+        try:
+            created, missing = import_layout_snapshot(context, self.filepath, phys_settings, self.replace_existing)
+        except Exception as e:
+            self.report({'ERROR'}, f"Fehler beim Import des Layout-Snapshots: {e}")
+            traceback.print_exc()
+            return {'CANCELLED'}
+        if missing:
+            self.report({'WARNING'}, f"{missing} Objekt(e) übersprungen: Quell-Mesh nicht in dieser Datei.")
+        self.report({'INFO'}, f"{created} Objekt(e) in {time.perf_counter() - t0:.2f}s aus '{self.filepath}' aufgebaut.")
+        return {'FINISHED'}
 
 # --- UI Panel for Instance Manager ---
 class VIEW3D_PT_instance_manager_controls(bpy.types.Panel):
@@ -761,6 +745,11 @@ class VIEW3D_PT_instance_manager_controls(bpy.types.Panel):
         layout.label(text="Processing Mode & Options:")
         box_mode = layout.box()
         box_mode.prop(settings, "use_instancing", text="Output as Instances")
+        col_backend = box_mode.column()
+        col_backend.enabled = settings.use_instancing
+        col_backend.prop(settings, "output_backend", text="Output")
+        if settings.output_backend == 'POINTS':
+            col_backend.prop(settings, "points_object_name", text="Points Object")
         box_mode.prop(settings, "enable_instancing_on_scatter_finish", text="Process on Scatter Finish")
 
         col_rigid = box_mode.column()
@@ -777,8 +766,10 @@ class VIEW3D_PT_instance_manager_controls(bpy.types.Panel):
         col_batch_settings = layout.column(align=True)
         col_batch_settings.label(text="Modal Operator Settings:")
         row_batch = col_batch_settings.row(align=True)
+        col_batch_settings.prop(settings, "time_budget_ms")
         row_batch.prop(settings, "batch_size", text="Batch Size")
         row_batch.prop(settings, "timer_interval", text="Timer (s)")
+        draw_job_status(layout)
         layout.separator()
 
         col_ops = layout.column(align=True)
@@ -787,12 +778,25 @@ class VIEW3D_PT_instance_manager_controls(bpy.types.Panel):
         op_make_editable = col_ops.operator(OBJECT_OT_prepare_managed_instances_modal.bl_idname,
                                             text="Make Selected Instances Editable",
                                             icon='OBJECT_DATAMODE')
+        if settings.output_backend == 'POINTS':
+            col_ops.operator(OBJECT_OT_realize_scatter_points.bl_idname,
+                             text="Realize Selected Points",
+                             icon='OUTLINER_OB_POINTCLOUD')
+
+        col_snapshot = layout.column(align=True)
+        col_snapshot.label(text="Layout Snapshot:")
+        row_snapshot = col_snapshot.row(align=True)
+        row_snapshot.operator(OBJECT_OT_export_layout_snapshot.bl_idname, text="Export", icon='EXPORT')
+        row_snapshot.operator(OBJECT_OT_import_layout_snapshot.bl_idname, text="Import", icon='IMPORT')
 
 # --- Registration ---
 _classes_to_register_im = (
     InstanceManagerSettings,
     OBJECT_OT_process_source_for_instancing_modal,
     OBJECT_OT_prepare_managed_instances_modal,
+    OBJECT_OT_realize_scatter_points,
+    OBJECT_OT_export_layout_snapshot,
+    OBJECT_OT_import_layout_snapshot,
     VIEW3D_PT_instance_manager_controls,
 )
 _im_registered_classes_module_set = set()
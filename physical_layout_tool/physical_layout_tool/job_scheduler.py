@@ -0,0 +1,244 @@
+# job_scheduler.py
+# Zeitbudgetierter Job-Scheduler auf bpy.app.timers für lang laufende Operationen.
+# Statt fester batch_size pro timer_interval verarbeitet jeder Tick so viele Elemente,
+# bis das Zeitbudget (Standard 12 ms) verbraucht ist. Die Batchgröße passt sich an die
+# gemessenen Kosten an, mehrere Jobs werden nacheinander abgearbeitet (Warteschlange).
+import bpy
+import time
+import traceback
+
+from .perf_timing import timed_section
+
+_sched_module_name = __name__
+
+DEFAULT_TIME_BUDGET_SEC = 0.012
+TICK_INTERVAL_SEC = 0.001       # Pause zwischen zwei Ticks (Events/Redraws laufen dazwischen)
+UI_REFRESH_INTERVAL_SEC = 0.25  # Wie oft Panels/Statusleiste aktualisiert werden
+MAX_BATCH_GROWTH = 2.0          # Batch darf pro Messung höchstens verdoppelt werden
+MAX_BATCH_SHRINK = 0.25         # ... und höchstens auf ein Viertel schrumpfen
+
+JOB_QUEUED = 'QUEUED'
+JOB_RUNNING = 'RUNNING'
+JOB_DONE = 'DONE'
+JOB_CANCELLED = 'CANCELLED'
+JOB_FAILED = 'FAILED'
+
+_job_queue = []
+_last_ui_refresh = 0.0
+
+
+class ScatterJob:
+    """
+    Ein Job verarbeitet eine Liste von Elementen (z.B. Objektnamen oder C++-Anweisungen)
+    über process_batch(context, items). on_finish(job) wird einmal am Ende aufgerufen
+    (auch bei Abbruch/Fehler; Status in job.state).
+    """
+
+    def __init__(self, label, items, process_batch, on_finish=None,
+                 initial_batch_size=1, max_batch_size=100000,
+                 time_budget=DEFAULT_TIME_BUDGET_SEC, window=None):
+        self.label = label
+        self.items = list(items)
+        self.process_batch = process_batch
+        self.on_finish = on_finish
+        self.batch_size = max(1, int(initial_batch_size))
+        self.max_batch_size = max(self.batch_size, int(max_batch_size))
+        self.time_budget = max(0.001, float(time_budget))
+        self.window = window
+
+        self.index = 0
+        self.state = JOB_QUEUED
+        self.error = None
+        self.started_at = None
+        self.finished_at = None
+        self.busy_time = 0.0
+
+    # --- Fortschritt ---
+    @property
+    def total(self):
+        return len(self.items)
+
+    @property
+    def is_finished(self):
+        return self.state in (JOB_DONE, JOB_CANCELLED, JOB_FAILED)
+
+    @property
+    def progress(self):
+        return 1.0 if not self.items else self.index / len(self.items)
+
+    @property
+    def throughput(self):
+        """Elemente pro Sekunde (Wanduhrzeit seit Start)."""
+        if not self.started_at or self.index == 0:
+            return 0.0
+        elapsed = (self.finished_at or time.perf_counter()) - self.started_at
+        return self.index / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta_seconds(self):
+        rate = self.throughput
+        if rate <= 0.0:
+            return None
+        return (len(self.items) - self.index) / rate
+
+    def status_text(self):
+        eta = self.eta_seconds
+        eta_text = f"{eta:.1f}s" if eta is not None else "--"
+        return (f"{self.label}: {self.index}/{len(self.items)} ({self.progress * 100.0:.0f}%) | "
+                f"{self.throughput:.0f}/s | ETA {eta_text}")
+
+    def cancel(self):
+        if not self.is_finished:
+            self._finish(JOB_CANCELLED)
+
+    # --- Ausführung ---
+    def _run_slice(self, context, deadline):
+        """Verarbeitet Batches bis zur Deadline. Gibt True zurück, wenn der Job fertig ist."""
+        if self.state == JOB_QUEUED:
+            self.state = JOB_RUNNING
+            self.started_at = time.perf_counter()
+
+        while self.index < len(self.items):
+            now = time.perf_counter()
+            remaining = deadline - now
+            if remaining <= 0.0:
+                return False
+            # Restbudget im Tick anteilig auf die Batchgröße anwenden
+            n = max(1, min(self.batch_size, int(self.batch_size * remaining / self.time_budget) or 1))
+            batch = self.items[self.index:self.index + n]
+
+            t0 = time.perf_counter()
+            with timed_section(f"job.{self.label}", items=len(batch), index=self.index):
+                self.process_batch(context, batch)
+            dt = time.perf_counter() - t0
+
+            self.index += len(batch)
+            self.busy_time += dt
+            self._adapt_batch_size(len(batch), dt)
+
+        self._finish(JOB_DONE)
+        return True
+
+    def _adapt_batch_size(self, batch_len, dt):
+        if dt <= 0.0:
+            target = self.batch_size * MAX_BATCH_GROWTH
+        else:
+            # Proportional auf das Budget skalieren, Sprünge begrenzen (fixe Kosten pro Batch, Ausreißer)
+            target = batch_len * self.time_budget / dt
+            target = min(target, self.batch_size * MAX_BATCH_GROWTH)
+            target = max(target, self.batch_size * MAX_BATCH_SHRINK)
+        self.batch_size = int(max(1, min(self.max_batch_size, target)))
+
+    def _finish(self, state, error=None):
+        self.state = state
+        self.error = error
+        self.finished_at = time.perf_counter()
+        if self.on_finish:
+            try:
+                self.on_finish(self)
+            except Exception as e_cb:
+                print(f"FEHLER [{_sched_module_name}]: on_finish von Job '{self.label}' fehlgeschlagen: {e_cb}")
+                traceback.print_exc()
+
+
+# --- Warteschlange ---
+def submit_job(job):
+    _job_queue.append(job)
+    if not bpy.app.timers.is_registered(_scheduler_tick):
+        bpy.app.timers.register(_scheduler_tick, first_interval=0.0)
+    return job
+
+
+def cancel_job(job):
+    job.cancel()
+    if job in _job_queue:
+        _job_queue.remove(job)
+
+
+def cancel_all_jobs():
+    for job in list(_job_queue):
+        cancel_job(job)
+    if bpy.app.timers.is_registered(_scheduler_tick):
+        bpy.app.timers.unregister(_scheduler_tick)
+
+
+def get_jobs():
+    return list(_job_queue)
+
+
+def _job_context(job):
+    """temp_override auf das Fenster, aus dem der Job gestartet wurde (Timer laufen ohne Fenster-Kontext)."""
+    window = job.window
+    if window is not None:
+        try:
+            if any(w == window for w in bpy.context.window_manager.windows):
+                return bpy.context.temp_override(window=window)
+        except ReferenceError:
+            pass
+        job.window = None
+    return None
+
+
+def _run_job_slice(job, deadline):
+    override = _job_context(job)
+    if override is None:
+        return job._run_slice(bpy.context, deadline)
+    with override:
+        return job._run_slice(bpy.context, deadline)
+
+
+def _scheduler_tick():
+    global _last_ui_refresh
+    tick_start = time.perf_counter()
+
+    while _job_queue:
+        job = _job_queue[0]
+        if job.is_finished:
+            _job_queue.pop(0)
+            continue
+        deadline = tick_start + job.time_budget
+        if time.perf_counter() >= deadline:
+            break
+        try:
+            finished = _run_job_slice(job, deadline)
+        except Exception as e:
+            print(f"FEHLER [{_sched_module_name}]: Job '{job.label}' abgebrochen: {e}")
+            traceback.print_exc()
+            job._finish(JOB_FAILED, error=e)
+            finished = True
+        if finished:
+            _job_queue.pop(0)
+        else:
+            break
+
+    now = time.perf_counter()
+    if now - _last_ui_refresh >= UI_REFRESH_INTERVAL_SEC or not _job_queue:
+        _last_ui_refresh = now
+        _tag_ui_redraw()
+
+    return TICK_INTERVAL_SEC if _job_queue else None
+
+
+def _tag_ui_redraw():
+    try:
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == 'VIEW_3D':
+                    area.tag_redraw()
+    except (AttributeError, ReferenceError):
+        pass
+
+
+def draw_job_status(layout):
+    """Zeichnet Fortschritt/Durchsatz/ETA aller laufenden Jobs (für Panels)."""
+    jobs = [job for job in _job_queue if not job.is_finished]
+    if not jobs:
+        return
+    box = layout.box()
+    box.label(text="Laufende Jobs:", icon='TIME')
+    for job in jobs:
+        col = box.column(align=True)
+        if hasattr(col, "progress"):
+            col.progress(factor=job.progress, type='BAR', text=job.status_text())
+        else:
+            col.label(text=job.status_text())
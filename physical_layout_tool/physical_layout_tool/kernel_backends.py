@@ -0,0 +1,206 @@
+# kernel_backends.py
+# Backend-Registry für die Rechenkernel: Pro Kernel (z.B. "records.static_bake") gibt es bis zu vier
+# Implementierungen, NATIVE_THREADED, NATIVE, NUMPY und PYTHON; gewählt wird die schnellste verfügbare,
+# optional übersteuert durch den Nutzer (Addon-Einstellungen) oder per set_override().
+# Native Implementierungen meldet scatter_accel selbst über capabilities() (Kernel, Funktionsname, Stufe)
+# und NATIVE_API_VERSION; ältere Builds ohne capabilities() werden über die hier deklarierten Funktionsnamen
+# erkannt. Die NumPy/Python-Implementierungen (numpy_kernels.py, record_kernels.py) werden unten registriert;
+# damit läuft jeder Kernel auch ohne kompiliertes Modul.
+# Aufrufstellen rufen nur KERNELS.call(kernel, ...) auf; ein neuer oder parallelisierter Kernel braucht dort
+# keine Änderung. Schlägt ein natives Backend zur Laufzeit fehl, springt call() auf das nächste Backend.
+from .native_access import get_native_module, is_native_resolved
+from . import numpy_kernels, record_kernels
+
+_backends_module_name = __name__
+
+BACKEND_AUTO = 'AUTO'
+BACKEND_NATIVE_THREADED = 'NATIVE_THREADED'
+BACKEND_NATIVE = 'NATIVE'
+BACKEND_NUMPY = 'NUMPY'
+BACKEND_PYTHON = 'PYTHON'
+
+# Reihenfolge = Priorität im AUTO-Modus
+BACKEND_ORDER = (BACKEND_NATIVE_THREADED, BACKEND_NATIVE, BACKEND_NUMPY, BACKEND_PYTHON)
+NATIVE_BACKENDS = (BACKEND_NATIVE_THREADED, BACKEND_NATIVE)
+
+BACKEND_OVERRIDE_ITEMS = [
+    (BACKEND_AUTO, "Auto", "Fastest available implementation per kernel"),
+    (BACKEND_NATIVE_THREADED, "Native (threaded)", "Prefer multi-threaded native kernels where the build provides them"),
+    (BACKEND_NATIVE, "Native", "Prefer single-threaded native kernels"),
+    (BACKEND_NUMPY, "NumPy", "Prefer vectorized NumPy kernels (no compiled module needed)"),
+    (BACKEND_PYTHON, "Python", "Prefer pure-Python reference kernels (debugging)"),
+]
+
+KERNEL_ANALYZE_BATCH = "processing.analyze_batch"
+KERNEL_ANALYZE_SINGLE = "processing.analyze_single"
+KERNEL_RANDOM_TRANSFORMS = "transforms.random"
+KERNEL_STATIC_BAKE_RECORDS = "records.static_bake"
+KERNEL_RB_SETUP_RECORDS = "records.rb_setup"
+KERNEL_CONFIGURE_RIGID_BODIES = "rigidbody.configure_batch"
+KERNEL_CIRCLE_MARKER = "gpu.circle_marker"
+KERNEL_MESH_GPU_DATA = "gpu.mesh_data"
+
+# Kernel -> Funktionsname in scatter_accel (Erkennung für Builds ohne capabilities())
+_NATIVE_FUNCTIONS = {
+    KERNEL_ANALYZE_BATCH: "analyze_scatter_objects_for_processing",
+    KERNEL_ANALYZE_SINGLE: "analyze_single_object_for_processing",
+    KERNEL_RANDOM_TRANSFORMS: "calculate_random_transforms_cpp",
+    KERNEL_STATIC_BAKE_RECORDS: "analyze_static_bake_records_cpp",
+    KERNEL_RB_SETUP_RECORDS: "analyze_rb_setup_records_cpp",
+    KERNEL_CONFIGURE_RIGID_BODIES: "configure_batch_rigidbody_properties_cpp",
+    KERNEL_CIRCLE_MARKER: "generate_circle_marker_gpu_data_cpp",
+    KERNEL_MESH_GPU_DATA: "prepare_mesh_gpu_data_from_flat_arrays_cpp",
+}
+
+
+class KernelUnavailableError(RuntimeError):
+    """Für den Kernel gibt es in dieser Installation keine Implementierung."""
+
+
+class KernelRegistry:
+    def __init__(self, native_functions):
+        self._native_functions = dict(native_functions)
+        self._python_impls = {}      # kernel -> {backend: callable}
+        self._native_table = None    # kernel -> {backend: funktionsname}, None = noch nicht gelesen
+        self.native_api_version = None
+        self.override = BACKEND_AUTO
+        self._kernel_overrides = {}
+        self._resolved = {}          # kernel -> [(backend, callable), ...] in Auswahlreihenfolge
+
+    # --- Registrierung ---
+    def register(self, kernel, backend, func):
+        """Registriert eine Python-seitige Implementierung (NUMPY oder PYTHON) für kernel."""
+        if backend in NATIVE_BACKENDS:
+            raise ValueError(f"Native Backends meldet scatter_accel selbst (capabilities()), nicht register(): {kernel}")
+        self._python_impls.setdefault(kernel, {})[backend] = func
+        self._resolved.pop(kernel, None)
+
+    def kernels(self):
+        return sorted(set(self._native_functions) | set(self._python_impls))
+
+    # --- Native Fähigkeiten ---
+    def _native_capabilities(self):
+        if self._native_table is not None:
+            return self._native_table
+        module = get_native_module()
+        table = {}
+        if module is not None:
+            self.native_api_version = getattr(module, "NATIVE_API_VERSION", None)
+            try:
+                reported = module.capabilities() if hasattr(module, "capabilities") else None
+            except Exception as e:
+                print(f"WARNUNG [{_backends_module_name}]: scatter_accel.capabilities() fehlgeschlagen: {e}")
+                reported = None
+            if reported is not None:
+                for kernel, function_name, backend in reported:
+                    if backend in NATIVE_BACKENDS and hasattr(module, function_name):
+                        table.setdefault(kernel, {})[backend] = function_name
+            else:
+                # Älterer Build: Funktionen über die bekannten Namen erkennen, alle einstufig
+                for kernel, function_name in self._native_functions.items():
+                    if hasattr(module, function_name):
+                        table[kernel] = {BACKEND_NATIVE: function_name}
+        self._native_table = table
+        return table
+
+    def _implementations(self, kernel):
+        """{backend: callable} aller verfügbaren Implementierungen (lädt ggf. das native Modul)."""
+        impls = dict(self._python_impls.get(kernel, {}))
+        native_entries = self._native_capabilities().get(kernel)
+        if native_entries:
+            module = get_native_module()
+            for backend, function_name in native_entries.items():
+                impls[backend] = getattr(module, function_name)
+        return impls
+
+    # --- Auswahl ---
+    def set_override(self, backend, kernel=None):
+        """Bevorzugtes Backend global oder für einen Kernel (BACKEND_AUTO bzw. None hebt auf)."""
+        if backend is not None and backend != BACKEND_AUTO and backend not in BACKEND_ORDER:
+            raise ValueError(f"Unbekanntes Backend '{backend}'")
+        if kernel is None:
+            self.override = backend or BACKEND_AUTO
+        elif backend in (None, BACKEND_AUTO):
+            self._kernel_overrides.pop(kernel, None)
+        else:
+            self._kernel_overrides[kernel] = backend
+        self._resolved.clear()
+
+    def preferred_backend(self, kernel):
+        return self._kernel_overrides.get(kernel, self.override)
+
+    def _candidates(self, kernel):
+        candidates = self._resolved.get(kernel)
+        if candidates is None:
+            impls = self._implementations(kernel)
+            order = list(BACKEND_ORDER)
+            preferred = self.preferred_backend(kernel)
+            if preferred in impls:
+                order.remove(preferred)
+                order.insert(0, preferred)
+            candidates = self._resolved[kernel] = [(backend, impls[backend]) for backend in order if backend in impls]
+        return candidates
+
+    def available(self, kernel):
+        return bool(self._candidates(kernel))
+
+    def selected_backend(self, kernel):
+        candidates = self._candidates(kernel)
+        return candidates[0][0] if candidates else None
+
+    def get(self, kernel):
+        """Die gewählte Implementierung als Callable (für enge Schleifen, ohne Fehler-Fallback)."""
+        candidates = self._candidates(kernel)
+        if not candidates:
+            raise KernelUnavailableError(f"Keine Implementierung für Kernel '{kernel}' verfügbar.")
+        return candidates[0][1]
+
+    def call(self, kernel, *args, **kwargs):
+        """Ruft die gewählte Implementierung auf; ein fehlschlagendes natives Backend fällt auf das nächste zurück."""
+        candidates = self._candidates(kernel)
+        if not candidates:
+            raise KernelUnavailableError(f"Keine Implementierung für Kernel '{kernel}' verfügbar.")
+        last = len(candidates) - 1
+        for position, (backend, func) in enumerate(candidates):
+            if position == last or backend not in NATIVE_BACKENDS:
+                return func(*args, **kwargs)
+            try:
+                return func(*args, **kwargs)
+            except Exception as e_native:
+                print(f"WARNUNG [{_backends_module_name}]: Kernel '{kernel}' ({backend}) fehlgeschlagen, "
+                      f"nutze {candidates[position + 1][0]}: {e_native}")
+
+    # --- Anzeige ---
+    def describe(self, load_native=False):
+        """
+        Zeilen für die UI: {"kernel", "selected", "available", "override"}.
+        load_native=False lädt das native Modul nicht (draw()); native Backends erscheinen dann erst nach dem Laden.
+        """
+        rows = []
+        native_known = load_native or is_native_resolved()
+        for kernel in self.kernels():
+            if native_known:
+                backends = [backend for backend, _ in self._candidates(kernel)]
+            else:
+                impls = self._python_impls.get(kernel, {})
+                backends = [backend for backend in BACKEND_ORDER if backend in impls]
+            rows.append({
+                "kernel": kernel,
+                "selected": backends[0] if backends else None,
+                "available": sorted(backends, key=BACKEND_ORDER.index),
+                "override": self._kernel_overrides.get(kernel),
+            })
+        return rows
+
+
+KERNELS = KernelRegistry(_NATIVE_FUNCTIONS)
+
+
+# NumPy/Python-Backend: jeder Kernel bis auf rigidbody.configure_batch (braucht bpy, Python-Pfad in rigidbody_bulk)
+KERNELS.register(KERNEL_ANALYZE_BATCH, BACKEND_PYTHON, numpy_kernels.analyze_scatter_objects_for_processing_py)
+KERNELS.register(KERNEL_ANALYZE_SINGLE, BACKEND_PYTHON, numpy_kernels.analyze_single_object_for_processing_py)
+KERNELS.register(KERNEL_RANDOM_TRANSFORMS, BACKEND_PYTHON, numpy_kernels.calculate_random_transforms_py)
+KERNELS.register(KERNEL_STATIC_BAKE_RECORDS, BACKEND_NUMPY, record_kernels.analyze_static_bake_records_np)
+KERNELS.register(KERNEL_RB_SETUP_RECORDS, BACKEND_NUMPY, record_kernels.analyze_rb_setup_records_np)
+KERNELS.register(KERNEL_CIRCLE_MARKER, BACKEND_NUMPY, numpy_kernels.generate_circle_marker_gpu_data_np)
+KERNELS.register(KERNEL_MESH_GPU_DATA, BACKEND_NUMPY, numpy_kernels.prepare_mesh_gpu_data_np)
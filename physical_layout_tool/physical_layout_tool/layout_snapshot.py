@@ -0,0 +1,290 @@
+# layout_snapshot.py
+# Binärer Layout-Snapshot der Addon-Collections (Instanz-, Static- und Session-Collections):
+# Namen, Quell-Mesh, Weltmatrix und Flags aller Objekte landen als OBJECT_RECORD_DTYPE-Records
+# (object_metadata) in EINER .npz-Datei. Beim Import werden die Objekte gesammelt neu angelegt
+# (geteilte Mesh-Daten = Instanzen), per Collection-Bit verlinkt und Rigid Bodies über
+# rigidbody_bulk in einem Durchgang ergänzt. Layouts lassen sich so versionieren und zwischen Szenen verschieben.
+# Punkt-Träger des Punkt-Backends (point_instancing) sind keine Objekt-Records: ihre Punkte werden als
+# Weltmatrix + Quell-Mesh + Träger gespeichert und beim Import über ScatterPointBuffer wieder aufgebaut.
+import bpy
+import os
+import re
+import traceback
+import numpy as np
+
+from .object_metadata import (
+    extract_object_records,
+    RECORD_HAS_RIGIDBODY,
+    RECORD_RB_ENABLED,
+    RECORD_RB_KINEMATIC,
+    RB_TYPE_ACTIVE,
+    RB_TYPE_PASSIVE,
+)
+from .point_instancing import POINTS_SOURCES_PROP, ScatterPointBuffer, compose_matrices_np, read_point_arrays
+from .rigidbody_bulk import bulk_add_rigid_bodies, build_rigid_body_settings
+from .simulation_bake import gather_managed_collections
+from .static_bake import write_world_matrices
+
+_snapshot_module_name = __name__
+
+LAYOUT_SNAPSHOT_VERSION = 2 # 2: Punkt-Träger (points_*)
+LAYOUT_SNAPSHOT_EXTENSION = ".npz"
+
+# Addon-Flags pro Objekt (Array "addon_flags")
+SNAPSHOT_SCATTER_INSTANCE = 1  # Custom Property is_scatter_instance
+
+_COPY_SUFFIX_RE = re.compile(r"\.\d{3,}$")
+
+
+def gather_layout_objects(context, im_settings):
+    """Alle Objekte der Addon-Collections (ohne Duplikate) plus die Collections selbst."""
+    collections = gather_managed_collections(context, im_settings)
+    objects, seen = [], set()
+    for col in collections:
+        for obj in col.objects:
+            if obj.name not in seen:
+                seen.add(obj.name)
+                objects.append(obj)
+    return objects, collections
+
+
+def is_point_carrier(obj):
+    """Punkt-Träger des Punkt-Backends: Mesh-Objekt mit der Proxy-Namensliste (POINTS_SOURCES_PROP)."""
+    return obj.type == 'MESH' and POINTS_SOURCES_PROP in obj
+
+
+def extract_point_layouts(carriers):
+    """
+    Punkte aller Träger als (P,4,4) Weltmatrizen plus Index ins Quell-Mesh (-1: Proxy fehlt) und in carriers.
+    Gibt (matrices, mesh_indices, carrier_indices, mesh_names) zurück.
+    """
+    matrix_blocks, mesh_blocks, carrier_blocks = [], [], []
+    mesh_names, mesh_lookup = [], {}
+    for carrier_index, carrier in enumerate(carriers):
+        positions, quats, scales, source_indices = read_point_arrays(carrier)
+        if not len(source_indices):
+            continue
+        order = list(carrier.get(POINTS_SOURCES_PROP, []))
+        proxy_mesh_indices = []
+        for proxy_name in order:
+            proxy = bpy.data.objects.get(proxy_name)
+            mesh_name = proxy.data.name if proxy and proxy.data else None
+            if mesh_name is not None and mesh_name not in mesh_lookup:
+                mesh_lookup[mesh_name] = len(mesh_names)
+                mesh_names.append(mesh_name)
+            proxy_mesh_indices.append(mesh_lookup.get(mesh_name, -1))
+        remap = np.array(proxy_mesh_indices + [-1], dtype=np.int32) # letzter Eintrag: ungültiger Index
+        in_range = (source_indices >= 0) & (source_indices < len(order))
+        mesh_blocks.append(remap[np.where(in_range, source_indices, len(order))])
+        world = np.array(carrier.matrix_world, dtype=np.float64)
+        matrix_blocks.append(world @ compose_matrices_np(positions, quats, scales))
+        carrier_blocks.append(np.full(len(source_indices), carrier_index, dtype=np.int32))
+    if not matrix_blocks:
+        return np.empty((0, 4, 4)), np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32), mesh_names
+    return np.concatenate(matrix_blocks), np.concatenate(mesh_blocks), np.concatenate(carrier_blocks), mesh_names
+
+
+def export_layout_snapshot(context, im_settings, filepath):
+    """
+    Schreibt den Snapshot nach filepath (.npz, komprimiert).
+    Gibt die Anzahl exportierter Objekte plus Punkte (Punkt-Backend) zurück.
+    """
+    layout_objects, collections = gather_layout_objects(context, im_settings)
+    objects = [obj for obj in layout_objects if not is_point_carrier(obj)]
+    carriers = [obj for obj in layout_objects if is_point_carrier(obj)]
+    record_set = extract_object_records(context, objects, collections)
+    point_matrices, point_mesh_indices, point_carrier_indices, point_mesh_names = extract_point_layouts(carriers)
+    addon_flags = np.fromiter(
+        (SNAPSHOT_SCATTER_INSTANCE if obj.get("is_scatter_instance") else 0 for obj in record_set.objects),
+        dtype=np.uint8, count=len(record_set.objects))
+
+    directory = os.path.dirname(filepath)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    np.savez_compressed(
+        filepath,
+        version=np.int64(LAYOUT_SNAPSHOT_VERSION),
+        records=record_set.records,
+        names=np.array([obj.name for obj in record_set.objects], dtype=str),
+        mesh_names=np.array(record_set.mesh_names, dtype=str),
+        collection_names=np.array(record_set.collection_names, dtype=str),
+        addon_flags=addon_flags,
+        points_matrices=point_matrices,
+        points_mesh_index=point_mesh_indices,
+        points_carrier_index=point_carrier_indices,
+        points_mesh_names=np.array(point_mesh_names, dtype=str),
+        points_carrier_names=np.array([obj.name for obj in carriers], dtype=str),
+        points_carrier_collections=np.array(
+            [obj.users_collection[0].name if obj.users_collection else context.scene.collection.name for obj in carriers],
+            dtype=str),
+    )
+    return len(record_set.objects) + len(point_matrices)
+
+
+def read_layout_snapshot(filepath):
+    """
+    Liest einen Snapshot. Gibt ein dict mit records, names, mesh_names, collection_names, addon_flags und
+    den points_*-Arrays zurück (Version 1 ohne Punkt-Träger: leer).
+    """
+    with np.load(filepath, allow_pickle=False) as data:
+        version = int(data["version"])
+        if version > LAYOUT_SNAPSHOT_VERSION:
+            raise ValueError(f"Snapshot-Version {version} wird nicht unterstützt (max. {LAYOUT_SNAPSHOT_VERSION}).")
+        has_points = "points_matrices" in data.files
+        return {
+            "records": data["records"],
+            "names": data["names"].tolist(),
+            "mesh_names": data["mesh_names"].tolist(),
+            "collection_names": data["collection_names"].tolist(),
+            "addon_flags": data["addon_flags"],
+            "points_matrices": data["points_matrices"] if has_points else np.empty((0, 4, 4)),
+            "points_mesh_index": data["points_mesh_index"] if has_points else np.empty(0, dtype=np.int32),
+            "points_carrier_index": data["points_carrier_index"] if has_points else np.empty(0, dtype=np.int32),
+            "points_mesh_names": data["points_mesh_names"].tolist() if has_points else [],
+            "points_carrier_names": data["points_carrier_names"].tolist() if has_points else [],
+            "points_carrier_collections": data["points_carrier_collections"].tolist() if has_points else [],
+        }
+
+
+def _resolve_mesh(mesh_name):
+    # Single-User-Kopien (Name.001) fehlen evtl. in der Zieldatei -> auf das Quell-Mesh zurückfallen
+    mesh = bpy.data.meshes.get(mesh_name)
+    if mesh is None:
+        mesh = bpy.data.meshes.get(_COPY_SUFFIX_RE.sub("", mesh_name))
+    return mesh
+
+
+def _scene_collection_for(context, collection_name):
+    scene_collection = context.scene.collection
+    if collection_name == scene_collection.name:
+        return scene_collection
+    col = bpy.data.collections.get(collection_name)
+    if col is None:
+        col = bpy.data.collections.new(collection_name)
+    if col != scene_collection and col not in scene_collection.children_recursive:
+        scene_collection.children.link(col)
+    return col
+
+
+def _remove_collection_objects(collections):
+    to_remove = {obj for col in collections for obj in col.objects}
+    if to_remove:
+        bpy.data.batch_remove(list(to_remove))
+    return len(to_remove)
+
+
+def import_layout_snapshot(context, filepath, phys_settings=None, replace_existing=False):
+    """
+    Baut das Layout aus filepath in der aktuellen Szene auf. Objekte teilen sich die Mesh-Daten
+    (Instanzen), Punkte landen wieder auf ihren Punkt-Trägern; fehlende Quell-Meshes werden übersprungen.
+    Gibt (created_count, missing_mesh_count) zurück, Punkte mitgezählt.
+    """
+    snapshot = read_layout_snapshot(filepath)
+    records = snapshot["records"]
+    names = snapshot["names"]
+    count = len(records)
+    if not count and not len(snapshot["points_matrices"]):
+        return 0, 0
+
+    collections = [_scene_collection_for(context, name) for name in snapshot["collection_names"]]
+    if replace_existing:
+        removed = _remove_collection_objects([col for col in collections if col != context.scene.collection])
+        print(f"INFO [{_snapshot_module_name}]: {removed} vorhandene Objekt(e) vor dem Import entfernt.")
+
+    points_created, points_missing = _restore_point_layouts(context, snapshot)
+    if not count:
+        context.view_layer.update()
+        return points_created, points_missing
+
+    meshes = [_resolve_mesh(name) for name in snapshot["mesh_names"]]
+    mesh_indices = records["mesh_index"]
+
+    created = [None] * count
+    missing = 0
+    for i, (name, mesh_index) in enumerate(zip(names, mesh_indices.tolist())):
+        mesh = meshes[mesh_index] if mesh_index >= 0 else None
+        if mesh is None:
+            missing += 1
+            continue
+        created[i] = bpy.data.objects.new(name=name, object_data=mesh)
+    valid = np.array([obj is not None for obj in created], dtype=bool)
+    if not valid.any():
+        context.view_layer.update()
+        return points_created, missing + points_missing
+
+    # Pro Collection ein Batch über die Bitmaske
+    masks = records["collection_mask"]
+    linked = np.zeros(count, dtype=bool)
+    for bit, col in enumerate(collections):
+        members = np.flatnonzero(valid & ((masks & (np.uint64(1) << np.uint64(bit))) != 0))
+        col_objects = col.objects
+        for i in members.tolist():
+            col_objects.link(created[i])
+        linked[members] = True
+    for i in np.flatnonzero(valid & ~linked).tolist():
+        context.scene.collection.objects.link(created[i])
+
+    objects = [obj for obj in created if obj is not None]
+    write_world_matrices(objects, records["matrix_world"][valid])
+
+    addon_flags = snapshot["addon_flags"]
+    for i in np.flatnonzero(valid & ((addon_flags & SNAPSHOT_SCATTER_INSTANCE) != 0)).tolist():
+        created[i]["is_scatter_instance"] = True
+
+    _restore_rigid_bodies(context, created, records, valid, phys_settings)
+    context.view_layer.update()
+    return len(objects) + points_created, missing + points_missing
+
+
+def _restore_point_layouts(context, snapshot):
+    """Schreibt die Punkte je Träger über ScatterPointBuffer (Proxies/Geometry Nodes wie beim Scattern)."""
+    matrices = snapshot["points_matrices"]
+    if not len(matrices):
+        return 0, 0
+    meshes = [_resolve_mesh(name) for name in snapshot["points_mesh_names"]]
+    mesh_indices = snapshot["points_mesh_index"]
+    carrier_indices = snapshot["points_carrier_index"]
+    created = missing = 0
+    for carrier_index, (carrier_name, collection_name) in enumerate(
+            zip(snapshot["points_carrier_names"], snapshot["points_carrier_collections"])):
+        members = np.flatnonzero(carrier_indices == carrier_index)
+        if not len(members):
+            continue
+        # Punkte liegen im Objektraum des Trägers; ein vorhandener Träger behält seine Transformation
+        carrier = bpy.data.objects.get(carrier_name)
+        to_local = np.linalg.inv(np.array(carrier.matrix_world, dtype=np.float64)) if carrier else np.eye(4)
+        buffer = ScatterPointBuffer(carrier_name)
+        for i in members.tolist():
+            mesh = meshes[mesh_indices[i]] if mesh_indices[i] >= 0 else None
+            if mesh is None:
+                missing += 1
+                continue
+            buffer.add(to_local @ matrices[i], mesh.name)
+        if len(buffer):
+            created += buffer.flush(context, _scene_collection_for(context, collection_name))
+    return created, missing
+
+
+def _restore_rigid_bodies(context, created, records, valid, phys_settings):
+    flags = records["flags"]
+    has_rb = valid & ((flags & RECORD_HAS_RIGIDBODY) != 0)
+    if not has_rb.any():
+        return
+    rb_types = records["rb_type"]
+    for rb_type_code, rb_type in ((RB_TYPE_ACTIVE, 'ACTIVE'), (RB_TYPE_PASSIVE, 'PASSIVE')):
+        group = np.flatnonzero(has_rb & (rb_types == rb_type_code))
+        if not len(group):
+            continue
+        try:
+            bulk_add_rigid_bodies(context, [created[i] for i in group.tolist()],
+                                  build_rigid_body_settings(phys_settings, rb_type))
+        except Exception as e_rb:
+            print(f"FEHLER [{_snapshot_module_name}]: Rigid Bodies ({rb_type}) konnten nicht wiederhergestellt werden: {e_rb}")
+            traceback.print_exc()
+    for i in np.flatnonzero(has_rb).tolist():
+        rb = created[i].rigid_body
+        if rb is None:
+            continue
+        rb.kinematic = bool(flags[i] & RECORD_RB_KINEMATIC)
+        rb.enabled = bool(flags[i] & RECORD_RB_ENABLED)
+
@@ -14,6 +14,11 @@ def load_native_module(module_name, addon_root_path):
         module_name (str): Der Name des Moduls ohne Dateiendung (z.B. "scatter_accel").
         addon_root_path (str): Der Pfad zum Hauptverzeichnis des Addons.
     """
+    return load_native_module_from_path(module_name, find_native_module_path(module_name, addon_root_path))
+
+
+def find_native_module_path(module_name, addon_root_path):
+    """Sucht die Moduldatei (erst native/, dann Addon-Root) und gibt ihren Pfad zurück; ImportError, wenn keine passt."""
     system = platform.system()
     # machine_arch = platform.machine() # z.B. 'AMD64', 'x86_64', 'arm64'
 
@@ -65,15 +70,16 @@ def load_native_module(module_name, addon_root_path):
     if not module_path:
         searched_names_str = ", ".join(possible_filenames)
         raise ImportError(f"Native module '{module_name}' (gesuchte Dateien: '{searched_names_str}') nicht gefunden in Pfaden: {search_paths}")
+    return module_path
 
-    print(f"  [Loader] Versuche Modul zu laden von: {module_path}")
 
+def load_native_module_from_path(module_name, module_path):
+    """Importiert das native Modul aus module_path (Verzeichnis nur während des Imports im sys.path)."""
     module_dir = os.path.dirname(module_path)
     path_added_to_sys = False
     if module_dir not in sys.path:
         sys.path.insert(0, module_dir)
         path_added_to_sys = True
-        print(f"  [Loader] Temporär zum sys.path hinzugefügt: {module_dir}")
 
     try:
         spec = importlib.util.spec_from_file_location(module_name, module_path)
@@ -83,7 +89,6 @@ def load_native_module(module_name, addon_root_path):
         mod = importlib.util.module_from_spec(spec)
         sys.modules[module_name] = mod 
         spec.loader.exec_module(mod)
-        print(f"  [Loader] Modul '{module_name}' erfolgreich geladen.")
         return mod
     except ImportError as e:
         print(f"  [Loader] ImportError beim Laden von '{module_name}': {e}")
@@ -97,4 +102,3 @@ def load_native_module(module_name, addon_root_path):
         if path_added_to_sys:
             if sys.path and sys.path[0] == module_dir:
                 sys.path.pop(0)
-                print(f"  [Loader] Temporärer Pfad entfernt: {module_dir}")
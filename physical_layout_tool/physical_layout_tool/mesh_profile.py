@@ -0,0 +1,326 @@
+# mesh_profile.py
+# Geometrie-Kennwerte pro Mesh-Datenblock, einmal berechnet statt bei jedem Schritt neu:
+# lokale AABB, Bounding Sphere, Hüllpunkte für Min-Z-Abfragen unter beliebiger Rotation/Skalierung
+# und die Flächen-CDF der Dreiecke zum Sampling von Oberflächenpunkten.
+# Schlüssel: (Mesh-Datenblock, Auswertungs-Hash, Generation). Der Auswertungs-Hash beschreibt den aktiven
+# Modifier-Stack samt Einstellungen (mit Modifiern wird das ausgewertete Mesh gelesen, wie bei
+# obj.bound_box/obj.dimensions); Objekte mit gleichem Mesh und gleich eingestellten Modifiern teilen ein Profil.
+# Verweist ein Modifier auf ein Objekt (Boolean, Shrinkwrap, Array-Offset ...), gehört das Objekt mit zum Hash;
+# die Generation zählt ein depsgraph_update_post-Handler bei Geometrie-Änderungen (Edit, Modifier) hoch.
+import bpy
+import bmesh
+import numpy as np
+from mathutils import Vector
+from mathutils.bvhtree import BVHTree
+
+_profile_module_name = __name__
+
+MAX_PROFILES = 512        # älteste Einträge fallen zuerst heraus
+HULL_MIN_VERTICES = 64    # darunter ist min() über alle Vertices billiger als die Hülle
+
+
+class MeshProfile:
+    """Lokale Kennwerte eines Meshes (Objektraum, ohne Objekt-Transformation)."""
+    __slots__ = ("mesh_name", "vertex_count", "bbox_min", "bbox_max", "sphere_center", "sphere_radius",
+                 "_positions", "_triangles", "_area_cdf", "_tri_bounds", "_hull", "_hull_mesh_name")
+
+    def __init__(self, mesh_name, positions, triangles, hull_points=None, hull_mesh_name=None):
+        """hull_mesh_name: Basis-Mesh, aus dem die Hülle erst bei der ersten Min-Z-Abfrage gebaut wird."""
+        self.mesh_name = mesh_name
+        self.vertex_count = len(positions)
+        self._positions = positions
+        self._triangles = triangles
+        self._area_cdf = None
+        self._tri_bounds = None
+        if self.vertex_count:
+            self.bbox_min = positions.min(axis=0)
+            self.bbox_max = positions.max(axis=0)
+        else:
+            self.bbox_min = self.bbox_max = np.zeros(3, dtype=np.float32)
+        self.sphere_center = 0.5 * (self.bbox_min + self.bbox_max)
+        self.sphere_radius = float(np.sqrt(np.max(np.sum((positions - self.sphere_center) ** 2, axis=1)))) if self.vertex_count else 0.0
+        self._hull = hull_points
+        self._hull_mesh_name = hull_mesh_name
+
+    @property
+    def hull_points(self):
+        """Punkte der konvexen Hülle (bzw. alle Vertices): Min/Max einer linearen Funktion liegen immer dort."""
+        if self._hull is None:
+            mesh = bpy.data.meshes.get(self._hull_mesh_name) if self._hull_mesh_name else None
+            hull = _hull_points(mesh, self._positions) if mesh is not None and len(mesh.vertices) == self.vertex_count else None
+            self._hull = hull if hull is not None else self._positions
+            self._hull_mesh_name = None
+        return self._hull
+
+    @property
+    def dimensions(self):
+        """Lokale Abmessungen (wie obj.dimensions bei Skalierung 1)."""
+        return Vector((self.bbox_max - self.bbox_min).tolist())
+
+    def scaled_dimensions(self, scale):
+        return Vector(float(d) * abs(s) for d, s in zip(self.bbox_max - self.bbox_min, scale))
+
+    def min_z(self, matrix):
+        """
+        Kleinstes Z der Geometrie unter matrix (3x3 oder 4x4, Translation wird ignoriert):
+        ein Skalarprodukt pro Hüllpunkt statt acht rotierter bound_box-Ecken; exakt für das Mesh selbst.
+        """
+        if not self.vertex_count:
+            return 0.0
+        row = np.array(tuple(matrix[2])[:3], dtype=np.float64)
+        return float((self.hull_points @ row).min())
+
+    def world_sphere(self, matrix_world):
+        """(Mittelpunkt in Weltkoordinaten, Radius) der Bounding Sphere unter matrix_world."""
+        center = matrix_world @ Vector(self.sphere_center.tolist())
+        scale = max(abs(s) for s in matrix_world.to_scale())
+        return center, self.sphere_radius * scale
+
+    def triangles_in_box(self, matrix_world, box_min, box_max):
+        """
+        Dreiecke (T,3,3) in Weltkoordinaten, deren AABB die Welt-Box box_min/box_max schneidet. Geprüft wird
+        lokal gegen die (konservative) zurücktransformierte Box; transformiert werden nur die Treffer.
+        """
+        if not len(self._triangles):
+            return np.empty((0, 3, 3), dtype=np.float64)
+        if self._tri_bounds is None:
+            corners = self._positions[self._triangles]
+            self._tri_bounds = (corners.min(axis=1), corners.max(axis=1))
+        matrix = np.array(matrix_world, dtype=np.float64)
+        tri_min, tri_max = self._tri_bounds
+        try:
+            inverse = np.linalg.inv(matrix)
+        except np.linalg.LinAlgError:
+            mask = slice(None) # degenerierte Skalierung: alle Dreiecke
+        else:
+            box = np.array([(x, y, z) for x in (box_min[0], box_max[0]) for y in (box_min[1], box_max[1])
+                            for z in (box_min[2], box_max[2])], dtype=np.float64)
+            local = box @ inverse[:3, :3].T + inverse[:3, 3]
+            mask = np.all(tri_min <= local.max(axis=0), axis=1) & np.all(tri_max >= local.min(axis=0), axis=1)
+        corners = self._positions[self._triangles[mask]].astype(np.float64)
+        return corners @ matrix[:3, :3].T + matrix[:3, 3]
+
+    def bvh(self, matrix_world):
+        """BVHTree der Dreiecke unter matrix_world: Overlap-Test ohne verlinktes, ausgewertetes Objekt."""
+        matrix = np.array(matrix_world, dtype=np.float64)
+        world = self._positions @ matrix[:3, :3].T + matrix[:3, 3]
+        return BVHTree.FromPolygons(world.tolist(), self._triangles.tolist(), all_triangles=True)
+
+    def _area_distribution(self):
+        if self._area_cdf is None:
+            if len(self._triangles):
+                corners = self._positions[self._triangles]
+                areas = 0.5 * np.linalg.norm(np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]), axis=1)
+                self._area_cdf = np.cumsum(areas, dtype=np.float64)
+            else:
+                self._area_cdf = np.zeros(0, dtype=np.float64)
+        return self._area_cdf
+
+    @property
+    def surface_area(self):
+        cdf = self._area_distribution()
+        return float(cdf[-1]) if len(cdf) else 0.0
+
+    def sample_surface(self, count, rng=None):
+        """count flächengleichverteilte Punkte (count, 3) auf der Oberfläche, lokal; leer ohne Dreiecke."""
+        cdf = self._area_distribution()
+        if not len(cdf) or cdf[-1] <= 0.0:
+            return np.empty((0, 3), dtype=np.float32)
+        rng = rng or np.random.default_rng()
+        tri = np.searchsorted(cdf, rng.random(count) * cdf[-1], side="right").clip(0, len(cdf) - 1)
+        corners = self._positions[self._triangles[tri]]
+        u, v = rng.random(count), rng.random(count)
+        flip = u + v > 1.0
+        u[flip], v[flip] = 1.0 - u[flip], 1.0 - v[flip]
+        return (corners[:, 0] + u[:, None] * (corners[:, 1] - corners[:, 0])
+                + v[:, None] * (corners[:, 2] - corners[:, 0])).astype(np.float32)
+
+
+_MODIFIER_UI_PROPERTIES = {"rna_type", "name", "show_expanded", "show_in_editmode", "show_on_cage", "show_render", "is_active"}
+_modifier_properties = {} # Modifier-Typ -> Identifier der Einstellungen (beschreibbar, ohne UI-Flags)
+
+
+def _settings_of(mod):
+    identifiers = _modifier_properties.get(mod.type)
+    if identifiers is None:
+        identifiers = _modifier_properties[mod.type] = tuple(
+            prop.identifier for prop in mod.bl_rna.properties
+            if not prop.is_readonly and prop.type != 'COLLECTION' and prop.identifier not in _MODIFIER_UI_PROPERTIES)
+    return identifiers
+
+
+def _setting_value(value):
+    if isinstance(value, bpy.types.ID):
+        return value.name_full
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, set):
+        return tuple(sorted(value))
+    try:
+        return tuple(map(_setting_value, value)) # bpy_prop_array, Vector, Matrix-Zeilen
+    except TypeError:
+        return None         # verschachtelte Structs (keine Geometrie-Parameter)
+
+
+def _modifier_signature(obj):
+    """
+    Auswertungs-Hash: aktive Modifier mit allen Einstellungen, bei Geometry Nodes auch die Eingänge
+    (leer = Basis-Mesh genügt, keine Depsgraph-Auswertung). Objekt-Verweise binden das Profil an obj.
+    """
+    if obj is None:
+        return ()
+    signature = []
+    references_object = False
+    for mod in obj.modifiers:
+        if not mod.show_viewport:
+            continue
+        settings = []
+        for identifier in _settings_of(mod):
+            value = getattr(mod, identifier, None)
+            references_object = references_object or isinstance(value, bpy.types.Object)
+            settings.append(_setting_value(value))
+        inputs = ()
+        if mod.type == 'NODES': # Eingänge liegen als ID-Properties am Modifier
+            input_values = [mod[key] for key in mod.keys()]
+            references_object = references_object or any(isinstance(value, bpy.types.Object) for value in input_values)
+            inputs = tuple(zip(mod.keys(), map(_setting_value, input_values)))
+        signature.append((mod.type, mod.name, tuple(settings), inputs))
+    if signature and references_object:
+        signature.append(("OBJECT", obj.name_full))
+    return tuple(signature)
+
+
+def _hull_points(mesh, positions):
+    if len(positions) < HULL_MIN_VERTICES:
+        return None
+    bm = bmesh.new()
+    try:
+        bm.from_mesh(mesh)
+        result = bmesh.ops.convex_hull(bm, input=bm.verts[:], use_existing_faces=False)
+        indices = [elem.index for elem in result.get("geom", ()) if isinstance(elem, bmesh.types.BMVert)]
+    except Exception as e:
+        print(f"WARNUNG [{_profile_module_name}]: Konvexe Hülle für '{mesh.name}' fehlgeschlagen, nutze alle Vertices: {e}")
+        return None
+    finally:
+        bm.free()
+    indices = [i for i in indices if 0 <= i < len(positions)]
+    return positions[np.unique(indices)] if len(indices) >= 4 else None
+
+
+def _build_profile(mesh, lazy_hull):
+    count = len(mesh.vertices)
+    positions = np.empty(count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", positions)
+    positions = positions.reshape(count, 3)
+    mesh.calc_loop_triangles()
+    triangles = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", triangles)
+    if lazy_hull:
+        # Basis-Mesh bleibt erreichbar: Hülle erst bei Bedarf (Hindernisse brauchen nur die Sphere)
+        return MeshProfile(mesh.name_full, positions, triangles.reshape(-1, 3), hull_mesh_name=mesh.name)
+    # Ausgewertetes Mesh ist nach to_mesh_clear() weg: Hülle sofort
+    return MeshProfile(mesh.name_full, positions, triangles.reshape(-1, 3), _hull_points(mesh, positions))
+
+
+class MeshProfileCache:
+    def __init__(self, max_entries=MAX_PROFILES):
+        self.max_entries = max_entries
+        self._profiles = {}
+        self._generations = {}   # Mesh-Name -> Zähler, erhöht bei Geometrie-Updates (angelegt beim ersten Schlüssel)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._profiles)
+
+    def _store(self, key, profile):
+        if len(self._profiles) >= self.max_entries:
+            self._profiles.pop(next(iter(self._profiles)))
+        self._profiles[key] = profile
+        return profile
+
+    def key_for_object(self, obj):
+        """Schlüssel der Geometrie, die obj zeigt: (Mesh-Name, Modifier-Hash, Generation); None ohne Mesh."""
+        if obj is None or obj.type != 'MESH' or obj.data is None:
+            return None
+        mesh_name = obj.data.name_full
+        return (mesh_name, _modifier_signature(obj), self._generations.setdefault(mesh_name, 0))
+
+    def for_object(self, obj, depsgraph=None):
+        """Profil der Geometrie, die obj zeigt (mit aktiven Modifiern ausgewertet); None ohne Mesh."""
+        key = self.key_for_object(obj)
+        if key is None:
+            return None
+        mesh, signature = obj.data, key[1]
+        profile = self._profiles.get(key)
+        if profile is not None:
+            self.hits += 1
+            return profile
+        self.misses += 1
+        if not signature:
+            return self._store(key, _build_profile(mesh, lazy_hull=True))
+        depsgraph = depsgraph or bpy.context.evaluated_depsgraph_get()
+        obj_eval = obj.evaluated_get(depsgraph)
+        try:
+            return self._store(key, _build_profile(obj_eval.to_mesh(), lazy_hull=False))
+        finally:
+            obj_eval.to_mesh_clear()
+
+    def for_mesh(self, mesh):
+        """Profil des Basis-Meshes (ohne Modifier)."""
+        if mesh is None:
+            return None
+        key = (mesh.name_full, (), self._generations.setdefault(mesh.name_full, 0))
+        profile = self._profiles.get(key)
+        if profile is not None:
+            self.hits += 1
+            return profile
+        self.misses += 1
+        return self._store(key, _build_profile(mesh, lazy_hull=True))
+
+    def invalidate(self, mesh_name=None):
+        """Verwirft die Profile eines Meshes (bzw. alle bei None)."""
+        if mesh_name is None:
+            self._profiles.clear()
+            self._generations.clear()
+            return
+        self._generations[mesh_name] = self._generations.get(mesh_name, 0) + 1
+        for key in [key for key in self._profiles if key[0] == mesh_name]:
+            del self._profiles[key]
+
+
+PROFILES = MeshProfileCache()
+
+
+@bpy.app.handlers.persistent
+def _on_depsgraph_update_post(scene, depsgraph):
+    if not PROFILES._generations: # Noch kein Mesh verschlüsselt (Profile oder Proxy-Batches)
+        return
+    for update in depsgraph.updates:
+        if not update.is_updated_geometry:
+            continue
+        id_data = getattr(update.id, "original", update.id)
+        if isinstance(id_data, bpy.types.Object):
+            id_data = id_data.data if id_data.type == 'MESH' else None
+        if isinstance(id_data, bpy.types.Mesh):
+            PROFILES.invalidate(id_data.name_full)
+
+
+@bpy.app.handlers.persistent
+def _on_load_post(*_args):
+    PROFILES.invalidate()
+
+
+def register():
+    if _on_depsgraph_update_post not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update_post)
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
+
+
+def unregister():
+    if _on_depsgraph_update_post in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update_post)
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    PROFILES.invalidate()
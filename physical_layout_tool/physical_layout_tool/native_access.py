@@ -0,0 +1,233 @@
+# native_access.py
+# Einziger Zugriffspunkt auf das native Modul scatter_accel, lazy: Beim Addon-Import wird nichts gesucht
+# oder geladen; erst der erste echte Gebrauch (Attributzugriff auf scatter_accel bzw. bool(NATIVE_MODULE_AVAILABLE))
+# löst get_native_module() aus. Der gefundene Pfad wird pro Blender-Version und Python-ABI in einer kleinen
+# JSON-Datei gecacht, damit spätere Starts die Kandidatensuche überspringen.
+# Die Submodule binden die beiden Proxys (scatter_accel, NATIVE_MODULE_AVAILABLE) wie bisher als Modulglobale,
+# die Aufrufstellen (`if NATIVE_MODULE_AVAILABLE and scatter_accel: scatter_accel.f(...)`) bleiben unverändert.
+import json
+import os
+import platform
+import sys
+import sysconfig
+import tempfile
+import time
+import traceback
+
+from .loader import find_native_module_path, load_native_module_from_path
+from .perf_timing import instrument_module
+
+_native_module_name = __name__
+
+NATIVE_MODULE_NAME = "scatter_accel"
+PATH_CACHE_FILENAME = ".plt_native_path_cache.json"
+PATH_CACHE_VERSION = 1
+
+LOAD_STATE_UNRESOLVED = 'UNRESOLVED'
+LOAD_STATE_LOADED = 'LOADED'
+LOAD_STATE_FAILED = 'FAILED'
+
+_ADDON_ROOT = os.path.dirname(os.path.realpath(__file__))
+
+
+class NativeLoadStatus:
+    """Ergebnis und Kosten der (einmaligen) Auflösung, angezeigt in den Addon-Einstellungen."""
+
+    def __init__(self):
+        self.state = LOAD_STATE_UNRESOLVED
+        self.module_path = None
+        self.error = None
+        self.abi_key = None
+        self.cache_hit = False
+        self.probe_ms = 0.0   # Kandidatensuche bzw. Cache-Lookup
+        self.import_ms = 0.0  # Import der Erweiterung
+        self.resolved_at = None
+
+    @property
+    def total_ms(self):
+        return self.probe_ms + self.import_ms
+
+
+_status = NativeLoadStatus()
+_module = None
+
+
+def abi_key():
+    """Schlüssel für den Pfad-Cache: Blender-Version, Python-ABI (SOABI/cache_tag), OS und Architektur."""
+    try:
+        import bpy
+        blender_version = bpy.app.version_string
+    except (ImportError, AttributeError):
+        blender_version = "no-blender"
+    soabi = sysconfig.get_config_var("SOABI") or sysconfig.get_config_var("EXT_SUFFIX") or ""
+    return "|".join((blender_version, sys.implementation.cache_tag or "", soabi, platform.system(), platform.machine()))
+
+
+def _cache_candidates():
+    # Addon-Ordner zuerst; ist er schreibgeschützt (z.B. systemweite Installation), Temp-Verzeichnis
+    return [os.path.join(_ADDON_ROOT, PATH_CACHE_FILENAME),
+            os.path.join(tempfile.gettempdir(), "plt_" + PATH_CACHE_FILENAME.lstrip("."))]
+
+
+def _read_path_cache():
+    for path in _cache_candidates():
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                document = json.load(handle)
+        except (OSError, ValueError):
+            continue
+        if document.get("version") == PATH_CACHE_VERSION:
+            return document.get("entries", {})
+    return {}
+
+
+def _write_path_cache(entries):
+    document = {"version": PATH_CACHE_VERSION, "entries": entries}
+    for path in _cache_candidates():
+        try:
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(document, handle, indent=1)
+            os.replace(tmp_path, path)
+            return path
+        except OSError:
+            continue
+    return None
+
+
+def _cached_module_path(key):
+    """Gecachter Pfad, wenn die Datei noch existiert und sich (mtime/Größe) nicht geändert hat."""
+    entry = _read_path_cache().get(key)
+    if not entry:
+        return None
+    try:
+        stat = os.stat(entry["path"])
+    except (OSError, KeyError, TypeError):
+        return None
+    if stat.st_mtime_ns != entry.get("mtime_ns") or stat.st_size != entry.get("size"):
+        return None
+    return entry["path"]
+
+
+def _store_module_path(key, module_path):
+    entries = _read_path_cache()
+    stat = os.stat(module_path)
+    entries[key] = {"path": module_path, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+    _write_path_cache(entries)
+
+
+def clear_path_cache():
+    """Entfernt alle Cache-Dateien; der nächste Start sucht die Kandidaten wieder ab."""
+    removed = 0
+    for path in _cache_candidates():
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def _set_addon_warning(message):
+    package = sys.modules.get(__package__)
+    bl_info = getattr(package, "bl_info", None)
+    if isinstance(bl_info, dict):
+        bl_info["warning"] = message
+
+
+def _resolve():
+    global _module
+    status = _status
+    status.abi_key = key = abi_key()
+    t0 = time.perf_counter()
+    module_path = _cached_module_path(key)
+    status.cache_hit = module_path is not None
+    try:
+        if module_path is None:
+            module_path = find_native_module_path(NATIVE_MODULE_NAME, _ADDON_ROOT)
+        t1 = time.perf_counter()
+        status.probe_ms = (t1 - t0) * 1000.0
+        status.module_path = module_path
+        module = load_native_module_from_path(NATIVE_MODULE_NAME, module_path)
+        status.import_ms = (time.perf_counter() - t1) * 1000.0
+    except Exception as e:
+        elapsed_ms = (time.perf_counter() - t0) * 1000.0
+        if status.module_path is None:
+            status.probe_ms = elapsed_ms
+        else:
+            status.import_ms = elapsed_ms - status.probe_ms
+        status.state = LOAD_STATE_FAILED
+        status.error = f"{type(e).__name__}: {e}"
+        if not isinstance(e, ImportError):
+            traceback.print_exc()
+        print(f"WARNUNG [{_native_module_name}]: Natives Modul '{NATIVE_MODULE_NAME}' nicht geladen, reiner Python-Modus: {status.error}")
+        _set_addon_warning(f"Natives C++ Modul '{NATIVE_MODULE_NAME}' nicht geladen. Addon läuft im reinen Python-Modus.")
+        return None
+    finally:
+        status.resolved_at = time.time()
+
+    if not status.cache_hit:
+        try:
+            _store_module_path(key, module_path)
+        except OSError as e:
+            print(f"WARNUNG [{_native_module_name}]: Pfad-Cache nicht geschrieben: {e}")
+    # Alle Aufrufe ins native Modul laufen über die Zeitmessung (perf_timing)
+    _module = instrument_module(module, NATIVE_MODULE_NAME)
+    status.state = LOAD_STATE_LOADED
+    print(f"INFO [{_native_module_name}]: '{NATIVE_MODULE_NAME}' geladen aus {module_path} "
+          f"({status.total_ms:.1f} ms, {'Pfad aus Cache' if status.cache_hit else 'Pfad gesucht'}).")
+    return _module
+
+
+def get_native_module():
+    """Das (instrumentierte) native Modul oder None; lädt beim ersten Aufruf, danach nur ein Zustandsvergleich."""
+    if _status.state == LOAD_STATE_UNRESOLVED:
+        _resolve()
+    return _module
+
+
+def is_native_resolved():
+    """True, sobald ein Ladeversuch stattgefunden hat (löst selbst nichts aus, z.B. für draw())."""
+    return _status.state != LOAD_STATE_UNRESOLVED
+
+
+def native_load_status():
+    return _status
+
+
+class LazyNativeModule:
+    """Proxy für scatter_accel: Attributzugriff lädt bei Bedarf; bool() ist False ohne natives Modul."""
+    __slots__ = ()
+
+    def __getattr__(self, attr):
+        module = get_native_module()
+        if module is None:
+            raise AttributeError(f"native module '{NATIVE_MODULE_NAME}' is not available (attribute '{attr}')")
+        return getattr(module, attr)
+
+    def __bool__(self):
+        return get_native_module() is not None
+
+    def __dir__(self):
+        module = get_native_module()
+        return dir(module) if module is not None else []
+
+    def __repr__(self):
+        if not is_native_resolved():
+            return f"<lazy native module '{NATIVE_MODULE_NAME}' (not loaded yet)>"
+        return repr(_module) if _module is not None else f"<native module '{NATIVE_MODULE_NAME}' unavailable>"
+
+
+class LazyNativeFlag:
+    """Proxy für NATIVE_MODULE_AVAILABLE: bool() löst das Laden aus, repr() nicht."""
+    __slots__ = ()
+
+    def __bool__(self):
+        return get_native_module() is not None
+
+    def __repr__(self):
+        return repr(_module is not None) if is_native_resolved() else "<not loaded yet>"
+
+
+scatter_accel = LazyNativeModule()
+NATIVE_MODULE_AVAILABLE = LazyNativeFlag()
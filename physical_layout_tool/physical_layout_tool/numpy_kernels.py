@@ -0,0 +1,231 @@
+# numpy_kernels.py
+# NumPy-/Python-Backend aller Analyse- und Aufbereitungsfunktionen von scatter_accel, ohne bpy und ohne
+# relative Imports (die Benchmarks laden die Datei direkt und prüfen sie gegen das native Modul).
+# Gleiche Signaturen, Defaults und Ergebnisse wie die C++-Funktionen; Fehler bei ungültigen Eingaben als
+# ValueError statt RuntimeError. Registriert werden die Funktionen in kernel_backends.py.
+# Die Record-Analyzer (analyze_*_records_np) liegen in record_kernels.py.
+import math
+import random
+
+import numpy as np
+
+
+_EMPTY_BOUNDS = ((0.0, 0.0, 0.0), (0.0, 0.0, 0.0), (0.0, 0.0, 0.0), 0.0)
+
+
+class _MeshBoundsMixin:
+    """bbox_min/bbox_max/sphere_center als (x, y, z)-Tupel, sphere_radius als float (wie MeshBounds im C++)."""
+    __slots__ = ()
+
+    def _set_bounds(self, bounds):
+        self.bbox_min, self.bbox_max, self.sphere_center, self.sphere_radius = bounds
+
+
+class GpuVertexData(_MeshBoundsMixin):
+    """Gegenstück zu scatter_accel.GpuVertexData: positions (N,3) float32, indices (M,K) uint32, normals (N,3)."""
+    __slots__ = ("positions", "indices", "normals", "bbox_min", "bbox_max", "sphere_center", "sphere_radius")
+
+    def __init__(self, positions, indices, normals=None, bounds=_EMPTY_BOUNDS):
+        self.positions = positions
+        self.indices = indices
+        self.normals = np.empty((0,), dtype=np.float32) if normals is None else normals
+        self._set_bounds(bounds)
+
+
+class MasterMeshData(_MeshBoundsMixin):
+    """Gegenstück zu scatter_accel.MasterMeshData: positions (N,3), uvs (N,2), normals (N,3) float32, indices (M,3) uint32."""
+    __slots__ = ("positions", "uvs", "indices", "normals", "bbox_min", "bbox_max", "sphere_center", "sphere_radius")
+
+    def __init__(self, positions, uvs, indices, normals, bounds=_EMPTY_BOUNDS):
+        self.positions = positions
+        self.uvs = uvs
+        self.indices = indices
+        self.normals = normals
+        self._set_bounds(bounds)
+
+
+# --- Dict-Analysen (Instance Operator / Mouse Scatter) ---
+def _setting(mapping, key, default):
+    """Wert oder Default, wenn fehlend/None bzw. vom falschen Typ (wie die Cast-Fehler im C++)."""
+    value = mapping.get(key)
+    return value if isinstance(value, type(default)) else default
+
+
+def _processing_options(settings):
+    return (
+        bool(settings.get("mode_is_instancing", False)),
+        bool(settings.get("apply_rigidbody_static", False)),
+        _setting(settings, "instance_collection_name", "UnknownInstanceCol"),
+        _setting(settings, "static_collection_name", "UnknownStaticCol"),
+        _setting(settings, "instance_name_base_suffix", "_inst"),
+    )
+
+
+def _matrix_list(data):
+    """matrix_world als neue Liste (wie py::list-Cast im C++), None wenn fehlend/ungültig."""
+    matrix = data.get("matrix_world")
+    if matrix is None:
+        return None
+    try:
+        return list(matrix)
+    except TypeError:
+        return None
+
+
+def analyze_scatter_objects_for_processing_py(objects_data, processing_settings):
+    """Batch-Analyse: eine Anweisung pro Objekt-Dict (siehe analyze_scatter_objects_for_processing)."""
+    instancing, apply_rb, instance_col, static_col, suffix = _processing_options(processing_settings)
+    instructions = []
+    append = instructions.append
+    for data in objects_data:
+        if not isinstance(data, dict):
+            append({"action": "SKIP", "original_name": "[CastErrorToObjectData]",
+                    "reason": "Failed to cast object data to dict."})
+            continue
+        name = _setting(data, "name", "[UnknownObjName]")
+        has_rb = bool(data.get("has_rigidbody", False))
+        if not instancing:
+            append({"original_name": name, "action": "MOVE_TO_STATIC_COLLECTION",
+                    "target_collection_name": static_col, "add_rigidbody": apply_rb and not has_rb})
+        elif has_rb:
+            append({"original_name": name, "action": "SKIP",
+                    "reason": "Original already has Rigid Body, skipping for instancing."})
+        else:
+            instruction = {"original_name": name, "action": "CREATE_INSTANCE_AND_DELETE_ORIGINAL",
+                           "new_instance_name_base": name + suffix,
+                           "mesh_to_instance": _setting(data, "mesh_name", "[UnknownMesh]")}
+            matrix = _matrix_list(data)
+            if matrix is None:
+                instruction["action"] = "SKIP"
+                instruction["reason"] = "Missing or invalid matrix_world for instancing."
+            else:
+                instruction["matrix_world"] = matrix
+            instruction["target_collection_name"] = instance_col
+            append(instruction)
+    return instructions
+
+
+def analyze_single_object_for_processing_py(single_object_data, processing_settings):
+    """Analyse eines einzelnen Markers (siehe analyze_single_object_for_processing)."""
+    instancing, apply_rb, instance_col, static_col, suffix = _processing_options(processing_settings)
+    marker_name = _setting(single_object_data, "original_marker_name", "[UnknownMarkerName]")
+    matrix = _matrix_list(single_object_data)
+    if instancing:
+        instruction = {"original_marker_name": marker_name, "action": "CREATE_INSTANCE_FROM_SOURCE",
+                       "new_instance_name_base": marker_name + suffix,
+                       "mesh_to_instance": _setting(single_object_data, "source_mesh_name", "[UnknownSourceMesh]")}
+        if matrix is None:
+            instruction["action"] = "SKIP"
+            instruction["reason"] = "Missing or invalid matrix_world for instancing."
+        else:
+            instruction["matrix_world"] = matrix
+        instruction["target_collection_name"] = instance_col
+        return instruction
+    instruction = {"original_marker_name": marker_name,
+                   "action": "CONVERT_MARKER_TO_STATIC_RIGID" if apply_rb else "CONVERT_MARKER_TO_STATIC",
+                   "add_rigidbody": apply_rb, "target_collection_name": static_col}
+    if matrix is not None:
+        instruction["matrix_world"] = matrix
+    return instruction
+
+
+def calculate_random_transforms_py(settings_dict):
+    """Zufällige Euler-Rotation (Radiant) und uniforme Skalierung (siehe calculate_random_transforms_cpp)."""
+    def _range(key_min, key_max, default):
+        low, high = float(settings_dict.get(key_min, default)), float(settings_dict.get(key_max, default))
+        return (high, low) if low > high else (low, high)
+    rot = [math.radians(random.uniform(*_range(f"rot_{axis}_min_deg", f"rot_{axis}_max_deg", 0.0))) for axis in "xyz"]
+    scale_min, scale_max = (max(0.001, value) for value in _range("scale_min", "scale_max", 1.0))
+    return {"rotation_euler_rad": tuple(rot), "scale_uniform": random.uniform(scale_min, scale_max)}
+
+
+# --- GPU-Datenaufbereitung ---
+def generate_circle_marker_gpu_data_np(radius, segments):
+    """Mittelpunkt + Ring mit segments Punkten; Linien Mitte->Rand und Rand->Rand ((2*segments, 2) uint32)."""
+    segments = max(3, int(segments))
+    angles = np.arange(segments, dtype=np.float32) / np.float32(segments) * np.float32(2.0 * math.pi)
+    positions = np.zeros((segments + 1, 3), dtype=np.float32)
+    positions[1:, 0] = np.float32(radius) * np.cos(angles)
+    positions[1:, 1] = np.float32(radius) * np.sin(angles)
+    outer = np.arange(1, segments + 1, dtype=np.uint32)
+    indices = np.empty((segments * 2, 2), dtype=np.uint32)
+    indices[0::2, 0] = 0
+    indices[0::2, 1] = outer
+    indices[1::2, 0] = outer
+    indices[1::2, 1] = np.roll(outer, -1)
+    return GpuVertexData(positions, indices)
+
+
+def _flat_array(values, dtype, expected_size, label):
+    array = np.ascontiguousarray(values, dtype=dtype)
+    if array.ndim != 1 or array.size != expected_size:
+        raise ValueError(f"Mismatch: expected {expected_size} values in 1D {label} array, got shape {array.shape}.")
+    return array
+
+
+def _triangle_indices(flat_triangle_indices, num_actual_vertices, num_loop_triangles, check_upper=True):
+    """(T,3) uint32-View auf das flache int32-Index-Array; Bereichsprüfung über min/max statt pro Index."""
+    if num_loop_triangles <= 0:
+        return np.empty((0, 3), dtype=np.uint32)
+    indices = _flat_array(flat_triangle_indices, np.int32, num_loop_triangles * 3, "index")
+    low, high = int(indices.min()), int(indices.max())
+    if low < 0:
+        raise ValueError(f"Negative vertex index found: {low}")
+    if check_upper and high >= num_actual_vertices:
+        raise ValueError(f"Vertex index {high} is out of bounds for {num_actual_vertices} vertices.")
+    # Nach der Prüfung alle >= 0: gleiche Bits als uint32, keine Kopie
+    return indices.view(np.uint32).reshape(num_loop_triangles, 3)
+
+
+def _bounds_and_normals(positions, indices):
+    """AABB, Bounding Sphere um die AABB-Mitte und flächengewichtete Einheits-Normalen (V,3)."""
+    num_vertices = len(positions)
+    normals = np.zeros((num_vertices, 3), dtype=np.float32)
+    if num_vertices == 0:
+        return normals, _EMPTY_BOUNDS
+    bbox_min, bbox_max = positions.min(axis=0), positions.max(axis=0)
+    center = (np.float32(0.5) * (bbox_min + bbox_max)).astype(np.float32)
+    if len(indices):
+        corners = positions[indices]
+        # Unnormiertes Kreuzprodukt = doppelte Dreiecksfläche -> große Dreiecke gewichten stärker
+        face_normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+        flat_indices = indices.ravel()
+        for axis in range(3):
+            normals[:, axis] = np.bincount(flat_indices, weights=np.repeat(face_normals[:, axis], 3),
+                                           minlength=num_vertices)
+        lengths = np.linalg.norm(normals, axis=1)
+        np.divide(normals, lengths[:, None], out=normals, where=lengths[:, None] > 0.0)
+    radius = float(np.sqrt(np.max(np.sum((positions - center) ** 2, axis=1))))
+    return normals, (tuple(map(float, bbox_min)), tuple(map(float, bbox_max)), tuple(map(float, center)), radius)
+
+
+def prepare_mesh_gpu_data_np(flat_vertex_cos, flat_loop_triangle_indices, num_actual_vertices, num_loop_triangles):
+    """Flache Koordinaten/Indizes -> (V,3)/(T,3)-Views plus Normalen und Bounds (siehe prepare_mesh_gpu_data_from_flat_arrays_cpp)."""
+    num_actual_vertices, num_loop_triangles = int(num_actual_vertices), int(num_loop_triangles)
+    if num_actual_vertices == 0:
+        return GpuVertexData(np.empty((0, 3), dtype=np.float32), np.empty((0, 3), dtype=np.uint32),
+                             np.empty((0, 3), dtype=np.float32))
+    positions = _flat_array(flat_vertex_cos, np.float32, num_actual_vertices * 3, "coordinate").reshape(num_actual_vertices, 3)
+    indices = _triangle_indices(flat_loop_triangle_indices, num_actual_vertices, num_loop_triangles)
+    normals, bounds = _bounds_and_normals(positions, indices)
+    return GpuVertexData(positions, indices, normals, bounds)
+
+
+def prepare_master_mesh_data_np(flat_vertex_cos, flat_vertex_uvs, flat_loop_triangle_indices,
+                                num_actual_vertices, num_loop_triangles):
+    """Wie prepare_mesh_gpu_data_np plus (V,2) UVs; fehlende/falsch große UVs werden (0,0)."""
+    num_actual_vertices, num_loop_triangles = int(num_actual_vertices), int(num_loop_triangles)
+    if num_actual_vertices > 0:
+        positions = _flat_array(flat_vertex_cos, np.float32, num_actual_vertices * 3, "position").reshape(num_actual_vertices, 3)
+        uvs_in = np.asarray(flat_vertex_uvs, dtype=np.float32)
+        if uvs_in.ndim == 1 and uvs_in.size == num_actual_vertices * 2:
+            uvs = np.ascontiguousarray(uvs_in).reshape(num_actual_vertices, 2)
+        else:
+            uvs = np.zeros((num_actual_vertices, 2), dtype=np.float32)
+    else:
+        positions = np.empty((0, 3), dtype=np.float32)
+        uvs = np.empty((0, 2), dtype=np.float32)
+    indices = _triangle_indices(flat_loop_triangle_indices, num_actual_vertices, num_loop_triangles,
+                                check_upper=num_actual_vertices > 0)
+    normals, bounds = _bounds_and_normals(positions, indices if num_actual_vertices > 0 else indices[:0])
+    return MasterMeshData(positions, uvs, indices, normals, bounds)
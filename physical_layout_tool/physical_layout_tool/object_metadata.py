@@ -0,0 +1,175 @@
+# object_metadata.py
+# Extraktionsschicht bpy -> NumPy: Metadaten vieler Objekte (Weltmatrix, Mesh-Index, Users,
+# Rigid-Body-Flags, Collection-Bitmaske) landen in EINEM strukturierten Record-Array.
+# Pro Objekt nur ein Zugriff auf obj.data; Matrizen per foreach_get, Rigid-Body- und
+# Collection-Mitgliedschaft über die Collections (keys()) statt pro Objekt.
+# Die nativen Analyzer (analyze_*_records_cpp) arbeiten nur noch auf diesen Arrays und fassen bpy nicht an.
+import bpy
+import numpy as np
+
+from .kernel_backends import KERNELS, KERNEL_STATIC_BAKE_RECORDS, KERNEL_RB_SETUP_RECORDS
+
+_meta_module_name = __name__
+
+from .record_kernels import (
+    OBJECT_RECORD_DTYPE, MAX_RECORD_COLLECTIONS,
+    RECORD_IS_MESH, RECORD_HAS_RIGIDBODY, RECORD_RB_ENABLED, RECORD_RB_KINEMATIC,
+    RB_TYPE_NONE, RB_TYPE_ACTIVE, RB_TYPE_PASSIVE,
+)
+
+_RB_TYPE_CODES = {'ACTIVE': RB_TYPE_ACTIVE, 'PASSIVE': RB_TYPE_PASSIVE}
+
+
+class ObjectRecordSet:
+    """Record-Array plus die Objekt-, Mesh- und Collection-Listen, auf die sich die Indizes/Bits beziehen."""
+
+    def __init__(self, objects, records, mesh_names, collection_names):
+        self.objects = objects
+        self.records = records
+        self.mesh_names = mesh_names
+        self.collection_names = collection_names
+
+    def __len__(self):
+        return len(self.records)
+
+    def collection_bit(self, collection_name):
+        """Bitmaske einer Collection (0, wenn sie bei der Extraktion nicht angegeben war)."""
+        try:
+            return np.uint64(1) << np.uint64(self.collection_names.index(collection_name))
+        except ValueError:
+            return np.uint64(0)
+
+    def select(self, mask):
+        """Objekte, deren Eintrag in der bool-Maske True ist."""
+        return [obj for obj, keep in zip(self.objects, mask) if keep]
+
+
+def read_world_matrices(context, objects):
+    """
+    Liest die ausgewerteten Weltmatrizen als float32-Array der Form (N,4,4) (zeilenweise wie mathutils.Matrix).
+    Ein foreach_get über alle Objekte des View Layers (der aktive Depsgraph schreibt die ausgewerteten
+    Matrizen, inkl. Rigid-Body-Simulation, auf die Originale zurück), danach Auswahl per Index.
+    """
+    objects = list(objects)
+    if not objects:
+        return np.empty((0, 4, 4), dtype=np.float32)
+
+    # Stellt sicher, dass der Depsgraph für den aktuellen Frame ausgewertet ist
+    depsgraph = context.evaluated_depsgraph_get()
+
+    layer_objects = context.view_layer.objects
+    try:
+        index_by_name = {name: i for i, name in enumerate(layer_objects.keys())}
+        indices = np.fromiter((index_by_name[obj.name] for obj in objects), dtype=np.int64, count=len(objects))
+        flat = np.empty(len(layer_objects) * 16, dtype=np.float32)
+        layer_objects.foreach_get("matrix_world", flat)
+        # RNA liefert die Matrizen spaltenweise -> transponieren
+        return flat.reshape(-1, 4, 4)[indices].transpose(0, 2, 1).copy()
+    except (KeyError, RuntimeError, TypeError) as e_bulk:
+        print(f"INFO [{_meta_module_name}]: foreach_get für matrix_world nicht möglich ({e_bulk}), lese pro Objekt.")
+
+    return np.array([obj.evaluated_get(depsgraph).matrix_world for obj in objects], dtype=np.float32).reshape(-1, 4, 4)
+
+
+def extract_object_records(context, objects, collections=(), with_matrices=True):
+    """
+    Füllt ein OBJECT_RECORD_DTYPE-Array für objects. collections (Collection-Objekte oder Namen, max. 64)
+    bestimmt die Bits der collection_mask. with_matrices=False lässt matrix_world auf Null
+    (spart das foreach_get, wenn nur Flags gebraucht werden). Gibt ein ObjectRecordSet zurück.
+    """
+    objects = [obj for obj in objects if obj is not None]
+    count = len(objects)
+    records = np.zeros(count, dtype=OBJECT_RECORD_DTYPE)
+    records["mesh_index"] = -1
+
+    collection_names = []
+    for col in collections:
+        name = col if isinstance(col, str) else getattr(col, "name", None)
+        if name and name not in collection_names:
+            collection_names.append(name)
+    if len(collection_names) > MAX_RECORD_COLLECTIONS:
+        print(f"WARNUNG [{_meta_module_name}]: Nur die ersten {MAX_RECORD_COLLECTIONS} Collections werden in der Bitmaske erfasst.")
+        collection_names = collection_names[:MAX_RECORD_COLLECTIONS]
+
+    if not count:
+        return ObjectRecordSet(objects, records, [], collection_names)
+
+    if with_matrices:
+        records["matrix_world"] = read_world_matrices(context, objects)
+
+    # Mesh-Daten: ein obj.data-Zugriff pro Objekt, users nur einmal pro Mesh
+    mesh_names = []
+    mesh_index_by_name = {}
+    mesh_users = []
+    mesh_indices = np.full(count, -1, dtype=np.int32)
+    is_mesh = np.zeros(count, dtype=bool)
+    for i, obj in enumerate(objects):
+        is_mesh[i] = obj.type == 'MESH'
+        data = obj.data
+        if data is None:
+            continue
+        idx = mesh_index_by_name.get(data.name)
+        if idx is None:
+            idx = len(mesh_names)
+            mesh_index_by_name[data.name] = idx
+            mesh_names.append(data.name)
+            mesh_users.append(data.users)
+        mesh_indices[i] = idx
+    records["mesh_index"] = mesh_indices
+    if mesh_users:
+        users_lookup = np.asarray(mesh_users, dtype=np.int32)
+        has_mesh = mesh_indices >= 0
+        records["users"][has_mesh] = users_lookup[mesh_indices[has_mesh]]
+
+    index_by_name = {obj.name: i for i, obj in enumerate(objects)}
+    flags = np.where(is_mesh, RECORD_IS_MESH, 0).astype(np.uint8)
+
+    # Rigid Bodies: Mitgliedschaft über die RBW-Collection, Details nur für Objekte mit RB
+    rbw = context.scene.rigidbody_world
+    if rbw is not None and rbw.collection is not None:
+        rb_types = records["rb_type"]
+        for name in rbw.collection.objects.keys():
+            i = index_by_name.get(name)
+            if i is None:
+                continue
+            rb = objects[i].rigid_body
+            if rb is None:
+                continue
+            flags[i] |= RECORD_HAS_RIGIDBODY
+            if rb.enabled: flags[i] |= RECORD_RB_ENABLED
+            if rb.kinematic: flags[i] |= RECORD_RB_KINEMATIC
+            rb_types[i] = _RB_TYPE_CODES.get(rb.type, RB_TYPE_NONE)
+    records["flags"] = flags
+
+    # Collection-Bitmaske: pro Collection ein keys()-Aufruf statt users_collection pro Objekt
+    masks = np.zeros(count, dtype=np.uint64)
+    for bit, col_name in enumerate(collection_names):
+        col = bpy.data.collections.get(col_name)
+        if col is None and context.scene.collection.name == col_name:
+            col = context.scene.collection
+        if col is None:
+            continue
+        member_indices = [index_by_name[name] for name in col.objects.keys() if name in index_by_name]
+        if member_indices:
+            masks[member_indices] |= np.uint64(1) << np.uint64(bit)
+    records["collection_mask"] = masks
+
+    return ObjectRecordSet(objects, records, mesh_names, collection_names)
+
+
+def analyze_static_bake_records(records, static_collection_mask):
+    """
+    Bake-to-Static-Analyse: pro Record BAKE_*-Bits (uint8-Array).
+    static_collection_mask: Bit der Ziel-Collection; alle anderen Bits bedeuten "muss verschoben werden".
+    """
+    return np.asarray(KERNELS.call(KERNEL_STATIC_BAKE_RECORDS, records, int(np.uint64(static_collection_mask))), dtype=np.uint8)
+
+
+def analyze_rb_setup_records(records, managed_collection_mask=0):
+    """
+    Rigid-Body-Setup-Analyse: pro Record RB_SETUP_*-Bits (uint8-Array).
+    managed_collection_mask: Objekte in diesen Collections (z.B. Instanz-Collection) brauchen eigene Mesh-Daten,
+    wenn sie sie teilen; 0 = gilt für alle Objekte.
+    """
+    return np.asarray(KERNELS.call(KERNEL_RB_SETUP_RECORDS, records, int(np.uint64(managed_collection_mask))), dtype=np.uint8)
+
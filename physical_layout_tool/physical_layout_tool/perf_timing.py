@@ -0,0 +1,227 @@
+# perf_timing.py
+# Leichtgewichtige Laufzeitmessung für Hot Paths:
+# timed(name) als Decorator bzw. timed_section(name) als Context Manager schreiben die Dauer
+# (time.perf_counter_ns, monoton) in ein HDR-artiges Histogramm pro Name (log-lineare Buckets,
+# ~3% Auflösung, konstanter Speicher). instrument_module() wickelt alle Funktionen des nativen
+# Moduls ein, ohne die Aufrufstellen anzufassen. Auswertung: REGISTRY.rows() (p50/p95/max, Anzahl) bzw. to_json().
+# Ist perf_trace.TRACER aktiv, wird jede Messung zusätzlich als Span (mit Argumenten) in die Zeitleiste geschrieben.
+import functools
+import json
+import time
+
+from .perf_trace import TRACER
+
+_perf_module_name = __name__
+
+# Log-lineare Buckets: Werte < SUB_BUCKETS exakt, darüber pro Zweierpotenz HALF_BUCKETS Unterteilungen
+SUB_BITS = 5
+SUB_BUCKETS = 1 << SUB_BITS
+HALF_BUCKETS = SUB_BUCKETS >> 1
+MAX_SHIFT = 42  # ~2^47 ns (~39 h) als obere Grenze
+BUCKET_COUNT = SUB_BUCKETS + MAX_SHIFT * HALF_BUCKETS
+
+
+def _bucket_index(value_ns):
+    if value_ns < SUB_BUCKETS:
+        return value_ns
+    shift = min(value_ns.bit_length() - SUB_BITS, MAX_SHIFT)
+    return SUB_BUCKETS + (shift - 1) * HALF_BUCKETS + min((value_ns >> shift) - HALF_BUCKETS, HALF_BUCKETS - 1)
+
+
+def _bucket_upper_bound(index):
+    if index < SUB_BUCKETS:
+        return index
+    shift = (index - SUB_BUCKETS) // HALF_BUCKETS + 1
+    sub = (index - SUB_BUCKETS) % HALF_BUCKETS + HALF_BUCKETS
+    return ((sub + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Zähler + Histogramm für einen Hot Path (Werte in Nanosekunden)."""
+    __slots__ = ("count", "total_ns", "max_ns", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.buckets = [0] * BUCKET_COUNT
+
+    def record(self, value_ns):
+        self.count += 1
+        self.total_ns += value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+        self.buckets[_bucket_index(value_ns)] += 1
+
+    def percentile(self, q):
+        """Obere Bucket-Grenze des q-Quantils (0..1) in ns, gedeckelt auf max_ns."""
+        if not self.count:
+            return 0
+        target = max(1, int(q * self.count + 0.5))
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            if bucket_count:
+                seen += bucket_count
+                if seen >= target:
+                    return min(_bucket_upper_bound(index), self.max_ns)
+        return self.max_ns
+
+
+class TimingRegistry:
+    """Histogramme pro Hot-Path-Name. enabled=False macht alle Messpunkte zu (fast) No-Ops."""
+
+    def __init__(self):
+        self.enabled = True
+        self.histograms = {}
+        self.started_at = time.time()
+
+    def record(self, name, value_ns):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = LatencyHistogram()
+        histogram.record(value_ns)
+
+    def reset(self):
+        self.histograms = {}
+        self.started_at = time.time()
+
+    def rows(self):
+        """Liste von dicts (name, count, p50_ms, p95_ms, max_ms, total_ms), nach Gesamtzeit absteigend."""
+        rows = []
+        for name, h in self.histograms.items():
+            rows.append({
+                "name": name,
+                "count": h.count,
+                "p50_ms": h.percentile(0.50) / 1e6,
+                "p95_ms": h.percentile(0.95) / 1e6,
+                "max_ms": h.max_ns / 1e6,
+                "total_ms": h.total_ns / 1e6,
+            })
+        rows.sort(key=lambda row: row["total_ms"], reverse=True)
+        return rows
+
+    def to_json(self, indent=2):
+        return json.dumps({
+            "started_at": self.started_at,
+            "dumped_at": time.time(),
+            "hot_paths": self.rows(),
+        }, indent=indent)
+
+
+REGISTRY = TimingRegistry()
+
+
+def _record(name, t0, trace_args):
+    elapsed = time.perf_counter_ns() - t0
+    if REGISTRY.enabled:
+        REGISTRY.record(name, elapsed)
+    if TRACER.enabled:
+        TRACER.complete(name, t0, elapsed, trace_args)
+
+
+class timed_section:
+    """
+    with timed_section("name", objects=n): ... -- misst den Block, wenn REGISTRY oder TRACER aktiv ist.
+    Keyword-Argumente landen als args am Trace-Span; im Block ergänzbar über section.args[...] = ...
+    """
+    __slots__ = ("name", "args", "_t0")
+
+    def __init__(self, name, **args):
+        self.name = name
+        self.args = args
+        self._t0 = 0
+
+    def __enter__(self):
+        self._t0 = time.perf_counter_ns() if REGISTRY.enabled or TRACER.enabled else 0
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        if self._t0:
+            _record(self.name, self._t0, self.args)
+        return False
+
+
+def timed(name=None, trace_args=None):
+    """
+    Decorator: misst jeden Aufruf unter name (Default: __qualname__ der Funktion).
+    trace_args(*args, **kwargs) -> dict liefert die Span-Argumente; wird nur bei aktivem TRACER ausgewertet.
+    """
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not REGISTRY.enabled and not TRACER.enabled:
+                return func(*args, **kwargs)
+            t0 = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                span_args = None
+                if trace_args is not None and TRACER.enabled:
+                    try:
+                        span_args = trace_args(*args, **kwargs)
+                    except Exception as e:
+                        span_args = {"trace_args_error": repr(e)}
+                _record(label, t0, span_args)
+        return wrapper
+    return decorator
+
+
+def _summarize_value(value):
+    shape = getattr(value, "shape", None)
+    if shape is not None:
+        return list(shape)
+    if isinstance(value, (list, tuple, dict)):
+        return len(value)
+    if isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, str):
+        return value[:64]
+    return type(value).__name__
+
+
+def native_call_args(*args, **kwargs):
+    """Span-Argumente für native Aufrufe: Formen/Längen statt Inhalte (Arrays, Listen, Dicts)."""
+    summary = {f"arg{i}": _summarize_value(value) for i, value in enumerate(args)}
+    summary.update((key, _summarize_value(value)) for key, value in kwargs.items())
+    return summary
+
+
+class InstrumentedModule:
+    """
+    Stellvertreter für ein (natives) Modul: Funktionen werden beim ersten Zugriff mit timed()
+    eingewickelt und zwischengespeichert; Klassen und Konstanten werden unverändert durchgereicht.
+    """
+
+    def __init__(self, module, prefix):
+        object.__setattr__(self, "_module", module)
+        object.__setattr__(self, "_prefix", prefix)
+        object.__setattr__(self, "_wrapped", {})
+
+    def __getattr__(self, attr):
+        wrapped = self._wrapped.get(attr)
+        if wrapped is not None:
+            return wrapped
+        value = getattr(self._module, attr)
+        if callable(value) and not isinstance(value, type):
+            value = timed(f"{self._prefix}.{attr}", trace_args=native_call_args)(value)
+            self._wrapped[attr] = value
+        return value
+
+    def __setattr__(self, attr, value):
+        setattr(self._module, attr, value)
+        self._wrapped.pop(attr, None)
+
+    def __dir__(self):
+        return dir(self._module)
+
+    def __repr__(self):
+        return f"<instrumented {self._module!r}>"
+
+
+def instrument_module(module, prefix=None):
+    """Gibt module als InstrumentedModule zurück (None bleibt None)."""
+    if module is None or isinstance(module, InstrumentedModule):
+        return module
+    return InstrumentedModule(module, prefix or getattr(module, "__name__", "native"))
@@ -0,0 +1,112 @@
+# perf_trace.py
+# Zeitleisten-Recorder für Scatter- und Bake-Sessions: Ereignisse (Spans, Instant-Events, Zähler) landen
+# in einem Ringpuffer fester Größe (älteste werden überschrieben), Export als Chrome-Trace-JSON
+# (chrome://tracing, ui.perfetto.dev). Anders als perf_timing (Histogramme) zeigt das EINZELNE Ausreißer:
+# welches MOUSEMOVE/TIMER-Event 300 ms gedauert hat und was darin lief.
+# Gefüttert wird der Recorder von perf_timing.timed/timed_section; TRACER.enabled=False kostet pro Messpunkt
+# nur eine Attributabfrage.
+import json
+import os
+import threading
+import time
+
+_trace_module_name = __name__
+
+DEFAULT_TRACE_CAPACITY = 200_000
+MIN_TRACE_CAPACITY = 1_000
+
+PHASE_COMPLETE = "X"
+PHASE_INSTANT = "i"
+PHASE_COUNTER = "C"
+
+
+class TraceRecorder:
+    """Ringpuffer für Trace-Ereignisse (Tupel: phase, name, start_ns, dauer_ns, thread, args)."""
+
+    def __init__(self, capacity=DEFAULT_TRACE_CAPACITY):
+        self.enabled = False
+        self.set_capacity(capacity)
+
+    def set_capacity(self, capacity):
+        """Neue Puffergröße; verwirft alle bisherigen Ereignisse."""
+        self.capacity = max(MIN_TRACE_CAPACITY, int(capacity))
+        self.clear()
+
+    def clear(self):
+        self._ring = [None] * self.capacity
+        self._next = 0
+        self.recorded = 0
+        self.origin_ns = time.perf_counter_ns()
+        self.started_at = time.time()
+
+    def __len__(self):
+        return min(self.recorded, self.capacity)
+
+    @property
+    def dropped(self):
+        return max(0, self.recorded - self.capacity)
+
+    def _push(self, event):
+        index = self._next
+        self._ring[index] = event
+        self._next = index + 1 if index + 1 < self.capacity else 0
+        self.recorded += 1
+
+    def complete(self, name, start_ns, duration_ns, args=None):
+        """Abgeschlossener Span (start_ns aus time.perf_counter_ns)."""
+        self._push((PHASE_COMPLETE, name, start_ns, duration_ns, threading.get_ident(), args))
+
+    def instant(self, name, args=None):
+        self._push((PHASE_INSTANT, name, time.perf_counter_ns(), 0, threading.get_ident(), args))
+
+    def counter(self, name, values):
+        """Zählerstand(e) als dict, z.B. {"falling": 120}; Perfetto zeichnet daraus eine Kurve."""
+        self._push((PHASE_COUNTER, name, time.perf_counter_ns(), 0, threading.get_ident(), values))
+
+    def events(self):
+        """Gepufferte Ereignisse in Aufnahmereihenfolge."""
+        if self.recorded <= self.capacity:
+            return self._ring[:self.recorded]
+        return self._ring[self._next:] + self._ring[:self._next]
+
+    def to_chrome_trace(self, process_name="Blender"):
+        """Chrome Trace Event Format (JSON-Objekt-Variante), Zeitstempel in µs relativ zu clear()."""
+        pid = os.getpid()
+        main_ident = threading.main_thread().ident
+        thread_ids = {}
+        trace_events = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": process_name}}]
+        for phase, name, start_ns, duration_ns, thread, args in self.events():
+            tid = thread_ids.get(thread)
+            if tid is None:
+                tid = thread_ids[thread] = len(thread_ids) + 1
+                trace_events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                                     "args": {"name": "Main" if thread == main_ident else f"Thread {thread}"}})
+            event = {"name": name, "cat": name.split(".", 1)[0], "ph": phase,
+                     "ts": (start_ns - self.origin_ns) / 1000.0, "pid": pid, "tid": tid}
+            if phase == PHASE_COMPLETE:
+                event["dur"] = duration_ns / 1000.0
+            elif phase == PHASE_INSTANT:
+                event["s"] = "t"
+            if args:
+                event["args"] = args
+            trace_events.append(event)
+        return {
+            "traceEvents": trace_events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "started_at": self.started_at,
+                "recorded": self.recorded,
+                "dropped": self.dropped,
+                "capacity": self.capacity,
+            },
+        }
+
+    def write_chrome_trace(self, filepath, process_name="Blender"):
+        """Schreibt die Zeitleiste nach filepath; gibt die Anzahl exportierter Ereignisse zurück."""
+        document = self.to_chrome_trace(process_name)
+        with open(filepath, "w", encoding="utf-8") as handle:
+            json.dump(document, handle, default=str)  # default=str: args dürfen z.B. Enums/Vektoren enthalten
+        return len(self)
+
+
+TRACER = TraceRecorder()
@@ -13,57 +13,28 @@ import bpy
 import traceback
 from bpy.props import FloatProperty, EnumProperty, PointerProperty, BoolProperty, StringProperty, IntProperty
 
-# --- Globale Variablen für C++ Modul und Flag (werden durch Import aus __init__.py gefüllt) ---
-# Diese werden am Anfang des Moduls definiert, damit sie immer existieren,
-# auch wenn der Import aus dem Paket fehlschlägt oder die __init__.py nicht korrekt arbeitet.
-# Die tatsächlichen Werte kommen dann aus dem Import.
-scatter_accel = None
-NATIVE_MODULE_AVAILABLE = False
-# ---
+# Natives Modul: Lazy-Proxys aus native_access (geladen beim ersten Gebrauch, nicht beim Import)
+from .native_access import (
+    get_native_module, native_load_status, clear_path_cache,
+    LOAD_STATE_UNRESOLVED, LOAD_STATE_LOADED,
+)
+from .kernel_backends import KERNELS, BACKEND_AUTO, BACKEND_OVERRIDE_ITEMS
 
 _pt_module_name = __name__ # physical_tool module name (dieser Name ist modul-spezifisch und ok)
 
-# Import für das C++ Modul und das Verfügbarkeits-Flag aus dem Hauptpaket
-# Angepasst an den Stil des ursprünglichen instance_operator.py für Konsistenz
-try:
-    # Diese Zeilen versuchen, die Variablen zu importieren, die in __init__.py des Pakets
-    # (also im Ordner darüber, repräsentiert durch '..') definiert und initialisiert wurden.
-    # Die Alias-Namen sind exakt wie im ursprünglichen instance_operator.py Vorbild.
-    from . import scatter_accel as pkg_scatter_accel
-    from . import NATIVE_MODULE_AVAILABLE as pkg_NATIVE_MODULE_AVAILABLE
-
-    # Weise die importierten Werte den modulglobalen Variablen zu.
-    # Dies ist der "alte" Stil, den wir hier für Konsistenz replizieren.
-    pkg_scatter_accel = pkg_scatter_accel
-    NATIVE_MODULE_AVAILABLE = pkg_NATIVE_MODULE_AVAILABLE
-
-    # Die nachfolgenden Prüfungen basieren nun auf den globalen Variablen,
-    # die gerade oben zugewiesen wurden.
-    if NATIVE_MODULE_AVAILABLE and pkg_scatter_accel:
-        print(f"INFO [{_pt_module_name}]: Native C++ Modul 'pkg_scatter_accel' und Flag NATIVE_MODULE_AVAILABLE für PhysicalTool erfolgreich bezogen.")
-    elif NATIVE_MODULE_AVAILABLE and not pkg_scatter_accel:
-         print(f"WARNUNG [{_pt_module_name}]: NATIVE_MODULE_AVAILABLE ist True, aber pkg_scatter_accel ist None. Problem in __init__.py? Setze NATIVE_MODULE_AVAILABLE lokal auf False.")
-         NATIVE_MODULE_AVAILABLE = False
-         # pkg_scatter_accel ist durch die Zuweisung oben bereits None.
-    elif not NATIVE_MODULE_AVAILABLE:
-        print(f"INFO [{_pt_module_name}]: Native C++ Modul für PhysicalTool NICHT verfügbar (NATIVE_MODULE_AVAILABLE ist False).")
-        if pkg_scatter_accel is not None:
-            print(f"WARNUNG [{_pt_module_name}]: NATIVE_MODULE_AVAILABLE False, aber pkg_scatter_accel ist nicht None. Setze pkg_scatter_accel auf None.")
-            pkg_scatter_accel = None
-
-except ImportError as e_imp_pt:
-    print(f"KRITISCH [{_pt_module_name}]: ImportError beim Versuch, C++ Modul/Flag für PhysicalTool aus Paket zu importieren: {e_imp_pt}")
-    print(f"  [{_pt_module_name}]: C++ Beschleunigung wird für dieses Modul DEAKTIVIERT.")
-    pkg_scatter_accel = None # Sicherstellen
-    NATIVE_MODULE_AVAILABLE = False # Sicherstellen
-except Exception as e_gen_imp_pt:
-    print(f"KRITISCH [{_pt_module_name}]: Allgemeiner Fehler (Typ: {type(e_gen_imp_pt).__name__}) beim Import von C++ Modul/Flag für PhysicalTool: {e_gen_imp_pt}")
-    print(f"  [{_pt_module_name}]: C++ Beschleunigung wird für dieses Modul DEAKTIVIERT.")
-    pkg_scatter_accel = None # Sicherstellen
-    NATIVE_MODULE_AVAILABLE = False # Sicherstellen
-
 # --- (Rest der Datei physical_layout_tool.py bleibt unverändert) ---
 
+from .rigidbody_bulk import build_rigid_body_settings, bulk_add_rigid_bodies, make_data_single_user
+from .selection_utils import SelectionSnapshot, single_object_override
+from .static_bake import bake_visual_transforms, bake_objects_to_static
+from .simulation_bake import bake_managed_settle, SettleMonitor
+from .progressive_freeze import ProgressiveFreezer
+from .object_metadata import extract_object_records, analyze_rb_setup_records
+from .record_kernels import RB_SETUP_NEEDS_SINGLE_USER
+from .job_scheduler import ScatterJob, submit_job, cancel_job, cancel_all_jobs, draw_job_status, JOB_DONE
+
+RB_BULK_INITIAL_BATCH_SIZE = 256 # Startgröße im Bulk-Pfad (ein view_layer.update() pro Batch); passt sich ans Zeitbudget an
+
 # Helper function to get or create collection
 def get_or_create_collection_phy(collection_name, context, parent_collection_obj=None): 
     if not collection_name:
@@ -118,30 +89,85 @@ class PhysicalToolSettings(bpy.types.PropertyGroup):
     
     batch_size: bpy.props.IntProperty(
         name="Batch Size",
-        description="Number of objects to process per step in modal operations",
+        description="Initial number of objects per step in modal operations (adapted to the time budget while running)",
         default=5, 
         min=1
     )
+    time_budget_ms: bpy.props.FloatProperty(
+        name="Time Budget (ms)",
+        description="Processing time per UI tick for modal operations. Higher = faster, lower = more responsive UI",
+        default=12.0,
+        min=1.0,
+        max=200.0
+    )
     timer_interval: bpy.props.FloatProperty(
         name="Timer Interval",
-        description="Delay between processing batches in modal operations (seconds)",
+        description="How often modal operations poll and report job progress (seconds)",
         default=0.01, 
         min=0.001,
         subtype='TIME',
         unit='TIME'
     )
 
+    use_rest_detection: bpy.props.BoolProperty(
+        name="Stop When Settled",
+        description="Managed settle bake: simulate frame by frame and stop once all bodies have come to rest",
+        default=True
+    )
+    rest_linear_threshold: bpy.props.FloatProperty(
+        name="Linear Threshold",
+        description="Maximum movement per frame that still counts as resting",
+        default=0.001,
+        min=0.0,
+        precision=4,
+        subtype='DISTANCE',
+        unit='LENGTH'
+    )
+    rest_angular_threshold: bpy.props.FloatProperty(
+        name="Angular Threshold",
+        description="Maximum rotation per frame that still counts as resting",
+        default=0.0017453, # 0.1°
+        min=0.0,
+        precision=4,
+        subtype='ANGLE'
+    )
+    rest_frames: bpy.props.IntProperty(
+        name="Rest Frames",
+        description="Number of consecutive resting frames before the bake stops",
+        default=5,
+        min=1
+    )
+    use_progressive_freeze: bpy.props.BoolProperty(
+        name="Freeze Resting Bodies",
+        description="Managed settle bake: switch bodies that have been at rest to Animated (kinematic) and wake them when a moving body comes close",
+        default=False
+    )
+    freeze_after_frames: bpy.props.IntProperty(
+        name="Freeze After",
+        description="Number of consecutive resting frames before a body is frozen",
+        default=10,
+        min=1
+    )
+    use_settle_cache: bpy.props.BoolProperty(
+        name="Cache Settled Layouts",
+        description="Managed settle bake: store settled transforms in a compressed .npz next to the .blend and reuse them when meshes, initial transforms and physics settings are unchanged",
+        default=True
+    )
+    last_settle_frame: bpy.props.IntProperty(
+        name="Last Settle Frame",
+        description="Frame at which the last managed settle bake came to rest (-1 = not settled / unknown)",
+        default=-1
+    )
+
 # --- Base Modal Operator for Rigid Body Operations ---
 class OBJECT_OT_rigidbody_modal_base(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'} 
 
     _timer = None
+    _job = None
     _objects_to_process_names = []
-    _current_object_index = 0
-    _processed_in_batch = 0 
     
-    _initial_selected_names = set()
-    _initial_active_name = None
+    _selection_snapshot = None
     
     _phys_settings_ref = None 
     _im_settings_ref = None   
@@ -149,6 +175,25 @@ class OBJECT_OT_rigidbody_modal_base(bpy.types.Operator):
     def process_single_object(self, context, obj):
         raise NotImplementedError("Subclasses must implement process_single_object.")
 
+    def _get_batch_size(self):
+        return self._phys_settings_ref.batch_size if self._phys_settings_ref else 1
+
+    def process_object_batch(self, context, objects):
+        """Standard: process_single_object pro Objekt in einem temp_override (globale Auswahl bleibt unberührt)."""
+        for obj in objects:
+            obj_name = obj.name
+            try:
+                with single_object_override(context, obj):
+                    self.process_single_object(context, obj)
+            except ReferenceError:
+                self.report({'WARNING'}, f"Objekt '{obj_name}' wurde während der Verarbeitung ungültig.")
+            except RuntimeError as e:
+                self.report({'WARNING'}, f"Laufzeitfehler bei der Verarbeitung von '{obj_name}': {e}")
+                traceback.print_exc()
+            except Exception as e_gen:
+                self.report({'ERROR'}, f"Unerwarteter Fehler bei Verarbeitung von '{obj_name}': {e_gen}")
+                traceback.print_exc()
+
     @classmethod
     def poll(cls, context):
         return any(obj and obj.type == 'MESH' for obj in context.selected_objects)
@@ -159,11 +204,7 @@ class OBJECT_OT_rigidbody_modal_base(bpy.types.Operator):
             self.report({'WARNING'}, "No mesh objects selected.")
             return {'CANCELLED'}
 
-        self._initial_selected_names = {obj.name for obj in context.selected_objects if obj}
-        self._initial_active_name = context.view_layer.objects.active.name if context.view_layer.objects.active else None
-        
-        self._current_object_index = 0
-        self._processed_in_batch = 0
+        self._selection_snapshot = SelectionSnapshot(context)
 
         active_scene = context.scene
         self._phys_settings_ref = getattr(active_scene, 'physical_tool_settings', None)
@@ -173,6 +214,14 @@ class OBJECT_OT_rigidbody_modal_base(bpy.types.Operator):
             self.report({'ERROR'}, "PhysicalToolSettings nicht gefunden.")
             return {'CANCELLED'}
 
+        # Verarbeitung läuft im Job-Scheduler (Zeitbudget pro Tick), der Modal-Timer fragt nur den Fortschritt ab
+        self._job = submit_job(ScatterJob(
+            self.bl_label, self._objects_to_process_names, self._process_job_batch,
+            initial_batch_size=self._get_batch_size(),
+            time_budget=self._phys_settings_ref.time_budget_ms / 1000.0,
+            window=context.window,
+        ))
+
         wm = context.window_manager
         self._timer = wm.event_timer_add(self._phys_settings_ref.timer_interval, window=context.window)
         wm.modal_handler_add(self)
@@ -180,68 +229,29 @@ class OBJECT_OT_rigidbody_modal_base(bpy.types.Operator):
         self.report({'INFO'}, f"Starting: {self.bl_label} for {len(self._objects_to_process_names)} objects.")
         return {'RUNNING_MODAL'}
 
+    def _process_job_batch(self, context, batch_names):
+        batch_objects = []
+        for obj_name in batch_names:
+            obj = bpy.data.objects.get(obj_name)
+            if obj and obj.name in context.view_layer.objects:
+                batch_objects.append(obj)
+            else:
+                self.report({'WARNING'}, f"Object '{obj_name}' not found or invalid, skipping.")
+        if batch_objects:
+            self.process_object_batch(context, batch_objects)
+
     def modal(self, context, event):
         if event.type == 'ESC':
             self.report({'INFO'}, f"{self.bl_label} cancelled by user.")
+            if self._job: cancel_job(self._job)
             return self._finish_modal(context, cancelled=True)
 
         if event.type == 'TIMER':
-            if self._current_object_index >= len(self._objects_to_process_names):
-                return self._finish_modal(context)
-
-            self._processed_in_batch = 0
-            batch_size = self._phys_settings_ref.batch_size if self._phys_settings_ref else 1
-
-            for _ in range(batch_size):
-                if self._current_object_index >= len(self._objects_to_process_names):
-                    break 
-
-                obj_name = self._objects_to_process_names[self._current_object_index]
-                obj = bpy.data.objects.get(obj_name)
-
-                if obj and obj.name in context.view_layer.objects: 
-                    loop_original_active = context.view_layer.objects.active
-                    loop_original_selected_names = {o.name for o in context.selected_objects if o}
-                    
-                    bpy.ops.object.select_all(action='DESELECT')
-                    try:
-                        obj.select_set(True)
-                        context.view_layer.objects.active = obj
-                        self.process_single_object(context, obj)
-                    except ReferenceError:
-                        self.report({'WARNING'}, f"Objekt '{obj_name}' wurde während der Verarbeitung ungültig.")
-                    except RuntimeError as e:
-                        self.report({'WARNING'}, f"Laufzeitfehler bei der Verarbeitung von '{obj_name}': {e}")
-                        traceback.print_exc()
-                    except Exception as e_gen:
-                        self.report({'ERROR'}, f"Unerwarteter Fehler bei Verarbeitung von '{obj_name}': {e_gen}")
-                        traceback.print_exc()
-                    finally:
-                        bpy.ops.object.select_all(action='DESELECT')
-                        for name_sel in loop_original_selected_names:
-                            obj_sel_loop = bpy.data.objects.get(name_sel)
-                            if obj_sel_loop and obj_sel_loop.name in context.view_layer.objects:
-                                try: obj_sel_loop.select_set(True)
-                                except ReferenceError: pass
-                        if loop_original_active and loop_original_active.name in context.view_layer.objects:
-                            try: context.view_layer.objects.active = loop_original_active
-                            except ReferenceError: pass
-                        elif loop_original_selected_names: # Fallback if original active is gone
-                            first_sel_name = next(iter(loop_original_selected_names), None)
-                            if first_sel_name:
-                                first_sel_obj = bpy.data.objects.get(first_sel_name)
-                                if first_sel_obj and first_sel_obj.name in context.view_layer.objects:
-                                    try: context.view_layer.objects.active = first_sel_obj
-                                    except ReferenceError: pass
-
-                else:
-                    self.report({'WARNING'}, f"Object '{obj_name}' not found or invalid, skipping.")
-                
-                self._current_object_index += 1
-                self._processed_in_batch += 1
-            
-            if self._processed_in_batch > 0:
-                 self.report({'INFO'}, f"Processed {self._current_object_index}/{len(self._objects_to_process_names)}...")
+            job = self._job
+            if job is None or job.is_finished:
+                return self._finish_modal(context, cancelled=(job is None or job.state != JOB_DONE))
+            try: context.workspace.status_text_set(job.status_text())
+            except (AttributeError, ReferenceError): pass
         return {'RUNNING_MODAL'}
 
     def _finish_modal(self, context, cancelled=False):
@@ -249,23 +259,16 @@ class OBJECT_OT_rigidbody_modal_base(bpy.types.Operator):
             context.window_manager.event_timer_remove(self._timer)
             self._timer = None
         context.window.cursor_modal_restore()
-        bpy.ops.object.select_all(action='DESELECT')
-        for name in self._initial_selected_names:
-            obj_to_reselect = bpy.data.objects.get(name)
-            if obj_to_reselect and obj_to_reselect.name in context.view_layer.objects:
-                try: obj_to_reselect.select_set(True)
-                except ReferenceError: pass
-        initial_active_obj = bpy.data.objects.get(self._initial_active_name) if self._initial_active_name else None
-        if initial_active_obj and initial_active_obj.name in context.view_layer.objects:
-            try: context.view_layer.objects.active = initial_active_obj
-            except ReferenceError: pass
-        elif self._initial_selected_names: 
-            first_selected_name = next(iter(self._initial_selected_names), None)
-            if first_selected_name:
-                first_selected_obj = bpy.data.objects.get(first_selected_name)
-                if first_selected_obj and first_selected_obj.name in context.view_layer.objects:
-                    try: context.view_layer.objects.active = first_selected_obj
-                    except ReferenceError: pass
+        try: context.workspace.status_text_set(None)
+        except (AttributeError, ReferenceError): pass
+        if self._job and not self._job.is_finished:
+            cancel_job(self._job)
+        if self._job:
+            print(f"INFO [{_pt_module_name}]: {self._job.status_text()}")
+        self._job = None
+        if self._selection_snapshot:
+            self._selection_snapshot.restore(context)
+            self._selection_snapshot = None
         if context.area: 
             try: context.area.tag_redraw()
             except ReferenceError: pass 
@@ -274,116 +277,54 @@ class OBJECT_OT_rigidbody_modal_base(bpy.types.Operator):
         return {'FINISHED'} if not cancelled else {'CANCELLED'}
 
 
-# --- Modal Operator to Set ACTIVE Rigid Body ---
-class OBJECT_OT_set_active_rigid_body_modal(OBJECT_OT_rigidbody_modal_base):
-    bl_idname = "object.set_active_rigid_body_modal"
-    bl_label = "Set Active Rigid Body (Modal)"
+# --- Base for Bulk Rigid Body Operations (ohne ops.rigidbody.object_add pro Objekt) ---
+class OBJECT_OT_rigidbody_bulk_modal_base(OBJECT_OT_rigidbody_modal_base):
+    _rb_type = 'ACTIVE'
+
+    def _get_batch_size(self):
+        # Ein Batch kostet nur ein Update -> mit größerem Batch starten, der Scheduler regelt nach
+        return max(super()._get_batch_size(), RB_BULK_INITIAL_BATCH_SIZE)
 
     def process_single_object(self, context, obj):
-        is_unprepared_managed_instance = False
-        obj_data_users = 0
-        if obj.data:
-            obj_data_users = obj.data.users
-        
+        self.process_object_batch(context, [obj])
+
+    def process_object_batch(self, context, objects):
+        instance_collection = None
         if self._im_settings_ref and self._im_settings_ref.instance_collection_name:
             instance_collection = bpy.data.collections.get(self._im_settings_ref.instance_collection_name)
-            if instance_collection and obj.name in instance_collection.objects:
-                if obj.data and obj_data_users > 1:
-                    is_unprepared_managed_instance = True
-        
-        if is_unprepared_managed_instance:
-            self.report({'DEBUG'}, f"Instanz '{obj.name}' wird für Physik vorbereitet (Make Single User)...")
-            try:
-                current_matrix = obj.matrix_world.copy() 
-                bpy.ops.object.make_single_user(object=True, obdata=True, animation=False, obdata_animation=False)
-                obj.matrix_world = current_matrix 
-                context.view_layer.update() 
-                obj_data_users_after = obj.data.users if obj.data else -1 
-                if obj_data_users_after > 1: 
-                     self.report({'WARNING'}, f"Vorbereitung (Make Single User) von '{obj.name}' fehlgeschlagen, Daten immer noch geteilt.")
-                     return 
-                else:
-                    self.report({'DEBUG'}, f"'{obj.name}' erfolgreich zu Single User gemacht.")
-            except RuntimeError as e_prep:
-                self.report({'WARNING'}, f"Konnte Instanz '{obj.name}' nicht zu Single User machen: {e_prep}.")
-                traceback.print_exc()
-                return 
-            except Exception as e_generic_prep: 
-                self.report({'ERROR'}, f"Generischer Fehler bei Vorbereitung von '{obj.name}': {e_generic_prep}")
-                traceback.print_exc()
-                return
 
-        if not obj.rigid_body: 
-            try: 
-                bpy.ops.rigidbody.object_add()
-            except RuntimeError as e_add_rb:
-                self.report({'WARNING'}, f"Konnte Rigid Body zu '{obj.name}' nicht hinzufügen: {e_add_rb}")
-                traceback.print_exc()
-                return 
-        
-        if obj.rigid_body: 
-            rb = obj.rigid_body
-            rb.type = 'ACTIVE'
-            rb.mass = self._phys_settings_ref.mass
-            rb.collision_shape = self._phys_settings_ref.collision_shape
-            rb.use_margin = True
-            rb.collision_margin = self._phys_settings_ref.collision_margin
-            rb.linear_damping = 0.04
-            rb.angular_damping = 0.1
-            rb.use_deactivation = True
-            rb.use_start_deactivated = False
-            context.view_layer.update()
-            self.report({'DEBUG'}, f"Rigid Body für '{obj.name}' als ACTIVE konfiguriert.")
+        if instance_collection:
+            # Verwaltete Instanzen teilen Mesh-Daten -> vor der Physik eigene Daten geben (statt ops.make_single_user)
+            record_set = extract_object_records(context, objects, [instance_collection], with_matrices=False)
+            actions = analyze_rb_setup_records(record_set.records, record_set.collection_bit(instance_collection.name))
+            managed = record_set.select((actions & RB_SETUP_NEEDS_SINGLE_USER) != 0)
+            if managed:
+                prepared = make_data_single_user(managed)
+                self.report({'DEBUG'}, f"{prepared}/{len(managed)} Instanzen für Physik vorbereitet (Single User).")
+
+        rb_settings = build_rigid_body_settings(self._phys_settings_ref, self._rb_type)
+        try:
+            configured = bulk_add_rigid_bodies(context, objects, rb_settings)
+        except Exception as e_bulk:
+            self.report({'ERROR'}, f"Fehler beim Bulk-Setup der Rigid Bodies: {e_bulk}")
+            traceback.print_exc()
+            return
+        if len(configured) < len(objects):
+            self.report({'WARNING'}, f"Rigid Body nur für {len(configured)}/{len(objects)} Objekte konfiguriert.")
+        else:
+            self.report({'DEBUG'}, f"Rigid Body für {len(configured)} Objekte als {self._rb_type} konfiguriert.")
+
+# --- Modal Operator to Set ACTIVE Rigid Body ---
+class OBJECT_OT_set_active_rigid_body_modal(OBJECT_OT_rigidbody_bulk_modal_base):
+    bl_idname = "object.set_active_rigid_body_modal"
+    bl_label = "Set Active Rigid Body (Modal)"
+    _rb_type = 'ACTIVE'
 
 # --- Modal Operator to Set PASSIVE Rigid Body ---
-class OBJECT_OT_set_passive_rigid_body_modal(OBJECT_OT_rigidbody_modal_base):
+class OBJECT_OT_set_passive_rigid_body_modal(OBJECT_OT_rigidbody_bulk_modal_base):
     bl_idname = "object.set_passive_rigid_body_modal"
     bl_label = "Set Passive Rigid Body (Modal)"
-
-    def process_single_object(self, context, obj):
-        is_unprepared_managed_instance = False
-        if self._im_settings_ref and self._im_settings_ref.instance_collection_name:
-            instance_collection = bpy.data.collections.get(self._im_settings_ref.instance_collection_name)
-            if instance_collection and obj.name in instance_collection.objects and \
-               obj.data and obj.data.users > 1:
-                is_unprepared_managed_instance = True
-        
-        if is_unprepared_managed_instance:
-            self.report({'DEBUG'}, f"Instanz '{obj.name}' wird für Physik vorbereitet (Make Single User)...")
-            try:
-                current_matrix = obj.matrix_world.copy()
-                bpy.ops.object.make_single_user(object=True, obdata=True, animation=False, obdata_animation=False)
-                obj.matrix_world = current_matrix
-                context.view_layer.update()
-                if obj.data.users > 1:
-                     self.report({'WARNING'}, f"Vorbereitung (Make Single User) von '{obj.name}' fehlgeschlagen.")
-                     return 
-                else:
-                    self.report({'DEBUG'}, f"'{obj.name}' erfolgreich zu Single User gemacht.")
-            except RuntimeError as e_prep:
-                self.report({'WARNING'}, f"Konnte Instanz '{obj.name}' nicht zu Single User machen: {e_prep}.")
-                traceback.print_exc()
-                return
-            except Exception as e_generic_prep:
-                self.report({'ERROR'}, f"Generischer Fehler bei Vorbereitung von '{obj.name}': {e_generic_prep}")
-                traceback.print_exc()
-                return
-
-        if not obj.rigid_body:
-            try: bpy.ops.rigidbody.object_add()
-            except RuntimeError as e_add_rb:
-                self.report({'WARNING'}, f"Konnte RB zu '{obj.name}' nicht hinzufügen: {e_add_rb}")
-                traceback.print_exc()
-                return
-        
-        if obj.rigid_body:
-            rb = obj.rigid_body
-            rb.type = 'PASSIVE'
-            rb.collision_shape = self._phys_settings_ref.collision_shape
-            rb.use_margin = True
-            rb.collision_margin = self._phys_settings_ref.collision_margin
-            context.view_layer.update()
-            self.report({'DEBUG'}, f"Rigid Body für '{obj.name}' als PASSIVE konfiguriert.")
+    _rb_type = 'PASSIVE'
 
 # --- Modal Operator to REMOVE Rigid Body ---
 class OBJECT_OT_remove_rigid_body_modal(OBJECT_OT_rigidbody_modal_base):
@@ -421,13 +362,12 @@ class OBJECT_OT_bake_visual_transform(bpy.types.Operator):
                 if not is_unprepared_instance: return True
         return False
     def execute(self, context):
-        original_active = context.view_layer.objects.active
-        original_selected_names = {obj.name for obj in context.selected_objects if obj}
+        original_selected_names = [obj.name for obj in context.selected_objects if obj]
         im_settings = getattr(context.scene, 'instance_manager_settings', None)
         instance_collection = None
         if im_settings and hasattr(im_settings, 'instance_collection_name') and im_settings.instance_collection_name:
             instance_collection = bpy.data.collections.get(im_settings.instance_collection_name)
-        processed_count = 0
+        objects_to_bake = []
         for obj_name in original_selected_names:
             obj = bpy.data.objects.get(obj_name)
             if not obj or obj.type != 'MESH': continue
@@ -435,47 +375,16 @@ class OBJECT_OT_bake_visual_transform(bpy.types.Operator):
             if instance_collection and obj.name in instance_collection.objects and \
                obj.data and obj.data.users > 1: is_unprepared_instance = True
             if is_unprepared_instance: self.report({'INFO'}, f"'{obj.name}' ist eine unvorbereitete Instanz. Bake Visual Transform übersprungen."); continue
-            
-            current_loop_active = context.view_layer.objects.active 
-            current_loop_selected_names = {o.name for o in context.selected_objects if o}
-            bpy.ops.object.select_all(action='DESELECT')
+            objects_to_bake.append(obj)
+
+        processed_count = 0
+        if objects_to_bake:
+            # Ausgewertete Weltmatrizen in einem Durchgang lesen und direkt zurückschreiben (kein Operator, keine Auswahl)
             try:
-                obj.select_set(True); context.view_layer.objects.active = obj
-                bpy.ops.object.visual_transform_apply(); processed_count += 1
-            except ReferenceError: self.report({'WARNING'}, f"Objekt '{obj_name}' wurde während Bake Visual Transform ungültig.")
-            except Exception as e: 
-                self.report({'WARNING'}, f"Fehler beim Anwenden des visuellen Transforms auf '{obj.name}': {e}")
+                processed_count = bake_visual_transforms(context, objects_to_bake)
+            except Exception as e:
+                self.report({'WARNING'}, f"Fehler beim Anwenden des visuellen Transforms: {e}")
                 traceback.print_exc()
-            finally:
-                bpy.ops.object.select_all(action='DESELECT')
-                for name_sel in current_loop_selected_names:
-                    obj_sel_loop = bpy.data.objects.get(name_sel)
-                    if obj_sel_loop and obj_sel_loop.name in context.view_layer.objects:
-                        try: obj_sel_loop.select_set(True)
-                        except ReferenceError: pass
-                if current_loop_active and current_loop_active.name in context.view_layer.objects:
-                    try: context.view_layer.objects.active = current_loop_active
-                    except ReferenceError: pass
-                elif current_loop_selected_names:
-                    first_sel_name = next(iter(current_loop_selected_names), None)
-                    if first_sel_name:
-                        first_sel_obj = bpy.data.objects.get(first_sel_name)
-                        if first_sel_obj and first_sel_obj.name in context.view_layer.objects:
-                            try: context.view_layer.objects.active = first_sel_obj
-                            except ReferenceError: pass
-                            
-        bpy.ops.object.select_all(action='DESELECT')
-        for name in original_selected_names:
-            obj_to_reselect = bpy.data.objects.get(name)
-            if obj_to_reselect and obj_to_reselect.name in context.view_layer.objects:
-                try: obj_to_reselect.select_set(True)
-                except ReferenceError: pass
-        if original_active and original_active.name in context.view_layer.objects:
-            try: context.view_layer.objects.active = original_active
-            except ReferenceError: pass
-        elif context.selected_objects:
-            try: context.view_layer.objects.active = context.selected_objects[0]
-            except (IndexError, ReferenceError) : pass
 
         if processed_count == 0 and any(bpy.data.objects.get(name) for name in original_selected_names):
             self.report({'INFO'}, "Keine geeigneten Objekte für Bake Visual Transform ausgewählt oder Fehler bei allen.")
@@ -508,231 +417,26 @@ class OBJECT_OT_bake_to_static(bpy.types.Operator):
             self.report({'ERROR'}, f"Static Collection '{static_collection_target_name}' konnte nicht gefunden oder erstellt werden.")
             return {'CANCELLED'}
 
-        original_active = context.view_layer.objects.active
         selected_mesh_objects = [obj for obj in context.selected_objects if obj and obj.type == 'MESH']
         
         if not selected_mesh_objects:
             self.report({'INFO'}, "Keine Mesh-Objekte zum Baken ausgewählt.")
             return {'FINISHED'}
 
-        original_selected_names = {obj.name for obj in selected_mesh_objects}
-
-        processed_count = 0
-        failed_count = 0
-        
-        if NATIVE_MODULE_AVAILABLE and pkg_scatter_accel and hasattr(pkg_scatter_accel, 'analyze_objects_for_static_bake'):
-            self.report({'INFO'}, "Verwende C++ Analyse für Bake to Static...")
-            object_names_for_cpp = [obj.name for obj in selected_mesh_objects]
-
-            try:
-                instructions_from_cpp = pkg_scatter_accel.analyze_objects_for_static_bake(object_names_for_cpp, static_collection_target_name)
-            except Exception as e_cpp_analyze:
-                self.report({'ERROR'}, f"Fehler bei C++ Analyse für Bake to Static: {e_cpp_analyze}. Fallback auf Python.")
-                traceback.print_exc()
-                instructions_from_cpp = None 
-            
-            if instructions_from_cpp is not None:
-                for instruction in instructions_from_cpp:
-                    obj_name = instruction.get("name")
-                    obj = bpy.data.objects.get(obj_name)
-
-                    if not obj:
-                        self.report({'WARNING'}, f"Objekt '{obj_name}' aus C++ Instruktion nicht gefunden. Übersprungen.")
-                        failed_count += 1
-                        continue
-                    
-                    loop_original_active = context.view_layer.objects.active
-                    loop_original_selected_names = {o.name for o in context.selected_objects if o}
-                    
-                    bpy.ops.object.select_all(action='DESELECT')
-                    try:
-                        obj.select_set(True)
-                        context.view_layer.objects.active = obj
-
-                        bpy.ops.object.visual_transform_apply()
-
-                        if instruction.get("has_rigidbody", False) and obj.rigid_body:
-                            bpy.ops.rigidbody.object_remove()
-                        
-                        if instruction.get("needs_make_single_user", False) and obj.data and obj.data.users > 1:
-                            current_matrix_for_sud = obj.matrix_world.copy()
-                            bpy.ops.object.make_single_user(object=True, obdata=True, animation=False, obdata_animation=False)
-                            obj.matrix_world = current_matrix_for_sud
-                        
-                        # Collection Management
-                        current_collections_on_obj_names_cpp = instruction.get("current_collections", [])
-                        for col_name_from_cpp in current_collections_on_obj_names_cpp:
-                            if col_name_from_cpp == static_collection_target_name:
-                                continue # Nicht von der Zielcollection entfernen
-                            col_to_unlink = bpy.data.collections.get(col_name_from_cpp)
-                            if col_to_unlink and obj.name in col_to_unlink.objects:
-                                try:
-                                    col_to_unlink.objects.unlink(obj)
-                                except RuntimeError as e_unlink_cpp:
-                                    self.report({'DEBUG'}, f"Fehler beim Unlinken (C++ path) von '{obj_name}' aus '{col_name_from_cpp}': {e_unlink_cpp} (ggf. schon weg)")
-                        
-                        # Fallback, falls C++ keine Collections lieferte oder als zusätzliche Sicherheit
-                        if not current_collections_on_obj_names_cpp:
-                             for col_obj_iter_py_fallback in list(obj.users_collection):
-                                if col_obj_iter_py_fallback.name != static_collection_target_name:
-                                    try: col_obj_iter_py_fallback.objects.unlink(obj)
-                                    except RuntimeError: pass
-
-
-                        if obj.name not in static_collection_obj.objects:
-                            try:
-                                static_collection_obj.objects.link(obj)
-                            except RuntimeError as e_link_cpp:
-                                 self.report({'WARNING'}, f"Konnte '{obj.name}' nicht mit Collection '{static_collection_obj.name}' verlinken (C++ path): {e_link_cpp}")
-                                 traceback.print_exc()
-                                 failed_count += 1
-                                 continue 
-                        
-                        processed_count += 1
-
-                    except ReferenceError:
-                        self.report({'WARNING'}, f"Objekt '{obj_name}' wurde während Bake to Static (C++ path) ungültig.")
-                        failed_count += 1
-                    except RuntimeError as e_rt_ops_cpp:
-                        self.report({'WARNING'}, f"Laufzeitfehler bei bpy.ops für '{obj_name}' (C++ path): {e_rt_ops_cpp}")
-                        traceback.print_exc()
-                        failed_count +=1
-                    except Exception as e_cpp_loop:
-                        self.report({'WARNING'}, f"Allgemeiner Fehler bei Bake to Static für '{obj_name}' (C++ path): {e_cpp_loop}")
-                        traceback.print_exc()
-                        failed_count += 1
-                    finally:
-                        bpy.ops.object.select_all(action='DESELECT')
-                        for name_sel_loop_cpp in loop_original_selected_names:
-                            obj_sel_loop_restore_cpp = bpy.data.objects.get(name_sel_loop_cpp)
-                            if obj_sel_loop_restore_cpp and obj_sel_loop_restore_cpp.name in context.view_layer.objects:
-                                try: obj_sel_loop_restore_cpp.select_set(True)
-                                except ReferenceError: pass
-                        if loop_original_active and loop_original_active.name in context.view_layer.objects:
-                            try: context.view_layer.objects.active = loop_original_active
-                            except ReferenceError: pass
-                        elif loop_original_selected_names:
-                            first_sel_name = next(iter(loop_original_selected_names), None)
-                            if first_sel_name:
-                                first_sel_obj = bpy.data.objects.get(first_sel_name)
-                                if first_sel_obj and first_sel_obj.name in context.view_layer.objects:
-                                    try: context.view_layer.objects.active = first_sel_obj
-                                    except ReferenceError: pass
-                
-                # Selektion am Ende des C++ Pfades wiederherstellen
-                bpy.ops.object.select_all(action='DESELECT')
-                for name in original_selected_names:
-                    obj_to_reselect = bpy.data.objects.get(name)
-                    if obj_to_reselect and obj_to_reselect.name in context.view_layer.objects:
-                        try: obj_to_reselect.select_set(True)
-                        except ReferenceError: pass
-                if original_active and original_active.name in context.view_layer.objects:
-                    try: context.view_layer.objects.active = original_active
-                    except ReferenceError: pass
-                elif context.selected_objects:
-                     try: context.view_layer.objects.active = context.selected_objects[0]
-                     except (IndexError, ReferenceError): pass
-
-                if processed_count > 0: self.report({'INFO'}, f"{processed_count} Objekt(e) zu Static gebacken (C++-Pfad).")
-                if failed_count > 0: self.report({'WARNING'}, f"{failed_count} Objekt(e) nicht gebacken (C++-Pfad).")
-                if processed_count == 0 and failed_count == 0 and original_selected_names: self.report({'INFO'}, "Keine Objekte gebacken (C++-Pfad, ggf. waren alle konform).")
-                return {'FINISHED'}
-
-        # === PYTHON FALLBACK PATH ===
-        self.report({'INFO'}, "Verwende reine Python-Logik für Bake to Static (Fallback).")
-        for obj_name in original_selected_names: 
-            obj = bpy.data.objects.get(obj_name)
-            if not obj: continue 
-
-            loop_original_active = context.view_layer.objects.active
-            loop_original_selected_names = {o.name for o in context.selected_objects if o}
-            original_obj_collections_py_path = [] # Für Rollback im Fehlerfall
-            
-            bpy.ops.object.select_all(action='DESELECT')
-            try:
-                obj.select_set(True); context.view_layer.objects.active = obj
-                original_obj_collections_py_path = [col for col in obj.users_collection] 
-                
-                bpy.ops.object.visual_transform_apply()
-                if obj.rigid_body: bpy.ops.rigidbody.object_remove()
-                if obj.data and obj.data.users > 1: 
-                    current_matrix_for_sud = obj.matrix_world.copy()
-                    bpy.ops.object.make_single_user(object=True, obdata=True, animation=False, obdata_animation=False)
-                    obj.matrix_world = current_matrix_for_sud
-                
-                for col_obj_iter_py in list(obj.users_collection): 
-                    if col_obj_iter_py.name != static_collection_target_name:
-                        try: col_obj_iter_py.objects.unlink(obj)
-                        except RuntimeError: pass 
-                
-                if obj.name not in static_collection_obj.objects: 
-                    try: static_collection_obj.objects.link(obj)
-                    except RuntimeError as e_link_py:
-                        self.report({'WARNING'}, f"Konnte '{obj.name}' nicht mit Collection '{static_collection_obj.name}' verlinken (Python path): {e_link_py}")
-                        traceback.print_exc()
-                        failed_count += 1
-                        continue
-                
-                processed_count += 1
-            except ReferenceError:
-                self.report({'WARNING'}, f"Objekt '{obj_name}' wurde während Bake to Static (Python path) ungültig.")
-                failed_count += 1
-                if obj and obj.name in bpy.data.objects and obj.name not in static_collection_obj.objects:
-                    for col_orig in original_obj_collections_py_path:
-                        if col_orig.name != static_collection_target_name and obj.name not in col_orig.objects:
-                           try: col_orig.objects.link(obj)
-                           except: pass
-            except RuntimeError as e_rt_ops_py:
-                self.report({'WARNING'}, f"Laufzeitfehler bei bpy.ops für '{obj_name}' (Python path): {e_rt_ops_py}")
-                traceback.print_exc()
-                failed_count +=1
-            except Exception as e_py:
-                self.report({'WARNING'}, f"Fehler bei Bake to Static für '{obj.name}' (Python path): {e_py}")
-                traceback.print_exc()
-                failed_count += 1
-                if obj and obj.name in bpy.data.objects and obj.name not in static_collection_obj.objects: 
-                    for col_orig in original_obj_collections_py_path:
-                        if col_orig.name != static_collection_target_name and obj.name not in col_orig.objects:
-                           try: col_orig.objects.link(obj)
-                           except: pass
-            finally:
-                bpy.ops.object.select_all(action='DESELECT')
-                for name_sel_loop_py in loop_original_selected_names:
-                    obj_sel_loop_restore_py = bpy.data.objects.get(name_sel_loop_py)
-                    if obj_sel_loop_restore_py and obj_sel_loop_restore_py.name in context.view_layer.objects:
-                        try: obj_sel_loop_restore_py.select_set(True)
-                        except ReferenceError: pass
-                if loop_original_active and loop_original_active.name in context.view_layer.objects:
-                    try: context.view_layer.objects.active = loop_original_active
-                    except ReferenceError: pass
-                elif loop_original_selected_names:
-                    first_sel_name = next(iter(loop_original_selected_names), None)
-                    if first_sel_name:
-                        first_sel_obj = bpy.data.objects.get(first_sel_name)
-                        if first_sel_obj and first_sel_obj.name in context.view_layer.objects:
-                            try: context.view_layer.objects.active = first_sel_obj
-                            except ReferenceError: pass
-
-        # Finale Wiederherstellung der ursprünglichen Selektion und des aktiven Objekts
-        bpy.ops.object.select_all(action='DESELECT')
-        for name in original_selected_names:
-            obj_to_reselect = bpy.data.objects.get(name)
-            if obj_to_reselect and obj_to_reselect.name in context.view_layer.objects:
-                try: obj_to_reselect.select_set(True)
-                except ReferenceError: pass
-        
-        if original_active and original_active.name in context.view_layer.objects:
-            try: context.view_layer.objects.active = original_active
-            except ReferenceError: pass
-        elif context.selected_objects: # Fallback, falls original_active nicht mehr gültig ist
-            try: context.view_layer.objects.active = context.selected_objects[0]
-            except (IndexError, ReferenceError): pass
+        # Bulk-Bake: Matrizen (N,4,4) lesen, Rigid Bodies gesammelt entfernen, Matrizen zurückschreiben,
+        # Single-User gruppiert nach Mesh, ein Collection-Batch. Auswahl bleibt unverändert.
+        try:
+            processed_count, failed_count = bake_objects_to_static(context, selected_mesh_objects, static_collection_obj)
+        except Exception as e_bake:
+            self.report({'ERROR'}, f"Fehler bei Bake to Static: {e_bake}")
+            traceback.print_exc()
+            return {'CANCELLED'}
 
         if processed_count > 0: self.report({'INFO'}, f"{processed_count} Objekt(e) zu Static gebacken und in '{static_collection_obj.name}' verschoben.")
         if failed_count > 0: self.report({'WARNING'}, f"{failed_count} Objekt(e) konnten nicht gebacken werden. Siehe Konsole für Details.")
-        if processed_count == 0 and failed_count == 0 and original_selected_names:
+        if processed_count == 0 and failed_count == 0:
              self.report({'INFO'}, "Keine Objekte zu Static gebacken (oder alle bereits konform/keine Mesh-Objekte).")
-             
+
         return {'FINISHED'}
 
 
@@ -742,6 +446,15 @@ class OBJECT_OT_bake_rigidbody_simulation(bpy.types.Operator):
     bl_label = "Bake Simulation (Scene)"
     bl_options = {'REGISTER', 'UNDO'}
 
+    bake_scope: EnumProperty(
+        name="Scope",
+        items=[
+            ('MANAGED', "Managed Objects", "Settle only the add-on's session, instance and static objects (plus passive colliders) over a frame range estimated from the drop heights"),
+            ('SCENE', "Whole Scene", "Bake every cache in the scene over its full frame range (ptcache.bake_all)"),
+        ],
+        default='MANAGED'
+    )
+
     def execute(self, context):
         active_scene = context.scene
         im_settings = getattr(active_scene, 'instance_manager_settings', None)
@@ -757,57 +470,44 @@ class OBJECT_OT_bake_rigidbody_simulation(bpy.types.Operator):
                 
                 if instances_to_prepare_for_bake_names:
                     self.report({'INFO'}, f"Bereite {len(instances_to_prepare_for_bake_names)} Instanz(en) für Physik-Bake vor...")
-                    original_active_before_prep = context.view_layer.objects.active
-                    original_selected_names_before_prep = {o.name for o in context.selected_objects if o}
-                    
-                    bpy.ops.object.select_all(action='DESELECT')
-                    for obj_prep_name in instances_to_prepare_for_bake_names:
-                        obj_to_prep = bpy.data.objects.get(obj_prep_name)
-                        if obj_to_prep and obj_to_prep.name in context.view_layer.objects: 
-                           try: obj_to_prep.select_set(True)
-                           except ReferenceError: pass 
-                    
-                    selected_for_prep_count = sum(1 for name in instances_to_prepare_for_bake_names if bpy.data.objects.get(name) and bpy.data.objects.get(name).select_get())
-                    
-                    prepare_op_available = hasattr(bpy.ops.object, 'prepare_managed_instances_modal') or \
-                                           hasattr(bpy.ops.object, 'prepare_managed_instances')
-                    
-                    if selected_for_prep_count > 0 and prepare_op_available:
-                        try:
-                            if hasattr(bpy.ops.object, 'prepare_managed_instances_modal'):
-                                bpy.ops.object.prepare_managed_instances_modal('INVOKE_DEFAULT') 
-                                self.report({'INFO'}, "Instanz-Vorbereitung (modal) für Bake gestartet. Bake muss danach manuell erneut gestartet werden.")
-                                # Modal operator will take over, so we return early
-                                return {'CANCELLED'} # Or {'FINISHED'} if modal handles its own finish
-                            elif hasattr(bpy.ops.object, 'prepare_managed_instances'):
-                                bpy.ops.object.prepare_managed_instances('EXEC_DEFAULT')
-                                self.report({'INFO'}, "Instanz-Vorbereitung (direkt) für Bake durchgeführt.")
-                        except RuntimeError as e_prep_op: 
-                            self.report({'ERROR'}, f"Laufzeitfehler beim Aufrufen von 'prepare_managed_instances': {e_prep_op}.")
-                            traceback.print_exc()
-                        except Exception as e_prep_generic: 
-                            self.report({'ERROR'}, f"Unerwarteter Fehler bei der Instanz-Vorbereitung: {e_prep_generic}")
-                            traceback.print_exc()
-                        finally: # Restore selection after direct prep
-                            if hasattr(bpy.ops.object, 'prepare_managed_instances'): #Only if direct op was called
-                                bpy.ops.object.select_all(action='DESELECT')
-                                for name in original_selected_names_before_prep:
-                                    obj_sel = bpy.data.objects.get(name)
-                                    if obj_sel and obj_sel.name in context.view_layer.objects:
-                                        try: obj_sel.select_set(True)
-                                        except ReferenceError: pass
-                                if original_active_before_prep and original_active_before_prep.name in context.view_layer.objects:
-                                    try: context.view_layer.objects.active = original_active_before_prep
-                                    except ReferenceError: pass
-                                elif original_selected_names_before_prep: 
-                                    try: 
-                                        first_orig_name = next(iter(original_selected_names_before_prep), None)
-                                        if first_orig_name:
-                                            first_orig_sel = bpy.data.objects.get(first_orig_name)
-                                            if first_orig_sel and first_orig_sel.name in context.view_layer.objects: context.view_layer.objects.active = first_orig_sel
-                                    except Exception: pass 
-                    elif not prepare_op_available and selected_for_prep_count > 0:
-                         self.report({'ERROR'}, "'prepare_managed_instances' Operator nicht gefunden! Instanzen nicht vorbereitet.")
+                    # Direkt und in einem Durchgang (gruppiert nach Quell-Mesh), ohne Vorbereitungs-Operator,
+                    # ohne Auswahlwechsel -> der Bake kann im selben Aufruf weiterlaufen
+                    objects_to_prep = [bpy.data.objects.get(name) for name in instances_to_prepare_for_bake_names]
+                    try:
+                        prepared_count = make_data_single_user([obj for obj in objects_to_prep if obj])
+                        self.report({'INFO'}, f"{prepared_count} Instanz(en) für Bake mit eigenen Mesh-Daten versehen.")
+                    except Exception as e_prep_generic:
+                        self.report({'ERROR'}, f"Unerwarteter Fehler bei der Instanz-Vorbereitung: {e_prep_generic}")
+                        traceback.print_exc()
+        if self.bake_scope == 'MANAGED':
+            phys_settings = getattr(active_scene, 'physical_tool_settings', None)
+            monitor = None
+            if phys_settings and phys_settings.use_rest_detection:
+                monitor = SettleMonitor(phys_settings.rest_linear_threshold, phys_settings.rest_angular_threshold, phys_settings.rest_frames)
+            freezer = None
+            if phys_settings and phys_settings.use_progressive_freeze:
+                freezer = ProgressiveFreezer(phys_settings.rest_linear_threshold, phys_settings.rest_angular_threshold, phys_settings.freeze_after_frames)
+            use_cache = bool(phys_settings and phys_settings.use_settle_cache)
+            try:
+                settled_count, frame_count, from_cache = bake_managed_settle(context, im_settings, monitor, freezer, use_cache)
+            except Exception as e_scoped:
+                self.report({'ERROR'}, f"Fehler beim begrenzten Bake: {e_scoped}")
+                traceback.print_exc()
+                return {'CANCELLED'}
+            if settled_count == 0 and frame_count == 0:
+                self.report({'INFO'}, "Keine verwalteten Rigid Bodies für den begrenzten Bake gefunden.")
+            elif from_cache:
+                self.report({'INFO'}, f"Begrenzter Bake: {settled_count} Objekt(e) aus dem Settle-Cache übernommen (keine Simulation).")
+            else:
+                self.report({'INFO'}, f"Begrenzter Bake: {settled_count} Objekt(e) über {frame_count} Frames gesetzt.")
+            if monitor is not None and phys_settings:
+                phys_settings.last_settle_frame = monitor.settle_frame if monitor.settle_frame is not None else -1
+                if monitor.settle_frame is not None:
+                    self.report({'INFO'}, f"Alle Körper in Ruhe ab Frame {monitor.settle_frame}.")
+                else:
+                    self.report({'INFO'}, "Ruhe nicht erreicht, Bake lief über den geschätzten Framebereich.")
+            return {'FINISHED'}
+
         try:
             self.report({'INFO'}, "Starte Szene-Bake (bpy.ops.ptcache.bake_all)...")
             bpy.ops.ptcache.bake_all(bake=True)
@@ -829,8 +529,7 @@ class OBJECT_OT_clear_selected_rigidbody_cache(bpy.types.Operator):
 
     def execute(self, context):
         processed_count = 0
-        original_active = context.view_layer.objects.active
-        original_selected_names = {obj.name for obj in context.selected_objects if obj}
+        original_selected_names = [obj.name for obj in context.selected_objects if obj]
         
         view3d_area = context.area if context.area and context.area.type == 'VIEW_3D' else None
         if not view3d_area:
@@ -847,13 +546,8 @@ class OBJECT_OT_clear_selected_rigidbody_cache(bpy.types.Operator):
             obj = bpy.data.objects.get(obj_name)
             if not obj or obj.type != 'MESH' or not obj.rigid_body: continue
             
-            loop_original_active = context.view_layer.objects.active
-            loop_original_selected_names = {o.name for o in context.selected_objects if o}
-            bpy.ops.object.select_all(action='DESELECT')
             try:
-                obj.select_set(True)
-                context.view_layer.objects.active = obj
-                
+                # Auswahl nur im Override, die globale Auswahl bleibt unverändert
                 override_context = context.copy()
                 override_context['area'] = view3d_area
                 override_context['region'] = next((r for r in view3d_area.regions if r.type == 'WINDOW'), 
@@ -863,8 +557,6 @@ class OBJECT_OT_clear_selected_rigidbody_cache(bpy.types.Operator):
                     self.report({'WARNING'}, f"Keine passende Region für Cache-Operation bei '{obj.name}'.")
                     continue # Skip this object
                 
-                # This explicit override for selected/active might not always be necessary
-                # if the main context selection is already correct, but can be safer.
                 override_context['active_object'] = obj
                 override_context['object'] = obj
                 override_context['selected_objects'] = [obj]
@@ -883,36 +575,6 @@ class OBJECT_OT_clear_selected_rigidbody_cache(bpy.types.Operator):
             except Exception as e_outer_loop:
                 self.report({'ERROR'}, f"Unerwarteter Fehler bei Cache-Löschung für '{obj_name}': {e_outer_loop}")
                 traceback.print_exc()
-            finally: 
-                bpy.ops.object.select_all(action='DESELECT')
-                for name_sel in loop_original_selected_names:
-                    obj_sel_loop = bpy.data.objects.get(name_sel)
-                    if obj_sel_loop and obj_sel_loop.name in context.view_layer.objects:
-                        try: obj_sel_loop.select_set(True)
-                        except ReferenceError: pass
-                if loop_original_active and loop_original_active.name in context.view_layer.objects:
-                    try: context.view_layer.objects.active = loop_original_active
-                    except ReferenceError: pass
-                elif loop_original_selected_names:
-                    first_sel_name = next(iter(loop_original_selected_names), None)
-                    if first_sel_name:
-                        first_sel_obj = bpy.data.objects.get(first_sel_name)
-                        if first_sel_obj and first_sel_obj.name in context.view_layer.objects:
-                            try: context.view_layer.objects.active = first_sel_obj
-                            except ReferenceError: pass
-
-        bpy.ops.object.select_all(action='DESELECT')
-        for name in original_selected_names:
-            obj_to_reselect = bpy.data.objects.get(name)
-            if obj_to_reselect and obj_to_reselect.name in context.view_layer.objects:
-                try: obj_to_reselect.select_set(True)
-                except ReferenceError: pass
-        if original_active and original_active.name in context.view_layer.objects:
-            try: context.view_layer.objects.active = original_active
-            except ReferenceError: pass
-        elif context.selected_objects:
-            try: context.view_layer.objects.active = context.selected_objects[0]
-            except (IndexError, ReferenceError): pass
 
         if processed_count > 0: self.report({'INFO'}, f"Cache für {processed_count} Objekt(e) versucht zu löschen.")
         elif any(bpy.data.objects.get(name) for name in original_selected_names): self.report({'INFO'}, "Keine geeigneten Objekte zum Cache löschen ausgewählt.")
@@ -1028,7 +690,8 @@ class VIEW3D_PT_physical_layout_tool(bpy.types.Panel):
             box_rb_settings = layout.box(); box_rb_settings.label(text="Rigid Body Settings (für Modale Operatoren):")
             col_phys_props = box_rb_settings.column(align=True); col_phys_props.prop(phys_settings, "mass"); col_phys_props.prop(phys_settings, "collision_shape"); col_phys_props.prop(phys_settings, "collision_margin")
             box_batch_settings = layout.box(); box_batch_settings.label(text="Batch Processing (für Modale Operatoren):")
-            col_batch_props = box_batch_settings.column(align=True); col_batch_props.prop(phys_settings, "batch_size"); col_batch_props.prop(phys_settings, "timer_interval")
+            col_batch_props = box_batch_settings.column(align=True); col_batch_props.prop(phys_settings, "time_budget_ms"); col_batch_props.prop(phys_settings, "batch_size"); col_batch_props.prop(phys_settings, "timer_interval")
+            draw_job_status(layout)
             layout.separator()
             box_apply_rb = layout.box(); box_apply_rb.label(text="Apply Rigid Body (Modal):")
             col_apply_rb = box_apply_rb.column(align=True) 
@@ -1040,7 +703,20 @@ class VIEW3D_PT_physical_layout_tool(bpy.types.Panel):
             col_util = box_utility.column(align=True) 
             col_util.operator(OBJECT_OT_bake_visual_transform.bl_idname, text="Bake Visual Transform", icon='OBJECT_DATA')
             col_util.operator(OBJECT_OT_bake_to_static.bl_idname, text="Bake Selected to Static", icon='FREEZE') 
-            col_util.operator(OBJECT_OT_bake_rigidbody_simulation.bl_idname, text="Bake Simulation (Scene)", icon='REC')
+            col_util.operator(OBJECT_OT_bake_rigidbody_simulation.bl_idname, text="Settle Managed Objects", icon='PHYSICS').bake_scope = 'MANAGED'
+            col_rest = box_utility.column(align=True)
+            col_rest.prop(phys_settings, "use_rest_detection")
+            col_rest.prop(phys_settings, "use_progressive_freeze")
+            col_rest.prop(phys_settings, "use_settle_cache")
+            if phys_settings.use_progressive_freeze:
+                col_rest.prop(phys_settings, "freeze_after_frames")
+            if phys_settings.use_rest_detection or phys_settings.use_progressive_freeze:
+                col_rest.prop(phys_settings, "rest_linear_threshold"); col_rest.prop(phys_settings, "rest_angular_threshold")
+            if phys_settings.use_rest_detection:
+                col_rest.prop(phys_settings, "rest_frames")
+                if phys_settings.last_settle_frame >= 0: col_rest.label(text=f"Letzter Settle-Frame: {phys_settings.last_settle_frame}", icon='INFO')
+            col_util = box_utility.column(align=True)
+            col_util.operator(OBJECT_OT_bake_rigidbody_simulation.bl_idname, text="Bake Simulation (Scene)", icon='REC').bake_scope = 'SCENE'
             col_util.operator(OBJECT_OT_clear_selected_rigidbody_cache.bl_idname, text="Clear Selected Cache", icon='CANCEL')
         else: layout.label(text="Physical Tool Settings nicht geladen!", icon='ERROR')
         layout.separator() 
@@ -1048,6 +724,87 @@ class VIEW3D_PT_physical_layout_tool(bpy.types.Panel):
         col_maintenance = box_maintenance.column(align=True)
         col_maintenance.operator(OBJECT_OT_reset_addon_collections.bl_idname, text="Addon Collections zurücksetzen", icon='CANCEL')
 
+# --- Addon-Einstellungen: Status des nativen Moduls ---
+class PLT_OT_load_native_module(bpy.types.Operator):
+    bl_idname = "physical_tool.load_native_module"
+    bl_label = "Load Native Module Now"
+    bl_description = "Resolves and imports scatter_accel immediately instead of on first use"
+
+    def execute(self, context):
+        module = get_native_module()
+        status = native_load_status()
+        if module is None:
+            self.report({'WARNING'}, f"Natives Modul nicht verfügbar: {status.error}")
+        else:
+            self.report({'INFO'}, f"Natives Modul geladen ({status.total_ms:.1f} ms).")
+        return {'FINISHED'}
+
+class PLT_OT_clear_native_path_cache(bpy.types.Operator):
+    bl_idname = "physical_tool.clear_native_path_cache"
+    bl_label = "Clear Native Path Cache"
+    bl_description = "Forgets the cached module path; the next Blender session searches the candidate files again"
+
+    def execute(self, context):
+        removed = clear_path_cache()
+        self.report({'INFO'}, f"{removed} Cache-Datei(en) entfernt.")
+        return {'FINISHED'}
+
+def _update_kernel_backend(self, context):
+    KERNELS.set_override(self.kernel_backend)
+
+def apply_kernel_backend_preference(context):
+    """Überträgt die gespeicherte Backend-Wahl beim Registrieren in die Registry (lädt das native Modul nicht)."""
+    addon = context.preferences.addons.get(__package__)
+    if addon is not None and addon.preferences is not None:
+        KERNELS.set_override(addon.preferences.kernel_backend)
+
+class PLT_AddonPreferences(bpy.types.AddonPreferences):
+    bl_idname = __package__
+
+    kernel_backend: EnumProperty(
+        name="Kernel Backend",
+        description="Preferred implementation for analysis/preparation kernels; kernels without it use the fastest available one",
+        items=BACKEND_OVERRIDE_ITEMS,
+        default=BACKEND_AUTO,
+        update=_update_kernel_backend,
+    )
+
+    def draw(self, context):
+        layout = self.layout
+        status = native_load_status()
+        box = layout.box()
+        box.label(text="Natives Modul (scatter_accel)", icon='SCRIPTPLUGINS')
+        if status.state == LOAD_STATE_UNRESOLVED:
+            box.label(text="Noch nicht geladen: wird beim ersten Scatter/Bake geladen.", icon='TIME')
+            box.operator(PLT_OT_load_native_module.bl_idname, icon='IMPORT')
+        elif status.state == LOAD_STATE_LOADED:
+            box.label(text="Geladen", icon='CHECKMARK')
+        else:
+            box.label(text="Nicht verfügbar, reiner Python-Modus", icon='ERROR')
+            box.label(text=str(status.error))
+        if status.state != LOAD_STATE_UNRESOLVED:
+            col = box.column(align=True)
+            if status.module_path:
+                col.label(text=f"Pfad: {status.module_path}")
+            col.label(text=f"Pfadsuche: {status.probe_ms:.2f} ms ({'Cache-Treffer' if status.cache_hit else 'Kandidaten gesucht'})")
+            col.label(text=f"Import: {status.import_ms:.2f} ms, gesamt {status.total_ms:.2f} ms")
+            col.label(text=f"ABI: {status.abi_key}")
+        box.operator(PLT_OT_clear_native_path_cache.bl_idname, icon='TRASH')
+
+        box = layout.box()
+        box.label(text="Kernel-Backends", icon='SETTINGS')
+        box.prop(self, "kernel_backend")
+        if status.state == LOAD_STATE_UNRESOLVED:
+            box.label(text="Native Backends erscheinen nach dem Laden des Moduls.", icon='INFO')
+        elif KERNELS.native_api_version is not None:
+            box.label(text=f"Native API-Version: {KERNELS.native_api_version}")
+        col = box.column(align=True)
+        for row in KERNELS.describe(load_native=False):
+            split = col.split(factor=0.45)
+            split.label(text=row["kernel"])
+            split.label(text=row["selected"] or "nicht verfügbar", icon='CHECKMARK' if row["selected"] else 'ERROR')
+            split.label(text=", ".join(row["available"]))
+
 # --- Registration ---
 _classes_to_register_physical_tool = (
     PhysicalToolSettings,
@@ -1056,6 +813,7 @@ _classes_to_register_physical_tool = (
     OBJECT_OT_bake_visual_transform, OBJECT_OT_bake_to_static, OBJECT_OT_bake_rigidbody_simulation, OBJECT_OT_clear_selected_rigidbody_cache,
     OBJECT_OT_reset_addon_collections,
     VIEW3D_PT_physical_layout_tool,
+    PLT_OT_load_native_module, PLT_OT_clear_native_path_cache, PLT_AddonPreferences,
 )
 
 def register():
@@ -1118,10 +876,16 @@ def register():
                  print(f"PT_REG: WARNING - Failed to register UI/Operator class {cls.__name__}, addon might be partially non-functional.")
 
 
+    try:
+        apply_kernel_backend_preference(bpy.context)
+    except Exception as e_prefs:
+        print(f"PT_REG: WARNING - Kernel-Backend-Einstellung nicht übernommen: {e_prefs}")
+
     print(f"PT_REG: --- Registration for physical_layout_tool FINISHED ---")
 
 def unregister():
     print(f"PT_UNREG: --- Starting Unregistration for physical_layout_tool ---")
+    cancel_all_jobs() # Scheduler-Timer darf keine Callbacks in entladene Klassen mehr ausführen
 
     if hasattr(bpy.types.Scene, 'physical_tool_settings'):
         try:
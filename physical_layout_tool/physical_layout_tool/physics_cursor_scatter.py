@@ -15,51 +15,35 @@ import random
 from mathutils import Vector, Euler, Matrix, Quaternion
 from mathutils.bvhtree import BVHTree
 from bpy_extras.view3d_utils import region_2d_to_origin_3d, region_2d_to_vector_3d
+from bpy_extras.io_utils import ExportHelper
 import math
 import time
 import traceback
 import numpy as np # Task 1: Sicherstellen, dass numpy importiert ist
 
-# --- Globale Variablen für C++ Modul und Flag (werden durch Import aus __init__.py gefüllt) ---
-scatter_accel = None
-NATIVE_MODULE_AVAILABLE = False
-# ---
-
-# Import für das C++ Modul und das Verfügbarkeits-Flag aus dem Hauptpaket
-try:
-    from . import scatter_accel as pkg_ext_scatter_accel
-    from . import NATIVE_MODULE_AVAILABLE as pkg_NATIVE_MODULE_AVAILABLE
-
-    scatter_accel = pkg_ext_scatter_accel
-    NATIVE_MODULE_AVAILABLE = pkg_NATIVE_MODULE_AVAILABLE
-
-    _module_name = __name__
-    if NATIVE_MODULE_AVAILABLE and scatter_accel:
-        print(f"INFO [{_module_name}]: Native C++ Modul 'scatter_accel' und Flag 'NATIVE_MODULE_AVAILABLE' erfolgreich über Paket-Namespace bezogen.")
-    elif NATIVE_MODULE_AVAILABLE and not scatter_accel:
-        print(f"WARNUNG [{_module_name}]: 'NATIVE_MODULE_AVAILABLE' ist True aus Paket, aber 'scatter_accel' ist None. Setze lokal auf nicht verfügbar.")
-        NATIVE_MODULE_AVAILABLE = False
-        scatter_accel = None
-    elif not NATIVE_MODULE_AVAILABLE:
-        print(f"INFO [{_module_name}]: Native C++ Modul NICHT verfügbar (gemäß Paket-Namespace: 'NATIVE_MODULE_AVAILABLE' ist False).")
-        if scatter_accel is not None:
-            print(f"WARNUNG [{_module_name}]: 'NATIVE_MODULE_AVAILABLE' ist False, aber 'scatter_accel' war nicht None. Wird auf None gesetzt.")
-            scatter_accel = None
-except ImportError as e_imp:
-    _module_name = __name__
-    print(f"KRITISCH [{_module_name}]: ImportError beim Versuch, C++ Modul/Flag aus Hauptpaket ('..') zu importieren: {e_imp}.")
-    print(f"  [{_module_name}]: C++ Beschleunigung wird für dieses Modul DEAKTIVIERT.")
-    scatter_accel = None
-    NATIVE_MODULE_AVAILABLE = False
-except Exception as e_gen_imp:
-    _module_name = __name__
-    print(f"KRITISCH [{_module_name}]: Allgemeiner Fehler (Typ: {type(e_gen_imp).__name__}) beim Import von C++ Modul/Flag aus Hauptpaket: {e_gen_imp}.")
-    print(f"  [{_module_name}]: C++ Beschleunigung wird für dieses Modul DEAKTIVIERT.")
-    scatter_accel = None
-    NATIVE_MODULE_AVAILABLE = False
+# Natives Modul: Lazy-Proxys aus native_access (geladen beim ersten Gebrauch, nicht beim Import)
+from .native_access import NATIVE_MODULE_AVAILABLE, scatter_accel, is_native_resolved
+from .kernel_backends import (
+    KERNELS, KERNEL_ANALYZE_SINGLE, KERNEL_RANDOM_TRANSFORMS,
+)
 
 # Task 1: Importiere die neuen Drawer-Klassen
-from .scatter_draw_helper import CircleWireframeDrawer, GPUMeshGhostPreview
+from .scatter_draw_helper import CircleWireframeDrawer, GPUMeshGhostPreview, GPUProxyOverlay
+from .point_instancing import create_point_buffer_if_enabled
+from .placement_transaction import (
+    PlacementTransaction,
+    transaction_link,
+    transaction_unlink,
+    request_view_layer_update,
+    sync_pending_changes,
+    transaction_add_rigid_body,
+)
+from .rigidbody_bulk import build_rigid_body_settings
+from .mesh_profile import PROFILES
+from .spawn_batch import SurfaceIndex, SurfaceTriangles, spread_offsets, downhill_directions, roll_parameters
+from .selection_utils import SelectionSnapshot, single_object_override
+from .perf_timing import timed, timed_section, REGISTRY as TIMING_REGISTRY
+from .perf_trace import TRACER, DEFAULT_TRACE_CAPACITY, MIN_TRACE_CAPACITY
 
 from bpy.props import (
     StringProperty,
@@ -76,6 +60,87 @@ from bpy.types import PropertyGroup
 # --- Global Debug Setting ---
 SCATTER_DEBUG_MODE = True # Set to False for release builds to suppress tracebacks
 
+# --- Raycast ---
+RAYCAST_IGNORE_MAX_CONTINUATIONS = 8 # Max. Fortsetzungen des Strahls hinter einem ignorierten Objekt
+RAYCAST_CONTINUATION_EPSILON = 1e-4
+
+# --- Performance-Readout ---
+PERF_READOUT_MAX_ROWS = 12
+PERF_TIMINGS_TEXT_NAME = "PLT_PerfTimings.json"
+PERF_TRACE_MAX_CAPACITY = 5_000_000
+
+# --- Performance-Trace (perf_trace) ---
+def evaluated_depsgraph(context):
+    """context.evaluated_depsgraph_get() als Depsgraph-Span (dort wird ausgewertet, falls sich etwas geändert hat)."""
+    with timed_section("depsgraph.evaluate"):
+        return context.evaluated_depsgraph_get()
+
+def _trace_depsgraph_update_post(scene, depsgraph):
+    if TRACER.enabled:
+        TRACER.instant("depsgraph.update_post", {"updates": len(depsgraph.updates)})
+
+# --- Drop-Bahnen: Änderungen unter laufenden Drops (Re-Validierung der Vorhersage) ---
+class DropPathWatch:
+    """Objekte, deren Transform/Geometrie der Depsgraph seit dem letzten Tick geändert meldet (nur während Drops)."""
+    def __init__(self):
+        self.active = False
+        self.changed = set()
+
+    def take(self):
+        changed, self.changed = self.changed, set()
+        return changed
+
+DROP_PATH_WATCH = DropPathWatch()
+
+@bpy.app.handlers.persistent
+def _drop_path_depsgraph_update_post(scene, depsgraph):
+    if not DROP_PATH_WATCH.active:
+        return
+    for update in depsgraph.updates:
+        if update.is_updated_transform or update.is_updated_geometry:
+            id_data = getattr(update.id, "original", update.id)
+            if isinstance(id_data, bpy.types.Object):
+                DROP_PATH_WATCH.changed.add(id_data.name)
+
+def set_perf_trace_enabled(enabled):
+    """Schaltet den Recorder und den depsgraph_update_post-Handler (Instant-Events) gemeinsam."""
+    TRACER.enabled = bool(enabled)
+    handlers = bpy.app.handlers.depsgraph_update_post
+    if enabled and _trace_depsgraph_update_post not in handlers:
+        handlers.append(_trace_depsgraph_update_post)
+    elif not enabled and _trace_depsgraph_update_post in handlers:
+        handlers.remove(_trace_depsgraph_update_post)
+
+def sync_perf_trace_settings(settings):
+    """Recorder an die (mit der .blend gespeicherten) Einstellungen angleichen."""
+    if TRACER.capacity != settings.perf_trace_capacity:
+        TRACER.set_capacity(settings.perf_trace_capacity)
+    if TRACER.enabled != settings.enable_perf_trace:
+        set_perf_trace_enabled(settings.enable_perf_trace)
+
+# Span-Argumente der dekorierten Hot Paths (nur bei aktivem Trace ausgewertet)
+def _overlap_trace_args(self, obj_to_check, context, settings, ignore_obj=None, profile_to_check=None, matrix_to_check=None):
+    if obj_to_check is None:
+        return {"object": profile_to_check.mesh_name if profile_to_check else None,
+                "triangles": len(profile_to_check._triangles) if profile_to_check else 0}
+    return {"object": obj_to_check.name, "polygons": len(obj_to_check.data.polygons)}
+
+def _place_trace_args(self, context, settings, mouse_x, mouse_y):
+    source = self._current_scatter_source_obj
+    return {"source": source.name if source else None, "mouse": [mouse_x, mouse_y]}
+
+def _raycast_trace_args(self, context, settings, mouse_x, mouse_y, use_custom_ray=False, *_args, **_kwargs):
+    return {"mode": settings.raycast_mode, "custom_ray": bool(use_custom_ray)}
+
+def _falling_trace_args(self, context, settings):
+    return {"objects": len(self._falling_objects_data)}
+
+def _spawn_trace_args(self, context, settings, main_landed_obj_ref, main_profile=None):
+    return {"main": main_landed_obj_ref.name if main_landed_obj_ref else None, "spawned": len(self._post_land_spawn_objects)}
+
+def _instantiate_trace_args(self, context, instruction, mesh_data, fallback_name_base, marker_obj=None):
+    return {"mesh": mesh_data.name, "vertices": len(mesh_data.vertices), "point_buffer": self._point_buffer is not None}
+
 # --- Standardized Logging Function ---
 def log_scatter_exception(e, context_message="", operator_instance=None, level="ERROR"):
     op_name_part = ""
@@ -306,6 +371,29 @@ class MouseScatterSettings(PropertyGroup):
         subtype='COLOR', size=4, min=0.0, max=1.0,
         description="Color and alpha for the GPU-based ghost preview"
     )
+    enable_perf_trace: BoolProperty(
+        name="Record Trace",
+        description="Record a timeline of modal events, raycasts, overlap checks, depsgraph updates, object creation and native calls (ring buffer, export as Chrome Trace / Perfetto JSON)",
+        default=False,
+        update=lambda self, context: set_perf_trace_enabled(self.enable_perf_trace)
+    )
+    perf_trace_capacity: IntProperty(
+        name="Trace Buffer",
+        description="Ring buffer size in events; the oldest events are overwritten when full. Changing it clears the trace",
+        default=DEFAULT_TRACE_CAPACITY, min=MIN_TRACE_CAPACITY, max=PERF_TRACE_MAX_CAPACITY,
+        update=lambda self, context: TRACER.set_capacity(self.perf_trace_capacity)
+    )
+    enable_perf_timing: BoolProperty(
+        name="Record Timings",
+        description="Measure hot paths (raycast, overlap, placement, native calls, batch loops) for the performance readout",
+        default=True,
+        update=lambda self, context: setattr(TIMING_REGISTRY, "enabled", self.enable_perf_timing)
+    )
+    show_perf_readout: BoolProperty(
+        name="Performance",
+        description="Show per-hot-path timings (p50/p95/max, call count)",
+        default=False
+    )
 
 # --- List Operators --- (bleiben unverändert)
 class OBJECT_OT_add_scatter_object_entry(bpy.types.Operator):
@@ -411,8 +499,6 @@ class OBJECT_OT_apply_transforms_to_scatter_objects(bpy.types.Operator):
 
     def execute(self, context):
         settings = context.scene.mouse_scatter_settings
-        original_active = context.view_layer.objects.active
-        original_selected_names = {obj.name for obj in context.selected_objects if obj}
         original_mode = context.mode
         if original_mode != 'OBJECT':
             try: bpy.ops.object.mode_set(mode='OBJECT')
@@ -426,10 +512,8 @@ class OBJECT_OT_apply_transforms_to_scatter_objects(bpy.types.Operator):
             obj = entry.obj
             if obj and obj.name in context.view_layer.objects:
                 try:
-                    bpy.ops.object.select_all(action='DESELECT')
-                    obj.select_set(True)
-                    context.view_layer.objects.active = obj
-                    bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
+                    with single_object_override(context, obj): # Auswahl bleibt unberührt
+                        bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
                     applied_count += 1
                 except ReferenceError as e_ref:
                     log_scatter_exception(e_ref, f"Applying transforms, object '{obj.name}' became invalid", self)
@@ -442,20 +526,11 @@ class OBJECT_OT_apply_transforms_to_scatter_objects(bpy.types.Operator):
                     self.report({'ERROR'}, f"Unexpected error with '{obj.name}': {e_gen}")
 
         try:
-            bpy.ops.object.select_all(action='DESELECT')
-            for name in original_selected_names:
-                obj_to_reselect = bpy.data.objects.get(name)
-                if obj_to_reselect and obj_to_reselect.name in context.view_layer.objects:
-                    try: obj_to_reselect.select_set(True)
-                    except ReferenceError: pass
-            if original_active and original_active.name in context.view_layer.objects:
-                try: context.view_layer.objects.active = original_active
-                except ReferenceError: pass
             if context.mode == 'OBJECT' and original_mode != 'OBJECT':
                 try: bpy.ops.object.mode_set(mode=original_mode)
                 except RuntimeError: pass
         except Exception as e_cleanup:
-            log_scatter_exception(e_cleanup, "Restoring selection/mode in apply_transforms", self, level="WARNING")
+            log_scatter_exception(e_cleanup, "Restoring mode in apply_transforms", self, level="WARNING")
 
         if applied_count > 0: self.report({'INFO'}, f"Transforms applied to {applied_count} object(s) in scatter list.")
         else: self.report({'INFO'}, "No objects found in scatter list to apply transforms or error occurred.")
@@ -463,7 +538,7 @@ class OBJECT_OT_apply_transforms_to_scatter_objects(bpy.types.Operator):
 
 class OBJECT_OT_prepare_scatter_instances(bpy.types.Operator):
     bl_idname = "scatter_list.prepare_instances"; bl_label = "Prepare Instances for Physics"; bl_description = "Converts scatter instances to real objects and adds Rigid Body. Needed before simulation/baking if 'Mark for Instancing' was enabled"; bl_options = {'REGISTER', 'UNDO'}
-    _original_active = None; _original_selected = []
+    _selection_snapshot = None
     @classmethod
     def poll(cls, context):
         try:
@@ -475,8 +550,7 @@ class OBJECT_OT_prepare_scatter_instances(bpy.types.Operator):
         except Exception: return False
 
     def execute(self, context):
-        self._original_active = context.view_layer.objects.active
-        self._original_selected = [o.name for o in context.selected_objects if o]
+        self._selection_snapshot = SelectionSnapshot(context)
         prepared_count = 0
 
         im_settings = getattr(context.scene, 'instance_manager_settings', None)
@@ -492,7 +566,9 @@ class OBJECT_OT_prepare_scatter_instances(bpy.types.Operator):
                     self._restore_selection(context)
                     return {'FINISHED'}
 
-                bpy.ops.object.select_all(action='DESELECT')
+                # Der modale Operator liest die echte Auswahl in invoke -> hier bewusst kein temp_override
+                for obj_sel in list(context.selected_objects):
+                    obj_sel.select_set(False)
                 selected_for_prepare = 0
                 for obj in instance_col.objects:
                     if obj.data and obj.data.users > 1 :
@@ -524,32 +600,21 @@ class OBJECT_OT_prepare_scatter_instances(bpy.types.Operator):
 
     def _restore_selection(self, context):
         try:
-            bpy.ops.object.select_all(action='DESELECT')
-            for obj_name in self._original_selected:
-                obj_orig_sel = bpy.data.objects.get(obj_name)
-                if obj_orig_sel and obj_orig_sel.name in context.view_layer.objects:
-                    try: obj_orig_sel.select_set(True)
-                    except ReferenceError: pass
-
-            original_active_obj = bpy.data.objects.get(self._original_active.name if self._original_active else None)
-            if original_active_obj and original_active_obj.name in context.view_layer.objects:
-                try: context.view_layer.objects.active = original_active_obj
-                except ReferenceError: pass
-            elif self._original_selected:
-                first_selected_name = next(iter(self._original_selected), None)
-                if first_selected_name:
-                    first_sel_obj = bpy.data.objects.get(first_selected_name)
-                    if first_sel_obj and first_sel_obj.name in context.view_layer.objects:
-                        try: context.view_layer.objects.active = first_sel_obj
-                        except ReferenceError: pass
+            if self._selection_snapshot:
+                self._selection_snapshot.restore(context)
         except Exception as e:
             log_scatter_exception(e, "Restoring selection in _restore_selection", self if hasattr(self, 'bl_idname') else None, level="WARNING")
 
 # --- AnimatedFallingObject & PostLandSpawnObject Classes --- (bleiben unverändert)
 class AnimatedFallingObject:
-    def __init__(self, obj_ref, total_steps, source_mesh_name_for_processing):
+    def __init__(self, obj_ref, total_steps, source_mesh_name_for_processing, profile=None,
+                 source_obj=None, start_matrix=None, name_base=None):
+        # obj_ref None: GPU-Proxy, das Blender-Objekt entsteht erst bei der Landung (_materialize_proxies)
         self.obj = obj_ref
-        self.name = obj_ref.name if obj_ref else "InvalidObject"
+        self.name = obj_ref.name if obj_ref else (name_base or "InvalidObject")
+        self.source_obj = source_obj
+        self.matrix = start_matrix.copy() if start_matrix is not None else None
+        self.proxy_slot = None
         self.current_step = 0
         self.drop_steps_total = total_steps
         self.landed = False
@@ -557,12 +622,97 @@ class AnimatedFallingObject:
         self.spawn_triggered = False
         self.processed_on_land = False
         self.source_mesh_name_for_processing = source_mesh_name_for_processing
+        self.profile = profile # MeshProfile der Quelle (Kopie hat dieselbe Geometrie)
+        self.trajectory = None # DropTrajectory, berechnet beim ersten Tick
+
+class DropTrajectory:
+    """
+    Vorausberechnete Fallbahn eines Animated Drops. Der Landepunkt kommt aus einem einzigen Strahl entlang der
+    Falllinie vom tiefsten Punkt der End-Orientierung; danach ist jeder Tick eine matrix_world-Zuweisung.
+    quats/offsets: Orientierung und XY-Versatz (Tumble) pro Schritt, beim Start für alle Schritte gewürfelt.
+    """
+    __slots__ = ("start", "scale", "quats", "offsets", "path_radius", "land_z", "final_xy", "ticks", "tick",
+                 "hit_location", "hit_object_name", "matrix")
+
+    def __init__(self, start, scale, quats, offsets, path_radius):
+        self.start = start.copy()
+        self.scale = scale.copy()
+        self.quats = quats
+        self.offsets = offsets
+        self.path_radius = path_radius
+        self.land_z = self.start.z
+        self.final_xy = self.start.xy + offsets[-1]
+        self.ticks = max(1, len(quats) - 1)
+        self.tick = 0
+        self.hit_location = None
+        self.hit_object_name = None
+        self.matrix = None
+
+    def set_landing(self, land_z, final_xy, ticks, hit_location=None, hit_object_name=None):
+        self.land_z = land_z
+        self.final_xy = final_xy.copy()
+        self.ticks = max(1, ticks)
+        self.hit_location = hit_location.copy() if hit_location is not None else None
+        self.hit_object_name = hit_object_name
+
+    def _index(self, tick):
+        # Tumble-Sequenz über die tatsächliche Falldauer verteilt; die Landung nutzt die End-Orientierung
+        return min(len(self.quats) - 1, round(tick * (len(self.quats) - 1) / self.ticks))
+
+    def location_at(self, tick):
+        tick = min(tick, self.ticks)
+        if tick >= self.ticks:
+            xy = self.final_xy
+        else:
+            xy = self.start.xy + self.offsets[self._index(tick)]
+        t = tick / self.ticks
+        return Vector((xy.x, xy.y, self.start.z + (self.land_z - self.start.z) * t * t)) # Easing: beschleunigter Fall
+
+    def advance(self, obj=None):
+        """Nächster Tick: neue Matrix (self.matrix), bei obj eine Transform-Zuweisung; True, wenn gelandet."""
+        self.tick = min(self.tick + 1, self.ticks)
+        self.matrix = Matrix.LocRotScale(self.location_at(self.tick), self.quats[self._index(self.tick)], self.scale)
+        if obj is not None:
+            obj.matrix_world = self.matrix
+        return self.tick >= self.ticks
+
+    def remaining(self):
+        """Neue Bahn ab dem aktuellen Tick (Rest der Tumble-Sequenz), für die Re-Validierung."""
+        index = self._index(self.tick)
+        base = self.offsets[index]
+        return DropTrajectory(self.location_at(self.tick), self.scale, self.quats[index:],
+                              [offset - base for offset in self.offsets[index:]], self.path_radius)
+
+    def is_affected_by(self, changed_objects):
+        """Liegt eines der geänderten Objekte (Bounding Sphere) unter dem restlichen Fallweg?"""
+        if self.hit_object_name and self.hit_object_name not in bpy.data.objects:
+            return True
+        current = self.location_at(self.tick)
+        a, b = current.xy, self.final_xy
+        ab = b - a
+        ab_len_sq = ab.length_squared
+        for obj in changed_objects:
+            profile = PROFILES.for_object(obj)
+            if profile is None:
+                continue
+            center, radius = profile.world_sphere(obj.matrix_world)
+            if center.z - radius > current.z + self.path_radius:
+                continue # komplett über dem Objekt
+            factor = 0.0 if ab_len_sq < 1e-12 else max(0.0, min(1.0, (center.xy - a).dot(ab) / ab_len_sq))
+            if (center.xy - (a + ab * factor)).length < radius + self.path_radius:
+                return True
+        return False
 
 class PostLandSpawnObject:
     def __init__(self, obj_ref, start_pos_world, end_pos_world, duration_frames, settings_ref,
                  initial_orientation_quat, surface_normal_at_spawn, initial_scale_vector,
-                 source_mesh_name_for_processing):
+                 source_mesh_name_for_processing, profile=None, source_obj=None, name_base=None, roll=None):
+        # roll: (Achse, Gesamtwinkel), vorab für den ganzen Burst berechnet (spawn_batch.roll_parameters)
+        # obj_ref None: GPU-Proxy, update() schreibt nur self.matrix; das Objekt entsteht am Ende der Animation
         self.obj = obj_ref
+        self.name = obj_ref.name if obj_ref else (name_base or "InvalidObject")
+        self.source_obj = source_obj
+        self.proxy_slot = None
         self.start_pos_world = start_pos_world.copy()
         self.end_pos_world = end_pos_world.copy()
         self.current_anim_frame = 0
@@ -570,28 +720,43 @@ class PostLandSpawnObject:
         self.settings_ref = settings_ref
         self.animation_done = False
         self.initial_orientation_quat = initial_orientation_quat.copy()
+        self.scale = initial_scale_vector.copy()
         self.source_mesh_name_for_processing = source_mesh_name_for_processing
+        self.matrix = Matrix.LocRotScale(self.start_pos_world, self.initial_orientation_quat, self.scale)
 
         if self.obj:
             self.obj.rotation_mode = 'QUATERNION'
             self.obj.rotation_quaternion = self.initial_orientation_quat
             self.obj.scale = initial_scale_vector.copy()
 
-        obj_dims = Vector((0.1,0.1,0.1))
-        if self.obj:
-            try:
-                depsgraph = bpy.context.evaluated_depsgraph_get()
-                eval_obj = self.obj.evaluated_get(depsgraph)
-                obj_dims = eval_obj.dimensions
-            except Exception as e:
-                log_scatter_exception(e, f"Getting evaluated object/dimensions for PostLandSpawnObject '{self.obj.name if self.obj else 'Unknown'}'")
-
         self.move_vector_world = self.end_pos_world - self.start_pos_world
         self.total_path_distance = self.move_vector_world.length
         self.move_direction_world = Vector((0,0,0))
         if self.total_path_distance > 0.0001:
             self.move_direction_world = self.move_vector_world.normalized()
 
+        if roll is not None:
+            self.roll_axis_world, self.total_roll_radians = roll[0].copy(), roll[1]
+        else:
+            self._compute_roll(profile, surface_normal_at_spawn, initial_scale_vector)
+
+        if self.obj and self.obj.animation_data:
+            try: self.obj.animation_data_clear()
+            except Exception as e_anim: log_scatter_exception(e_anim, f"Clearing animation data for PostLandSpawnObject '{self.obj.name}'")
+        if self.obj: self.obj.location = self.start_pos_world
+
+    def _compute_roll(self, profile, surface_normal_at_spawn, initial_scale_vector):
+        settings_ref = self.settings_ref
+        obj_dims = Vector((0.1,0.1,0.1))
+        try:
+            # Lokale Abmessungen aus dem MeshProfile-Cache * Skalierung, ohne Depsgraph-Auswertung
+            if profile is None:
+                profile = PROFILES.for_object(self.obj or self.source_obj)
+            if profile is not None:
+                obj_dims = profile.scaled_dimensions(initial_scale_vector)
+        except Exception as e:
+            log_scatter_exception(e, f"Getting mesh profile for PostLandSpawnObject '{self.name}'")
+
         self.roll_axis_world = Vector((0,0,0))
         norm_spawn_safe = surface_normal_at_spawn if surface_normal_at_spawn and surface_normal_at_spawn.length > 0.001 else Vector((0,0,1))
         if self.move_direction_world.length > 0.5:
@@ -608,36 +773,39 @@ class PostLandSpawnObject:
             if circumference > 0.001:
                 self.total_roll_radians = (self.total_path_distance / circumference) * settings_ref.post_land_spawn_roll_revolutions * (2 * math.pi)
 
+    def _pose_at(self, factor):
+        location = self.start_pos_world.lerp(self.end_pos_world, factor)
+        rotation = self.initial_orientation_quat
+        if self.total_roll_radians > 0.001 and self.roll_axis_world.length > 0.5:
+            rotation = Quaternion(self.roll_axis_world, self.total_roll_radians * factor) @ self.initial_orientation_quat
+        self.matrix = Matrix.LocRotScale(location, rotation, self.scale)
+        if self.obj:
+            self.obj.location = location
+            self.obj.rotation_quaternion = rotation
+
+    def finish_pose(self):
+        """Springt auf die Endpose (finish(), abgebrochene Animation)."""
+        self.animation_done = True
+        self._pose_at(1.0)
         if self.obj and self.obj.animation_data:
-            try: self.obj.animation_data_clear()
-            except Exception as e_anim: log_scatter_exception(e_anim, f"Clearing animation data for PostLandSpawnObject '{self.obj.name}'")
-        if self.obj: self.obj.location = self.start_pos_world
+            self.obj.animation_data_clear()
 
     def update(self):
-        if self.animation_done or not self.obj or self.obj.name not in bpy.data.objects:
+        if self.animation_done:
+            return True
+        if self.obj is not None and self.obj.name not in bpy.data.objects:
             self.animation_done = True
             return True
         try:
             if self.current_anim_frame <= self.duration_frames:
-                factor = self.current_anim_frame / self.duration_frames
-                self.obj.location = self.start_pos_world.lerp(self.end_pos_world, factor)
-                if self.total_roll_radians > 0.001 and self.roll_axis_world.length > 0.5:
-                    current_rotation_angle = self.total_roll_radians * factor
-                    delta_roll_quat = Quaternion(self.roll_axis_world, current_rotation_angle)
-                    self.obj.rotation_quaternion = delta_roll_quat @ self.initial_orientation_quat
+                self._pose_at(self.current_anim_frame / self.duration_frames)
                 self.current_anim_frame += 1
                 return False
             else:
-                self.animation_done = True
-                self.obj.location = self.end_pos_world
-                if self.total_roll_radians > 0.001 and self.roll_axis_world.length > 0.5:
-                    final_roll_quat = Quaternion(self.roll_axis_world, self.total_roll_radians)
-                    self.obj.rotation_quaternion = final_roll_quat @ self.initial_orientation_quat
-                if self.obj.animation_data:
-                    self.obj.animation_data_clear()
+                self.finish_pose()
                 return True
         except Exception as e:
-            log_scatter_exception(e, f"Updating PostLandSpawnObject '{self.obj.name if self.obj else 'Unknown'}'", level="WARNING")
+            log_scatter_exception(e, f"Updating PostLandSpawnObject '{self.name}'", level="WARNING")
             self.animation_done = True
             return True
 
@@ -666,6 +834,9 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
     _post_land_spawn_objects: list = []
     _scatter_debug_empties_names: list = []
     _last_overlap_report_time = 0.0
+    _point_buffer = None # ScatterPointBuffer, wenn das Punkt-Backend (Geometry Nodes) aktiv ist
+    _proxy_overlay: GPUProxyOverlay = None # Fallende/gespawnte Proxys bis zur Landung
+    _surface_index: SurfaceIndex = None # Kandidaten-Index für die Post-Landing-Oberfläche (pro Session)
 
     # Alte Ghost-Management-Methoden sind entfernt (create_preview, remove_ghost_object, update_preview)
 
@@ -682,76 +853,88 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
             "instance_name_base_suffix": "_inst"
         }
 
-    def _apply_rigid_body_to_object(self, context, obj_to_modify): # Unverändert
-        if not obj_to_modify or obj_to_modify.rigid_body:
-            return False
-
-        phys_settings_main = getattr(context.scene, 'physical_tool_settings', None)
-        default_mass = getattr(phys_settings_main, 'mass', 1.0)
-        default_shape = getattr(phys_settings_main, 'collision_shape', 'CONVEX_HULL')
-        default_margin = getattr(phys_settings_main, 'collision_margin', 0.001)
+    @timed("mouse_scatter.create_instance", trace_args=_instantiate_trace_args)
+    def _instantiate_from_cpp_instruction(self, context, instruction, mesh_data, fallback_name_base, marker_obj=None):
+        # Gemeinsamer Pfad für CREATE_INSTANCE_FROM_SOURCE. Im Punkt-Backend wird nur gepuffert:
+        # der Marker bleibt bis zum nächsten Flush bestehen und es wird None zurückgegeben.
+        if self._point_buffer is not None:
+            self._point_buffer.add(instruction.get("matrix_world"), mesh_data.name,
+                                   marker_name=marker_obj.name if marker_obj else None)
+            return None
 
-        original_active = context.view_layer.objects.active
-        original_selected_names = {o.name for o in context.selected_objects if o}
+        # Eindeutiger Name: bei Kollision vergibt Blender selbst das .001-Suffix
+        instance_base_name = instruction.get("new_instance_name_base", fallback_name_base)
+        new_instance = bpy.data.objects.new(name=instance_base_name, object_data=mesh_data)
+        new_instance.matrix_world = Matrix(instruction.get("matrix_world"))
 
-        original_hide_viewport = obj_to_modify.hide_get(view_layer=context.view_layer)
-        original_hide_select = obj_to_modify.hide_select
-        if original_hide_viewport: obj_to_modify.hide_set(False, view_layer=context.view_layer)
-        if original_hide_select: obj_to_modify.hide_select = False
+        target_col_name = instruction.get("target_collection_name")
+        target_col = get_or_create_scatter_target_collection(target_col_name, context)
+        if target_col: transaction_link(new_instance, target_col)
+        else:
+            self.report({'WARNING'}, f"Target instance collection '{target_col_name}' not found or creatable. Linking to scene.")
+            transaction_link(new_instance, context.scene.collection)
+        return new_instance
 
-        bpy.ops.object.select_all(action='DESELECT')
-        success = False
+    def _flush_point_buffer(self, context):
+        if self._point_buffer is None or not len(self._point_buffer):
+            return
+        im_settings = getattr(context.scene, 'instance_manager_settings', None)
+        target_col = get_or_create_scatter_target_collection(im_settings.instance_collection_name, context) if im_settings else None
+        self._point_buffer.flush(context, target_col)
+
+    def _get_proxy_overlay(self, settings):
+        if self._proxy_overlay is None:
+            self._proxy_overlay = GPUProxyOverlay(color=tuple(settings.ghost_color))
+        return self._proxy_overlay
+
+    def _materialize_proxies(self, context, wrappers):
+        """
+        Gelandete Proxys (AnimatedFallingObject/PostLandSpawnObject mit obj None) werden zu Blender-Objekten:
+        verlinkte Kopie der Quelle (gemeinsames Mesh, kein data.copy()), ein View-Layer-Update für alle.
+        """
+        created = []
+        for wrapper in wrappers:
+            if self._proxy_overlay is not None:
+                self._proxy_overlay.remove(wrapper.proxy_slot)
+            wrapper.proxy_slot = None
+            source_obj = wrapper.source_obj
+            try:
+                if wrapper.obj is not None or source_obj is None or source_obj.name not in bpy.data.objects:
+                    continue
+                new_obj = source_obj.copy()
+                new_obj.name = wrapper.name # bei Kollision vergibt Blender selbst das .001-Suffix
+                new_obj.animation_data_clear()
+                new_obj.rotation_mode = 'QUATERNION'
+                new_obj.matrix_world = wrapper.matrix
+                transaction_link(new_obj, context.scene.collection)
+                wrapper.obj = new_obj; wrapper.name = new_obj.name
+                created.append(new_obj)
+            except ReferenceError as e_ref_proxy:
+                log_scatter_exception(e_ref_proxy, f"Source of proxy '{wrapper.name}' became invalid", self, level="WARNING")
+        if created:
+            request_view_layer_update(context)
+            if self._surface_index is not None:
+                self._surface_index.add(created)
+        return len(created)
+
+    def _apply_rigid_body_to_object(self, context, obj_to_modify):
+        if not obj_to_modify or obj_to_modify.rigid_body:
+            return False
+        phys_settings_main = getattr(context.scene, 'physical_tool_settings', None)
         try:
-            obj_to_modify.select_set(True)
-            context.view_layer.objects.active = obj_to_modify
-            bpy.ops.rigidbody.object_add()
-
-            if obj_to_modify.rigid_body:
-                rb = obj_to_modify.rigid_body
-                rb.type = 'ACTIVE'
-                rb.mass = default_mass
-                rb.collision_shape = default_shape
-                rb.use_margin = True
-                rb.collision_margin = default_margin
-                rb.linear_damping = 0.04
-                rb.angular_damping = 0.1
-                rb.use_deactivation = True
-                rb.use_start_deactivated = False
-                context.view_layer.update()
-                success = True
-            else:
-                self.report({'WARNING'}, f"Rigid Body could not be added to '{obj_to_modify.name}' (after ops call).")
-        except RuntimeError as e_rt:
-            log_scatter_exception(e_rt, f"Adding/configuring Rigid Body to '{obj_to_modify.name}'", self)
-            self.report({'WARNING'}, f"Could not add/configure Rigid Body for '{obj_to_modify.name}': {e_rt}")
-        except Exception as e_gen:
-            log_scatter_exception(e_gen, f"General error adding/configuring Rigid Body to '{obj_to_modify.name}'", self)
-        finally:
-            bpy.ops.object.select_all(action='DESELECT')
-            for name in original_selected_names:
-                sel_obj = bpy.data.objects.get(name)
-                if sel_obj and sel_obj.name in context.view_layer.objects:
-                    try: sel_obj.select_set(True)
-                    except ReferenceError: pass
-
-            active_obj_restored = bpy.data.objects.get(original_active.name) if original_active else None
-            if active_obj_restored and active_obj_restored.name in context.view_layer.objects:
-                 try: context.view_layer.objects.active = active_obj_restored
-                 except ReferenceError: pass
-            elif original_selected_names:
-                first_selected_name = next(iter(original_selected_names), None)
-                if first_selected_name:
-                    first_sel_obj_restored = bpy.data.objects.get(first_selected_name)
-                    if first_sel_obj_restored and first_sel_obj_restored.name in context.view_layer.objects:
-                        try: context.view_layer.objects.active = first_sel_obj_restored
-                        except ReferenceError: pass
-
-            if obj_to_modify and obj_to_modify.name in bpy.data.objects:
-                if original_hide_viewport: obj_to_modify.hide_set(True, view_layer=context.view_layer)
-                if original_hide_select: obj_to_modify.hide_select = True
-        return success
+            # Ohne Operatoren/Auswahlwechsel: RBW-Link + Settings werden mit der Transaktion gebündelt
+            transaction_add_rigid_body(context, obj_to_modify, build_rigid_body_settings(phys_settings_main, 'ACTIVE'))
+            return True
+        except (ReferenceError, RuntimeError) as e_rb:
+            log_scatter_exception(e_rb, f"Adding Rigid Body to '{obj_to_modify.name}'", self)
+            self.report({'WARNING'}, f"Could not add/configure Rigid Body for '{obj_to_modify.name}': {e_rb}")
+            return False
 
     def _cleanup_and_finish_for_error(self, context): # Task 4 angepasst
+        try: self._flush_point_buffer(context)
+        except Exception as e_flush: log_scatter_exception(e_flush, "Flushing point buffer in cleanup", self, level="WARNING")
+        self._point_buffer = None
+
         if self._timer:
             try: context.window_manager.event_timer_remove(self._timer)
             except Exception as e_timer: log_scatter_exception(e_timer, "Removing timer in cleanup", self, level="WARNING")
@@ -764,11 +947,16 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
         if self._ghost_drawer:
             self._ghost_drawer.cleanup()
             self._ghost_drawer = None
+        if self._proxy_overlay:
+            self._proxy_overlay.cleanup()
+            self._proxy_overlay = None
+        self._surface_index = None
 
         self._cleanup_scatter_debug_objects(context)
 
         self._falling_objects_data.clear()
         self._post_land_spawn_objects.clear()
+        DROP_PATH_WATCH.active = False; DROP_PATH_WATCH.changed.clear()
 
         try:
             if context.window: context.window.cursor_modal_set('DEFAULT')
@@ -792,16 +980,26 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
         valid_objects = [entry.obj for entry in settings.scatter_objects_list if entry.obj and entry.obj.type == 'MESH']
         return random.choice(valid_objects) if valid_objects else None
 
-    def check_overlap_bvh(self, obj_to_check, context, settings, ignore_obj=None): # Unverändert (nutzt Blender-Objekt, was für GPU Ghost problematisch ist)
+    @timed("mouse_scatter.check_overlap_bvh", trace_args=_overlap_trace_args)
+    def check_overlap_bvh(self, obj_to_check, context, settings, ignore_obj=None, profile_to_check=None, matrix_to_check=None):
+        # profile_to_check: MeshProfile der Quelle, wenn obj_to_check eine Kopie mit frischem Mesh ist
+        # obj_to_check=None + profile_to_check + matrix_to_check: Kandidat an einer Ziel-Transform prüfen, ohne
+        # ein Objekt zu verlinken (kein sync_pending_changes / keine Auswertung des Kandidaten pro Platzierung)
         # Task 6 Hinweis: Dieser Overlap-Check muss für GPU-Ghost angepasst oder temporär deaktiviert/vereinfacht werden.
         # Aktuell wird er mit dem Blueprint-Objekt in place_object aufgerufen, bevor C++ ins Spiel kommt.
         # Für den *visuellen* Feedback des GPU-Ghosts ist er noch nicht integriert.
+        depsgraph = evaluated_depsgraph(context)
+        if obj_to_check is None:
+            if profile_to_check is None or matrix_to_check is None or not len(profile_to_check._triangles):
+                return False
+            bvh_obj_to_check = profile_to_check.bvh(matrix_to_check)
+            check_center, check_radius = profile_to_check.world_sphere(matrix_to_check)
+            return self._overlaps_obstacle(context, settings, depsgraph, bvh_obj_to_check, check_center, check_radius, ignore_obj)
         try:
-            if not obj_to_check or obj_to_check.name not in bpy.data.objects or \
+            if obj_to_check.name not in bpy.data.objects or \
                not obj_to_check.data or not hasattr(obj_to_check.data, 'polygons'):
                 return False
         except ReferenceError: return False
-        depsgraph = context.evaluated_depsgraph_get()
         try: eval_obj_to_check = obj_to_check.evaluated_get(depsgraph)
         except (ReferenceError, RuntimeError) as e:
             log_scatter_exception(e, f"Getting evaluated obj_to_check '{obj_to_check.name if obj_to_check else 'Unknown'}' in overlap check", operator_instance=self, level="DEBUG")
@@ -813,6 +1011,16 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
         except (RuntimeError, Exception) as e:
             log_scatter_exception(e, f"Creating BVH for obj_to_check '{eval_obj_to_check.name}' in overlap check", operator_instance=self, level="DEBUG")
             return False
+        # Grobtest über Bounding Spheres aus dem MeshProfile-Cache statt obj.dimensions
+        profile_to_check = profile_to_check or PROFILES.for_object(obj_to_check)
+        if profile_to_check is not None:
+            check_center, check_radius = profile_to_check.world_sphere(obj_to_check.matrix_world)
+        else:
+            check_center, check_radius = obj_to_check.matrix_world.translation, 0.1
+        return self._overlaps_obstacle(context, settings, depsgraph, bvh_obj_to_check, check_center, check_radius,
+                                       ignore_obj, obj_to_check)
+
+    def _overlaps_obstacle(self, context, settings, depsgraph, bvh_obj_to_check, check_center, check_radius, ignore_obj=None, obj_to_check=None):
         for obj_iter_name in context.scene.objects.keys():
             obj = bpy.data.objects.get(obj_iter_name)
             if not obj: continue
@@ -832,15 +1040,20 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
                             is_potential_obstacle = True
 
                 if not is_potential_obstacle: continue
+                # Der Punkt-Träger (Punkt-Backend) hat keine Polygone und fällt hier heraus: frühere
+                # Punkt-Platzierungen sind für prevent_overlap kein Hindernis (siehe point_instancing).
                 if not obj.data or not hasattr(obj.data, 'polygons') or not obj.data.polygons: continue
             except ReferenceError: continue
             except Exception as e_iter_check:
                 log_scatter_exception(e_iter_check, f"Checking iterated object '{obj.name}' in overlap check", operator_instance=self, level="DEBUG")
                 continue
-            dist_sq = (obj.matrix_world.translation - obj_to_check.location).length_squared
-            obj_to_check_radius = obj_to_check.dimensions.length / 2 if obj_to_check.dimensions else 0.1
-            obj_radius = obj.dimensions.length / 2 if obj.dimensions else 0.1
-            combined_radius_threshold = (obj_to_check_radius + obj_radius + settings.overlap_check_distance)**2
+            obj_profile = PROFILES.for_object(obj, depsgraph)
+            if obj_profile is not None:
+                obj_center, obj_radius = obj_profile.world_sphere(obj.matrix_world)
+            else:
+                obj_center, obj_radius = obj.matrix_world.translation, 0.1
+            dist_sq = (obj_center - check_center).length_squared
+            combined_radius_threshold = (check_radius + obj_radius + settings.overlap_check_distance)**2
             if dist_sq > combined_radius_threshold : continue
             try: target_eval = obj.evaluated_get(depsgraph)
             except (ReferenceError, RuntimeError) as e_eval_target:
@@ -856,6 +1069,7 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
             if bvh_obj_to_check.overlap(bvh_target): return True
         return False
 
+    @timed("mouse_scatter.place_object", trace_args=_place_trace_args)
     def place_object(self, context, settings, mouse_x, mouse_y): # Task 6 angepasst
         # Diese Methode wird nur für GHOST_IMMEDIATE relevant sein.
         # Sie erzeugt das temporäre "Marker"-Objekt, das dann von C++ verarbeitet wird.
@@ -872,24 +1086,30 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
         # Das "Blueprint"-Objekt wird hier erstellt und erhält die Transform des GPU-Ghosts
         marker_obj = None
         source_obj_for_marker = self._current_scatter_source_obj
+        marker_matrix = self._ghost_drawer.transform_matrix.copy()
+        if settings.prevent_overlap:
+            # Geprüft wird die Ghost-Transform mit dem Profil der Quelle, bevor der Marker entsteht:
+            # kein verlinkter Marker und kein sync_pending_changes pro Platzierung
+            if self.check_overlap_bvh(None, context, settings, profile_to_check=PROFILES.for_object(source_obj_for_marker),
+                                      matrix_to_check=marker_matrix):
+                current_time = time.time()
+                if current_time - self._last_overlap_report_time > 1.0:
+                    self.report({'INFO'}, "Placement prevented: Overlap (Immediate).")
+                    self._last_overlap_report_time = current_time
+                return None
+
         try:
-            marker_obj = source_obj_for_marker.copy()
-            if marker_obj.data == source_obj_for_marker.data and source_obj_for_marker.data:
-                marker_obj.data = source_obj_for_marker.data.copy()
+            marker_obj = source_obj_for_marker.copy() # gemeinsames Mesh wie _materialize_proxies, kein data.copy()
+            marker_obj.name = f"{source_obj_for_marker.name}_Marker" # bei Kollision vergibt Blender das .001-Suffix
 
-            marker_obj.matrix_world = self._ghost_drawer.transform_matrix.copy()
+            marker_obj.matrix_world = marker_matrix
             # Rotation mode wird durch matrix_world gesetzt, aber zur Sicherheit:
             marker_obj.rotation_mode = 'QUATERNION' # Oder entsprechend aus Matrix extrahieren
             # marker_obj.rotation_quaternion = self._ghost_drawer.transform_matrix.to_quaternion()
 
-            base_marker_name = f"{source_obj_for_marker.name}_Marker"
-            i = 0; final_marker_name = base_marker_name
-            while final_marker_name in bpy.data.objects:
-                i += 1; final_marker_name = f"{base_marker_name}.{i:03d}"
-            marker_obj.name = final_marker_name
-
-            context.scene.collection.objects.link(marker_obj)
-            context.view_layer.update()
+            transaction_link(marker_obj, context.scene.collection)
+            if self._surface_index is not None:
+                self._surface_index.invalidate() # Marker/Instanz entstehen außerhalb von _materialize_proxies
         except Exception as e_marker_create:
             log_scatter_exception(e_marker_create, "Creating temporary marker in place_object", self)
             if marker_obj and marker_obj.name in bpy.data.objects:
@@ -897,29 +1117,19 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
                 except Exception: pass
             return None
 
-        if settings.prevent_overlap:
-            # Verwendet das gerade erstellte Blender-Objekt für den BVH-Check
-            if self.check_overlap_bvh(marker_obj, context, settings, ignore_obj=marker_obj):
-                current_time = time.time()
-                if current_time - self._last_overlap_report_time > 1.0:
-                    self.report({'INFO'}, "Placement prevented: Overlap (Immediate).")
-                    self._last_overlap_report_time = current_time
-                if marker_obj and marker_obj.name in bpy.data.objects: bpy.data.objects.remove(marker_obj, do_unlink=True)
-                return None
-
         # Ab hier bleibt die Logik für C++-Verarbeitung oder Fallback gleich,
         # da sie auf dem `marker_obj` (einem Blender-Objekt) basiert.
         final_placed_obj_location = None
         cpp_processing_settings = self._get_processing_settings_for_cpp(context)
 
-        if cpp_processing_settings and NATIVE_MODULE_AVAILABLE and scatter_accel:
+        if cpp_processing_settings and KERNELS.available(KERNEL_ANALYZE_SINGLE):
             single_object_data_cpp = {
                 "original_marker_name": marker_obj.name,
                 "source_mesh_name": source_obj_for_marker.data.name,
                 "matrix_world": [list(row) for row in marker_obj.matrix_world],
             }
             try:
-                instruction = scatter_accel.analyze_single_object_for_processing(single_object_data_cpp, cpp_processing_settings)
+                instruction = KERNELS.call(KERNEL_ANALYZE_SINGLE, single_object_data_cpp, cpp_processing_settings)
 
                 action = instruction.get("action")
                 original_marker_name_from_cpp = instruction.get("original_marker_name")
@@ -938,37 +1148,23 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
                         if marker_to_process.name in bpy.data.objects: bpy.data.objects.remove(marker_to_process, do_unlink=True)
                         return None
 
-                    instance_base_name = instruction.get("new_instance_name_base", f"{marker_to_process.name}_processed_inst")
-                    final_inst_name = instance_base_name; i_inst = 0
-                    while final_inst_name in bpy.data.objects:
-                        i_inst += 1; final_inst_name = f"{instance_base_name}.{i_inst:03d}"
-
-                    new_instance = bpy.data.objects.new(name=final_inst_name, object_data=original_scatter_source_mesh_data)
-                    new_instance.matrix_world = Matrix(instruction.get("matrix_world"))
-
-                    target_col_name = instruction.get("target_collection_name")
-                    target_col = get_or_create_scatter_target_collection(target_col_name, context)
-
-                    if target_col: target_col.objects.link(new_instance)
-                    else:
-                        self.report({'WARNING'}, f"Target instance collection '{target_col_name}' not found or creatable. Linking to scene.")
-                        context.scene.collection.objects.link(new_instance)
+                    new_instance = self._instantiate_from_cpp_instruction(
+                        context, instruction, original_scatter_source_mesh_data,
+                        f"{marker_to_process.name}_processed_inst", marker_obj=marker_to_process)
 
-                    final_placed_obj_location = new_instance.location.copy()
-                    if marker_to_process.name in bpy.data.objects: bpy.data.objects.remove(marker_to_process, do_unlink=True)
+                    final_placed_obj_location = Matrix(instruction.get("matrix_world")).translation.copy()
+                    if new_instance and marker_to_process.name in bpy.data.objects: bpy.data.objects.remove(marker_to_process, do_unlink=True)
 
                 elif action == "CONVERT_MARKER_TO_STATIC_RIGID" or action == "CONVERT_MARKER_TO_STATIC":
                     target_col_name = instruction.get("target_collection_name")
                     target_col = get_or_create_scatter_target_collection(target_col_name, context)
 
-                    if marker_to_process.name in context.scene.collection.objects:
-                        context.scene.collection.objects.unlink(marker_to_process)
+                    transaction_unlink(marker_to_process, context.scene.collection)
 
-                    if target_col: target_col.objects.link(marker_to_process)
+                    if target_col: transaction_link(marker_to_process, target_col)
                     else:
                         self.report({'WARNING'}, f"Target static collection '{target_col_name}' not found or creatable. Leaving in scene.")
-                        if marker_to_process.name not in context.scene.collection.objects:
-                             context.scene.collection.objects.link(marker_to_process)
+                        transaction_link(marker_to_process, context.scene.collection)
 
                     if instruction.get("add_rigidbody", False):
                         self._apply_rigid_body_to_object(context, marker_to_process)
@@ -994,20 +1190,20 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
             if use_legacy_marking:
                  marker_obj["is_scatter_instance"] = True
 
-            if marker_obj.name in context.scene.collection.objects:
-                context.scene.collection.objects.unlink(marker_obj)
+            transaction_unlink(marker_obj, context.scene.collection)
 
             if self._session_source_collection and self._session_source_collection.name in bpy.data.collections:
-                self._session_source_collection.objects.link(marker_obj)
+                transaction_link(marker_obj, self._session_source_collection)
             else:
                 self.report({'ERROR'}, "Session source collection invalid in fallback. Linking marker to scene.")
-                context.scene.collection.objects.link(marker_obj)
+                transaction_link(marker_obj, context.scene.collection)
 
             final_placed_obj_location = marker_obj.location.copy()
 
-        context.view_layer.update()
+        request_view_layer_update(context)
         return final_placed_obj_location
 
+    @timed("mouse_scatter.mouse_raycast", trace_args=_raycast_trace_args)
     def mouse_raycast(self, context, settings, mouse_x, mouse_y, use_custom_ray=False, custom_origin=None, custom_direction=None, max_distance_override=None, ignore_object_for_raycast=None): # Unverändert
         # Wichtig: ignore_object_for_raycast ist ein Blender-Objekt.
         # Wenn wir GPU-Ghost haben, gibt es kein Blender-Objekt zum Ignorieren beim Raycast für *dessen* Position.
@@ -1043,31 +1239,17 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
             if not origin or not direction or direction.length == 0: return False, None, None, None
             direction.normalize()
 
-        original_hide_state = None
-        obj_was_hidden_for_raycast = False
         obj_to_ignore_actual = None
         try:
             if ignore_object_for_raycast and hasattr(ignore_object_for_raycast, 'name') and ignore_object_for_raycast.name in bpy.data.objects:
                 obj_to_ignore_actual = ignore_object_for_raycast
         except ReferenceError: pass
-
-        if obj_to_ignore_actual and obj_to_ignore_actual.name in context.view_layer.objects:
-            try:
-                original_hide_state = obj_to_ignore_actual.hide_get()
-                if not original_hide_state:
-                    obj_to_ignore_actual.hide_set(True)
-                    context.view_layer.update()
-                    obj_was_hidden_for_raycast = True
-            except (ReferenceError, RuntimeError) as e_hide_ignore:
-                log_scatter_exception(e_hide_ignore, f"Hiding ignore_object '{obj_to_ignore_actual.name}' for raycast", self, level="DEBUG")
-                obj_was_hidden_for_raycast = False
-            except Exception as e_gen_hide_ignore:
-                log_scatter_exception(e_gen_hide_ignore, f"Unexpected error hiding ignore_object '{obj_to_ignore_actual.name}' for raycast", self, level="DEBUG")
-                obj_was_hidden_for_raycast = False
+        # Statt das Ignore-Objekt zu verstecken (2x view_layer.update pro Raycast) wird der Strahl
+        # hinter dem Treffer fortgesetzt, solange das ignorierte Objekt getroffen wird.
 
 
         hit_success_final = False; loc_final, norm_final, obj_hit_final = None, None, None
-        depsgraph = context.evaluated_depsgraph_get()
+        depsgraph = evaluated_depsgraph(context)
         max_dist_for_ray = max_distance_override if max_distance_override is not None else 10000.0
 
         try:
@@ -1095,28 +1277,25 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
                                 obj_hit_final = ground_obj; hit_success_final = True
                 elif ground_obj: pass
             else:
-                hit_success, loc, norm, _, obj_hit, _ = context.scene.ray_cast(depsgraph, origin, direction, distance=max_dist_for_ray)
-                if hit_success:
+                ray_origin = origin.copy(); remaining_dist = max_dist_for_ray
+                for _ in range(RAYCAST_IGNORE_MAX_CONTINUATIONS):
+                    hit_success, loc, norm, _, obj_hit, _ = context.scene.ray_cast(depsgraph, ray_origin, direction, distance=remaining_dist)
+                    if not hit_success: break
                     if obj_to_ignore_actual and obj_hit == obj_to_ignore_actual:
-                        pass
-                    else:
-                        loc_final = loc
-                        norm_final = norm.normalized() if norm and norm.length > 0.0001 else Vector((0.0,0.0,1.0))
-                        obj_hit_final = obj_hit
-                        hit_success_final = True
+                        travelled = (loc - ray_origin).length + RAYCAST_CONTINUATION_EPSILON
+                        remaining_dist -= travelled
+                        if remaining_dist <= 0.0: break
+                        ray_origin = loc + direction * RAYCAST_CONTINUATION_EPSILON
+                        continue
+                    loc_final = loc
+                    norm_final = norm.normalized() if norm and norm.length > 0.0001 else Vector((0.0,0.0,1.0))
+                    obj_hit_final = obj_hit
+                    hit_success_final = True
+                    break
         except (RuntimeError, ReferenceError) as e_ray:
             log_scatter_exception(e_ray, "Performing ray_cast operation", self, level="DEBUG")
         except Exception as e_gen_ray:
             log_scatter_exception(e_gen_ray, "Unexpected error during ray_cast", self, level="WARNING")
-        finally:
-            if obj_was_hidden_for_raycast and obj_to_ignore_actual and obj_to_ignore_actual.name in bpy.data.objects and obj_to_ignore_actual.name in context.view_layer.objects :
-                try:
-                    obj_to_ignore_actual.hide_set(original_hide_state)
-                    context.view_layer.update()
-                except (ReferenceError, RuntimeError) as e_restore_hide:
-                    log_scatter_exception(e_restore_hide, f"Restoring hide state of ignore_object '{obj_to_ignore_actual.name}'", self, level="DEBUG")
-                except Exception as e_gen_restore_hide:
-                    log_scatter_exception(e_gen_restore_hide, f"Unexpected error restoring hide state of '{obj_to_ignore_actual.name}'", self, level="DEBUG")
         return hit_success_final, loc_final, norm_final, obj_hit_final
 
     def _cleanup_scatter_debug_objects(self, context): # Unverändert
@@ -1201,111 +1380,57 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
             return None
 
         if settings.prevent_overlap and settings.placement_mode == 'ANIMATED_DROP_DIRECT':
-            temp_ghost = None # Dieses Objekt ist nur für den Overlap-Check, nicht für die GPU-Darstellung
+            # Overlap am Startpunkt: Profil der Quelle an der Ziel-Transform, ohne temporären Ghost im Szenengraph
             try:
-                temp_ghost = source_obj_for_drop.copy()
-                if temp_ghost.data == source_obj_for_drop.data and source_obj_for_drop.data: temp_ghost.data = source_obj_for_drop.data.copy()
-                temp_ghost.name = "TempOverlapCheckGhost_Drop"
-                if not temp_ghost.users_collection: context.scene.collection.objects.link(temp_ghost)
-
-                hit, loc, norm, _ = self.mouse_raycast(context, settings, mouse_x, mouse_y, ignore_object_for_raycast=temp_ghost)
+                hit, loc, norm, _ = self.mouse_raycast(context, settings, mouse_x, mouse_y)
                 if hit and loc:
-                    scale = random.uniform(settings.scale_min, settings.scale_max); temp_ghost.scale = (scale, scale, scale)
+                    scale = random.uniform(settings.scale_min, settings.scale_max)
                     rot_x = math.radians(random.uniform(settings.rot_x_min, settings.rot_x_max)); rot_y = math.radians(random.uniform(settings.rot_y_min, settings.rot_y_max)); rot_z = math.radians(random.uniform(settings.rot_z_min, settings.rot_z_max))
                     align_rot_quat = norm.normalized().to_track_quat('Z', 'Y') if norm and norm.length > 0.001 else Euler((0,0,0),'XYZ').to_quaternion()
-                    rand_rot_eul = Euler((rot_x, rot_y, rot_z), 'XYZ'); temp_ghost.rotation_euler = (align_rot_quat @ rand_rot_eul.to_quaternion()).to_euler('XYZ')
-                    context.view_layer.update()
+                    rand_rot_eul = Euler((rot_x, rot_y, rot_z), 'XYZ')
                     h_offset = random.uniform(settings.height_min, settings.height_max)
 
-                    temp_ghost.location = loc
+                    check_location = loc.copy()
                     if settings.offset_application_mode == 'WORLD_Z':
-                        temp_ghost.location.z += h_offset
+                        check_location.z += h_offset
                     else:
-                        temp_ghost.location += (norm.normalized() * h_offset if norm and norm.length > 0.001 else Vector((0,0,h_offset)))
-                    context.view_layer.update()
+                        check_location += (norm.normalized() * h_offset if norm and norm.length > 0.001 else Vector((0,0,h_offset)))
+                    check_matrix = Matrix.LocRotScale(check_location, align_rot_quat @ rand_rot_eul.to_quaternion(), Vector((scale, scale, scale)))
 
-                    if self.check_overlap_bvh(temp_ghost, context, settings, ignore_obj=temp_ghost):
+                    if self.check_overlap_bvh(None, context, settings, profile_to_check=PROFILES.for_object(source_obj_for_drop),
+                                              matrix_to_check=check_matrix):
                         current_time = time.time()
                         if current_time - self._last_overlap_report_time > 1.0:
                             self.report({'INFO'}, "Drop prevented: Overlap at start point (Direct Drop)."); self._last_overlap_report_time = current_time
-                        if temp_ghost and temp_ghost.name in bpy.data.objects:
-                             try: bpy.data.objects.remove(temp_ghost, do_unlink=True)
-                             except Exception: pass
                         return None
             except ReferenceError as e_ref_overlap:
                 log_scatter_exception(e_ref_overlap, "Overlap check for animated_drop_direct", self)
-                if temp_ghost and temp_ghost.name in bpy.data.objects: bpy.data.objects.remove(temp_ghost, do_unlink=True)
                 return None
             except Exception as e_overlap:
                 log_scatter_exception(e_overlap, "Unexpected error during overlap check for animated_drop_direct", self)
-            finally:
-                if temp_ghost and temp_ghost.name in bpy.data.objects:
-                    try: bpy.data.objects.remove(temp_ghost, do_unlink=True)
-                    except Exception as e_rem_tg: log_scatter_exception(e_rem_tg, "Removing temp_ghost in animated_drop_direct", self, level="WARNING")
-
-        original_mode = context.mode
-        if original_mode != 'OBJECT':
-            try: bpy.ops.object.mode_set(mode='OBJECT')
-            except Exception as e_mode:
-                log_scatter_exception(e_mode, "Setting OBJECT mode for animated drop", self)
-                self.report({'ERROR'}, "Could not switch to Object Mode.")
-                return None
-        new_obj = None
-        try:
-            new_obj = source_obj_for_drop.copy()
-            if new_obj.data == source_obj_for_drop.data and source_obj_for_drop.data is not None: new_obj.data = source_obj_for_drop.data.copy()
-            base_name = source_obj_for_drop.name; count = 1; new_name_candidate = f"{base_name}_DropAnim"
-            while new_name_candidate in bpy.data.objects: new_name_candidate = f"{base_name}_DropAnim.{count:03d}"; count += 1
-            new_obj.name = new_name_candidate
-
-            for col_other in list(new_obj.users_collection): col_other.objects.unlink(new_obj)
-            context.scene.collection.objects.link(new_obj)
-        except ReferenceError as e_ref_create:
-            log_scatter_exception(e_ref_create, "Creating/linking new drop object", self)
-            if new_obj and new_obj.name in bpy.data.objects: bpy.data.objects.remove(new_obj, do_unlink=True)
-            if context.mode == 'OBJECT' and original_mode != 'OBJECT':
-                try: bpy.ops.object.mode_set(mode=original_mode)
-                except RuntimeError: pass
-            return None
-        except Exception as e_create:
-            log_scatter_exception(e_create, "Unexpected error creating/linking new drop object", self)
-            self.report({'ERROR'}, f"Error creating drop object: {e_create}")
-            if new_obj and new_obj.name in bpy.data.objects: bpy.data.objects.remove(new_obj, do_unlink=True)
-            if context.mode == 'OBJECT' and original_mode != 'OBJECT':
-                try: bpy.ops.object.mode_set(mode=original_mode)
-                except RuntimeError: pass
-            return None
-
-        if context.mode == 'OBJECT' and original_mode != 'OBJECT':
-            try: bpy.ops.object.mode_set(mode=original_mode)
-            except Exception as e_restore_mode_drop: log_scatter_exception(e_restore_mode_drop, "Restoring original mode after creating drop object", self, level="WARNING")
 
+        # Kein Blender-Objekt während des Falls: Start-Matrix + GPU-Proxy, das Objekt entsteht bei der Landung
+        drop_profile = PROFILES.for_object(source_obj_for_drop)
         try:
             if use_ghost_transform and initial_ghost_matrix: # Relevant if drop triggered from a ghost state
-                new_obj.matrix_world = initial_ghost_matrix
+                start_matrix = initial_ghost_matrix.copy()
             else: # Standard direct drop from mouse click
-                scale_val = random.uniform(settings.scale_min, settings.scale_max); new_obj.scale = (scale_val, scale_val, scale_val)
-                context.view_layer.update()
+                scale_val = random.uniform(settings.scale_min, settings.scale_max)
                 rot_x_rad = math.radians(random.uniform(settings.rot_x_min, settings.rot_x_max)); rot_y_rad = math.radians(random.uniform(settings.rot_y_min, settings.rot_y_max)); rot_z_rad = math.radians(random.uniform(settings.rot_z_min, settings.rot_z_max))
                 random_euler_rot = Euler((rot_x_rad, rot_y_rad, rot_z_rad), 'XYZ')
 
-                hit_initial, loc_initial, norm_initial, _ = self.mouse_raycast(context, settings, mouse_x, mouse_y, ignore_object_for_raycast=new_obj)
+                hit_initial, loc_initial, norm_initial, _ = self.mouse_raycast(context, settings, mouse_x, mouse_y)
 
                 if hit_initial and norm_initial and norm_initial.length > 0.001:
                     align_quat = norm_initial.normalized().to_track_quat('Z','Y');
-                    new_obj.rotation_mode = 'QUATERNION'
-                    new_obj.rotation_quaternion = align_quat @ random_euler_rot.to_quaternion()
+                    rotation_for_matrix = align_quat @ random_euler_rot.to_quaternion()
                 else:
-                    new_obj.rotation_euler = random_euler_rot
-                context.view_layer.update()
+                    rotation_for_matrix = random_euler_rot.to_quaternion()
 
                 initial_height_offset = random.uniform(settings.height_min, settings.height_max)
 
-                matrix_world_no_loc_drop = new_obj.matrix_world.copy(); matrix_world_no_loc_drop.translation = Vector((0,0,0))
-                min_z_local_space_drop = 0.0
-                if new_obj.bound_box:
-                    local_bbox_corners_rot_scaled = [matrix_world_no_loc_drop @ Vector(corner) for corner in new_obj.bound_box]
-                    if local_bbox_corners_rot_scaled: min_z_local_space_drop = min(c.z for c in local_bbox_corners_rot_scaled)
+                matrix_world_no_loc_drop = Matrix.LocRotScale(None, rotation_for_matrix, Vector((scale_val, scale_val, scale_val)))
+                min_z_local_space_drop = drop_profile.min_z(matrix_world_no_loc_drop) if drop_profile else 0.0
 
                 if hit_initial and loc_initial:
                     start_location_base = loc_initial.copy()
@@ -1331,28 +1456,62 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
 
                     offset_dir = Vector((0,0,1)) if settings.offset_application_mode == 'WORLD_Z' or not (norm_initial and norm_initial.length > 0.001) else norm_initial.normalized()
                     start_location += offset_dir * initial_height_offset
-                new_obj.location = start_location
+                start_matrix = Matrix.LocRotScale(start_location, rotation_for_matrix, Vector((scale_val, scale_val, scale_val)))
         except ReferenceError as e_ref_transform:
-            log_scatter_exception(e_ref_transform, "Transforming new drop object", self)
-            if new_obj and new_obj.name in bpy.data.objects: bpy.data.objects.remove(new_obj, do_unlink=True)
+            log_scatter_exception(e_ref_transform, "Computing start transform for drop proxy", self)
             return None
         except Exception as e_gen_transform:
-            log_scatter_exception(e_gen_transform, "Unexpected error transforming new drop object", self)
-            if new_obj and new_obj.name in bpy.data.objects: bpy.data.objects.remove(new_obj, do_unlink=True)
+            log_scatter_exception(e_gen_transform, "Unexpected error computing start transform for drop proxy", self)
             return None
-        context.view_layer.update()
-        falling_obj_wrapper = AnimatedFallingObject(new_obj, settings.drop_anim_steps, source_obj_for_drop.data.name)
+
+        falling_obj_wrapper = AnimatedFallingObject(None, settings.drop_anim_steps, source_obj_for_drop.data.name,
+                                                    profile=drop_profile, source_obj=source_obj_for_drop,
+                                                    start_matrix=start_matrix, name_base=f"{source_obj_for_drop.name}_DropAnim")
+        try:
+            falling_obj_wrapper.proxy_slot = self._get_proxy_overlay(settings).add(source_obj_for_drop, start_matrix)
+        except Exception as e_proxy:
+            log_scatter_exception(e_proxy, f"Adding GPU proxy for drop '{falling_obj_wrapper.name}'", self, level="WARNING")
         self._falling_objects_data.append(falling_obj_wrapper)
-        return new_obj
+        return start_matrix.translation.copy()
 
+    @timed("mouse_scatter.update_falling_objects", trace_args=_falling_trace_args)
     def _update_falling_objects(self, context, settings): # Unverändert
-        if not self._falling_objects_data: return
+        if not self._falling_objects_data:
+            DROP_PATH_WATCH.active = False; DROP_PATH_WATCH.changed.clear()
+            return
         currently_falling_obj_refs = {f_obj.obj for f_obj in self._falling_objects_data if f_obj.obj and not f_obj.landed}
+        # Vom Depsgraph gemeldete Änderungen seit dem letzten Tick, ohne die fallenden Objekte selbst
+        DROP_PATH_WATCH.active = any(not f_obj.landed for f_obj in self._falling_objects_data)
+        falling_names = {f_obj.name for f_obj in currently_falling_obj_refs}
+        path_changes = [obj for obj in (bpy.data.objects.get(name) for name in DROP_PATH_WATCH.take() if name not in falling_names)
+                        if obj is not None and obj.type == 'MESH']
+        landed_proxies = []
 
         for i in range(len(self._falling_objects_data) - 1, -1, -1):
             f_obj_wrapper = self._falling_objects_data[i]
             try:
                 target_obj = f_obj_wrapper.obj
+                if target_obj is None and not f_obj_wrapper.landed:
+                    # --- Animation (GPU-Proxy): vorausberechnete Bahn, pro Tick nur eine Zeile im Overlay ---
+                    trajectory = f_obj_wrapper.trajectory
+                    if trajectory is None:
+                        trajectory = f_obj_wrapper.trajectory = self._predict_drop_trajectory(context, settings, f_obj_wrapper, currently_falling_obj_refs)
+                    elif path_changes and trajectory.is_affected_by(path_changes):
+                        trajectory = f_obj_wrapper.trajectory = self._predict_drop_trajectory(
+                            context, settings, f_obj_wrapper, currently_falling_obj_refs, previous=trajectory)
+
+                    has_landed_this_frame = trajectory.advance()
+                    f_obj_wrapper.matrix = trajectory.matrix
+                    if self._proxy_overlay is not None and f_obj_wrapper.proxy_slot is not None:
+                        self._proxy_overlay.update(f_obj_wrapper.proxy_slot, trajectory.matrix)
+                    if has_landed_this_frame:
+                        f_obj_wrapper.landed = True
+                        landed_proxies.append(f_obj_wrapper) # Verarbeitung im nächsten Tick, wie bisher
+                        if trajectory.hit_location is not None:
+                            self._create_scatter_debug_empty_at(context, trajectory.hit_location, f"{f_obj_wrapper.name}_HitP_S{f_obj_wrapper.current_step}", f_obj_wrapper)
+                    f_obj_wrapper.current_step += 1
+                    continue
+
                 if not target_obj or target_obj.name not in bpy.data.objects:
                     self._falling_objects_data.pop(i); continue
 
@@ -1361,7 +1520,7 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
 
                 if f_obj_wrapper.landed and not f_obj_wrapper.processed_on_land:
                     cpp_processing_settings_drop = self._get_processing_settings_for_cpp(context)
-                    if cpp_processing_settings_drop and NATIVE_MODULE_AVAILABLE and scatter_accel:
+                    if cpp_processing_settings_drop and KERNELS.available(KERNEL_ANALYZE_SINGLE):
                         if not f_obj_wrapper.source_mesh_name_for_processing:
                             self.report({'WARNING'}, f"Missing source_mesh_name_for_processing for landed drop object {target_obj.name}.")
                             f_obj_wrapper.processed_on_land = True
@@ -1374,7 +1533,7 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
                             "matrix_world": [list(row) for row in target_obj.matrix_world],
                         }
                         try:
-                            instruction_drop = scatter_accel.analyze_single_object_for_processing(single_object_data_drop_cpp, cpp_processing_settings_drop)
+                            instruction_drop = KERNELS.call(KERNEL_ANALYZE_SINGLE, single_object_data_drop_cpp, cpp_processing_settings_drop)
                             action_drop = instruction_drop.get("action")
 
                             if action_drop == "CREATE_INSTANCE_FROM_SOURCE":
@@ -1385,22 +1544,15 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
                                     if target_obj.name in bpy.data.objects: bpy.data.objects.remove(target_obj, do_unlink=True)
                                     self._falling_objects_data.pop(i); continue
 
-                                inst_base_name_drop = instruction_drop.get("new_instance_name_base", f"{target_obj.name}_drop_inst")
-                                final_inst_name_drop = inst_base_name_drop; i_inst_d = 0
-                                while final_inst_name_drop in bpy.data.objects:
-                                    i_inst_d += 1; final_inst_name_drop = f"{inst_base_name_drop}.{i_inst_d:03d}"
-
-                                new_instance_drop = bpy.data.objects.new(name=final_inst_name_drop, object_data=original_mesh_data_drop)
-                                new_instance_drop.matrix_world = Matrix(instruction_drop.get("matrix_world"))
+                                new_instance_drop = self._instantiate_from_cpp_instruction(
+                                    context, instruction_drop, original_mesh_data_drop,
+                                    f"{target_obj.name}_drop_inst", marker_obj=target_obj)
 
-                                target_col_name_drop = instruction_drop.get("target_collection_name")
-                                target_col_drop = get_or_create_scatter_target_collection(target_col_name_drop, context)
-                                if target_col_drop: target_col_drop.objects.link(new_instance_drop)
-                                else: context.scene.collection.objects.link(new_instance_drop)
-
-                                if target_obj.name in bpy.data.objects: bpy.data.objects.remove(target_obj, do_unlink=True)
-                                self.report({'DEBUG'}, f"Drop object {target_obj.name if hasattr(target_obj, 'name') else 'Unknown'} converted to instance {new_instance_drop.name}.")
-                                target_obj = new_instance_drop # Update ref for post-spawn
+                                if new_instance_drop:
+                                    if target_obj.name in bpy.data.objects: bpy.data.objects.remove(target_obj, do_unlink=True)
+                                    self.report({'DEBUG'}, f"Drop object converted to instance {new_instance_drop.name}.")
+                                    target_obj = new_instance_drop # Update ref for post-spawn
+                                # Punkt-Backend: Marker bleibt bis zum Flush als Referenz für den Post-Spawn bestehen
 
                             elif action_drop == "CONVERT_MARKER_TO_STATIC_RIGID" or action_drop == "CONVERT_MARKER_TO_STATIC":
                                 target_col_name_drop_s = instruction_drop.get("target_collection_name")
@@ -1410,13 +1562,13 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
                                     is_linked_to_scene = any(target_obj.name in col.objects for col in bpy.data.scenes[context.scene.name].collection.children_recursive if target_obj.name in col.objects) or \
                                                          target_obj.name in context.scene.collection.objects
                                     if is_linked_to_scene:
-                                        context.scene.collection.objects.unlink(target_obj) # Unlink from main scene collection
+                                        transaction_unlink(target_obj, context.scene.collection) # Unlink from main scene collection
 
-                                if target_col_drop_s: target_col_drop_s.objects.link(target_obj)
+                                if target_col_drop_s: transaction_link(target_obj, target_col_drop_s)
                                 else: # Fallback if target collection not found/creatable
                                     self.report({'WARNING'}, f"Static collection '{target_col_name_drop_s}' not found for {target_obj.name}. Re-linking to scene.")
                                     if target_obj.name not in context.scene.collection.objects: # Only link if not already there
-                                        context.scene.collection.objects.link(target_obj)
+                                        transaction_link(target_obj, context.scene.collection)
 
 
                                 if instruction_drop.get("add_rigidbody", False):
@@ -1443,114 +1595,126 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
                              target_obj["is_scatter_instance"] = True
 
                         if target_obj.name in context.scene.collection.objects:
-                            context.scene.collection.objects.unlink(target_obj)
+                            transaction_unlink(target_obj, context.scene.collection)
                         if self._session_source_collection and self._session_source_collection.name in bpy.data.collections:
-                            self._session_source_collection.objects.link(target_obj)
-                        else: context.scene.collection.objects.link(target_obj)
+                            transaction_link(target_obj, self._session_source_collection)
+                        else: transaction_link(target_obj, context.scene.collection)
 
                     f_obj_wrapper.processed_on_land = True
 
                     # Check if target_obj still exists before triggering spawn
                     if target_obj and target_obj.name in bpy.data.objects:
                         if settings.use_post_land_spawn and not f_obj_wrapper.spawn_triggered:
-                            self._trigger_post_land_spawn(context, settings, target_obj)
+                            self._trigger_post_land_spawn(context, settings, target_obj, main_profile=f_obj_wrapper.profile)
                             f_obj_wrapper.spawn_triggered = True
 
                     if not target_obj or target_obj.name not in bpy.data.objects :
                         self._falling_objects_data.pop(i)
                     continue
 
-                # --- Animation part (if not landed yet) ---
-                has_landed_this_frame = False
-                if f_obj_wrapper.current_step >= f_obj_wrapper.drop_steps_total:
-                    has_landed_this_frame = True
-                else:
-                    if settings.enable_tumble_during_drop and random.random() < settings.tumble_frequency_during_drop:
-                        intensity = settings.tumble_rotation_intensity_factor
-                        tumble_rot_x = math.radians(random.uniform(settings.rot_x_min, settings.rot_x_max) * intensity)
-                        tumble_rot_y = math.radians(random.uniform(settings.rot_y_min, settings.rot_y_max) * intensity)
-                        tumble_rot_z = math.radians(random.uniform(settings.rot_z_min, settings.rot_z_max) * intensity)
-                        delta_euler = Euler((tumble_rot_x, tumble_rot_y, tumble_rot_z), 'XYZ')
-                        current_quat = target_obj.rotation_quaternion if target_obj.rotation_mode == 'QUATERNION' else target_obj.rotation_euler.to_quaternion()
-                        target_obj.rotation_quaternion = current_quat @ delta_euler.to_quaternion()
-                        target_obj.rotation_mode = 'QUATERNION'
-                        max_offset_step = settings.tumble_offset_xy_max_step
-                        local_offset = Vector((random.uniform(-max_offset_step, max_offset_step), random.uniform(-max_offset_step, max_offset_step), 0.0))
-                        global_offset = target_obj.matrix_world.to_3x3() @ local_offset
-                        target_obj.location += global_offset
-
-                    obj_dims = target_obj.dimensions if target_obj.dimensions.length > 0.001 else Vector((0.1,0.1,0.1))
-                    ray_origin_offset_factor = 0.1
-                    ray_origin_z_offset_local = obj_dims.z * ray_origin_offset_factor
-                    ray_origin_up_vector_world = target_obj.matrix_world.to_3x3() @ Vector((0,0,1))
-
-                    ray_origin = target_obj.matrix_world.translation - ray_origin_up_vector_world * (obj_dims.z * 0.5 - ray_origin_z_offset_local)
-                    ray_direction = -ray_origin_up_vector_world.normalized()
-
-                    max_ray_dist = settings.drop_anim_speed_step + obj_dims.z * (1 + ray_origin_offset_factor) + abs(settings.landing_z_correction) + 0.1
-
-                    hit_collision, loc_collision, norm_collision, hit_obj_for_collision = self.mouse_raycast(
-                        context, settings, 0, 0, use_custom_ray=True, custom_origin=ray_origin, custom_direction=ray_direction,
-                        max_distance_override=max_ray_dist, ignore_object_for_raycast=target_obj
-                    )
-
-                    if hit_collision and loc_collision:
-                        if hit_obj_for_collision in currently_falling_obj_refs and hit_obj_for_collision != target_obj:
-                            target_obj.location.z -= settings.drop_anim_speed_step
-                        else:
-                            self._create_scatter_debug_empty_at(context, loc_collision, f"{target_obj.name}_HitP_S{f_obj_wrapper.current_step}", f_obj_wrapper)
-
-                            matrix_world_no_loc_fall = target_obj.matrix_world.copy()
-                            matrix_world_no_loc_fall.translation = Vector((0,0,0))
-                            min_z_local_space_fall = 0.0
-                            if target_obj.bound_box:
-                                local_bbox_corners_rot_scaled_fall = [matrix_world_no_loc_fall @ Vector(corner) for corner in target_obj.bound_box]
-                                if local_bbox_corners_rot_scaled_fall:
-                                    min_z_local_space_fall = min(c.z for c in local_bbox_corners_rot_scaled_fall)
-
-                            target_obj_pivot_z_on_surface = loc_collision.z - min_z_local_space_fall
-
-                            final_pivot_location_fall = loc_collision.copy()
-                            final_pivot_location_fall.z = target_obj_pivot_z_on_surface + settings.landing_z_correction
-
-                            if settings.use_scatter_on_scatter and settings.snap_to_center_on_stack and \
-                               hit_obj_for_collision and hit_obj_for_collision.name in bpy.data.objects and \
-                               ((hasattr(hit_obj_for_collision, 'rigid_body') and hit_obj_for_collision.rigid_body and hit_obj_for_collision.rigid_body.type == 'ACTIVE') or \
-                                (self._session_source_collection and self._session_source_collection.name in bpy.data.collections and hit_obj_for_collision.name.startswith(self._session_source_collection.name))):
-                                target_obj.location.xy = hit_obj_for_collision.matrix_world.translation.xy
-                                target_obj.location.z = final_pivot_location_fall.z
-                            else:
-                                target_obj.location = final_pivot_location_fall
-
-                            has_landed_this_frame = True
-                    else:
-                        target_obj.location.z -= settings.drop_anim_speed_step
-
-                if has_landed_this_frame:
-                    f_obj_wrapper.landed = True
-                    if target_obj.animation_data: target_obj.animation_data_clear()
-
-                f_obj_wrapper.current_step +=1
+                # Noch nicht gelandete Objekte gibt es nur als GPU-Proxy (oben); hier ist nichts mehr zu animieren
+                f_obj_wrapper.landed = True
 
             except ReferenceError as e_ref_fall:
                 log_scatter_exception(e_ref_fall, f"Falling object '{f_obj_wrapper.name}' became invalid", self)
                 self.report({'WARNING'}, f"A falling object ({f_obj_wrapper.name}) became invalid. Removing.");
+                if self._proxy_overlay is not None: self._proxy_overlay.remove(f_obj_wrapper.proxy_slot)
                 self._falling_objects_data.pop(i); continue
             except Exception as e_fall:
                 log_scatter_exception(e_fall, f"Unexpected error updating falling object '{f_obj_wrapper.name}'", self)
                 self.report({'ERROR'}, f"Unexpected error in _update_falling_objects for {f_obj_wrapper.name}: {e_fall}");
+                if self._proxy_overlay is not None: self._proxy_overlay.remove(f_obj_wrapper.proxy_slot)
                 self._falling_objects_data.pop(i); continue
 
-    def _calculate_downhill_direction(self, surface_normal: Vector) -> Vector: # Unverändert
-        world_down = Vector((0, 0, -1))
-        downhill_on_plane = world_down - world_down.dot(surface_normal) * surface_normal
-        if downhill_on_plane.length > 0.0001:
-            return downhill_on_plane.normalized()
-        if abs(surface_normal.z) > 0.9999:
-            return Vector((random.uniform(-1,1), random.uniform(-1,1), 0.0)).normalized() if random.random() > 0.1 else Vector((0,0,0))
-        return Vector((0,0,0))
-
-    def _trigger_post_land_spawn(self, context, settings, main_landed_obj_ref): # Unverändert
+        if landed_proxies:
+            self._materialize_proxies(context, landed_proxies) # ein Batch pro Tick statt Objekten im Flug
+
+    def _roll_drop_tumble(self, settings, start_quat, scale, steps):
+        """Tumble für alle Schritte vorab würfeln: Orientierung und kumulierter XY-Versatz pro Schritt."""
+        quat = start_quat.copy(); offset = Vector((0.0, 0.0))
+        quats = [quat.copy()]; offsets = [offset.copy()]
+        tumble = settings.enable_tumble_during_drop
+        intensity = settings.tumble_rotation_intensity_factor
+        max_offset_step = settings.tumble_offset_xy_max_step
+        for _ in range(steps):
+            if tumble and random.random() < settings.tumble_frequency_during_drop:
+                delta_euler = Euler((math.radians(random.uniform(settings.rot_x_min, settings.rot_x_max) * intensity),
+                                     math.radians(random.uniform(settings.rot_y_min, settings.rot_y_max) * intensity),
+                                     math.radians(random.uniform(settings.rot_z_min, settings.rot_z_max) * intensity)), 'XYZ')
+                quat = quat @ delta_euler.to_quaternion()
+                local_offset = Vector((random.uniform(-max_offset_step, max_offset_step), random.uniform(-max_offset_step, max_offset_step), 0.0))
+                offset = offset + (Matrix.LocRotScale(None, quat, scale).to_3x3() @ local_offset).xy
+            quats.append(quat.copy()); offsets.append(offset.copy())
+        return quats, offsets
+
+    def _predict_drop_trajectory(self, context, settings, f_obj_wrapper, currently_falling_obj_refs, previous=None):
+        """
+        Landepunkt und Bahn eines Drops: ein Strahl senkrecht nach unten vom tiefsten Punkt (MeshProfile.min_z) der
+        End-Orientierung, Reichweite = restliche Schritte * drop_anim_speed_step. Fallende Objekte auf dem Weg
+        werden durchstoßen (sie landen selbst noch; ihre Landung löst die Re-Validierung aus).
+        previous: bestehende Bahn, ab deren aktuellem Tick neu vorhergesagt wird.
+        """
+        target_obj = f_obj_wrapper.obj # None bei GPU-Proxys: Start-Transform aus f_obj_wrapper.matrix
+        profile = f_obj_wrapper.profile or PROFILES.for_object(target_obj or f_obj_wrapper.source_obj)
+        f_obj_wrapper.profile = profile
+        if previous is not None:
+            trajectory = previous.remaining()
+        else:
+            if target_obj is None:
+                start_location, start_quat, scale = f_obj_wrapper.matrix.decompose()
+            else:
+                start_location = target_obj.location
+                start_quat = target_obj.rotation_quaternion.copy() if target_obj.rotation_mode == 'QUATERNION' else target_obj.rotation_euler.to_quaternion()
+                scale = target_obj.scale.copy()
+            quats, offsets = self._roll_drop_tumble(settings, start_quat, scale, max(0, f_obj_wrapper.drop_steps_total - f_obj_wrapper.current_step))
+            path_radius = profile.sphere_radius * max(abs(v) for v in scale) if profile else 0.1
+            trajectory = DropTrajectory(start_location, scale, quats, offsets, path_radius)
+
+        steps = len(trajectory.quats) - 1
+        speed = settings.drop_anim_speed_step
+        fall_budget = steps * speed
+        if profile:
+            min_z = profile.min_z(Matrix.LocRotScale(None, trajectory.quats[-1], trajectory.scale))
+            lift = max(0.001, profile.scaled_dimensions(trajectory.scale).z * 0.1)
+        else:
+            min_z, lift = 0.0, 0.01
+        final_xy = trajectory.final_xy
+        down = Vector((0.0, 0.0, -1.0))
+        origin = Vector((final_xy.x, final_xy.y, trajectory.start.z + min_z + lift))
+        remaining_dist = fall_budget + lift + abs(settings.landing_z_correction) + 0.1
+
+        hit, loc, hit_obj = False, None, None
+        for _ in range(RAYCAST_IGNORE_MAX_CONTINUATIONS):
+            hit, loc, _norm, hit_obj = self.mouse_raycast(
+                context, settings, 0, 0, use_custom_ray=True, custom_origin=origin, custom_direction=down,
+                max_distance_override=remaining_dist, ignore_object_for_raycast=target_obj)
+            if not (hit and loc):
+                hit = False; break
+            if hit_obj in currently_falling_obj_refs and hit_obj != target_obj:
+                remaining_dist -= (origin.z - loc.z) + RAYCAST_CONTINUATION_EPSILON
+                origin = loc + down * RAYCAST_CONTINUATION_EPSILON
+                hit = False
+                if remaining_dist <= 0.0: break
+                continue
+            break
+
+        if hit:
+            land_z = loc.z - min_z + settings.landing_z_correction
+            if settings.use_scatter_on_scatter and settings.snap_to_center_on_stack and \
+               hit_obj and hit_obj.name in bpy.data.objects and \
+               ((hasattr(hit_obj, 'rigid_body') and hit_obj.rigid_body and hit_obj.rigid_body.type == 'ACTIVE') or \
+                (self._session_source_collection and self._session_source_collection.name in bpy.data.collections and hit_obj.name.startswith(self._session_source_collection.name))):
+                final_xy = hit_obj.matrix_world.translation.xy
+        else:
+            land_z = trajectory.start.z - fall_budget
+        fall_distance = max(0.0, trajectory.start.z - land_z)
+        ticks = min(max(1, steps), max(1, math.ceil(fall_distance / speed))) if speed > 0.0 else max(1, steps)
+        trajectory.set_landing(land_z, final_xy, ticks, hit_location=loc if hit else None,
+                               hit_object_name=hit_obj.name if hit and hit_obj else None)
+        return trajectory
+
+    @timed("mouse_scatter.trigger_post_land_spawn", trace_args=_spawn_trace_args)
+    def _trigger_post_land_spawn(self, context, settings, main_landed_obj_ref, main_profile=None):
         if not main_landed_obj_ref or main_landed_obj_ref.name not in bpy.data.objects:
             self.report({'WARNING'}, "Main landed object for post-spawn is invalid or gone.")
             return
@@ -1569,30 +1733,15 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
         if actual_spawn_count == 0: return
         duration = settings.post_land_spawn_duration_frames
         land_pos = main_landed_obj_ref.location.copy()
+        surface_offset = settings.post_land_spawn_offset_from_surface
 
         try:
-            ray_origin_main = land_pos + Vector((0,0,0.1))
-            hit_main, _, main_land_norm, _ = self.mouse_raycast(context, settings, 0, 0,
-                                                                 use_custom_ray=True, custom_origin=ray_origin_main,
-                                                                 custom_direction=Vector((0,0,-1)), max_distance_override=0.2,
-                                                                 ignore_object_for_raycast=main_landed_obj_ref)
-            main_obj_surface_normal = main_land_norm.normalized() if hit_main and main_land_norm and main_land_norm.length > 0.001 else Vector((0,0,1))
-
-            if abs(main_obj_surface_normal.dot(Vector((0,0,1)))) > 0.99:
-                plane_x_axis = Vector((1,0,0)); plane_y_axis = Vector((0,1,0))
-            else:
-                plane_x_axis = main_obj_surface_normal.cross(Vector((0,0,1))).normalized()
-                if plane_x_axis.length < 0.01: plane_x_axis = Vector((1,0,0))
-                plane_y_axis = plane_x_axis.cross(main_obj_surface_normal).normalized()
-                if plane_y_axis.length < 0.01 : plane_y_axis = Vector((0,1,0)) if abs(plane_x_axis.dot(Vector((1,0,0)))) > 0.9 else plane_x_axis.cross(Vector((0,0,1))).normalized()
-
             min_spawn_dist_base = settings.post_land_spawn_distance_min
             max_spawn_dist_base = settings.post_land_spawn_distance_max
 
             if settings.post_land_spawn_scale_distance_by_mesh_size:
-                depsgraph = context.evaluated_depsgraph_get()
-                eval_main_landed_obj = main_landed_obj_ref.evaluated_get(depsgraph)
-                main_dims = eval_main_landed_obj.dimensions
+                main_profile = main_profile or PROFILES.for_object(main_landed_obj_ref)
+                main_dims = main_profile.scaled_dimensions(main_landed_obj_ref.scale) if main_profile else main_landed_obj_ref.dimensions
                 mesh_size_metric = max(0.01, (main_dims.x + main_dims.y) / 2.0)
                 distance_multiplier = mesh_size_metric * settings.post_land_spawn_mesh_size_influence
                 min_spawn_dist_actual = min_spawn_dist_base * distance_multiplier
@@ -1602,105 +1751,84 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
                 min_spawn_dist_actual = min_spawn_dist_base
                 max_spawn_dist_actual = max_spawn_dist_base
 
+            # Oberfläche einmal pro Burst: Streuung + Virtual Gravity (bis 1.5x) + Strahlstart (1.0) und Reichweite (2.0)
+            reach = max(abs(min_spawn_dist_actual), abs(max_spawn_dist_actual)) * 2.5 + 3.0 + abs(surface_offset)
+            if self._surface_index is None:
+                self._surface_index = SurfaceIndex()
+            surface = SurfaceTriangles.gather(context, land_pos, reach, evaluated_depsgraph(context), index=self._surface_index)
+
+            hit_main, _, main_land_norm, _ = surface.ray_cast(tuple(land_pos + Vector((0,0,0.1))), (0.0, 0.0, -1.0), 0.2,
+                                                              ignore_obj=main_landed_obj_ref)
+            main_obj_surface_normal = Vector(main_land_norm[0].tolist()) if hit_main[0] else Vector((0,0,1))
+
+            if abs(main_obj_surface_normal.dot(Vector((0,0,1)))) > 0.99:
+                plane_x_axis = Vector((1,0,0)); plane_y_axis = Vector((0,1,0))
+            else:
+                plane_x_axis = main_obj_surface_normal.cross(Vector((0,0,1))).normalized()
+                if plane_x_axis.length < 0.01: plane_x_axis = Vector((1,0,0))
+                plane_y_axis = plane_x_axis.cross(main_obj_surface_normal).normalized()
+                if plane_y_axis.length < 0.01 : plane_y_axis = Vector((0,1,0)) if abs(plane_x_axis.dot(Vector((1,0,0)))) > 0.9 else plane_x_axis.cross(Vector((0,0,1))).normalized()
+
+            # --- Alle Kinder als Arrays: Streupunkte, Oberflächentreffer, Hangabtrieb ---
+            rng = np.random.default_rng()
+            land = np.array(tuple(land_pos))
+            main_normal = np.array(tuple(main_obj_surface_normal))
+            spread_distances, spread_offsets_world = spread_offsets(actual_spawn_count, min_spawn_dist_actual, max_spawn_dist_actual,
+                                                                    tuple(plane_x_axis), tuple(plane_y_axis), rng)
+            targets_on_main_plane = land + spread_offsets_world
+            hit_spread, loc_spread, norm_spread, _ = surface.ray_cast(targets_on_main_plane + main_normal, np.broadcast_to(-main_normal, targets_on_main_plane.shape), 2.0)
+            spread_pos = np.where(hit_spread[:, None], loc_spread, targets_on_main_plane)
+            spread_normals = np.where(hit_spread[:, None], norm_spread, main_normal)
+            spread_pos += spread_normals * surface_offset
+            end_positions = spread_pos.copy()
+
+            if settings.post_land_spawn_use_virtual_gravity:
+                downhill = downhill_directions(spread_normals, rng)
+                rolling = np.linalg.norm(downhill, axis=1) > 0.01
+                if rolling.any():
+                    gravity_distances = spread_distances[rolling] * rng.uniform(0.5, 1.5, int(rolling.sum()))
+                    tentative_gravity_end = spread_pos[rolling] + downhill[rolling] * gravity_distances[:, None]
+                    rolling_normals = spread_normals[rolling]
+                    hit_gravity, loc_gravity, norm_gravity, _ = surface.ray_cast(tentative_gravity_end + rolling_normals, -rolling_normals, 2.0)
+                    end_positions[rolling] = np.where(hit_gravity[:, None], loc_gravity + norm_gravity * surface_offset, tentative_gravity_end)
+
+            # Rotation/Skalierung, Startpunkt und Rollen (gleiche Skalierung -> ein Radius für alle Kinder)
+            if settings.post_land_spawn_copy_main_obj_transform:
+                initial_scale_vec = main_landed_obj_ref.scale.copy()
+                main_quat = main_landed_obj_ref.rotation_quaternion if main_landed_obj_ref.rotation_mode == 'QUATERNION' else main_landed_obj_ref.rotation_euler.to_quaternion()
+                initial_quats = [main_quat] * actual_spawn_count
+            else:
+                initial_scale_vec = source_obj_for_spawn.scale.copy()
+                initial_quats = [Euler((0,0,angle), 'XYZ').to_quaternion() for angle in rng.uniform(0.0, 2 * math.pi, actual_spawn_count)]
+
+            source_profile = PROFILES.for_object(source_obj_for_spawn)
+            source_dims = source_profile.scaled_dimensions(source_obj_for_spawn.scale) if source_profile else source_obj_for_spawn.dimensions
+            source_z_dim = source_dims.z if source_dims.z > 0.001 else 0.1
+            spawn_pop_height = source_z_dim * initial_scale_vec.z * 0.25 + surface_offset
+            anim_start_pos_world = land_pos + main_obj_surface_normal * spawn_pop_height
+            child_dims = source_profile.scaled_dimensions(initial_scale_vec) if source_profile else Vector((0.1,0.1,0.1))
+            roll_axes, roll_radians = roll_parameters(anim_start_pos_world, end_positions, spread_normals,
+                                                      (child_dims.x + child_dims.y) / 4.0, settings.post_land_spawn_roll_revolutions)
+
+            proxy_overlay = self._get_proxy_overlay(settings)
             for i in range(actual_spawn_count):
-                new_spawned_obj_marker = None
-                try:
-                    new_spawned_obj_marker = source_obj_for_spawn.copy()
-                    if new_spawned_obj_marker.data == source_obj_for_spawn.data and source_obj_for_spawn.data:
-                        new_spawned_obj_marker.data = source_obj_for_spawn.data.copy()
-
-                    sub_count = 1; new_name_candidate = f"{main_landed_obj_ref.name}_SpawnMarker{i}"
-                    while new_name_candidate in bpy.data.objects:
-                        new_name_candidate = f"{main_landed_obj_ref.name}_SpawnMarker{i}.{sub_count:03d}"; sub_count += 1
-                    new_spawned_obj_marker.name = new_name_candidate
-
-                    for col_other in list(new_spawned_obj_marker.users_collection):
-                        col_other.objects.unlink(new_spawned_obj_marker)
-                    context.scene.collection.objects.link(new_spawned_obj_marker)
-
-                    initial_obj_rotation_quat = Quaternion()
-                    initial_scale_vec = Vector((1,1,1))
-                    if settings.post_land_spawn_copy_main_obj_transform:
-                        new_spawned_obj_marker.scale = main_landed_obj_ref.scale.copy()
-                        initial_scale_vec = main_landed_obj_ref.scale.copy()
-                        initial_obj_rotation_quat = main_landed_obj_ref.rotation_quaternion if main_landed_obj_ref.rotation_mode == 'QUATERNION' else main_landed_obj_ref.rotation_euler.to_quaternion()
-                    else:
-                        new_spawned_obj_marker.scale = source_obj_for_spawn.scale.copy()
-                        initial_scale_vec = new_spawned_obj_marker.scale.copy()
-                        initial_obj_rotation_quat = Euler((0,0,random.uniform(0, 2 * math.pi)), 'XYZ').to_quaternion()
-                    new_spawned_obj_marker.rotation_mode = 'QUATERNION'
-                    new_spawned_obj_marker.rotation_quaternion = initial_obj_rotation_quat
-
-                    current_spread_distance = random.uniform(min_spawn_dist_actual, max_spawn_dist_actual)
-                    angle = (2 * math.pi / actual_spawn_count) * i + random.uniform(-0.1, 0.1)
-                    local_offset_on_plane = Vector((math.cos(angle) * current_spread_distance, math.sin(angle) * current_spread_distance, 0))
-
-                    world_offset_on_plane = plane_x_axis * local_offset_on_plane.x + plane_y_axis * local_offset_on_plane.y
-                    initial_target_pos_on_main_plane = land_pos + world_offset_on_plane
-
-                    ray_origin_for_spawn_z = initial_target_pos_on_main_plane + main_obj_surface_normal * 1.0
-                    hit_spawn_z, hit_loc_spawn_z, hit_norm_spawn_z, _ = self.mouse_raycast(
-                        context, settings, 0, 0, use_custom_ray=True,
-                        custom_origin=ray_origin_for_spawn_z, custom_direction=-main_obj_surface_normal,
-                        max_distance_override=2.0, ignore_object_for_raycast=new_spawned_obj_marker
-                    )
-
-                    actual_spread_pos_on_surface = initial_target_pos_on_main_plane
-                    surface_normal_at_spread_point = main_obj_surface_normal
-
-                    if hit_spawn_z and hit_loc_spawn_z:
-                        actual_spread_pos_on_surface = hit_loc_spawn_z
-                        if hit_norm_spawn_z and hit_norm_spawn_z.length > 0.1:
-                            surface_normal_at_spread_point = hit_norm_spawn_z.normalized()
-
-                    actual_spread_pos_on_surface += surface_normal_at_spread_point * settings.post_land_spawn_offset_from_surface
-                    final_end_pos_world = actual_spread_pos_on_surface
-
-                    if settings.post_land_spawn_use_virtual_gravity:
-                        downhill_dir = self._calculate_downhill_direction(surface_normal_at_spread_point)
-                        if downhill_dir.length > 0.01:
-                            gravity_roll_distance_factor = random.uniform(0.5, 1.5)
-                            gravity_roll_distance = current_spread_distance * gravity_roll_distance_factor
-
-                            tentative_gravity_end_pos = actual_spread_pos_on_surface + downhill_dir * gravity_roll_distance
-
-                            ray_origin_for_gravity_z = tentative_gravity_end_pos + surface_normal_at_spread_point * 1.0
-                            hit_gravity_z, hit_loc_gravity_z, hit_norm_gravity_z, _ = self.mouse_raycast(
-                                context, settings, 0, 0, use_custom_ray=True,
-                                custom_origin=ray_origin_for_gravity_z, custom_direction=-surface_normal_at_spread_point,
-                                max_distance_override=2.0, ignore_object_for_raycast=new_spawned_obj_marker
-                            )
-                            if hit_gravity_z and hit_loc_gravity_z:
-                                final_end_pos_world = hit_loc_gravity_z + ((hit_norm_gravity_z.normalized() * settings.post_land_spawn_offset_from_surface) if hit_norm_gravity_z and hit_norm_gravity_z.length > 0.001 else Vector())
-                            else:
-                                final_end_pos_world = tentative_gravity_end_pos
-
-                    source_z_dim = source_obj_for_spawn.dimensions.z if source_obj_for_spawn.dimensions and source_obj_for_spawn.dimensions.z > 0.001 else 0.1
-                    effective_z_dim_for_pop = source_z_dim * initial_scale_vec.z
-                    spawn_pop_height = effective_z_dim_for_pop * 0.25 + settings.post_land_spawn_offset_from_surface
-                    anim_start_pos_world = land_pos + main_obj_surface_normal * spawn_pop_height
-
-                    spawn_wrapper = PostLandSpawnObject(
-                        obj_ref=new_spawned_obj_marker,
-                        start_pos_world=anim_start_pos_world,
-                        end_pos_world=final_end_pos_world, duration_frames=duration,
-                        settings_ref=settings, initial_orientation_quat = initial_obj_rotation_quat,
-                        surface_normal_at_spawn = surface_normal_at_spread_point,
-                        initial_scale_vector = initial_scale_vec,
-                        source_mesh_name_for_processing=source_obj_for_spawn.data.name
-                    )
-                    self._post_land_spawn_objects.append(spawn_wrapper)
-                except ReferenceError as e_ref_spawn_item:
-                    log_scatter_exception(e_ref_spawn_item, f"Source object for spawn item {i} became invalid", self)
-                    self.report({'WARNING'}, "Source object for spawn became invalid during copy.")
-                    if new_spawned_obj_marker and new_spawned_obj_marker.name in bpy.data.objects: bpy.data.objects.remove(new_spawned_obj_marker, do_unlink=True)
-                    continue
-                except Exception as e_spawn_item:
-                    log_scatter_exception(e_spawn_item, f"Creating spawn object item {i}", self)
-                    self.report({'ERROR'}, f"Error creating a spawn object: {e_spawn_item}")
-                    if new_spawned_obj_marker and new_spawned_obj_marker.name in bpy.data.objects: bpy.data.objects.remove(new_spawned_obj_marker, do_unlink=True)
-                    continue
-            if actual_spawn_count > 0: context.view_layer.update()
+                spawn_wrapper = PostLandSpawnObject(
+                    obj_ref=None,
+                    start_pos_world=anim_start_pos_world,
+                    end_pos_world=Vector(end_positions[i].tolist()), duration_frames=duration,
+                    settings_ref=settings, initial_orientation_quat=initial_quats[i],
+                    surface_normal_at_spawn=Vector(spread_normals[i].tolist()),
+                    initial_scale_vector=initial_scale_vec,
+                    source_mesh_name_for_processing=source_obj_for_spawn.data.name,
+                    profile=source_profile, source_obj=source_obj_for_spawn,
+                    name_base=f"{main_landed_obj_ref.name}_SpawnMarker{i}",
+                    roll=(Vector(roll_axes[i].tolist()), float(roll_radians[i]))
+                )
+                spawn_wrapper.proxy_slot = proxy_overlay.add(source_obj_for_spawn, spawn_wrapper.matrix)
+                self._post_land_spawn_objects.append(spawn_wrapper)
+        except ReferenceError as e_ref_spawn:
+            log_scatter_exception(e_ref_spawn, "Source or landed object for post-land spawn became invalid", self)
+            self.report({'WARNING'}, "Source object for spawn became invalid.")
         except Exception as e_trigger_spawn_outer:
             log_scatter_exception(e_trigger_spawn_outer, "Outer _trigger_post_land_spawn logic", self)
             self.report({'ERROR'}, f"General error in _trigger_post_land_spawn: {e_trigger_spawn_outer}")
@@ -1708,16 +1836,33 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
     def _update_post_land_spawn_animations(self, context, settings): # Unverändert
         if not self._post_land_spawn_objects: return False
         needs_redraw_for_spawn_anim = False
+        # GPU-Proxys: nur Matrizen fortschreiben; fertige Animationen werden gesammelt als Objekte angelegt
+        finished_proxies = []
+        for spawn_wrapper in self._post_land_spawn_objects:
+            if spawn_wrapper.obj is not None or spawn_wrapper.proxy_slot is None:
+                continue
+            if spawn_wrapper.update():
+                finished_proxies.append(spawn_wrapper)
+            else:
+                if self._proxy_overlay is not None:
+                    self._proxy_overlay.update(spawn_wrapper.proxy_slot, spawn_wrapper.matrix)
+                needs_redraw_for_spawn_anim = True
+        if finished_proxies:
+            self._materialize_proxies(context, finished_proxies)
+            needs_redraw_for_spawn_anim = True
+
         for i in range(len(self._post_land_spawn_objects) - 1, -1, -1):
             spawn_wrapper = self._post_land_spawn_objects[i]
             try:
                 marker_obj_spawn = spawn_wrapper.obj
+                if marker_obj_spawn is None and spawn_wrapper.proxy_slot is not None:
+                    continue # noch in der Luft
                 if not marker_obj_spawn or marker_obj_spawn.name not in bpy.data.objects:
                     self._post_land_spawn_objects.pop(i); continue
 
                 if spawn_wrapper.update():
                     cpp_processing_settings_spawn = self._get_processing_settings_for_cpp(context)
-                    if cpp_processing_settings_spawn and NATIVE_MODULE_AVAILABLE and scatter_accel:
+                    if cpp_processing_settings_spawn and KERNELS.available(KERNEL_ANALYZE_SINGLE):
                         if not spawn_wrapper.source_mesh_name_for_processing:
                             self.report({'WARNING'}, f"Missing source_mesh_name_for_processing for spawned object {marker_obj_spawn.name}.")
                             if marker_obj_spawn.name in bpy.data.objects: bpy.data.objects.remove(marker_obj_spawn, do_unlink=True)
@@ -1729,7 +1874,7 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
                             "matrix_world": [list(row) for row in marker_obj_spawn.matrix_world],
                         }
                         try:
-                            instruction_spawn = scatter_accel.analyze_single_object_for_processing(single_object_data_spawn_cpp, cpp_processing_settings_spawn)
+                            instruction_spawn = KERNELS.call(KERNEL_ANALYZE_SINGLE, single_object_data_spawn_cpp, cpp_processing_settings_spawn)
                             action_spawn = instruction_spawn.get("action")
 
                             if action_spawn == "CREATE_INSTANCE_FROM_SOURCE":
@@ -1740,29 +1885,19 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
                                     if marker_obj_spawn.name in bpy.data.objects: bpy.data.objects.remove(marker_obj_spawn, do_unlink=True)
                                     self._post_land_spawn_objects.pop(i); continue
 
-                                inst_base_name_s = instruction_spawn.get("new_instance_name_base", f"{marker_obj_spawn.name}_spawn_inst")
-                                final_inst_name_s = inst_base_name_s; i_inst_s = 0
-                                while final_inst_name_s in bpy.data.objects:
-                                    i_inst_s +=1; final_inst_name_s = f"{inst_base_name_s}.{i_inst_s:03d}"
-
-                                new_inst_spawn = bpy.data.objects.new(name=final_inst_name_s, object_data=mesh_data_inst_spawn)
-                                new_inst_spawn.matrix_world = Matrix(instruction_spawn.get("matrix_world"))
-
-                                target_col_name_s = instruction_spawn.get("target_collection_name")
-                                target_col_s = get_or_create_scatter_target_collection(target_col_name_s, context)
-                                if target_col_s: target_col_s.objects.link(new_inst_spawn)
-                                else: context.scene.collection.objects.link(new_inst_spawn)
-
-                                if marker_obj_spawn.name in bpy.data.objects: bpy.data.objects.remove(marker_obj_spawn, do_unlink=True)
+                                new_inst_spawn = self._instantiate_from_cpp_instruction(
+                                    context, instruction_spawn, mesh_data_inst_spawn,
+                                    f"{marker_obj_spawn.name}_spawn_inst", marker_obj=marker_obj_spawn)
+                                if new_inst_spawn and marker_obj_spawn.name in bpy.data.objects: bpy.data.objects.remove(marker_obj_spawn, do_unlink=True)
 
                             elif action_spawn == "CONVERT_MARKER_TO_STATIC_RIGID" or action_spawn == "CONVERT_MARKER_TO_STATIC":
                                 target_col_name_st = instruction_spawn.get("target_collection_name")
                                 target_col_st = get_or_create_scatter_target_collection(target_col_name_st, context)
 
                                 if marker_obj_spawn.name in context.scene.collection.objects:
-                                    context.scene.collection.objects.unlink(marker_obj_spawn)
-                                if target_col_st: target_col_st.objects.link(marker_obj_spawn)
-                                else: context.scene.collection.objects.link(marker_obj_spawn)
+                                    transaction_unlink(marker_obj_spawn, context.scene.collection)
+                                if target_col_st: transaction_link(marker_obj_spawn, target_col_st)
+                                else: transaction_link(marker_obj_spawn, context.scene.collection)
 
                                 if instruction_spawn.get("add_rigidbody", False):
                                     self._apply_rigid_body_to_object(context, marker_obj_spawn)
@@ -1782,10 +1917,10 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
                             marker_obj_spawn["is_scatter_instance"] = True
 
                         if marker_obj_spawn.name in context.scene.collection.objects:
-                            context.scene.collection.objects.unlink(marker_obj_spawn)
+                            transaction_unlink(marker_obj_spawn, context.scene.collection)
                         if self._session_source_collection and self._session_source_collection.name in bpy.data.collections:
-                            self._session_source_collection.objects.link(marker_obj_spawn)
-                        else: context.scene.collection.objects.link(marker_obj_spawn)
+                            transaction_link(marker_obj_spawn, self._session_source_collection)
+                        else: transaction_link(marker_obj_spawn, context.scene.collection)
 
                     self._post_land_spawn_objects.pop(i)
                 else:
@@ -1805,6 +1940,7 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
         settings = context.scene.mouse_scatter_settings
         self._mouse_x = event.mouse_region_x; self._mouse_y = event.mouse_region_y
         self._is_dragging = False; self._last_placed_loc = None; self._last_action_time = 0.0
+        sync_perf_trace_settings(settings)
         self._last_overlap_report_time = 0.0
         self._falling_objects_data.clear(); self._post_land_spawn_objects.clear()
         self._cleanup_scatter_debug_objects(context)
@@ -1841,6 +1977,7 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
         self._session_source_collection = get_or_create_scatter_target_collection(session_col_name, context, parent_collection_obj=parent_for_session_col)
         if not self._session_source_collection:
             self.report({'ERROR'}, f"Could not create Session Source Collection '{session_col_name}' (for fallback)."); return {'CANCELLED'}
+        self._point_buffer = create_point_buffer_if_enabled(im_settings)
 
         if not settings.scatter_objects_list or not any(entry.obj for entry in settings.scatter_objects_list):
             self.report({'ERROR'}, "No scatter objects defined in the list."); return {'CANCELLED'}
@@ -1898,12 +2035,20 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
             self.report({'ERROR'}, "Error initializing modal operator.")
             self._cleanup_and_finish_for_error(context); return {'CANCELLED'}
 
-        processing_mode_report = "On-the-fly processing" if NATIVE_MODULE_AVAILABLE and scatter_accel else "Fallback (marker) processing"
+        processing_mode_report = (f"On-the-fly processing ({KERNELS.selected_backend(KERNEL_ANALYZE_SINGLE)})"
+                                  if KERNELS.available(KERNEL_ANALYZE_SINGLE) else "Fallback (marker) processing")
         self.report({'INFO'}, f"Mouse Scatter '{settings.placement_mode}' mode started. ({processing_mode_report})")
         self.report({'INFO'}, "Left-click to place/drop. ESC/RMB to exit.")
         return {'RUNNING_MODAL'}
 
-    def modal(self, context, event): # Task 5 & 6 & 7 angepasst
+    def modal(self, context, event):
+        # Alle Links/Unlinks/Updates eines Events (Klick, Brush-Tick, TIMER) werden gesammelt
+        # und einmal committet -> eine Depsgraph-Auswertung pro Event statt pro Objekt
+        # Kein Decorator: Blender prüft die Argumentanzahl von modal()
+        with timed_section("mouse_scatter.modal", event=event.type, value=event.value), PlacementTransaction(context):
+            return self._modal_impl(context, event)
+
+    def _modal_impl(self, context, event): # Task 5 & 6 & 7 angepasst
         settings = context.scene.mouse_scatter_settings
         try: # State checks
             if self._session_source_collection and self._session_source_collection.name not in bpy.data.collections:
@@ -1956,19 +2101,15 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
                                 # Berechnung der Ghost-Transformationsmatrix
                                 rand_rot_euler_rad = None
                                 rand_scale_uniform = 1.0
-                                if NATIVE_MODULE_AVAILABLE and scatter_accel:
-                                    try:
-                                        transform_data = scatter_accel.calculate_random_transforms_cpp(self._get_random_transform_settings_dict(settings))
-                                        rot_values = transform_data["rotation_euler_rad"]
-                                        rand_rot_euler_rad = Euler(rot_values, 'XYZ') if isinstance(rot_values, tuple) and len(rot_values) == 3 else None
-                                        rand_scale_uniform = float(transform_data["scale_uniform"])
-                                    except Exception: rand_rot_euler_rad = None
-                                if not rand_rot_euler_rad: # Python Fallback
-                                    rot_x_rad_py = math.radians(random.uniform(settings.rot_x_min, settings.rot_x_max))
-                                    rot_y_rad_py = math.radians(random.uniform(settings.rot_y_min, settings.rot_y_max))
-                                    rot_z_rad_py = math.radians(random.uniform(settings.rot_z_min, settings.rot_z_max))
-                                    rand_rot_euler_rad = Euler((rot_x_rad_py, rot_y_rad_py, rot_z_rad_py), 'XYZ')
-                                    rand_scale_uniform = random.uniform(settings.scale_min, settings.scale_max)
+                                try:
+                                    transform_data = KERNELS.call(KERNEL_RANDOM_TRANSFORMS, self._get_random_transform_settings_dict(settings))
+                                    rot_values = transform_data["rotation_euler_rad"]
+                                    rand_rot_euler_rad = Euler(rot_values, 'XYZ') if isinstance(rot_values, tuple) and len(rot_values) == 3 else None
+                                    rand_scale_uniform = float(transform_data["scale_uniform"])
+                                except Exception: rand_rot_euler_rad = None
+                                if not rand_rot_euler_rad:
+                                    rand_rot_euler_rad = Euler((0.0, 0.0, 0.0), 'XYZ')
+                                    rand_scale_uniform = 1.0
 
                                 scale_matrix = Matrix.Scale(rand_scale_uniform, 4)
                                 placement_normal_vec = (normal.normalized() if normal and normal.length > 0.001 else Vector((0.0, 0.0, 1.0)))
@@ -2034,8 +2175,8 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
                             new_loc = self.place_object(context, settings, self._mouse_x, self._mouse_y)
                             if new_loc: self._last_placed_loc = new_loc; action_taken_in_brush_drag = True
                         elif settings.placement_mode == 'ANIMATED_DROP_DIRECT' and self._drop_marker_drawer and self._drop_marker_drawer.get_is_visible():
-                            new_dropped_obj_marker = self._start_animated_drop_object(context, settings, self._mouse_x, self._mouse_y)
-                            if new_dropped_obj_marker: self._last_placed_loc = new_dropped_obj_marker.location.copy(); action_taken_in_brush_drag = True
+                            new_drop_loc = self._start_animated_drop_object(context, settings, self._mouse_x, self._mouse_y)
+                            if new_drop_loc is not None: self._last_placed_loc = new_drop_loc; action_taken_in_brush_drag = True
 
                         if action_taken_in_brush_drag:
                             self._last_action_time = current_time
@@ -2065,9 +2206,9 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
                         elif settings.placement_mode == 'ANIMATED_DROP_DIRECT':
                             if settings.use_brush_mode: self._is_dragging = True; self._last_action_time = 0
                             if self._drop_marker_drawer and self._drop_marker_drawer.get_is_visible(): # Nur wenn Marker sichtbar
-                                new_dropped_obj_marker = self._start_animated_drop_object(context, settings, self._mouse_x, self._mouse_y)
-                                if new_dropped_obj_marker:
-                                    self._last_placed_loc = new_dropped_obj_marker.location.copy()
+                                new_drop_loc = self._start_animated_drop_object(context, settings, self._mouse_x, self._mouse_y)
+                                if new_drop_loc is not None:
+                                    self._last_placed_loc = new_drop_loc
                                     action_taken_this_click = True; self._last_action_time = current_time
 
                         redraw_needed_this_event = True
@@ -2086,6 +2227,8 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
                     self._update_falling_objects(context, settings); timer_did_something = True
                 if self._post_land_spawn_objects:
                     if self._update_post_land_spawn_animations(context, settings): timer_did_something = True
+                if self._point_buffer is not None and len(self._point_buffer):
+                    self._flush_point_buffer(context); timer_did_something = True
 
                 # Entfernt: self.update_preview(context, settings)
                 # Die GPU-Drawer werden in MOUSEMOVE aktualisiert.
@@ -2112,6 +2255,16 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
         session_col_name_at_finish = self._session_source_collection.name if self._session_source_collection and self._session_source_collection.name in bpy.data.collections else None
 
         try:
+            # Proxys in der Luft direkt auf den vorhergesagten Landepunkt und als Objekte anlegen
+            landing_proxies = [f_obj for f_obj in self._falling_objects_data if f_obj.obj is None and f_obj.proxy_slot is not None]
+            for f_obj_wrapper in landing_proxies:
+                f_obj_wrapper.landed = True
+                if f_obj_wrapper.trajectory is not None:
+                    f_obj_wrapper.trajectory.tick = f_obj_wrapper.trajectory.ticks
+                    f_obj_wrapper.trajectory.advance()
+                    f_obj_wrapper.matrix = f_obj_wrapper.trajectory.matrix
+            self._materialize_proxies(context, landing_proxies)
+
             # Finalize any falling objects
             for f_obj_wrapper in list(self._falling_objects_data):
                 marker_obj_falling = f_obj_wrapper.obj
@@ -2125,7 +2278,7 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
 
                 if not f_obj_wrapper.processed_on_land:
                     cpp_proc_settings_finish = self._get_processing_settings_for_cpp(context)
-                    if cpp_proc_settings_finish and NATIVE_MODULE_AVAILABLE and scatter_accel:
+                    if cpp_proc_settings_finish and KERNELS.available(KERNEL_ANALYZE_SINGLE):
                         if not f_obj_wrapper.source_mesh_name_for_processing:
                             self.report({'WARNING'}, f"Missing source_mesh_name for falling obj '{marker_obj_falling.name}' in finish. Removing.")
                             if marker_obj_falling.name in bpy.data.objects: bpy.data.objects.remove(marker_obj_falling, do_unlink=True)
@@ -2137,7 +2290,7 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
                             "matrix_world": [list(row) for row in marker_obj_falling.matrix_world],
                         }
                         try:
-                            instruction_finish = scatter_accel.analyze_single_object_for_processing(data_for_cpp_finish, cpp_proc_settings_finish)
+                            instruction_finish = KERNELS.call(KERNEL_ANALYZE_SINGLE, data_for_cpp_finish, cpp_proc_settings_finish)
                             action_finish = instruction_finish.get("action")
                             original_marker_name_cpp = instruction_finish.get("original_marker_name")
                             marker_to_process_finish = bpy.data.objects.get(original_marker_name_cpp)
@@ -2154,29 +2307,22 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
                                     if marker_to_process_finish.name in bpy.data.objects: bpy.data.objects.remove(marker_to_process_finish, do_unlink=True)
                                     continue
 
-                                inst_base_f = instruction_finish.get("new_instance_name_base", f"{marker_to_process_finish.name}_finish_inst")
-                                final_inst_name_f = inst_base_f; idx_f = 0
-                                while final_inst_name_f in bpy.data.objects:
-                                    idx_f += 1; final_inst_name_f = f"{inst_base_f}.{idx_f:03d}"
-
-                                new_inst_f = bpy.data.objects.new(name=final_inst_name_f, object_data=mesh_data_inst_f)
-                                new_inst_f.matrix_world = Matrix(instruction_finish.get("matrix_world"))
-                                target_col_name_f = instruction_finish.get("target_collection_name")
-                                target_col_f = get_or_create_scatter_target_collection(target_col_name_f, context)
-                                if target_col_f: target_col_f.objects.link(new_inst_f)
-                                else: context.scene.collection.objects.link(new_inst_f)
-                                if marker_to_process_finish.name in bpy.data.objects: bpy.data.objects.remove(marker_to_process_finish, do_unlink=True)
-                                marker_obj_falling = new_inst_f # Update ref for potential post-spawn
+                                new_inst_f = self._instantiate_from_cpp_instruction(
+                                    context, instruction_finish, mesh_data_inst_f,
+                                    f"{marker_to_process_finish.name}_finish_inst", marker_obj=marker_to_process_finish)
+                                if new_inst_f:
+                                    if marker_to_process_finish.name in bpy.data.objects: bpy.data.objects.remove(marker_to_process_finish, do_unlink=True)
+                                    marker_obj_falling = new_inst_f # Update ref for potential post-spawn
 
                             elif action_finish == "CONVERT_MARKER_TO_STATIC_RIGID" or action_finish == "CONVERT_MARKER_TO_STATIC":
                                 target_col_name_f_s = instruction_finish.get("target_collection_name")
                                 target_col_f_s = get_or_create_scatter_target_collection(target_col_name_f_s, context)
                                 if marker_to_process_finish.name in context.scene.collection.objects:
-                                     context.scene.collection.objects.unlink(marker_to_process_finish)
-                                if target_col_f_s: target_col_f_s.objects.link(marker_to_process_finish)
+                                     transaction_unlink(marker_to_process_finish, context.scene.collection)
+                                if target_col_f_s: transaction_link(marker_to_process_finish, target_col_f_s)
                                 else:
                                     if marker_to_process_finish.name not in context.scene.collection.objects:
-                                        context.scene.collection.objects.link(marker_to_process_finish)
+                                        transaction_link(marker_to_process_finish, context.scene.collection)
                                 if instruction_finish.get("add_rigidbody", False):
                                     self._apply_rigid_body_to_object(context, marker_to_process_finish)
 
@@ -2192,32 +2338,31 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
                         if im_settings_finish_f: use_legacy_mark_f = im_settings_finish_f.use_instancing
                         if use_legacy_mark_f: marker_obj_falling["is_scatter_instance"] = True
                         if marker_obj_falling.name in context.scene.collection.objects:
-                            context.scene.collection.objects.unlink(marker_obj_falling)
-                        if self._session_source_collection: self._session_source_collection.objects.link(marker_obj_falling)
-                        else: context.scene.collection.objects.link(marker_obj_falling)
+                            transaction_unlink(marker_obj_falling, context.scene.collection)
+                        if self._session_source_collection: transaction_link(marker_obj_falling, self._session_source_collection)
+                        else: transaction_link(marker_obj_falling, context.scene.collection)
                     f_obj_wrapper.processed_on_land = True
 
                 if marker_obj_falling and marker_obj_falling.name in bpy.data.objects: # Check if object still exists
                     if scatter_settings.use_post_land_spawn and not f_obj_wrapper.spawn_triggered:
-                        self._trigger_post_land_spawn(context, scatter_settings, marker_obj_falling)
+                        self._trigger_post_land_spawn(context, scatter_settings, marker_obj_falling, main_profile=f_obj_wrapper.profile)
                         f_obj_wrapper.spawn_triggered = True
             self._falling_objects_data.clear()
 
-            # Finalize any post-land spawn animations
+            # Finalize any post-land spawn animations (Proxys springen auf ihre Endpose)
+            spawn_proxies = [spawn for spawn in self._post_land_spawn_objects if spawn.obj is None and spawn.proxy_slot is not None]
+            for spawn_wrapper in spawn_proxies:
+                spawn_wrapper.finish_pose()
+            self._materialize_proxies(context, spawn_proxies)
             for spawn_wrapper in list(self._post_land_spawn_objects):
                 marker_obj_spawn = spawn_wrapper.obj
                 if not marker_obj_spawn or marker_obj_spawn.name not in bpy.data.objects:
                     continue
                 if not spawn_wrapper.animation_done:
-                    marker_obj_spawn.location = spawn_wrapper.end_pos_world
-                    if spawn_wrapper.total_roll_radians > 0.001 and spawn_wrapper.roll_axis_world.length > 0.5:
-                        final_roll_quat = Quaternion(spawn_wrapper.roll_axis_world, spawn_wrapper.total_roll_radians)
-                        marker_obj_spawn.rotation_quaternion = final_roll_quat @ spawn_wrapper.initial_orientation_quat
-                    if marker_obj_spawn.animation_data:
-                        marker_obj_spawn.animation_data_clear()
+                    spawn_wrapper.finish_pose()
 
                 cpp_proc_settings_spawn_finish = self._get_processing_settings_for_cpp(context)
-                if cpp_proc_settings_spawn_finish and NATIVE_MODULE_AVAILABLE and scatter_accel:
+                if cpp_proc_settings_spawn_finish and KERNELS.available(KERNEL_ANALYZE_SINGLE):
                     if not spawn_wrapper.source_mesh_name_for_processing:
                         self.report({'WARNING'}, f"Missing source_mesh_name for spawned obj '{marker_obj_spawn.name}' in finish. Removing.")
                         if marker_obj_spawn.name in bpy.data.objects: bpy.data.objects.remove(marker_obj_spawn, do_unlink=True)
@@ -2229,7 +2374,7 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
                         "matrix_world": [list(row) for row in marker_obj_spawn.matrix_world],
                     }
                     try:
-                        instruction_spawn_f = scatter_accel.analyze_single_object_for_processing(data_for_cpp_spawn_finish, cpp_proc_settings_spawn_finish)
+                        instruction_spawn_f = KERNELS.call(KERNEL_ANALYZE_SINGLE, data_for_cpp_spawn_finish, cpp_proc_settings_spawn_finish)
                         action_spawn_f = instruction_spawn_f.get("action")
                         original_marker_name_spawn_cpp = instruction_spawn_f.get("original_marker_name")
                         marker_to_process_spawn_finish = bpy.data.objects.get(original_marker_name_spawn_cpp)
@@ -2246,28 +2391,20 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
                                 if marker_to_process_spawn_finish.name in bpy.data.objects: bpy.data.objects.remove(marker_to_process_spawn_finish, do_unlink=True)
                                 continue
 
-                            inst_base_sf = instruction_spawn_f.get("new_instance_name_base", f"{marker_to_process_spawn_finish.name}_finish_inst")
-                            final_inst_name_sf = inst_base_sf; idx_sf = 0
-                            while final_inst_name_sf in bpy.data.objects:
-                                idx_sf += 1; final_inst_name_sf = f"{inst_base_sf}.{idx_sf:03d}"
-
-                            new_inst_sf = bpy.data.objects.new(name=final_inst_name_sf, object_data=mesh_data_inst_sf)
-                            new_inst_sf.matrix_world = Matrix(instruction_spawn_f.get("matrix_world"))
-                            target_col_name_sf = instruction_spawn_f.get("target_collection_name")
-                            target_col_sf = get_or_create_scatter_target_collection(target_col_name_sf, context)
-                            if target_col_sf: target_col_sf.objects.link(new_inst_sf)
-                            else: context.scene.collection.objects.link(new_inst_sf)
-                            if marker_to_process_spawn_finish.name in bpy.data.objects: bpy.data.objects.remove(marker_to_process_spawn_finish, do_unlink=True)
+                            new_inst_sf = self._instantiate_from_cpp_instruction(
+                                context, instruction_spawn_f, mesh_data_inst_sf,
+                                f"{marker_to_process_spawn_finish.name}_finish_inst", marker_obj=marker_to_process_spawn_finish)
+                            if new_inst_sf and marker_to_process_spawn_finish.name in bpy.data.objects: bpy.data.objects.remove(marker_to_process_spawn_finish, do_unlink=True)
 
                         elif action_spawn_f == "CONVERT_MARKER_TO_STATIC_RIGID" or action_spawn_f == "CONVERT_MARKER_TO_STATIC":
                             target_col_name_sf_s = instruction_spawn_f.get("target_collection_name")
                             target_col_sf_s = get_or_create_scatter_target_collection(target_col_name_sf_s, context)
                             if marker_to_process_spawn_finish.name in context.scene.collection.objects:
-                                context.scene.collection.objects.unlink(marker_to_process_spawn_finish)
-                            if target_col_sf_s: target_col_sf_s.objects.link(marker_to_process_spawn_finish)
+                                transaction_unlink(marker_to_process_spawn_finish, context.scene.collection)
+                            if target_col_sf_s: transaction_link(marker_to_process_spawn_finish, target_col_sf_s)
                             else:
                                 if marker_to_process_spawn_finish.name not in context.scene.collection.objects:
-                                    context.scene.collection.objects.link(marker_to_process_spawn_finish)
+                                    transaction_link(marker_to_process_spawn_finish, context.scene.collection)
                             if instruction_spawn_f.get("add_rigidbody", False):
                                 self._apply_rigid_body_to_object(context, marker_to_process_spawn_finish)
 
@@ -2283,10 +2420,12 @@ class OBJECT_OT_mouse_scatter(bpy.types.Operator):
                     if im_settings_finish_s: use_legacy_mark_s = im_settings_finish_s.use_instancing
                     if use_legacy_mark_s: marker_obj_spawn["is_scatter_instance"] = True
                     if marker_obj_spawn.name in context.scene.collection.objects:
-                        context.scene.collection.objects.unlink(marker_obj_spawn)
-                    if self._session_source_collection: self._session_source_collection.objects.link(marker_obj_spawn)
-                    else: context.scene.collection.objects.link(marker_obj_spawn)
+                        transaction_unlink(marker_obj_spawn, context.scene.collection)
+                    if self._session_source_collection: transaction_link(marker_obj_spawn, self._session_source_collection)
+                    else: transaction_link(marker_obj_spawn, context.scene.collection)
             self._post_land_spawn_objects.clear()
+            # Ausstehende Links der Marker-Schleifen jetzt ausführen: das Instancing unten liest fallback_collection.all_objects
+            sync_pending_changes(context)
 
             self._cleanup_and_finish_for_error(context) # Task 4: Cleanup Drawer auch hier
 
@@ -2491,7 +2630,10 @@ class VIEW3D_PT_mouse_scatter(bpy.types.Panel):
                 box_objects.prop(active_entry, "obj", text="Selected")
             layout.separator()
 
-            if NATIVE_MODULE_AVAILABLE and scatter_accel:
+            self._draw_perf_readout(layout, settings)
+
+            # draw() löst kein Laden aus: vor dem ersten Gebrauch wird der Test-Button immer angeboten
+            if not is_native_resolved() or (NATIVE_MODULE_AVAILABLE and scatter_accel):
                  layout.operator(SCATTER_OT_test_native_module.bl_idname, text="Test Native Module (Scatter)", icon='CONSOLE')
             else:
                  layout.label(text="Native module (Scatter) not available for testing.", icon='ERROR')
@@ -2504,6 +2646,101 @@ class VIEW3D_PT_mouse_scatter(bpy.types.Panel):
             log_scatter_exception(e_draw, "Drawing Scatter UI Panel", operator_instance=self, level="CRITICAL")
             layout.label(text="Error drawing panel!", icon='ERROR')
 
+    @staticmethod
+    def _draw_perf_readout(layout, settings):
+        box_perf = layout.box()
+        row_header = box_perf.row(align=True)
+        row_header.prop(settings, "show_perf_readout", icon='TRIA_DOWN' if settings.show_perf_readout else 'TRIA_RIGHT', emboss=False)
+        row_header.prop(settings, "enable_perf_timing", text="", icon='REC')
+        if not settings.show_perf_readout:
+            return
+        rows = TIMING_REGISTRY.rows()
+        if not rows:
+            box_perf.label(text="Noch keine Messwerte.", icon='INFO')
+        else:
+            grid = box_perf.grid_flow(row_major=True, columns=5, even_columns=False, align=True)
+            for header in ("Hot Path", "n", "p50 ms", "p95 ms", "max ms"):
+                grid.label(text=header)
+            for row in rows[:PERF_READOUT_MAX_ROWS]:
+                grid.label(text=row["name"])
+                grid.label(text=str(row["count"]))
+                grid.label(text=f"{row['p50_ms']:.3f}")
+                grid.label(text=f"{row['p95_ms']:.3f}")
+                grid.label(text=f"{row['max_ms']:.3f}")
+            if len(rows) > PERF_READOUT_MAX_ROWS:
+                box_perf.label(text=f"... {len(rows) - PERF_READOUT_MAX_ROWS} weitere (JSON-Dump)")
+        row_ops = box_perf.row(align=True)
+        row_ops.operator(SCATTER_OT_dump_perf_timings.bl_idname, text="Dump JSON", icon='TEXT')
+        row_ops.operator(SCATTER_OT_reset_perf_timings.bl_idname, text="Reset", icon='LOOP_BACK')
+
+        box_trace = box_perf.box()
+        row_trace = box_trace.row(align=True)
+        row_trace.prop(settings, "enable_perf_trace", icon='REC')
+        row_trace.prop(settings, "perf_trace_capacity", text="Buffer")
+        status = f"{len(TRACER):,} Ereignisse"
+        if TRACER.dropped:
+            status += f" ({TRACER.dropped:,} überschrieben)"
+        box_trace.label(text=status, icon='TIME')
+        row_trace_ops = box_trace.row(align=True)
+        row_trace_ops.operator(SCATTER_OT_export_perf_trace.bl_idname, text="Export Trace", icon='EXPORT')
+        row_trace_ops.operator(SCATTER_OT_clear_perf_trace.bl_idname, text="Clear", icon='TRASH')
+
+# --- Operators: Performance-Readout ---
+class SCATTER_OT_dump_perf_timings(bpy.types.Operator):
+    bl_idname = "scatter.dump_perf_timings"
+    bl_label = "Dump Performance Timings"
+    bl_description = "Writes all hot-path timings as JSON into a text datablock"
+
+    def execute(self, context):
+        text = bpy.data.texts.get(PERF_TIMINGS_TEXT_NAME) or bpy.data.texts.new(PERF_TIMINGS_TEXT_NAME)
+        text.clear()
+        text.write(TIMING_REGISTRY.to_json())
+        self.report({'INFO'}, f"{len(TIMING_REGISTRY.histograms)} Hot Paths nach Text '{PERF_TIMINGS_TEXT_NAME}' geschrieben.")
+        return {'FINISHED'}
+
+class SCATTER_OT_reset_perf_timings(bpy.types.Operator):
+    bl_idname = "scatter.reset_perf_timings"
+    bl_label = "Reset Performance Timings"
+    bl_description = "Clears all recorded hot-path timings"
+
+    def execute(self, context):
+        TIMING_REGISTRY.reset()
+        for area in context.screen.areas if context.screen else ():
+            if area.type == 'VIEW_3D': area.tag_redraw()
+        return {'FINISHED'}
+
+class SCATTER_OT_export_perf_trace(bpy.types.Operator, ExportHelper):
+    bl_idname = "scatter.export_perf_trace"
+    bl_label = "Export Performance Trace"
+    bl_description = "Writes the recorded timeline as Chrome Trace / Perfetto JSON (open in ui.perfetto.dev or chrome://tracing)"
+
+    filename_ext = ".json"
+    filter_glob: StringProperty(default="*.json", options={'HIDDEN'})
+
+    def execute(self, context):
+        if not len(TRACER):
+            self.report({'WARNING'}, "Trace ist leer. 'Record Trace' aktivieren und eine Session aufnehmen.")
+            return {'CANCELLED'}
+        try:
+            exported = TRACER.write_chrome_trace(self.filepath, process_name=f"Blender {bpy.app.version_string}")
+        except OSError as e:
+            self.report({'ERROR'}, f"Trace konnte nicht geschrieben werden: {e}")
+            return {'CANCELLED'}
+        dropped_note = f" ({TRACER.dropped:,} ältere überschrieben)" if TRACER.dropped else ""
+        self.report({'INFO'}, f"{exported:,} Trace-Ereignisse nach '{self.filepath}' exportiert{dropped_note}.")
+        return {'FINISHED'}
+
+class SCATTER_OT_clear_perf_trace(bpy.types.Operator):
+    bl_idname = "scatter.clear_perf_trace"
+    bl_label = "Clear Performance Trace"
+    bl_description = "Discards all recorded trace events"
+
+    def execute(self, context):
+        TRACER.clear()
+        for area in context.screen.areas if context.screen else ():
+            if area.type == 'VIEW_3D': area.tag_redraw()
+        return {'FINISHED'}
+
 # --- UIList Class ---
 class SCATTER_UL_objects_list(bpy.types.UIList):
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
@@ -2601,7 +2838,9 @@ classes_to_register_scatter = (
     OBJECT_OT_move_scatter_object_entry, OBJECT_OT_add_selected_to_scatter_list,
     OBJECT_OT_clear_scatter_list, OBJECT_OT_apply_transforms_to_scatter_objects,
     OBJECT_OT_prepare_scatter_instances, OBJECT_OT_mouse_scatter,
-    SCATTER_UL_objects_list, VIEW3D_PT_mouse_scatter, SCATTER_OT_test_native_module
+    SCATTER_UL_objects_list, VIEW3D_PT_mouse_scatter, SCATTER_OT_test_native_module,
+    SCATTER_OT_dump_perf_timings, SCATTER_OT_reset_perf_timings,
+    SCATTER_OT_export_perf_trace, SCATTER_OT_clear_perf_trace
 )
 _registered_classes_scatter = set()
 
@@ -2673,11 +2912,18 @@ def register():
             else:
                  print(f"SCATTER_REG: WARNING - Failed to register UI/Operator class {cls.__name__}, addon might be partially non-functional.")
 
+    if _drop_path_depsgraph_update_post not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_drop_path_depsgraph_update_post)
+
     print(f"SCATTER_REG: --- Scatter Registration Complete ({len(_registered_classes_scatter)} classes actually registered by this module) ---")
 
 
 def unregister():
     global _registered_classes_scatter
+    set_perf_trace_enabled(False)
+    if _drop_path_depsgraph_update_post in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_drop_path_depsgraph_update_post)
+    DROP_PATH_WATCH.active = False; DROP_PATH_WATCH.changed.clear()
     print(f"SCATTER_UNREG: --- Starting Scatter Unregistration ({len(_registered_classes_scatter)} classes to check from this module) ---")
 
     # Remove the PointerProperty from Scene first
@@ -0,0 +1,201 @@
+# placement_transaction.py
+# Transaktionen für Platzierungen: Collection-Links/-Unlinks, Rigid-Body-Welt-Mitgliedschaft
+# und view_layer.update() werden gesammelt und beim Commit EINMAL ausgeführt.
+# Ein Brush-Strich oder ein Batch zahlt so eine Depsgraph-Auswertung statt mehrerer pro Objekt.
+import traceback
+
+from .rigidbody_bulk import bulk_add_rigid_bodies
+from .perf_timing import timed_section
+
+_txn_module_name = __name__
+
+# Stapel offener Transaktionen (verschachtelte Transaktionen werden in die äußere gefaltet)
+_active_transactions = []
+
+
+def _pending_key(obj, collection):
+    return obj.name_full, collection.name_full
+
+
+class PlacementTransaction:
+    """
+    Context Manager. Innerhalb des with-Blocks sollten Platzierungspfade
+    transaction_link / transaction_unlink / transaction_add_rigid_body /
+    request_view_layer_update statt der direkten Blender-Aufrufe verwenden.
+    """
+
+    def __init__(self, context):
+        self.context = context
+        # (obj.name_full, collection.name_full) -> (obj, collection); dicts behalten die Aufrufreihenfolge
+        # und machen unlink()/is_linked() O(1) statt eines linearen Scans pro Aufruf
+        self._pending_links = {}
+        self._pending_unlinks = {}
+        self._pending_rigid_bodies = {}  # obj.name -> (obj, settings dict | None)
+        self._update_requested = False
+        self._outer = None
+
+    # --- Context Manager ---
+    def __enter__(self):
+        self._outer = _active_transactions[-1] if _active_transactions else None
+        _active_transactions.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        if _active_transactions and _active_transactions[-1] is self:
+            _active_transactions.pop()
+        if self._outer is not None:
+            self._outer._absorb(self)
+        else:
+            self.commit()
+        return False
+
+    @staticmethod
+    def current():
+        return _active_transactions[-1] if _active_transactions else None
+
+    def _absorb(self, inner):
+        self._pending_links.update(inner._pending_links)
+        self._pending_unlinks.update(inner._pending_unlinks)
+        self._pending_rigid_bodies.update(inner._pending_rigid_bodies)
+        self._update_requested = self._update_requested or inner._update_requested
+
+    # --- Deferrable Operations ---
+    def link(self, obj, collection):
+        self._pending_links[_pending_key(obj, collection)] = (obj, collection)
+
+    def unlink(self, obj, collection):
+        # Ein noch ausstehender Link wird einfach verworfen, statt Link+Unlink auszuführen
+        key = _pending_key(obj, collection)
+        if self._pending_links.pop(key, None) is None:
+            self._pending_unlinks[key] = (obj, collection)
+
+    def is_linked(self, obj, collection):
+        """Berücksichtigt ausstehende Links/Unlinks beim Prüfen der Mitgliedschaft."""
+        key = _pending_key(obj, collection)
+        if key in self._pending_links:
+            return True
+        if key in self._pending_unlinks:
+            return False
+        try:
+            return obj.name in collection.objects
+        except ReferenceError:
+            return False
+
+    def add_rigid_body(self, obj, rb_settings=None):
+        self._pending_rigid_bodies[obj.name] = (obj, rb_settings)
+
+    def request_update(self):
+        self._update_requested = True
+
+    def sync(self):
+        """Führt ausstehende Änderungen sofort aus (z.B. vor Raycasts/BVH auf neuen Objekten)."""
+        if self._pending_links or self._pending_unlinks or self._pending_rigid_bodies or self._update_requested:
+            self.commit()
+
+    # --- Commit ---
+    def commit(self):
+        context = self.context
+        links, unlinks = list(self._pending_links.values()), list(self._pending_unlinks.values())
+        rigid_bodies = list(self._pending_rigid_bodies.values())
+        needs_update = self._update_requested or bool(links) or bool(unlinks) or bool(rigid_bodies)
+        self._pending_links, self._pending_unlinks = {}, {}
+        self._pending_rigid_bodies = {}
+        self._update_requested = False
+        with timed_section("placement_transaction.commit", links=len(links), unlinks=len(unlinks),
+                           rigid_bodies=len(rigid_bodies)):
+            self._apply(context, links, unlinks, rigid_bodies, needs_update)
+
+    @staticmethod
+    def _apply(context, links, unlinks, rigid_bodies, needs_update):
+        for obj, collection in unlinks:
+            try:
+                if obj.name in collection.objects:
+                    collection.objects.unlink(obj)
+            except (ReferenceError, RuntimeError):
+                pass  # Objekt/Collection wurde inzwischen entfernt
+
+        for obj, collection in links:
+            try:
+                if obj.name not in collection.objects:
+                    collection.objects.link(obj)
+            except (ReferenceError, RuntimeError):
+                pass
+
+        if rigid_bodies:
+            _commit_rigid_bodies(context, rigid_bodies)
+
+        if needs_update:
+            try:
+                update_view_layer(context)
+            except Exception as e:
+                print(f"WARNUNG [{_txn_module_name}]: view_layer.update() beim Commit fehlgeschlagen: {e}")
+
+
+def _commit_rigid_bodies(context, rigid_bodies):
+    # Nach Settings gruppieren, damit jede Gruppe einen einzigen Bulk-Aufruf bekommt
+    groups = {}
+    for obj, rb_settings in rigid_bodies:
+        key = tuple(sorted(rb_settings.items())) if rb_settings else ()
+        groups.setdefault(key, (rb_settings, []))[1].append(obj)
+    for rb_settings, objects in groups.values():
+        bulk_add_rigid_bodies(context, objects, rb_settings)
+
+
+def update_view_layer(context):
+    """view_layer.update() als Depsgraph-Span in perf_timing/perf_trace."""
+    with timed_section("depsgraph.view_layer_update"):
+        context.view_layer.update()
+
+
+# --- Modulfunktionen: arbeiten mit UND ohne offene Transaktion ---
+def transaction_link(obj, collection):
+    txn = PlacementTransaction.current()
+    if txn is not None:
+        txn.link(obj, collection)
+    elif obj.name not in collection.objects:
+        collection.objects.link(obj)
+
+
+def transaction_unlink(obj, collection):
+    txn = PlacementTransaction.current()
+    if txn is not None:
+        txn.unlink(obj, collection)
+    elif obj.name in collection.objects:
+        collection.objects.unlink(obj)
+
+
+def transaction_is_linked(obj, collection):
+    txn = PlacementTransaction.current()
+    if txn is not None:
+        return txn.is_linked(obj, collection)
+    return obj.name in collection.objects
+
+
+def transaction_add_rigid_body(context, obj, rb_settings=None):
+    txn = PlacementTransaction.current()
+    if txn is not None:
+        txn.add_rigid_body(obj, rb_settings)
+    else:
+        _commit_rigid_bodies(context, [(obj, rb_settings)])
+
+
+def request_view_layer_update(context):
+    txn = PlacementTransaction.current()
+    if txn is not None:
+        txn.request_update()
+    else:
+        update_view_layer(context)
+
+
+def sync_pending_changes(context):
+    """Für Stellen, die sofort einen ausgewerteten Zustand brauchen (BVH, dimensions, ray_cast auf neuen Objekten)."""
+    if _active_transactions:
+        try:
+            # Äußere zuerst, damit auch deren ausstehende Links ausgewertet werden
+            for txn in list(_active_transactions):
+                txn.sync()
+        except Exception as e:
+            print(f"FEHLER [{_txn_module_name}]: Sync der Transaktion fehlgeschlagen: {e}")
+            traceback.print_exc()
+    else:
+        update_view_layer(context)
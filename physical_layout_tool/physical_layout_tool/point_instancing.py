@@ -0,0 +1,441 @@
+# point_instancing.py
+# Alternatives Ausgabe-Backend: Alle Platzierungen einer Session landen als Punkt-Attribute
+# auf EINEM Mesh-Objekt, ein generiertes Geometry-Nodes "Instance on Points" Setup
+# instanziert daraus die Quell-Meshes. Physik-relevante Teilmengen werden explizit
+# über realize_points_to_objects() wieder zu echten Objekten.
+# Der Punkt-Träger hat keine Polygone: der BVH-Overlap-Check (prevent_overlap) sieht frühere Punkt-Platzierungen
+# daher nicht als Hindernis; Overlap-Vermeidung gilt im Punkt-Backend nur gegenüber echten Objekten.
+import re
+import bpy
+import numpy as np
+import traceback
+from mathutils import Matrix
+
+_points_module_name = __name__
+
+POINTS_ATTR_ROTATION = "scatter_rotation"        # QUATERNION (w, x, y, z)
+POINTS_ATTR_SCALE = "scatter_scale"              # FLOAT_VECTOR
+POINTS_ATTR_SOURCE_INDEX = "scatter_source_index" # INT, Index in die Source-Library
+POINTS_SOURCES_PROP = "scatter_point_sources"    # Custom Property: Proxy-Namen in Index-Reihenfolge
+
+SOURCE_LIBRARY_COLLECTION_NAME = "ScatterTool_SourceLibrary"
+POINTS_NODE_GROUP_NAME = "SCATTER_InstanceOnPoints"
+POINTS_MODIFIER_NAME = "ScatterPointsInstancer"
+SOURCE_PROXY_SUFFIX = "_PointSrc"
+
+
+# --- Vektorisierte Matrix-Zerlegung ---
+def decompose_matrices_np(matrices: np.ndarray):
+    """
+    Zerlegt (N,4,4) Welt-Matrizen (zeilenweise wie mathutils.Matrix) in
+    Positionen (N,3), Quaternionen (N,4; w,x,y,z) und Skalierungen (N,3).
+    """
+    matrices = np.asarray(matrices, dtype=np.float64).reshape(-1, 4, 4)
+    positions = matrices[:, :3, 3].astype(np.float32)
+    basis = matrices[:, :3, :3]
+    scales = np.linalg.norm(basis, axis=1)
+    safe_scales = np.where(scales > 1e-12, scales, 1.0)
+    rot = basis / safe_scales[:, None, :]
+    return positions, rotation_matrices_to_quaternions_np(rot).astype(np.float32), scales.astype(np.float32)
+
+
+def rotation_matrices_to_quaternions_np(rot: np.ndarray) -> np.ndarray:
+    """(N,3,3) orthonormale Rotationsmatrizen -> (N,4) Quaternionen (w,x,y,z)."""
+    rot = np.asarray(rot, dtype=np.float64).reshape(-1, 3, 3)
+    m00, m01, m02 = rot[:, 0, 0], rot[:, 0, 1], rot[:, 0, 2]
+    m10, m11, m12 = rot[:, 1, 0], rot[:, 1, 1], rot[:, 1, 2]
+    m20, m21, m22 = rot[:, 2, 0], rot[:, 2, 1], rot[:, 2, 2]
+    trace = m00 + m11 + m22
+
+    quats = np.empty((rot.shape[0], 4), dtype=np.float64)
+
+    # Shepperd: pro Zeile den numerisch stabilsten Zweig wählen
+    c0 = trace > 0.0
+    c1 = ~c0 & (m00 > m11) & (m00 > m22)
+    c2 = ~c0 & ~c1 & (m11 > m22)
+    c3 = ~c0 & ~c1 & ~c2
+
+    s = np.sqrt(np.maximum(trace[c0] + 1.0, 1e-12)) * 2.0
+    quats[c0] = np.stack([0.25 * s, (m21[c0] - m12[c0]) / s, (m02[c0] - m20[c0]) / s, (m10[c0] - m01[c0]) / s], axis=1)
+    s = np.sqrt(np.maximum(1.0 + m00[c1] - m11[c1] - m22[c1], 1e-12)) * 2.0
+    quats[c1] = np.stack([(m21[c1] - m12[c1]) / s, 0.25 * s, (m01[c1] + m10[c1]) / s, (m02[c1] + m20[c1]) / s], axis=1)
+    s = np.sqrt(np.maximum(1.0 + m11[c2] - m00[c2] - m22[c2], 1e-12)) * 2.0
+    quats[c2] = np.stack([(m02[c2] - m20[c2]) / s, (m01[c2] + m10[c2]) / s, 0.25 * s, (m12[c2] + m21[c2]) / s], axis=1)
+    s = np.sqrt(np.maximum(1.0 + m22[c3] - m00[c3] - m11[c3], 1e-12)) * 2.0
+    quats[c3] = np.stack([(m10[c3] - m01[c3]) / s, (m02[c3] + m20[c3]) / s, (m12[c3] + m21[c3]) / s, 0.25 * s], axis=1)
+
+    norms = np.linalg.norm(quats, axis=1, keepdims=True)
+    return quats / np.where(norms > 1e-12, norms, 1.0)
+
+
+def compose_matrices_np(positions: np.ndarray, quats: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    """Umkehrung von decompose_matrices_np: liefert (N,4,4) float64 Matrizen."""
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    q = np.asarray(quats, dtype=np.float64).reshape(-1, 4)
+    scales = np.asarray(scales, dtype=np.float64).reshape(-1, 3)
+    w, x, y, z = q[:, 0], q[:, 1], q[:, 2], q[:, 3]
+
+    rot = np.empty((q.shape[0], 3, 3), dtype=np.float64)
+    rot[:, 0, 0] = 1 - 2 * (y * y + z * z); rot[:, 0, 1] = 2 * (x * y - z * w); rot[:, 0, 2] = 2 * (x * z + y * w)
+    rot[:, 1, 0] = 2 * (x * y + z * w); rot[:, 1, 1] = 1 - 2 * (x * x + z * z); rot[:, 1, 2] = 2 * (y * z - x * w)
+    rot[:, 2, 0] = 2 * (x * z - y * w); rot[:, 2, 1] = 2 * (y * z + x * w); rot[:, 2, 2] = 1 - 2 * (x * x + y * y)
+
+    matrices = np.zeros((q.shape[0], 4, 4), dtype=np.float64)
+    matrices[:, :3, :3] = rot * scales[:, None, :]
+    matrices[:, :3, 3] = positions
+    matrices[:, 3, 3] = 1.0
+    return matrices
+
+
+# --- Source-Library (Proxy-Objekte je Quell-Mesh) ---
+def get_or_create_source_library(context):
+    library = bpy.data.collections.get(SOURCE_LIBRARY_COLLECTION_NAME)
+    if library is None:
+        library = bpy.data.collections.new(SOURCE_LIBRARY_COLLECTION_NAME)
+        context.scene.collection.children.link(library)
+        # Die Proxies liegen im Ursprung und sollen nur über Geometry Nodes sichtbar sein
+        layer_col = _find_layer_collection(context.view_layer.layer_collection, library.name)
+        if layer_col:
+            layer_col.exclude = True
+        print(f"INFO [{_points_module_name}]: Source-Library '{library.name}' erstellt.")
+    return library
+
+
+def _find_layer_collection(layer_collection, collection_name):
+    if layer_collection.collection.name == collection_name:
+        return layer_collection
+    for child in layer_collection.children:
+        found = _find_layer_collection(child, collection_name)
+        if found:
+            return found
+    return None
+
+
+def get_or_create_source_proxy(mesh, library):
+    for obj in library.objects:
+        if obj.data == mesh:
+            return obj
+    proxy = bpy.data.objects.new(name=f"{mesh.name}{SOURCE_PROXY_SUFFIX}", object_data=mesh)
+    library.objects.link(proxy)
+    return proxy
+
+
+_NATURAL_TOKEN = re.compile(r"\d+|.", re.DOTALL)
+_NATURAL_DIGIT_RANK = ord("0") # Ziffernfolge gegen Zeichen: verglichen wird die erste Ziffer, also wie "0".."9"
+
+
+def natural_sort_key(name):
+    """
+    Sortierschlüssel wie BLI_strcasecmp_natural (Reihenfolge der Collection-Info-Kinder): ohne Groß-/Klein-
+    schreibung, Ziffernfolgen als Zahlen ("rock" < "Rock2" < "Rock10"), "." vor allen anderen Zeichen,
+    kürzere Namen zuerst. Bei Gleichstand ("Rock"/"rock", "a01"/"a1") entscheidet der Rohname (strcmp).
+    """
+    tokens = []
+    for token in _NATURAL_TOKEN.findall(name.casefold()):
+        if token.isdigit():
+            tokens.append((_NATURAL_DIGIT_RANK, int(token)))
+        else:
+            tokens.append((-1 if token == "." else ord(token), 0))
+    return tuple(tokens), name
+
+
+def library_source_order(library):
+    # Collection Info mit "Separate Children" liefert die Kinder natürlich sortiert (BLI_strcasecmp_natural)
+    return sorted((obj.name for obj in library.objects), key=natural_sort_key)
+
+
+# --- Punkt-Objekt und Geometry-Nodes Setup ---
+def get_or_create_points_object(context, object_name, target_collection=None):
+    points_obj = bpy.data.objects.get(object_name)
+    if points_obj and points_obj.type == 'MESH':
+        return points_obj
+    if points_obj:
+        print(f"WARNUNG [{_points_module_name}]: '{object_name}' existiert, ist aber kein Mesh. Neues Punkt-Objekt wird angelegt.")
+    mesh = bpy.data.meshes.new(f"{object_name}_Mesh")
+    points_obj = bpy.data.objects.new(object_name, mesh)
+    points_obj[POINTS_SOURCES_PROP] = []
+    (target_collection or context.scene.collection).objects.link(points_obj)
+    return points_obj
+
+
+def ensure_instance_on_points_node_group(library):
+    node_group = bpy.data.node_groups.get(POINTS_NODE_GROUP_NAME)
+    if node_group and node_group.bl_idname == 'GeometryNodeTree':
+        collection_info = next((n for n in node_group.nodes if n.bl_idname == 'GeometryNodeCollectionInfo'), None)
+        if collection_info:
+            collection_info.inputs['Collection'].default_value = library
+            return node_group
+
+    node_group = bpy.data.node_groups.new(POINTS_NODE_GROUP_NAME, 'GeometryNodeTree')
+    node_group.interface.new_socket("Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+    node_group.interface.new_socket("Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+    nodes, links = node_group.nodes, node_group.links
+
+    group_in = nodes.new('NodeGroupInput'); group_in.location = (-600, 0)
+    group_out = nodes.new('NodeGroupOutput'); group_out.location = (400, 0)
+
+    collection_info = nodes.new('GeometryNodeCollectionInfo'); collection_info.location = (-400, -200)
+    collection_info.transform_space = 'ORIGINAL'
+    collection_info.inputs['Collection'].default_value = library
+    collection_info.inputs['Separate Children'].default_value = True
+    collection_info.inputs['Reset Children'].default_value = True
+
+    def named_attribute(name, data_type, y):
+        node = nodes.new('GeometryNodeInputNamedAttribute')
+        node.data_type = data_type
+        node.inputs['Name'].default_value = name
+        node.location = (-400, y)
+        return node
+
+    attr_index = named_attribute(POINTS_ATTR_SOURCE_INDEX, 'INT', -400)
+    attr_rotation = named_attribute(POINTS_ATTR_ROTATION, 'QUATERNION', -550)
+    attr_scale = named_attribute(POINTS_ATTR_SCALE, 'FLOAT_VECTOR', -700)
+
+    instance_on_points = nodes.new('GeometryNodeInstanceOnPoints'); instance_on_points.location = (100, 0)
+    instance_on_points.inputs['Pick Instance'].default_value = True
+
+    links.new(group_in.outputs[0], instance_on_points.inputs['Points'])
+    links.new(collection_info.outputs['Instances'], instance_on_points.inputs['Instance'])
+    links.new(attr_index.outputs['Attribute'], instance_on_points.inputs['Instance Index'])
+    links.new(attr_rotation.outputs['Attribute'], instance_on_points.inputs['Rotation'])
+    links.new(attr_scale.outputs['Attribute'], instance_on_points.inputs['Scale'])
+    links.new(instance_on_points.outputs['Instances'], group_out.inputs[0])
+    return node_group
+
+
+def ensure_points_modifier(points_obj, library):
+    node_group = ensure_instance_on_points_node_group(library)
+    modifier = points_obj.modifiers.get(POINTS_MODIFIER_NAME)
+    if modifier is None or modifier.type != 'NODES':
+        modifier = points_obj.modifiers.new(POINTS_MODIFIER_NAME, 'NODES')
+    if modifier.node_group != node_group:
+        modifier.node_group = node_group
+    return modifier
+
+
+# --- Bulk-Lesen/Schreiben der Punkt-Attribute ---
+def _ensure_point_attribute(mesh, name, data_type):
+    attr = mesh.attributes.get(name)
+    if attr is not None and (attr.data_type != data_type or attr.domain != 'POINT'):
+        mesh.attributes.remove(attr)
+        attr = None
+    if attr is None:
+        attr = mesh.attributes.new(name=name, type=data_type, domain='POINT')
+    return attr
+
+
+def read_point_arrays(points_obj):
+    """Liest alle Platzierungen als NumPy-Arrays: positions, quats, scales, source_indices."""
+    mesh = points_obj.data
+    count = len(mesh.vertices)
+    positions = np.empty(count * 3, dtype=np.float32)
+    quats = np.zeros(count * 4, dtype=np.float32)
+    scales = np.ones(count * 3, dtype=np.float32)
+    indices = np.zeros(count, dtype=np.int32)
+    if count:
+        mesh.vertices.foreach_get("co", positions)
+        attr = mesh.attributes.get(POINTS_ATTR_ROTATION)
+        if attr: attr.data.foreach_get("value", quats)
+        else: quats.reshape(-1, 4)[:, 0] = 1.0
+        attr = mesh.attributes.get(POINTS_ATTR_SCALE)
+        if attr: attr.data.foreach_get("vector", scales)
+        attr = mesh.attributes.get(POINTS_ATTR_SOURCE_INDEX)
+        if attr: attr.data.foreach_get("value", indices)
+    return positions.reshape(-1, 3), quats.reshape(-1, 4), scales.reshape(-1, 3), indices
+
+
+def write_point_arrays(points_obj, positions, quats, scales, source_indices):
+    """Ersetzt die komplette Punktgeometrie in einem Schritt (foreach_set je Attribut)."""
+    mesh = points_obj.data
+    count = len(source_indices)
+    mesh.clear_geometry()
+    if count:
+        mesh.vertices.add(count)
+        mesh.vertices.foreach_set("co", np.ascontiguousarray(positions, dtype=np.float32).ravel())
+    _ensure_point_attribute(mesh, POINTS_ATTR_ROTATION, 'QUATERNION').data.foreach_set(
+        "value", np.ascontiguousarray(quats, dtype=np.float32).ravel())
+    _ensure_point_attribute(mesh, POINTS_ATTR_SCALE, 'FLOAT_VECTOR').data.foreach_set(
+        "vector", np.ascontiguousarray(scales, dtype=np.float32).ravel())
+    _ensure_point_attribute(mesh, POINTS_ATTR_SOURCE_INDEX, 'INT').data.foreach_set(
+        "value", np.ascontiguousarray(source_indices, dtype=np.int32).ravel())
+    mesh.update()
+
+
+APPEND_ELEMENTWISE_MAX = 256 # bis hierhin werden neue Punkte einzeln gesetzt, darüber per foreach_set
+# Ein Punkt einzeln (4 RNA-Zuweisungen) kostet grob so viel wie ~50 Punkte im foreach_set-Neuschreiben
+APPEND_REWRITE_RATIO = 50
+
+
+def append_point_arrays(points_obj, positions, quats, scales, source_indices):
+    """
+    Hängt Punkte an, ohne den Bestand zu lesen oder zu löschen: vertices.add() verlängert auch die
+    Punkt-Attribute, geschrieben wird nur das neue Ende. Ein Flush kostet so O(neue Punkte) statt O(alle).
+    foreach_set kennt keine Teilbereiche: einzeln geschrieben werden nur kleine Blöcke (Timer-Flushes) auf
+    großen Trägern, sonst werden die ganzen Arrays neu geschrieben.
+    """
+    count = len(source_indices)
+    if not count:
+        return
+    mesh = points_obj.data
+    start = len(mesh.vertices)
+    for name, data_type in ((POINTS_ATTR_ROTATION, 'QUATERNION'), (POINTS_ATTR_SCALE, 'FLOAT_VECTOR'),
+                            (POINTS_ATTR_SOURCE_INDEX, 'INT')):
+        _ensure_point_attribute(mesh, name, data_type)
+    positions = np.ascontiguousarray(positions, dtype=np.float32).reshape(-1, 3)
+    quats = np.ascontiguousarray(quats, dtype=np.float32).reshape(-1, 4)
+    scales = np.ascontiguousarray(scales, dtype=np.float32).reshape(-1, 3)
+    source_indices = np.ascontiguousarray(source_indices, dtype=np.int32).ravel()
+    if count > APPEND_ELEMENTWISE_MAX or count * APPEND_REWRITE_RATIO > start:
+        old_pos, old_quat, old_scale, old_idx = read_point_arrays(points_obj)
+        mesh.vertices.add(count)
+        mesh.vertices.foreach_set("co", np.concatenate([old_pos, positions]).ravel())
+        mesh.attributes[POINTS_ATTR_ROTATION].data.foreach_set("value", np.concatenate([old_quat, quats]).ravel())
+        mesh.attributes[POINTS_ATTR_SCALE].data.foreach_set("vector", np.concatenate([old_scale, scales]).ravel())
+        mesh.attributes[POINTS_ATTR_SOURCE_INDEX].data.foreach_set("value", np.concatenate([old_idx, source_indices]))
+    else:
+        mesh.vertices.add(count)
+        # Attribut-Referenzen erst nach add() holen (die Punktdaten wurden neu angelegt)
+        vertices = mesh.vertices
+        rotation_data = mesh.attributes[POINTS_ATTR_ROTATION].data
+        scale_data = mesh.attributes[POINTS_ATTR_SCALE].data
+        index_data = mesh.attributes[POINTS_ATTR_SOURCE_INDEX].data
+        for offset in range(count):
+            i = start + offset
+            vertices[i].co = positions[offset]
+            rotation_data[i].value = quats[offset]
+            scale_data[i].vector = scales[offset]
+            index_data[i].value = int(source_indices[offset])
+    mesh.update()
+
+
+def _sync_source_order(points_obj, library):
+    """
+    Neue Proxies verschieben die (natürlich sortierte) Reihenfolge der Collection-Info-Kinder.
+    Nur dann werden die bestehenden Indizes über die gespeicherte Namensliste neu gemappt.
+    """
+    new_order = library_source_order(library)
+    old_order = list(points_obj.get(POINTS_SOURCES_PROP, []))
+    mesh = points_obj.data
+    attr = mesh.attributes.get(POINTS_ATTR_SOURCE_INDEX)
+    if old_order != new_order and attr is not None and len(mesh.vertices):
+        lookup = {name: i for i, name in enumerate(new_order)}
+        remap = np.array([lookup.get(name, 0) for name in old_order] or [0], dtype=np.int32)
+        source_indices = np.empty(len(mesh.vertices), dtype=np.int32)
+        attr.data.foreach_get("value", source_indices)
+        attr.data.foreach_set("value", remap[np.clip(source_indices, 0, len(remap) - 1)])
+    points_obj[POINTS_SOURCES_PROP] = new_order
+    return new_order
+
+
+class ScatterPointBuffer:
+    """
+    Sammelt Platzierungen (Matrix + Quell-Mesh) und schreibt sie in EINEM Bulk-Schritt
+    auf das Punkt-Objekt. Ersetzt im Punkt-Backend das bpy.data.objects.new pro Item.
+    """
+    def __init__(self, points_object_name):
+        self.points_object_name = points_object_name
+        self._matrices = []
+        self._mesh_names = []
+        self._marker_names = []
+
+    def __len__(self):
+        return len(self._matrices)
+
+    def add(self, matrix_world, mesh_name, marker_name=None):
+        """marker_name: optionales Objekt, das entfernt wird, sobald seine Zeile geschrieben ist."""
+        self._matrices.append(np.asarray(matrix_world, dtype=np.float64).reshape(4, 4))
+        self._mesh_names.append(mesh_name)
+        self._marker_names.append(marker_name) # parallel zu _matrices (None: kein Marker)
+
+    def clear(self):
+        self._matrices.clear()
+        self._mesh_names.clear()
+        self._marker_names.clear()
+
+    def _remove_markers(self, written):
+        """Entfernt nur die Marker geschriebener Zeilen (written: bool-Maske); die übrigen bleiben als Objekt stehen."""
+        for marker_name, was_written in zip(self._marker_names, written.tolist()):
+            if not marker_name or not was_written:
+                continue
+            marker = bpy.data.objects.get(marker_name)
+            if marker:
+                try: bpy.data.objects.remove(marker, do_unlink=True)
+                except Exception as e: print(f"WARNUNG [{_points_module_name}]: Marker '{marker_name}' nicht entfernbar: {e}")
+
+    def flush(self, context, target_collection=None):
+        """Schreibt alle gepufferten Platzierungen. Gibt die Anzahl geschriebener Punkte zurück."""
+        if not self._matrices:
+            return 0
+        try:
+            library = get_or_create_source_library(context)
+            points_obj = get_or_create_points_object(context, self.points_object_name, target_collection)
+
+            proxy_names = []
+            proxy_by_mesh = {}
+            for mesh_name in self._mesh_names:
+                if mesh_name not in proxy_by_mesh:
+                    mesh = bpy.data.meshes.get(mesh_name)
+                    proxy_by_mesh[mesh_name] = get_or_create_source_proxy(mesh, library).name if mesh else None
+                proxy_names.append(proxy_by_mesh[mesh_name])
+
+            valid = np.array([name is not None for name in proxy_names], dtype=bool)
+            if not valid.any():
+                print(f"WARNUNG [{_points_module_name}]: Keine gültigen Quell-Meshes im Puffer. Nichts geschrieben, Marker bleiben erhalten.")
+                return 0
+
+            order = _sync_source_order(points_obj, library)
+            lookup = {name: i for i, name in enumerate(order)}
+
+            new_pos, new_quat, new_scale = decompose_matrices_np(np.stack(self._matrices)[valid])
+            new_idx = np.array([lookup[name] for name in proxy_names if name is not None], dtype=np.int32)
+
+            append_point_arrays(points_obj, new_pos, new_quat, new_scale, new_idx)
+            ensure_points_modifier(points_obj, library)
+            # Erst jetzt sind die Platzierungen gesichert: Marker übersprungener Zeilen (Quell-Mesh fehlt) bleiben
+            self._remove_markers(valid)
+            written = int(valid.sum())
+            print(f"INFO [{_points_module_name}]: {written} Platzierungen auf '{points_obj.name}' geschrieben (gesamt {len(points_obj.data.vertices)}).")
+            return written
+        except Exception as e:
+            print(f"FEHLER [{_points_module_name}]: Schreiben der Punkt-Platzierungen fehlgeschlagen, Marker bleiben erhalten: {e}")
+            traceback.print_exc()
+            return 0
+        finally:
+            self.clear()
+
+
+def create_point_buffer_if_enabled(im_settings):
+    """Liefert einen ScatterPointBuffer, wenn Instancing mit Punkt-Backend aktiv ist, sonst None."""
+    if not im_settings or not im_settings.use_instancing:
+        return None
+    if getattr(im_settings, 'output_backend', 'OBJECTS') != 'POINTS':
+        return None
+    return ScatterPointBuffer(im_settings.points_object_name or "SCATTER_POINTS")
+
+
+def realize_points_to_objects(context, points_obj, point_mask, target_collection, name_suffix="_inst"):
+    """
+    Wandelt die per Maske gewählten Punkte in echte Objekte (geteilte Mesh-Daten) um
+    und entfernt sie aus dem Punkt-Objekt. Gibt die Liste der neuen Objekte zurück.
+    """
+    positions, quats, scales, indices = read_point_arrays(points_obj)
+    point_mask = np.asarray(point_mask, dtype=bool)
+    if point_mask.shape[0] != indices.shape[0] or not point_mask.any():
+        return []
+
+    order = list(points_obj.get(POINTS_SOURCES_PROP, []))
+    matrices = compose_matrices_np(positions[point_mask], quats[point_mask], scales[point_mask])
+    created = []
+    for matrix, src_index in zip(matrices, indices[point_mask]):
+        proxy = bpy.data.objects.get(order[src_index]) if 0 <= src_index < len(order) else None
+        if not proxy or not proxy.data:
+            continue
+        base_name = proxy.name[:-len(SOURCE_PROXY_SUFFIX)] if proxy.name.endswith(SOURCE_PROXY_SUFFIX) else proxy.name
+        new_obj = bpy.data.objects.new(name=f"{base_name}{name_suffix}", object_data=proxy.data)
+        new_obj.matrix_world = Matrix(matrix.tolist())
+        target_collection.objects.link(new_obj)
+        created.append(new_obj)
+
+    keep = ~point_mask
+    write_point_arrays(points_obj, positions[keep], quats[keep], scales[keep], indices[keep])
+    return created
@@ -0,0 +1,188 @@
+# progressive_freeze.py
+# Progressives Einfrieren ruhender Körper während Addon-Bakes (Frame-Hook für simulation_bake.bake_until_settled):
+# Körper, die für freeze_after_frames Frames unter den Ruhe-Schwellen liegen, werden auf "Animated" (kinematic)
+# geschaltet und kosten den Solver danach kaum noch etwas. Kommt ein bewegter Körper in ihre Bounds, werden
+# sie wieder geweckt. Umgeschaltet wird über Keyframes auf rigid_body.kinematic (ein direktes Setzen der
+# Eigenschaft würde über das RNA-Update den Rigid-Body-Cache zurücksetzen). Ereignisse landen in einem Text-Datablock.
+import bpy
+import numpy as np
+from mathutils import Matrix
+from mathutils.kdtree import KDTree
+
+from .simulation_bake import rotation_parts, matrix_deltas
+
+_freeze_module_name = __name__
+
+KINEMATIC_DATA_PATH = "rigid_body.kinematic"
+FREEZE_LOG_TEXT_NAME = "PLT_FreezeLog"
+FREEZE_ACTION_PREFIX = "PLT_Freeze_"
+
+EVENT_FREEZE = 'FREEZE'
+EVENT_WAKE = 'WAKE'
+
+
+class ProgressiveFreezer:
+    """
+    Nutzung: begin(objects, frame_start) -> on_frame(context, frame, matrices) pro Frame -> release().
+    release() entfernt alle angelegten Keyframes/Actions wieder; die eingefrorene Lage bleibt in Loc/Rot/Scale.
+    """
+
+    def __init__(self, linear_threshold, angular_threshold, freeze_after_frames=10, wake_margin=0.0):
+        self.linear_threshold = float(linear_threshold)
+        self.angular_threshold = float(angular_threshold)
+        self.freeze_after_frames = max(1, int(freeze_after_frames))
+        self.wake_margin = float(wake_margin)
+        self.events = []  # (frame, EVENT_*, object name)
+
+        self._objects = []
+        self._frame_start = 0
+        self._radii = None
+        self._calm_counts = None
+        self._frozen = None
+        self._freezable = None
+        self._previous = None
+        self._previous_rotations = None
+        self._frozen_tree = None
+        self._frozen_tree_indices = None
+        self._channels = {}  # obj.name -> (obj, fcurve, created_action, created_anim_data)
+
+    # --- Lebenszyklus ---
+    def begin(self, objects, frame_start):
+        self._objects = list(objects)
+        self._frame_start = int(frame_start)
+        count = len(self._objects)
+        # Bounding-Sphere-Radius aus den Dimensionen (inkl. Skalierung), einmal pro Bake
+        dims = np.array([obj.dimensions for obj in self._objects], dtype=np.float64).reshape(-1, 3)
+        self._radii = 0.5 * np.linalg.norm(dims, axis=1) + self.wake_margin
+        self._calm_counts = np.zeros(count, dtype=np.int32)
+        self._frozen = np.zeros(count, dtype=bool)
+        self._freezable = np.array([self._can_freeze(obj) for obj in self._objects], dtype=bool)
+        self._previous = None
+        self._previous_rotations = None
+        self._frozen_tree = None
+        self.events = []
+
+    def on_frame(self, context, frame, matrices):
+        rotations = rotation_parts(matrices)
+        if self._previous is None or len(self._previous) != len(matrices):
+            self._previous, self._previous_rotations = matrices, rotations
+            return
+
+        linear, angular = matrix_deltas(self._previous, self._previous_rotations, matrices, rotations)
+        self._previous, self._previous_rotations = matrices, rotations
+
+        calm = (linear < self.linear_threshold) & (angular < self.angular_threshold)
+        self._calm_counts = np.where(calm, self._calm_counts + 1, 0).astype(np.int32)
+
+        positions = matrices[:, :3, 3]
+        woken = self._wake_touched(frame, positions, ~self._frozen & ~calm)
+        frozen_now = self._freeze_resting(frame, matrices)
+        if woken or frozen_now:
+            print(f"INFO [{_freeze_module_name}]: Frame {frame}: {frozen_now} eingefroren, {woken} geweckt "
+                  f"({int(self._frozen.sum())}/{len(self._frozen)} gefroren).")
+
+    def release(self):
+        """Entfernt die angelegten Kinematic-Keyframes und schreibt das Ereignis-Log."""
+        for obj, fcurve, created_action, created_anim_data in self._channels.values():
+            try:
+                anim = obj.animation_data
+                action = anim.action if anim else None
+                if action is not None:
+                    action.fcurves.remove(fcurve)
+                if created_action and action is not None:
+                    anim.action = None
+                    bpy.data.actions.remove(action)
+                if created_anim_data:
+                    obj.animation_data_clear()
+            except (ReferenceError, RuntimeError) as e:
+                print(f"WARNUNG [{_freeze_module_name}]: Freeze-Keyframes konnten nicht entfernt werden: {e}")
+        self._channels = {}
+        self._write_log()
+
+    # --- Einfrieren / Wecken ---
+    @staticmethod
+    def _can_freeze(obj):
+        rb = obj.rigid_body
+        if rb is None or rb.type != 'ACTIVE' or rb.kinematic:
+            return False
+        # Vom Nutzer animiertes "Animated"-Flag nicht überschreiben
+        anim = obj.animation_data
+        if anim and anim.action and anim.action.fcurves.find(KINEMATIC_DATA_PATH):
+            return False
+        return True
+
+    def _freeze_resting(self, frame, matrices):
+        candidates = np.flatnonzero(self._freezable & ~self._frozen & (self._calm_counts >= self.freeze_after_frames))
+        if not len(candidates):
+            return 0
+        rows = matrices[candidates].tolist()
+        for i, matrix_rows in zip(candidates.tolist(), rows):
+            obj = self._objects[i]
+            # Kinematische Körper folgen Loc/Rot/Scale -> aktuelle simulierte Lage übernehmen
+            obj.matrix_world = Matrix(matrix_rows)
+            self._key_kinematic(obj, frame, True)
+            self.events.append((frame, EVENT_FREEZE, obj.name))
+        self._frozen[candidates] = True
+        self._frozen_tree = None
+        return len(candidates)
+
+    def _wake_touched(self, frame, positions, moving):
+        if not self._frozen.any() or not moving.any():
+            return 0
+        tree, tree_indices = self._frozen_lookup(positions)
+        max_frozen_radius = float(self._radii[tree_indices].max())
+        to_wake = set()
+        for j in np.flatnonzero(moving).tolist():
+            r_j = float(self._radii[j])
+            for _co, tree_index, dist in tree.find_range(positions[j].tolist(), r_j + max_frozen_radius):
+                i = int(tree_indices[tree_index])
+                if dist < r_j + float(self._radii[i]):
+                    to_wake.add(i)
+        for i in to_wake:
+            obj = self._objects[i]
+            self._key_kinematic(obj, frame, False)
+            self.events.append((frame, EVENT_WAKE, obj.name))
+            self._calm_counts[i] = 0
+        if to_wake:
+            self._frozen[list(to_wake)] = False
+            self._frozen_tree = None
+        return len(to_wake)
+
+    def _frozen_lookup(self, positions):
+        # Gefrorene Körper bewegen sich nicht -> Baum nur nach Freeze/Wake neu aufbauen
+        if self._frozen_tree is None:
+            indices = np.flatnonzero(self._frozen)
+            tree = KDTree(len(indices))
+            for tree_index, i in enumerate(indices.tolist()):
+                tree.insert(positions[i].tolist(), tree_index)
+            tree.balance()
+            self._frozen_tree, self._frozen_tree_indices = tree, indices
+        return self._frozen_tree, self._frozen_tree_indices
+
+    def _key_kinematic(self, obj, frame, value):
+        channel = self._channels.get(obj.name)
+        if channel is None:
+            created_anim_data = obj.animation_data is None
+            anim = obj.animation_data_create()
+            created_action = anim.action is None
+            if created_action:
+                anim.action = bpy.data.actions.new(FREEZE_ACTION_PREFIX + obj.name)
+            fcurve = anim.action.fcurves.new(KINEMATIC_DATA_PATH)
+            # Vor dem ersten Einfrieren dynamisch
+            key = fcurve.keyframe_points.insert(self._frame_start, 0.0, options={'FAST'})
+            key.interpolation = 'CONSTANT'
+            channel = (obj, fcurve, created_action, created_anim_data)
+            self._channels[obj.name] = channel
+        key = channel[1].keyframe_points.insert(frame, 1.0 if value else 0.0, options={'FAST'})
+        key.interpolation = 'CONSTANT'
+
+    def _write_log(self):
+        if not self.events:
+            return
+        text = bpy.data.texts.get(FREEZE_LOG_TEXT_NAME) or bpy.data.texts.new(FREEZE_LOG_TEXT_NAME)
+        text.clear()
+        text.write("frame;event;object\n")
+        text.write("".join(f"{frame};{event};{name}\n" for frame, event, name in self.events))
+        freezes = sum(1 for _f, event, _n in self.events if event == EVENT_FREEZE)
+        print(f"INFO [{_freeze_module_name}]: {freezes} Freeze- und {len(self.events) - freezes} Wake-Ereignisse "
+              f"(Details im Text '{FREEZE_LOG_TEXT_NAME}').")
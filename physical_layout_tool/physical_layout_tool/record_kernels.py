@@ -0,0 +1,66 @@
+# record_kernels.py
+# bpy-freier Kern der Record-Analyse: Layout von OBJECT_RECORD_DTYPE, die RECORD_*/RB_TYPE_*/Ergebnis-Bits
+# und die NumPy-Referenzimplementierungen der Analyzer (identische Logik wie analyze_*_records_cpp).
+# object_metadata re-exportiert alles und entscheidet zwischen nativem und NumPy-Pfad;
+# benchmarks/native_benchmarks.py lädt dieses Modul ohne Blender als Referenz.
+import numpy as np
+
+# Layout muss ScatterAccelImpl::ObjectRecord (scatter_accel_impl.hpp) entsprechen (align=True = C-Struct-Layout)
+OBJECT_RECORD_DTYPE = np.dtype([
+    ("matrix_world", np.float32, (4, 4)),
+    ("mesh_index", np.int32),        # Index in ObjectRecordSet.mesh_names, -1 ohne Mesh-Daten
+    ("users", np.int32),             # users der Mesh-Daten (0 ohne Mesh-Daten)
+    ("collection_mask", np.uint64),  # Bit i = Objekt liegt in ObjectRecordSet.collection_names[i]
+    ("flags", np.uint8),             # RECORD_*-Bits
+    ("rb_type", np.uint8),           # RB_TYPE_*
+], align=True)
+
+MAX_RECORD_COLLECTIONS = 64
+
+RECORD_IS_MESH = 1
+RECORD_HAS_RIGIDBODY = 2
+RECORD_RB_ENABLED = 4
+RECORD_RB_KINEMATIC = 8
+
+RB_TYPE_NONE = 0
+RB_TYPE_ACTIVE = 1
+RB_TYPE_PASSIVE = 2
+
+# Ergebnis-Bits der Analyzer (identisch in scatter_accel.cpp)
+BAKE_NEEDS_SINGLE_USER = 1
+BAKE_REMOVE_RIGIDBODY = 2
+BAKE_MOVE_COLLECTION = 4
+BAKE_SKIP = 8
+
+RB_SETUP_NEEDS_SINGLE_USER = 1
+RB_SETUP_HAS_COMPONENT = 2
+RB_SETUP_SKIP = 8
+
+
+def analyze_static_bake_records_np(records, static_collection_mask):
+    """NumPy-Referenz zu analyze_static_bake_records_cpp: BAKE_*-Bits pro Record (uint8-Array)."""
+    static_collection_mask = np.uint64(static_collection_mask)
+    flags = records["flags"]
+    masks = records["collection_mask"]
+    result = np.zeros(len(records), dtype=np.uint8)
+    result[records["users"] > 1] |= BAKE_NEEDS_SINGLE_USER
+    result[(flags & RECORD_HAS_RIGIDBODY) != 0] |= BAKE_REMOVE_RIGIDBODY
+    in_other = (masks & ~static_collection_mask) != 0
+    in_static = (masks & static_collection_mask) != 0
+    result[in_other | ~in_static] |= BAKE_MOVE_COLLECTION
+    result[(flags & RECORD_IS_MESH) == 0] = BAKE_SKIP
+    return result
+
+
+def analyze_rb_setup_records_np(records, managed_collection_mask=0):
+    """NumPy-Referenz zu analyze_rb_setup_records_cpp: RB_SETUP_*-Bits pro Record (uint8-Array)."""
+    managed_collection_mask = np.uint64(managed_collection_mask)
+    flags = records["flags"]
+    result = np.zeros(len(records), dtype=np.uint8)
+    shared = records["users"] > 1
+    if managed_collection_mask:
+        shared &= (records["collection_mask"] & managed_collection_mask) != 0
+    result[shared] |= RB_SETUP_NEEDS_SINGLE_USER
+    result[(flags & RECORD_HAS_RIGIDBODY) != 0] |= RB_SETUP_HAS_COMPONENT
+    result[(flags & RECORD_IS_MESH) == 0] = RB_SETUP_SKIP
+    return result
@@ -0,0 +1,217 @@
+# rigidbody_bulk.py
+# Operator-freies Rigid-Body-Setup für viele Objekte auf einmal:
+# Objekte werden direkt in die Collection der Rigid Body World gelinkt (Blender legt dabei die
+# rigid_body-Komponente an), danach EIN view_layer.update() und die Settings in einem Durchgang
+# (C++ configure_batch_rigidbody_properties_cpp, sonst Python).
+# Ersetzt die Sequenz Deselect -> Select -> ops.rigidbody.object_add() -> update -> Auswahl zurück pro Objekt.
+import bpy
+import traceback
+
+from .selection_utils import objects_override
+
+from .kernel_backends import KERNELS, KERNEL_CONFIGURE_RIGID_BODIES
+
+_rb_bulk_module_name = __name__
+
+RIGIDBODY_WORLD_COLLECTION_NAME = "RigidBodyWorld"
+
+# Schlüssel, die configure_batch_rigidbody_properties_cpp setzt (fehlende Schlüssel bekommen dort C++-Defaults)
+_NATIVE_RB_KEYS = frozenset((
+    "type", "kinematic", "enabled", "use_start_deactivated", "mass", "collision_shape",
+    "collision_margin", "linear_damping", "angular_damping", "use_deactivation", "friction", "restitution",
+))
+
+
+def build_rigid_body_settings(phys_settings, rb_type='ACTIVE'):
+    """Settings-Dict wie bisher von den Operatoren einzeln gesetzt (Werte aus PhysicalToolSettings)."""
+    settings = {
+        "type": rb_type,
+        "mass": getattr(phys_settings, 'mass', 1.0),
+        "collision_shape": getattr(phys_settings, 'collision_shape', 'CONVEX_HULL'),
+        "use_margin": True,
+        "collision_margin": getattr(phys_settings, 'collision_margin', 0.001),
+        # Blender-Defaults; explizit, damit der C++-Pfad nicht seine eigenen Defaults (0.6) nimmt
+        "linear_damping": 0.04,
+        "angular_damping": 0.1,
+        "friction": 0.5,
+        "restitution": 0.0,
+        "use_deactivation": True,
+        "use_start_deactivated": False,
+    }
+    return settings
+
+
+def ensure_rigidbody_world(context):
+    """Gibt die Rigid Body World der Szene zurück (legt Welt/Collection bei Bedarf einmalig an)."""
+    scene = context.scene
+    if scene.rigidbody_world is None:
+        try:
+            bpy.ops.rigidbody.world_add()
+        except RuntimeError as e:
+            print(f"FEHLER [{_rb_bulk_module_name}]: Rigid Body World konnte nicht erstellt werden: {e}")
+            return None
+    rbw = scene.rigidbody_world
+    if rbw is not None and rbw.collection is None:
+        rbw.collection = bpy.data.collections.new(RIGIDBODY_WORLD_COLLECTION_NAME)
+    return rbw
+
+
+def make_data_single_user(objects, progress_callback=None):
+    """
+    Ersatz für ops.object.make_single_user(obdata=True): jedes Objekt bekommt eigene Mesh-Daten
+    durch direkte Datablock-Zuweisung. Gruppiert nach Quell-Mesh; sind alle Nutzer eines Meshes
+    in der Auswahl, behält das erste Objekt das Original (eine Kopie weniger pro Gruppe).
+    Transformationen bleiben unverändert (nur obj.data wird getauscht).
+    Gibt die Anzahl der umgestellten Objekte zurück.
+    """
+    groups = {}
+    for obj in objects:
+        try:
+            if obj is None or obj.data is None or obj.data.users <= 1:
+                continue
+            groups.setdefault(obj.data.name, (obj.data, []))[1].append(obj)
+        except ReferenceError:
+            continue
+
+    changed = 0
+    done_groups = 0
+    for mesh, group_objects in groups.values():
+        try:
+            other_users = mesh.users - len(group_objects) - (1 if mesh.use_fake_user else 0)
+            to_copy = group_objects[1:] if other_users <= 0 else group_objects
+            for obj in to_copy:
+                obj.data = mesh.copy()
+                changed += 1
+        except (ReferenceError, RuntimeError) as e:
+            print(f"WARNUNG [{_rb_bulk_module_name}]: Single-User für Mesh-Gruppe fehlgeschlagen: {e}")
+        done_groups += 1
+        if progress_callback:
+            progress_callback(done_groups, len(groups))
+    return changed
+
+
+def configure_rigid_bodies(objects, rb_settings):
+    """Schreibt rb_settings auf alle vorhandenen rigid_body-Komponenten. Gibt True zurück, wenn alles gesetzt wurde."""
+    if not objects or not rb_settings:
+        return True
+    all_ok = True
+    remaining_keys = rb_settings.keys()
+
+    # Nur nativ vorhanden (arbeitet über Objektnamen); ohne natives Modul setzt der Python-Durchgang unten alles
+    if KERNELS.available(KERNEL_CONFIGURE_RIGID_BODIES):
+        try:
+            names = [obj.name for obj in objects]
+            native_settings = {k: v for k, v in rb_settings.items() if k in _NATIVE_RB_KEYS}
+            all_ok = bool(KERNELS.call(KERNEL_CONFIGURE_RIGID_BODIES, names, native_settings))
+            remaining_keys = [k for k in rb_settings.keys() if k not in _NATIVE_RB_KEYS]
+        except Exception as e_native:
+            print(f"WARNUNG [{_rb_bulk_module_name}]: C++ RB-Konfiguration fehlgeschlagen, nutze Python-Pfad: {e_native}")
+            remaining_keys = rb_settings.keys()
+            all_ok = True
+
+    if not remaining_keys:
+        return all_ok
+
+    # rigid_body ist keine Collection -> kein foreach_set; ein einfacher Durchgang ohne Operatoren/Updates
+    items = [(k, rb_settings[k]) for k in remaining_keys]
+    for obj in objects:
+        try:
+            rb = obj.rigid_body
+        except ReferenceError:
+            all_ok = False
+            continue
+        if rb is None:
+            all_ok = False
+            continue
+        for key, value in items:
+            try:
+                setattr(rb, key, value)
+            except (AttributeError, TypeError, ValueError) as e:
+                print(f"WARNUNG [{_rb_bulk_module_name}]: RB-Einstellung '{key}' für '{obj.name}' nicht setzbar: {e}")
+                all_ok = False
+    return all_ok
+
+
+def bulk_add_rigid_bodies(context, objects, rb_settings=None):
+    """
+    Fügt allen Mesh-Objekten einen Rigid Body hinzu (bzw. konfiguriert vorhandene neu).
+    Ein Link pro Objekt in die RBW-Collection, ein view_layer.update(), ein Konfigurationsdurchgang.
+    Gibt die Liste der erfolgreich verarbeiteten Objekte zurück.
+    """
+    rbw = ensure_rigidbody_world(context)
+    if rbw is None or rbw.collection is None:
+        return []
+
+    rbw_objects = rbw.collection.objects
+    valid = []
+    newly_linked = False
+    for obj in objects:
+        try:
+            if obj is None or obj.type != 'MESH':
+                continue
+            if obj.name not in rbw_objects:
+                rbw_objects.link(obj)
+                newly_linked = True
+            valid.append(obj)
+        except (ReferenceError, RuntimeError) as e_link:
+            print(f"WARNUNG [{_rb_bulk_module_name}]: Objekt konnte nicht in die Rigid Body World gelinkt werden: {e_link}")
+            continue
+
+    if not valid:
+        return []
+
+    if newly_linked:
+        # Einmalige Auswertung, damit Blender die rigid_body-Komponenten anlegt
+        try:
+            context.view_layer.update()
+        except Exception as e_upd:
+            print(f"FEHLER [{_rb_bulk_module_name}]: view_layer.update() nach RBW-Link fehlgeschlagen: {e_upd}")
+            traceback.print_exc()
+
+    if rb_settings:
+        if not configure_rigid_bodies(valid, rb_settings):
+            print(f"WARNUNG [{_rb_bulk_module_name}]: Nicht alle Rigid-Body-Einstellungen konnten gesetzt werden ({len(valid)} Objekte).")
+    return [obj for obj in valid if obj.rigid_body is not None]
+
+
+def bulk_remove_rigid_bodies(context, objects):
+    """
+    Entfernt die Rigid Bodies aller Objekte ohne ops.rigidbody.object_remove pro Objekt:
+    Unlink aus der RBW-Collection, ein view_layer.update(). Objekte, die danach noch eine
+    rigid_body-Komponente haben, bekommen EINEN gemeinsamen ops.rigidbody.objects_remove-Aufruf.
+    Gibt die Anzahl der Objekte ohne Rigid Body zurück.
+    """
+    scene = context.scene
+    rbw = scene.rigidbody_world
+    with_rb = []
+    for obj in objects:
+        try:
+            if obj is not None and obj.rigid_body is not None:
+                with_rb.append(obj)
+        except ReferenceError:
+            continue
+    if not with_rb:
+        return 0
+
+    if rbw is not None and rbw.collection is not None:
+        rbw_objects = rbw.collection.objects
+        for obj in with_rb:
+            try:
+                if obj.name in rbw_objects:
+                    rbw_objects.unlink(obj)
+            except (ReferenceError, RuntimeError) as e_unlink:
+                print(f"WARNUNG [{_rb_bulk_module_name}]: Objekt konnte nicht aus der Rigid Body World entfernt werden: {e_unlink}")
+        try:
+            context.view_layer.update()
+        except Exception as e_upd:
+            print(f"FEHLER [{_rb_bulk_module_name}]: view_layer.update() nach RBW-Unlink fehlgeschlagen: {e_upd}")
+            traceback.print_exc()
+
+    remaining = [obj for obj in with_rb if obj.rigid_body is not None]
+    if remaining:
+        try:
+            with objects_override(context, remaining):
+                bpy.ops.rigidbody.objects_remove()
+        except RuntimeError as e_op:
+            print(f"WARNUNG [{_rb_bulk_module_name}]: rigidbody.objects_remove für {len(remaining)} Objekte fehlgeschlagen: {e_op}")
+    return sum(1 for obj in with_rb if obj.rigid_body is None)
@@ -4,49 +4,19 @@ import gpu
 from gpu_extras.batch import batch_for_shader
 import numpy as np
 from mathutils import Matrix, Vector, Quaternion
-import math
 import traceback # Für detailliertere Fehlermeldungen, falls nötig
 
-# --- Globale Variablen für C++ Modul und Flag (werden durch Import aus __init__.py gefüllt) ---
-scatter_accel = None
-NATIVE_MODULE_AVAILABLE = False
-# ---
+from .perf_timing import timed
+from .mesh_profile import PROFILES
+
+from .kernel_backends import KERNELS, KERNEL_MESH_GPU_DATA, KERNEL_CIRCLE_MARKER
+from .numpy_kernels import GpuVertexData
 
 _helper_module_name = __name__
 
-try:
-    from . import scatter_accel as pkg_level_scatter_accel
-    from . import NATIVE_MODULE_AVAILABLE as pkg_level_native_flag
-    scatter_accel = pkg_level_scatter_accel
-    NATIVE_MODULE_AVAILABLE = pkg_level_native_flag
-
-    if NATIVE_MODULE_AVAILABLE and scatter_accel:
-        print(f"INFO [{_helper_module_name}]: C++ Modul 'scatter_accel' und Flag 'NATIVE_MODULE_AVAILABLE' erfolgreich vom Paket-Scope bezogen.")
-    elif NATIVE_MODULE_AVAILABLE and not scatter_accel:
-        print(f"WARNUNG [{_helper_module_name}]: Paket-Flag 'NATIVE_MODULE_AVAILABLE' ist True, aber 'scatter_accel' Modulreferenz ist None. C++-Modul wird als nicht verfügbar behandelt.")
-        NATIVE_MODULE_AVAILABLE = False
-    elif not NATIVE_MODULE_AVAILABLE:
-        print(f"INFO [{_helper_module_name}]: C++ Modul nicht verfügbar (gemäß Paket-Flag).")
-        if scatter_accel is not None:
-            print(f"WARNUNG [{_helper_module_name}]: Inkonsistenz: Paket-Flag 'NATIVE_MODULE_AVAILABLE' ist False, aber 'scatter_accel' Referenz ist nicht None. Wird lokal auf None gesetzt.")
-            scatter_accel = None
-except ImportError as e_imp:
-    print(f"KRITISCH [{_helper_module_name}]: ImportError beim Versuch, C++ Modul/Flag aus dem Paket ('..') zu importieren: {e_imp}.")
-    print(f"  [{_helper_module_name}]: C++ Beschleunigung wird für dieses Modul DEAKTIVIERT.")
-    scatter_accel = None
-    NATIVE_MODULE_AVAILABLE = False
-except Exception as e_gen_imp:
-    print(f"KRITISCH [{_helper_module_name}]: Allgemeiner Fehler beim Import von C++ Modul/Flag aus Paket: {e_gen_imp}.")
-    scatter_accel = None
-    NATIVE_MODULE_AVAILABLE = False
-
-# Definiere MockGpuVertexData auf Modulebene, falls es doch mal extern geprüft werden müsste,
-# oder um die Definition nicht bei jedem Funktionsaufruf neu zu erstellen.
-# Für den Moment ist es hauptsächlich für den Fallback-Pfad innerhalb von safe_prepare_mesh_data_for_cpp.
-class _MockGpuVertexData: # Unterstrich, da es primär intern genutzt wird
-    def __init__(self, pos, idx):
-        self.positions = pos
-        self.indices = idx
+def _ghost_batch_trace_args(self, obj_to_ghostify_ref):
+    mesh = obj_to_ghostify_ref.data
+    return {"object": obj_to_ghostify_ref.name, "vertices": len(mesh.vertices), "triangles": len(mesh.loop_triangles)}
 
 def safe_prepare_mesh_data_for_cpp(flat_positions_array_np: np.ndarray, flat_triangle_indices_array_np: np.ndarray):
     """
@@ -59,8 +29,8 @@ def safe_prepare_mesh_data_for_cpp(flat_positions_array_np: np.ndarray, flat_tri
         flat_triangle_indices_array_np (np.ndarray): Flat int32 NumPy array of triangle vertex indices (i0,i1,i2, i0,i1,i2,...).
 
     Returns:
-        scatter_accel.GpuVertexData or _MockGpuVertexData: Object containing 'positions' (Nx3 float32) and 'indices' (Mx3 uint32) NumPy arrays.
-                                       Returns _MockGpuVertexData with (0,3) shaped arrays if inputs are empty or C++ fails / is unavailable.
+        scatter_accel.GpuVertexData or numpy_kernels.GpuVertexData: Object containing 'positions' (Nx3 float32) and 'indices' (Mx3 uint32) NumPy arrays.
+                                       Returns an empty (0,3) GpuVertexData if inputs are empty or every backend fails unexpectedly.
     """
     if not isinstance(flat_positions_array_np, np.ndarray) or flat_positions_array_np.dtype != np.float32:
         # print(f"WARNUNG [{_helper_module_name}]: flat_positions_array_np ist kein float32 ndarray. Shape: {getattr(flat_positions_array_np, 'shape', 'N/A')}")
@@ -85,51 +55,15 @@ def safe_prepare_mesh_data_for_cpp(flat_positions_array_np: np.ndarray, flat_tri
     num_actual_vertices = max(0, num_actual_vertices)
     num_loop_triangles = max(0, num_loop_triangles)
 
-    if NATIVE_MODULE_AVAILABLE and scatter_accel:
-        try:
-            gpu_data = scatter_accel.prepare_mesh_gpu_data_from_flat_arrays_cpp(
-                flat_positions_array_np,
-                flat_triangle_indices_array_np,
-                num_actual_vertices,
-                num_loop_triangles
-            )
-            return gpu_data
-        except RuntimeError as e_cpp:
-            print(f"FEHLER [{_helper_module_name}]: C++ RuntimeError in prepare_mesh_gpu_data_from_flat_arrays_cpp: {e_cpp}")
-            # Details für Debugging
-            # print(f"  Aufrufparameter waren: V:{num_actual_vertices}, T:{num_loop_triangles}")
-            # print(f"  Pos-Array (flat) Shape: {flat_positions_array_np.shape}, dtype: {flat_positions_array_np.dtype}")
-            # print(f"  Idx-Array (flat) Shape: {flat_triangle_indices_array_np.shape}, dtype: {flat_triangle_indices_array_np.dtype}")
-            empty_pos_fallback = np.empty((0, 3), dtype=np.float32)
-            empty_idx_fallback = np.empty((0, 3), dtype=np.uint32)
-            return _MockGpuVertexData(empty_pos_fallback, empty_idx_fallback)
-        except Exception as e_gen: # Andere unerwartete Fehler vom C++ Modul
-            print(f"FEHLER [{_helper_module_name}]: Allgemeiner Fehler beim Aufruf von C++ prepare_mesh_gpu_data_from_flat_arrays_cpp: {e_gen}")
-            # traceback.print_exc()
-            return _MockGpuVertexData(np.empty((0,3), dtype=np.float32), np.empty((0,3), dtype=np.uint32))
-    else: # Python-Fallback
-        # print(f"INFO [{_helper_module_name}]: C++ Modul nicht verfügbar oder deaktiviert. Python-Fallback für prepare_mesh_gpu_data.")
-        if num_actual_vertices > 0:
-            py_positions = flat_positions_array_np.reshape((num_actual_vertices, 3)).astype(np.float32)
-        else:
-            py_positions = np.empty((0, 3), dtype=np.float32)
-
-        if num_loop_triangles > 0:
-            py_indices_temp = flat_triangle_indices_array_np.reshape((num_loop_triangles, 3))
-            if np.any(py_indices_temp < 0):
-                raise ValueError("Negative vertex index found in Python fallback.")
-            if num_actual_vertices > 0 and np.any(py_indices_temp >= num_actual_vertices):
-                max_idx = py_indices_temp.max()
-                raise ValueError(f"Vertex index {max_idx} out of bounds for {num_actual_vertices} vertices in Python fallback.")
-            elif num_actual_vertices == 0 and num_loop_triangles > 0:
-                 raise ValueError("Cannot have triangles with 0 vertices in Python fallback.")
-            py_indices = py_indices_temp.astype(np.uint32)
-        else:
-            py_indices = np.empty((0, 3), dtype=np.uint32)
-        
-        # Im Python-Fallback verwenden wir _MockGpuVertexData, um unabhängig von der
-        # C++ GpuVertexData-Konstruktor-Signatur zu sein.
-        return _MockGpuVertexData(py_positions, py_indices)
+    try:
+        return KERNELS.call(KERNEL_MESH_GPU_DATA,
+                            flat_positions_array_np, flat_triangle_indices_array_np,
+                            num_actual_vertices, num_loop_triangles)
+    except ValueError:
+        raise # Ungültige Indizes: der Aufrufer verwirft den Batch
+    except Exception as e_gen: # Unerwartete Fehler aller Backends
+        print(f"FEHLER [{_helper_module_name}]: Fehler bei der Mesh-Datenaufbereitung ({KERNELS.selected_backend(KERNEL_MESH_GPU_DATA)}): {e_gen}")
+        return GpuVertexData(np.empty((0,3), dtype=np.float32), np.empty((0,3), dtype=np.uint32))
 
 # --- CircleWireframeDrawer Klasse ---
 class CircleWireframeDrawer:
@@ -151,44 +85,18 @@ class CircleWireframeDrawer:
     def _generate_batch(self):
         if self._batch is not None: self._batch = None
 
-        use_cpp_for_circle = NATIVE_MODULE_AVAILABLE and scatter_accel is not None
         coords_np = None
         indices_np = None
 
-        # Verwende die validierten Instanzattribute
-        current_radius = self.radius
-        current_segments = self.segments
-
-        if use_cpp_for_circle:
-            try:
-                # print(f"DEBUG [{_helper_module_name} CircleDrawer]: C++ Batch: r={current_radius}, s={current_segments}")
-                gpu_data = scatter_accel.generate_circle_marker_gpu_data_cpp(current_radius, current_segments)
-                coords_np = np.asarray(gpu_data.positions, dtype=np.float32)
-                indices_np = np.asarray(gpu_data.indices, dtype=np.uint32)
-                if coords_np is None or indices_np is None:
-                    print(f"WARNUNG [{_helper_module_name} CircleDrawer]: C++ lieferte None für Arrays. Fallback.")
-                    use_cpp_for_circle = False
-            except Exception as e:
-                print(f"FEHLER [{_helper_module_name} CircleDrawer] C++ _generate_batch: {e}. Fallback zu Python.")
-                use_cpp_for_circle = False
-
-        if not use_cpp_for_circle:
-            # print(f"DEBUG [{_helper_module_name} CircleDrawer]: Python Batch")
-            coords_list_python = [(0.0, 0.0, 0.0)]
-            indices_list_python = []
-            center_idx = 0
-            for i in range(current_segments): # Verwende validiertes self.segments (current_segments)
-                angle = (i / current_segments) * (2 * math.pi)
-                x = current_radius * math.cos(angle) # Verwende validiertes self.radius (current_radius)
-                y = current_radius * math.sin(angle)
-                coords_list_python.append((x, y, 0.0))
-            for i in range(current_segments):
-                current_outer_idx = center_idx + 1 + i
-                next_outer_idx = center_idx + 1 + ((i + 1) % current_segments)
-                indices_list_python.append((center_idx, current_outer_idx))
-                indices_list_python.append((current_outer_idx, next_outer_idx))
-            coords_np = np.array(coords_list_python, dtype=np.float32)
-            indices_np = np.array(indices_list_python, dtype=np.uint32)
+        # Verwende die validierten Instanzattribute (Backend wählt die Registry, Fallback bei nativen Fehlern dort)
+        try:
+            gpu_data = KERNELS.call(KERNEL_CIRCLE_MARKER, self.radius, self.segments)
+            coords_np = np.asarray(gpu_data.positions, dtype=np.float32)
+            indices_np = np.asarray(gpu_data.indices, dtype=np.uint32)
+        except Exception as e:
+            print(f"FEHLER [{_helper_module_name} CircleDrawer] _generate_batch: {e}")
+            self._batch = None
+            return
 
         valid_batch_data = True
         if coords_np is None or coords_np.ndim != 2 or coords_np.shape[0] < 1 or coords_np.shape[1] != 3:
@@ -290,6 +198,7 @@ class GPUMeshGhostPreview:
                 pass
 
 
+    @timed("ghost_preview.generate_batch_from_object", trace_args=_ghost_batch_trace_args)
     def _generate_batch_from_object(self, obj_to_ghostify_ref):
         if self._batch is not None: self._batch = None
         self.current_mesh_source_name = None
@@ -367,31 +276,15 @@ class GPUMeshGhostPreview:
             print(f"FEHLER [{_helper_module_name} GPUMeshGhost]: ValueError bei der Datenaufbereitung via Wrapper für '{obj_name}': {e_val}")
             self._batch = None 
             return 
-        # Andere Exceptions aus safe_prepare_mesh_data_for_cpp werden dort bereits geloggt und geben _MockGpuVertexData zurück.
-
-        # Finale Validierung der vom Wrapper zurückgegebenen Daten
-        valid_batch_data = True
-        if coords_np is None or not hasattr(coords_np, 'shape') or coords_np.ndim != 2 or coords_np.shape[1] != 3:
-            if not (expected_num_verts == 0 and hasattr(coords_np, 'shape') and coords_np.shape == (0,3)):
-                print(f"FEHLER [{_helper_module_name} GPUMeshGhost]: Ungültige Coords nach Wrapper. Shape: {getattr(coords_np, 'shape', 'N/A')}. Erwartet (~,3) oder (0,3) für leere Meshes.")
-                valid_batch_data = False
-        elif expected_num_verts > 0 and coords_np.shape[0] != expected_num_verts:
-             print(f"FEHLER [{_helper_module_name} GPUMeshGhost]: Coords Zeilenanzahl {coords_np.shape[0]} != erwartet {expected_num_verts} nach Wrapper.")
-             valid_batch_data = False
+        # Andere Exceptions aus safe_prepare_mesh_data_for_cpp werden dort bereits geloggt und geben ein leeres GpuVertexData zurück.
 
-        if indices_np is None or not hasattr(indices_np, 'shape') or indices_np.ndim != 2 or indices_np.shape[1] != 3:
-            if not (expected_num_tris == 0 and hasattr(indices_np, 'shape') and indices_np.shape == (0,3)):
-                print(f"FEHLER [{_helper_module_name} GPUMeshGhost]: Ungültige Indices nach Wrapper. Shape: {getattr(indices_np, 'shape', 'N/A')}. Erwartet (~,3) oder (0,3) für keine Tris.")
-                valid_batch_data = False
-        elif expected_num_tris > 0 and indices_np.shape[0] != expected_num_tris:
-            print(f"FEHLER [{_helper_module_name} GPUMeshGhost]: Indices Zeilenanzahl {indices_np.shape[0]} != erwartet {expected_num_tris} nach Wrapper.")
-            valid_batch_data = False
+        # Form und Indexbereich garantieren die Kernel (min/max-Prüfung im selben Durchlauf);
+        # hier nur noch, ob der Kernel dieselbe Anzahl geliefert hat, die foreach_get gelesen hat.
+        valid_batch_data = coords_np.shape[0] == expected_num_verts and indices_np.shape[0] == expected_num_tris
+        if not valid_batch_data and expected_num_verts > 0:
+            print(f"FEHLER [{_helper_module_name} GPUMeshGhost]: Kernel lieferte V:{coords_np.shape[0]}/T:{indices_np.shape[0]}, "
+                  f"erwartet V:{expected_num_verts}/T:{expected_num_tris} für '{obj_name}'.")
 
-        if valid_batch_data and expected_num_tris > 0 and hasattr(indices_np, 'max') and indices_np.size > 0 and hasattr(coords_np, 'shape') and coords_np.shape[0] > 0 :
-            if indices_np.max() >= coords_np.shape[0]:
-                 print(f"FEHLER [{_helper_module_name} GPUMeshGhost]: Max Index {indices_np.max()} out of bounds für {coords_np.shape[0]} Vertices nach Wrapper.")
-                 valid_batch_data = False
-        
         if not valid_batch_data: self._batch = None; return
 
         try:
@@ -401,7 +294,7 @@ class GPUMeshGhostPreview:
                 self._batch = batch_for_shader(self.shader, 'TRIS', {"pos": coords_np}, indices=indices_np)
             elif expected_num_verts > 0 and coords_np.size > 0:
                  self._batch = batch_for_shader(self.shader, 'POINTS', {"pos": coords_np})
-            elif expected_num_verts == 0 and expected_num_tris == 0 and hasattr(coords_np, 'shape') and coords_np.shape == (0,3) and hasattr(indices_np, 'shape') and indices_np.shape == (0,3):
+            elif expected_num_verts == 0 and expected_num_tris == 0:
                 # print(f"DEBUG [{_helper_module_name} GPUMeshGhost]: Leeres Mesh ('{obj_name}'). Kein Batch erstellt, das ist erwartet.")
                 self._batch = None
             else: self._batch = None
@@ -458,4 +351,165 @@ class GPUMeshGhostPreview:
         if self._draw_handler:
             bpy.types.SpaceView3D.draw_handler_remove(self._draw_handler, 'WINDOW'); self._draw_handler = None
         self.set_visible(False)
-    def cleanup(self): self.disable_drawing(); self._batch = None; self.current_mesh_source_name = None
\ No newline at end of file
+    def cleanup(self): self.disable_drawing(); self._batch = None; self.current_mesh_source_name = None
+# --- GPUProxyOverlay Klasse ---
+PROXY_INSTANCE_CHUNK = 256 # Matrizen pro Instanced-Draw: 256 * 64 B = 16 KiB Uniform-Buffer (GL-Mindestgröße)
+
+_proxy_instance_shader = None
+_proxy_instance_shader_failed = False
+
+def _get_proxy_instance_shader():
+    """Shader mit mat4-Array im Uniform-Buffer (pro Instanz eine Matrix); None, wenn das Backend ihn nicht baut."""
+    global _proxy_instance_shader, _proxy_instance_shader_failed
+    if _proxy_instance_shader is not None or _proxy_instance_shader_failed:
+        return _proxy_instance_shader
+    try:
+        info = gpu.types.GPUShaderCreateInfo()
+        info.typedef_source(f"struct ProxyInstances {{ mat4 matrices[{PROXY_INSTANCE_CHUNK}]; }};\n")
+        info.uniform_buf(0, "ProxyInstances", "instances")
+        info.push_constant('MAT4', "ViewProjectionMatrix")
+        info.push_constant('VEC4', "color")
+        info.vertex_in(0, 'VEC3', "pos")
+        info.fragment_out(0, 'VEC4', "fragColor")
+        info.vertex_source(
+            "void main()\n{\n"
+            "  gl_Position = ViewProjectionMatrix * (instances.matrices[gpu_InstanceIndex] * vec4(pos, 1.0));\n"
+            "}\n")
+        info.fragment_source("void main()\n{\n  fragColor = color;\n}\n")
+        _proxy_instance_shader = gpu.shader.create_from_info(info)
+    except Exception as e:
+        _proxy_instance_shader_failed = True
+        print(f"WARNUNG [{_helper_module_name} GPUProxyOverlay]: Instanced-Shader nicht verfügbar, zeichne pro Proxy: {e}")
+    return _proxy_instance_shader
+
+class GPUProxyOverlay:
+    """
+    Zeichnet animierte Proxys (fallende und gespawnte Objekte, die noch kein Blender-Objekt sind).
+    Pro Geometrie-Schlüssel (Mesh, Modifier-Hash, PROFILES-Generation) eine Batch, über GPUMeshGhostPreview
+    erzeugt (ohne dessen Draw-Handler). Die Matrizen liegen in einem (N,4,4)-Array; ein Tick schreibt nur seine
+    Zeile, ohne RNA und ohne Depsgraph. Gezeichnet wird pro Batch ein draw_instanced je PROXY_INSTANCE_CHUNK Proxys.
+    """
+    def __init__(self, color=(0.8, 0.8, 0.8, 0.6), capacity=64):
+        self.shader = gpu.shader.from_builtin('UNIFORM_COLOR') # Fallback ohne Instanced-Shader
+        self.color_uniform_data = list(color)
+        self._mesh_batches = {} # Geometrie-Schlüssel -> GPUMeshGhostPreview
+        self._source_slots = {} # Geometrie-Schlüssel -> Menge aktiver Slots
+        self._matrices = np.zeros((max(1, capacity), 4, 4), dtype=np.float32)
+        self._slot_source = [None] * len(self._matrices)
+        self._free_slots = list(range(len(self._matrices) - 1, -1, -1))
+        self._active_count = 0
+        self._instance_data = np.zeros((PROXY_INSTANCE_CHUNK, 4, 4), dtype=np.float32)
+        self._instance_buffers = [] # Ein Uniform-Buffer pro Draw im Frame (nicht zwischen Draws überschreiben)
+        self._draw_handler = None
+
+    def __len__(self):
+        return self._active_count
+
+    def _grow(self):
+        old_capacity = len(self._matrices)
+        self._matrices = np.concatenate((self._matrices, np.zeros_like(self._matrices)))
+        self._slot_source.extend([None] * old_capacity)
+        self._free_slots.extend(range(len(self._matrices) - 1, old_capacity - 1, -1))
+
+    def _batch_key(self, source_obj):
+        key = PROFILES.key_for_object(source_obj)
+        if key is None: # Kein Mesh: eigener Schlüssel, die Batch bleibt leer
+            return (None, source_obj.name_full, 0)
+        if key not in self._mesh_batches:
+            # Ältere Generationen desselben Meshes ohne aktive Proxys verwerfen
+            for stale in [k for k in self._mesh_batches if k[0] == key[0] and k[2] != key[2] and not self._source_slots.get(k)]:
+                self._mesh_batches.pop(stale).cleanup()
+                self._source_slots.pop(stale, None)
+        return key
+
+    def add(self, source_obj, matrix):
+        """Neuer Proxy mit der Geometrie von source_obj; gibt den Slot zurück."""
+        key = self._batch_key(source_obj)
+        if key not in self._mesh_batches:
+            ghost = GPUMeshGhostPreview(color=self.color_uniform_data)
+            ghost.update_mesh_from_object(source_obj)
+            self._mesh_batches[key] = ghost
+        if not self._free_slots:
+            self._grow()
+        slot = self._free_slots.pop()
+        self._slot_source[slot] = key
+        self._source_slots.setdefault(key, set()).add(slot)
+        self._matrices[slot] = matrix
+        self._active_count += 1
+        if self._draw_handler is None:
+            self._draw_handler = bpy.types.SpaceView3D.draw_handler_add(self._draw_callback, (), 'WINDOW', 'POST_VIEW')
+        return slot
+
+    def update(self, slot, matrix):
+        self._matrices[slot] = matrix
+
+    def remove(self, slot):
+        if slot is None or self._slot_source[slot] is None:
+            return
+        self._source_slots[self._slot_source[slot]].discard(slot)
+        self._slot_source[slot] = None
+        self._free_slots.append(slot)
+        self._active_count -= 1
+
+    def _instance_buffer(self, index):
+        data = self._instance_data.tobytes()
+        if index < len(self._instance_buffers):
+            self._instance_buffers[index].update(data)
+        else:
+            self._instance_buffers.append(gpu.types.GPUUniformBuf(data))
+        return self._instance_buffers[index]
+
+    def _draw_instanced(self, shader):
+        shader.bind()
+        shader.uniform_float("ViewProjectionMatrix", gpu.matrix.get_projection_matrix() @ gpu.matrix.get_model_view_matrix())
+        shader.uniform_float("color", self.color_uniform_data)
+        draw_index = 0
+        for key, slots in self._source_slots.items():
+            batch = self._mesh_batches[key]._batch
+            if not slots or batch is None: continue
+            slot_indices = np.fromiter(slots, dtype=np.intp, count=len(slots))
+            for start in range(0, len(slot_indices), PROXY_INSTANCE_CHUNK):
+                chunk = slot_indices[start:start + PROXY_INSTANCE_CHUNK]
+                # GLSL-mat4 ist spaltenweise: Zeilen-Matrizen transponiert hochladen
+                self._instance_data[:len(chunk)] = self._matrices[chunk].transpose(0, 2, 1)
+                shader.uniform_block("instances", self._instance_buffer(draw_index))
+                batch.draw_instanced(shader, instance_start=0, instance_count=len(chunk))
+                draw_index += 1
+
+    def _draw_per_slot(self):
+        self.shader.bind(); self.shader.uniform_float("color", self.color_uniform_data)
+        for slot, key in enumerate(self._slot_source):
+            if key is None: continue
+            batch = self._mesh_batches[key]._batch
+            if batch is None: continue
+            gpu.matrix.push(); gpu.matrix.multiply_matrix(Matrix(self._matrices[slot].tolist()))
+            try: batch.draw(self.shader)
+            finally: gpu.matrix.pop()
+
+    def _draw_callback(self):
+        if not self._active_count or not self.shader: return
+        original_depth_test = gpu.state.depth_test_get(); original_blend = gpu.state.blend_get()
+        original_depth_mask = gpu.state.depth_mask_get()
+        gpu.state.blend_set('ALPHA'); gpu.state.depth_mask_set(False)
+        gpu.state.depth_test_set('LESS_EQUAL')
+        try:
+            instance_shader = _get_proxy_instance_shader()
+            if instance_shader is not None: self._draw_instanced(instance_shader)
+            else: self._draw_per_slot()
+        except Exception as e: print(f"ERROR [{_helper_module_name} GPUProxyOverlay] Draw: {e}")
+        gpu.state.depth_mask_set(original_depth_mask); gpu.state.blend_set(original_blend)
+        gpu.state.depth_test_set(original_depth_test)
+
+    def clear(self):
+        self._slot_source = [None] * len(self._matrices)
+        self._free_slots = list(range(len(self._matrices) - 1, -1, -1))
+        self._source_slots.clear()
+        self._active_count = 0
+
+    def cleanup(self):
+        if self._draw_handler:
+            bpy.types.SpaceView3D.draw_handler_remove(self._draw_handler, 'WINDOW'); self._draw_handler = None
+        self.clear()
+        for ghost in self._mesh_batches.values(): ghost.cleanup()
+        self._mesh_batches.clear()
+        self._instance_buffers.clear()
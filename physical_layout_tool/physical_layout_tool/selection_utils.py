@@ -0,0 +1,88 @@
+# selection_utils.py
+# Gemeinsame Helfer für Auswahl-Handling:
+#  - SelectionSnapshot: Auswahl + aktives Objekt EINMAL pro Operation sichern und EINMAL am Ende wiederherstellen
+#  - single_object_override: Operator-Aufrufe für ein einzelnes Objekt über context.temp_override,
+#    ohne die globale Auswahl anzufassen (statt Deselect-All -> Select -> op -> Auswahl zurück pro Objekt)
+import bpy
+
+_sel_module_name = __name__
+
+
+class SelectionSnapshot:
+    """
+    Sichert die Auswahl eines View Layers. Nutzbar als Context Manager oder mit capture()/restore()
+    (z.B. in modalen Operatoren: capture in invoke, restore in _finish_modal).
+    """
+
+    def __init__(self, context=None):
+        self.selected_names = []
+        self.active_name = None
+        self._context = context
+        if context is not None:
+            self.capture(context)
+
+    def capture(self, context):
+        self.selected_names = [obj.name for obj in context.selected_objects if obj]
+        active = context.view_layer.objects.active
+        self.active_name = active.name if active else None
+        return self
+
+    def restore(self, context):
+        view_layer = context.view_layer
+        view_layer_objects = view_layer.objects
+
+        # Nur die aktuell ausgewählten Objekte abwählen statt ops.object.select_all
+        for obj in list(context.selected_objects):
+            try: obj.select_set(False, view_layer=view_layer)
+            except (ReferenceError, RuntimeError): pass
+
+        restored = []
+        for name in self.selected_names:
+            obj = bpy.data.objects.get(name)
+            if obj and obj.name in view_layer_objects:
+                try:
+                    obj.select_set(True, view_layer=view_layer)
+                    restored.append(obj)
+                except (ReferenceError, RuntimeError): pass
+
+        active_obj = bpy.data.objects.get(self.active_name) if self.active_name else None
+        try:
+            if active_obj and active_obj.name in view_layer_objects:
+                view_layer_objects.active = active_obj
+            elif restored:
+                view_layer_objects.active = restored[0]
+        except (ReferenceError, RuntimeError) as e:
+            print(f"WARNUNG [{_sel_module_name}]: Aktives Objekt konnte nicht wiederhergestellt werden: {e}")
+        return restored
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        try:
+            self.restore(self._context if self._context is not None else bpy.context)
+        except Exception as e:
+            print(f"WARNUNG [{_sel_module_name}]: Auswahl konnte nicht wiederhergestellt werden: {e}")
+        return False
+
+
+def single_object_override(context, obj):
+    """temp_override, in dem obj das einzige ausgewählte und das aktive Objekt ist."""
+    return context.temp_override(
+        active_object=obj,
+        object=obj,
+        selected_objects=[obj],
+        selected_editable_objects=[obj],
+    )
+
+
+def objects_override(context, objects, active=None):
+    """temp_override für Operatoren, die auf mehreren ausgewählten Objekten gleichzeitig arbeiten."""
+    objects = list(objects)
+    active = active if active is not None else (objects[0] if objects else None)
+    return context.temp_override(
+        active_object=active,
+        object=active,
+        selected_objects=objects,
+        selected_editable_objects=objects,
+    )
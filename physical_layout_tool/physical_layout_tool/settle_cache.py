@@ -0,0 +1,133 @@
+# settle_cache.py
+# Festplatten-Cache für gesetzte (settled) Layouts:
+# Nach einem verwalteten Settle-Bake werden die Endlagen als komprimiertes .npz neben der .blend abgelegt
+# (Ordner plt_settle_cache/). Der Schlüssel ist ein Hash aus Quell-Meshes, Anfangstransformationen,
+# Rigid-Body-Settings, Welt-Settings und Bake-Parametern. Passt ein Eintrag, werden die Lagen in einem
+# Durchgang übernommen statt neu zu simulieren.
+import bpy
+import os
+import hashlib
+import tempfile
+import traceback
+import numpy as np
+
+from .object_metadata import read_world_matrices
+from .static_bake import write_world_matrices
+
+_cache_module_name = __name__
+
+SETTLE_CACHE_DIR_NAME = "plt_settle_cache"
+SETTLE_CACHE_VERSION = 1
+
+_RB_HASH_ATTRIBUTES = (
+    "type", "kinematic", "enabled", "mass", "collision_shape", "use_margin", "collision_margin",
+    "friction", "restitution", "linear_damping", "angular_damping", "use_deactivation", "use_start_deactivated",
+)
+
+
+def settle_cache_dir():
+    """Ordner neben der .blend; für ungespeicherte Dateien im temporären Verzeichnis."""
+    if bpy.data.filepath:
+        return bpy.path.abspath("//" + SETTLE_CACHE_DIR_NAME)
+    return os.path.join(bpy.app.tempdir or tempfile.gettempdir(), SETTLE_CACHE_DIR_NAME)
+
+
+def _mesh_digest(mesh, cache):
+    digest = cache.get(mesh.name)
+    if digest is None:
+        h = hashlib.sha1()
+        count = len(mesh.vertices)
+        co = np.empty(count * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        h.update(np.int64([count, len(mesh.polygons)]).tobytes())
+        h.update(co.tobytes())
+        digest = h.digest()
+        cache[mesh.name] = digest
+    return digest
+
+
+def compute_settle_key(context, active_objects, collider_objects, extra=()):
+    """
+    Hash über alles, was das Ergebnis der Simulation bestimmt. extra: weitere Bake-Parameter
+    (z.B. Framebereich, Ruhe-Schwellen), die in den Schlüssel eingehen.
+    """
+    scene = context.scene
+    rbw = scene.rigidbody_world
+    h = hashlib.sha1()
+    h.update(f"v{SETTLE_CACHE_VERSION}".encode())
+
+    objects = list(active_objects) + list(collider_objects)
+    h.update(f"{len(active_objects)}/{len(collider_objects)}".encode())
+    h.update(read_world_matrices(context, objects).tobytes())
+
+    mesh_digests = {}
+    for obj in objects:
+        h.update(obj.name.encode())
+        if obj.type == 'MESH' and obj.data is not None:
+            h.update(_mesh_digest(obj.data, mesh_digests))
+        rb = obj.rigid_body
+        if rb is not None:
+            h.update(repr(tuple(getattr(rb, attr, None) for attr in _RB_HASH_ATTRIBUTES)).encode())
+
+    world = (
+        tuple(round(float(v), 6) for v in scene.gravity), scene.use_gravity,
+        scene.render.fps, scene.render.fps_base,
+        rbw.time_scale, rbw.substeps_per_frame, rbw.solver_iterations,
+        getattr(rbw, "use_split_impulse", None),
+    )
+    h.update(repr(world).encode())
+    h.update(repr(tuple(extra)).encode())
+    return h.hexdigest()
+
+
+def _cache_path(key):
+    return os.path.join(settle_cache_dir(), f"{key}.npz")
+
+
+def load_settled_layout(key):
+    """Gibt (names, matrices (N,4,4), frame_count, settle_frame) zurück oder None, wenn kein Eintrag existiert."""
+    path = _cache_path(key)
+    if not os.path.isfile(path):
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            return data["names"].tolist(), data["matrices"], int(data["frame_count"]), int(data["settle_frame"])
+    except Exception as e:
+        print(f"WARNUNG [{_cache_module_name}]: Cache-Eintrag '{path}' nicht lesbar, wird ignoriert: {e}")
+        return None
+
+
+def store_settled_layout(key, objects, matrices, frame_count, settle_frame=-1):
+    """Schreibt die Endlagen als komprimiertes .npz (atomar über eine temporäre Datei). settle_frame: -1 = unbekannt."""
+    directory = settle_cache_dir()
+    try:
+        os.makedirs(directory, exist_ok=True)
+        path = _cache_path(key)
+        tmp_path = path + ".tmp.npz"
+        np.savez_compressed(
+            tmp_path,
+            names=np.array([obj.name for obj in objects]),
+            matrices=np.asarray(matrices, dtype=np.float32),
+            frame_count=np.int64(frame_count),
+            settle_frame=np.int64(settle_frame),
+        )
+        os.replace(tmp_path, path)
+        return path
+    except OSError as e:
+        print(f"WARNUNG [{_cache_module_name}]: Settle-Cache konnte nicht geschrieben werden ({directory}): {e}")
+        traceback.print_exc()
+        return None
+
+
+def apply_settled_layout(objects, names, matrices):
+    """Überträgt die gespeicherten Lagen per Name in einem Durchgang. Gibt die Anzahl übernommener Objekte zurück."""
+    index_by_name = {name: i for i, name in enumerate(names)}
+    targets, rows = [], []
+    for obj in objects:
+        i = index_by_name.get(obj.name)
+        if i is not None:
+            targets.append(obj)
+            rows.append(i)
+    if not targets:
+        return 0
+    return write_world_matrices(targets, np.asarray(matrices)[rows])
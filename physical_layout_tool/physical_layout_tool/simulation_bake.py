@@ -0,0 +1,366 @@
+# simulation_bake.py
+# Auf die Addon-Objekte begrenzter Rigid-Body-Bake ("Settle"):
+# Statt ptcache.bake_all (alle Caches der Szene über den vollen Framebereich) wird eine temporäre
+# Rigid-Body-World-Collection mit nur den verwalteten Objekten (Session-, Instanz- und Static-Collections)
+# plus den passiven Kollisionskörpern gebaut, der Framebereich aus den Fallhöhen abgeschätzt und nur der
+# Cache der Rigid Body World gebacken. Danach wird die ursprüngliche Konfiguration wiederhergestellt.
+# Optional mit Ruhe-Erkennung (SettleMonitor): Bake endet, sobald alle Körper für K Frames ruhen.
+# Ergebnisse können über settle_cache auf der Festplatte zwischengespeichert werden.
+import bpy
+import math
+import traceback
+import numpy as np
+
+from .object_metadata import read_world_matrices
+from .static_bake import write_world_matrices
+from .settle_cache import compute_settle_key, load_settled_layout, store_settled_layout, apply_settled_layout
+
+_simbake_module_name = __name__
+
+SCOPE_COLLECTION_NAME = "PLT_BAKE_SCOPE"
+SETTLE_MARGIN_FRAMES = 40   # Zusätzliche Frames nach dem Aufprall (Abrollen/Ausschwingen)
+MIN_SETTLE_FRAMES = 20
+MAX_SETTLE_FRAMES = 2500
+DEFAULT_GRAVITY = 9.81
+
+
+def gather_managed_collections(context, im_settings):
+    """Session-Collections (Präfix source_collection_basename), Instanz- und Static-Collection des Addons."""
+    collections = []
+    if im_settings is None:
+        return collections
+    for name in (im_settings.instance_collection_name, im_settings.static_collection_name):
+        col = bpy.data.collections.get(name) if name else None
+        if col and col not in collections:
+            collections.append(col)
+    basename = im_settings.source_collection_basename
+    if basename:
+        prefix = basename if basename.endswith("_") else basename + "_"
+        for col in bpy.data.collections:
+            if col.name.startswith(prefix) and col not in collections:
+                collections.append(col)
+    return collections
+
+
+def gather_scope_objects(context, managed_collections):
+    """
+    Gibt (active_objects, collider_objects) zurück: Rigid Bodies aus den verwalteten Collections
+    und alle passiven Rigid Bodies der Welt (Boden/Kollisionsobjekte, auch außerhalb des Addons).
+    """
+    rbw = context.scene.rigidbody_world
+    if rbw is None or rbw.collection is None:
+        return [], []
+    world_names = set(rbw.collection.objects.keys())
+    managed_names = set()
+    for col in managed_collections:
+        managed_names.update(name for name in col.all_objects.keys() if name in world_names)
+
+    active_objects, collider_objects = [], []
+    for obj in rbw.collection.objects:
+        rb = obj.rigid_body
+        if rb is None:
+            continue
+        if rb.type == 'PASSIVE':
+            collider_objects.append(obj)
+        elif obj.name in managed_names:
+            active_objects.append(obj)
+    return active_objects, collider_objects
+
+
+def estimate_settle_frame_count(context, active_objects, collider_objects):
+    """
+    Framebereich aus den Fallhöhen: freier Fall über die größte Höhe zum tiefsten Kollisionskörper
+    (t = sqrt(2h/g)) plus SETTLE_MARGIN_FRAMES, umgerechnet mit fps und time_scale der Rigid Body World.
+    """
+    scene = context.scene
+    if not active_objects:
+        return MIN_SETTLE_FRAMES
+    heights = read_world_matrices(context, active_objects)[:, 2, 3]
+    if collider_objects:
+        ground_z = float(read_world_matrices(context, collider_objects)[:, 2, 3].min())
+    else:
+        ground_z = float(heights.min())
+    drop_height = max(0.0, float(np.max(heights - ground_z)))
+
+    gravity = DEFAULT_GRAVITY
+    if scene.use_gravity:
+        gravity = max(1e-3, abs(float(scene.gravity[2])) or DEFAULT_GRAVITY)
+    fall_seconds = math.sqrt(2.0 * drop_height / gravity)
+
+    fps = scene.render.fps / (scene.render.fps_base or 1.0)
+    time_scale = scene.rigidbody_world.time_scale if scene.rigidbody_world else 1.0
+    frames = int(math.ceil(fall_seconds * fps / max(time_scale, 1e-3))) + SETTLE_MARGIN_FRAMES
+    return max(MIN_SETTLE_FRAMES, min(MAX_SETTLE_FRAMES, frames))
+
+
+class ScopedRigidBodyWorld:
+    """
+    Context Manager: ersetzt die Collection der Rigid Body World durch eine temporäre Collection mit
+    nur den angegebenen Objekten und setzt den Cache-Framebereich. Beim Verlassen wird der Teil-Bake verworfen,
+    Collection, Framebereich und aktueller Frame werden wiederhergestellt und die temporäre Collection entfernt.
+    War der Cache beim Betreten gebacken, wird er dafür freigegeben und beim Verlassen mit der ursprünglichen
+    Welt neu gebacken (is_baked entspricht danach wieder dem Zustand beim Betreten).
+    """
+
+    def __init__(self, context, objects, frame_start, frame_end):
+        self.context = context
+        self.objects = list(objects)
+        self.frame_start = int(frame_start)
+        self.frame_end = int(frame_end)
+        self._saved = None
+        self._scope_collection = None
+
+    def __enter__(self):
+        scene = self.context.scene
+        rbw = scene.rigidbody_world
+        cache = rbw.point_cache
+        self._saved = {
+            "collection": rbw.collection,
+            "frame_start": cache.frame_start,
+            "frame_end": cache.frame_end,
+            "frame_current": scene.frame_current,
+            "is_baked": cache.is_baked,
+        }
+        if cache.is_baked:
+            free_rigid_body_world_cache(self.context)
+        scope = bpy.data.collections.new(SCOPE_COLLECTION_NAME)
+        for obj in self.objects:
+            try: scope.objects.link(obj)
+            except RuntimeError: pass
+        self._scope_collection = scope
+        rbw.collection = scope
+        # Reihenfolge wegen Validierung (start <= end)
+        cache.frame_end = max(self.frame_end, cache.frame_start)
+        cache.frame_start = self.frame_start
+        cache.frame_end = self.frame_end
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        scene = self.context.scene
+        rbw = scene.rigidbody_world
+        saved = self._saved or {}
+        try:
+            if rbw is not None:
+                cache = rbw.point_cache
+                # Teil-Bake (nur Scope-Objekte) vor dem Zurücksetzen der Collection verwerfen
+                if cache.is_baked:
+                    free_rigid_body_world_cache(self.context)
+                if "collection" in saved:
+                    rbw.collection = saved["collection"]
+                if "frame_start" in saved:
+                    cache.frame_end = max(saved["frame_end"], cache.frame_start)
+                    cache.frame_start = saved["frame_start"]
+                    cache.frame_end = saved["frame_end"]
+                if saved.get("is_baked"):
+                    bake_rigid_body_world_cache(self.context)
+                if "is_baked" in saved and cache.is_baked != saved["is_baked"]:
+                    print(f"WARNUNG [{_simbake_module_name}]: Bake-Zustand des Rigid-Body-Caches nicht wiederhergestellt "
+                          f"(is_baked={cache.is_baked}, beim Start {saved['is_baked']}).")
+            if "frame_current" in saved:
+                scene.frame_set(saved["frame_current"])
+        except Exception as e:
+            print(f"FEHLER [{_simbake_module_name}]: Rigid-Body-World-Konfiguration konnte nicht vollständig wiederhergestellt werden: {e}")
+            traceback.print_exc()
+        if self._scope_collection is not None:
+            try: bpy.data.collections.remove(self._scope_collection)
+            except (ReferenceError, RuntimeError): pass
+            self._scope_collection = None
+        return False
+
+
+def free_rigid_body_world_cache(context):
+    """Verwirft den Bake der Rigid Body World (ptcache.free_bake mit point_cache-Override)."""
+    rbw = context.scene.rigidbody_world
+    try:
+        with context.temp_override(point_cache=rbw.point_cache):
+            bpy.ops.ptcache.free_bake()
+        return True
+    except (RuntimeError, TypeError) as e:
+        print(f"FEHLER [{_simbake_module_name}]: Freigeben des Rigid-Body-Caches fehlgeschlagen: {e}")
+        traceback.print_exc()
+        return False
+
+
+def bake_rigid_body_world_cache(context):
+    """Backt nur den Cache der Rigid Body World (kein bake_all). Gibt True bei Erfolg zurück."""
+    rbw = context.scene.rigidbody_world
+    try:
+        with context.temp_override(point_cache=rbw.point_cache):
+            bpy.ops.ptcache.bake(bake=True)
+        return True
+    except (RuntimeError, TypeError) as e:
+        print(f"FEHLER [{_simbake_module_name}]: Bake des Rigid-Body-Caches fehlgeschlagen: {e}")
+        traceback.print_exc()
+        return False
+
+
+def rotation_parts(matrices):
+    """Rotationsanteil (N,3,3) ohne Skalierung (Spalten normiert)."""
+    rot = matrices[:, :3, :3].astype(np.float64)
+    norms = np.linalg.norm(rot, axis=1, keepdims=True)
+    return rot / np.where(norms > 1e-12, norms, 1.0)
+
+
+def matrix_deltas(previous, previous_rotations, current, current_rotations):
+    """Lineare Deltas (Translation) und Winkel der Relativrotation pro Objekt als NumPy-Arrays."""
+    linear = np.linalg.norm(current[:, :3, 3] - previous[:, :3, 3], axis=1)
+    # cos(theta) = (trace(R_prev^T R) - 1) / 2
+    trace = np.einsum('nij,nij->n', previous_rotations, current_rotations)
+    angular = np.arccos(np.clip((trace - 1.0) * 0.5, -1.0, 1.0))
+    return linear, angular
+
+
+class SettleMonitor:
+    """
+    Ruhe-Erkennung: bekommt pro Frame die Weltmatrizen (N,4,4) der simulierten Objekte und berechnet
+    lineare (Translation) und Winkel-Deltas (Rotationswinkel zwischen zwei Frames) als NumPy-Arrays.
+    Gilt als "settled", wenn alle Deltas für required_frames aufeinanderfolgende Frames unter den Schwellen liegen.
+    """
+
+    def __init__(self, linear_threshold=0.001, angular_threshold=math.radians(0.1), required_frames=5):
+        self.linear_threshold = float(linear_threshold)
+        self.angular_threshold = float(angular_threshold)
+        self.required_frames = max(1, int(required_frames))
+        self.settle_frame = None
+        self.max_linear_delta = None
+        self.max_angular_delta = None
+        self._previous = None
+        self._previous_rotations = None
+        self._calm_frames = 0
+        self._first_calm_frame = None
+
+    def sample(self, frame, matrices):
+        """Nimmt die Matrizen eines Frames auf. Gibt True zurück, sobald alles zur Ruhe gekommen ist."""
+        rotations = rotation_parts(matrices)
+        if self._previous is None or len(self._previous) != len(matrices):
+            self._previous, self._previous_rotations = matrices, rotations
+            return False
+
+        linear, angular = matrix_deltas(self._previous, self._previous_rotations, matrices, rotations)
+        self._previous, self._previous_rotations = matrices, rotations
+
+        self.max_linear_delta = float(linear.max()) if len(linear) else 0.0
+        self.max_angular_delta = float(angular.max()) if len(angular) else 0.0
+        if self.max_linear_delta < self.linear_threshold and self.max_angular_delta < self.angular_threshold:
+            if self._calm_frames == 0:
+                self._first_calm_frame = frame
+            self._calm_frames += 1
+        else:
+            self._calm_frames = 0
+            self._first_calm_frame = None
+
+        if self._calm_frames >= self.required_frames:
+            self.settle_frame = self._first_calm_frame
+            return True
+        return False
+
+
+def bake_until_settled(context, objects, frame_start, frame_end, monitor=None, frame_hooks=()):
+    """
+    Simuliert Frame für Frame (frame_set füllt den Rigid-Body-Cache fortlaufend) und tastet nach jedem Frame
+    die Weltmatrizen in einem Durchgang ab. frame_hooks (callable(context, frame, matrices)) bekommen dieselbe
+    Abtastung. Bricht ab, sobald monitor Ruhe meldet; danach wird der Cache auf den letzten simulierten Frame
+    gekürzt und als gebacken markiert. Gibt den letzten simulierten Frame zurück.
+    """
+    scene = context.scene
+    rbw = scene.rigidbody_world
+    last_frame = frame_end
+    for frame in range(frame_start, frame_end + 1):
+        scene.frame_set(frame)
+        matrices = read_world_matrices(context, objects)
+        for hook in frame_hooks:
+            hook(context, frame, matrices)
+        if monitor is not None and monitor.sample(frame, matrices):
+            last_frame = frame
+            break
+
+    cache = rbw.point_cache
+    if last_frame < cache.frame_end:
+        cache.frame_end = max(last_frame, cache.frame_start)
+    try:
+        with context.temp_override(point_cache=cache):
+            bpy.ops.ptcache.bake_from_cache()
+    except (RuntimeError, TypeError) as e:
+        print(f"WARNUNG [{_simbake_module_name}]: Cache konnte nicht als gebacken markiert werden: {e}")
+    return last_frame
+
+
+def _settle_key_parameters(frame_count, monitor, freezer):
+    """Bake-Parameter, die neben Szene und Settings in den Cache-Schlüssel eingehen."""
+    params = [("frames", frame_count)]
+    if monitor is not None:
+        params.append(("rest", monitor.linear_threshold, monitor.angular_threshold, monitor.required_frames))
+    if freezer is not None:
+        params.append(("freeze", freezer.linear_threshold, freezer.angular_threshold,
+                       freezer.freeze_after_frames, freezer.wake_margin))
+    return params
+
+
+def bake_managed_settle(context, im_settings, monitor=None, freezer=None, use_cache=False):
+    """
+    Settle-Bake nur für die Addon-Objekte. Die Lage am Ende des Bakes wird auf die Objekte übernommen
+    (der Bake der temporären Welt wird beim Wiederherstellen verworfen).
+    Mit monitor (SettleMonitor) wird Frame für Frame simuliert und bei Ruhe vorzeitig beendet.
+    freezer (progressive_freeze.ProgressiveFreezer) friert ruhende Körper während des Bakes ein.
+    use_cache: passenden Eintrag aus settle_cache übernehmen statt zu simulieren, neue Ergebnisse dort ablegen.
+    Gibt (settled_count, frame_count, from_cache) zurück; (0, 0, False), wenn nichts zu backen war.
+    """
+    scene = context.scene
+    if scene.rigidbody_world is None or scene.rigidbody_world.collection is None:
+        return 0, 0, False
+    managed_collections = gather_managed_collections(context, im_settings)
+    active_objects, collider_objects = gather_scope_objects(context, managed_collections)
+    if not active_objects:
+        return 0, 0, False
+
+    frame_start = scene.frame_current
+    frame_count = estimate_settle_frame_count(context, active_objects, collider_objects)
+    frame_end = frame_start + frame_count
+
+    cache_key = None
+    if use_cache:
+        try:
+            cache_key = compute_settle_key(context, active_objects, collider_objects,
+                                           _settle_key_parameters(frame_count, monitor, freezer))
+            cached = load_settled_layout(cache_key)
+        except Exception as e_key:
+            print(f"WARNUNG [{_simbake_module_name}]: Settle-Cache nicht nutzbar, simuliere neu: {e_key}")
+            traceback.print_exc()
+            cache_key, cached = None, None
+        if cached is not None:
+            names, matrices, cached_frame_count, cached_settle_frame = cached
+            settled_count = apply_settled_layout(active_objects, names, matrices)
+            if settled_count == len(active_objects):
+                if monitor is not None and cached_settle_frame >= 0:
+                    monitor.settle_frame = cached_settle_frame
+                context.view_layer.update()
+                print(f"INFO [{_simbake_module_name}]: {settled_count} Lage(n) aus dem Settle-Cache übernommen ({cache_key[:12]}).")
+                return settled_count, cached_frame_count, True
+            print(f"WARNUNG [{_simbake_module_name}]: Settle-Cache-Eintrag unvollständig, simuliere neu.")
+
+    settled_matrices = None
+    with ScopedRigidBodyWorld(context, active_objects + collider_objects, frame_start, frame_end):
+        if monitor is not None or freezer is not None:
+            frame_hooks = ()
+            if freezer is not None:
+                freezer.begin(active_objects, frame_start)
+                frame_hooks = (freezer.on_frame,)
+            try:
+                last_frame = bake_until_settled(context, active_objects, frame_start, frame_end, monitor, frame_hooks)
+                frame_count = last_frame - frame_start
+                settled_matrices = read_world_matrices(context, active_objects)
+            finally:
+                if freezer is not None:
+                    freezer.release()
+        elif bake_rigid_body_world_cache(context):
+            scene.frame_set(frame_end)
+            settled_matrices = read_world_matrices(context, active_objects)
+
+    if settled_matrices is None:
+        return 0, frame_count, False
+    if cache_key is not None:
+        settle_frame = monitor.settle_frame if monitor is not None and monitor.settle_frame is not None else -1
+        store_settled_layout(cache_key, active_objects, settled_matrices, frame_count, settle_frame)
+    settled_count = write_world_matrices(active_objects, settled_matrices)
+    context.view_layer.update()
+    return settled_count, frame_count, False
@@ -0,0 +1,256 @@
+# spawn_batch.py
+# Post-Landing-Spawn als Batch: Streupositionen, Hangabtrieb (Virtual Gravity) und Roll-Parameter aller Kinder
+# als Arrays, Oberflächentreffer über einen gemeinsamen Strahl-Dreieck-Test statt 2-3 scene.ray_cast pro Kind.
+# Die Dreiecke der Objekte im Umkreis des Landepunkts werden einmal pro Burst aus dem MeshProfile-Cache
+# gesammelt (SurfaceTriangles); jede Strahlenstufe (Hauptnormale, Streupunkte, Gravity-Endpunkte) ist dann
+# ein einziger NumPy-Aufruf ohne Depsgraph-Zugriff.
+# Welche Objekte überhaupt in Frage kommen, beantwortet ein Session-Index (SurfaceIndex: KDTree der
+# Objekt-Ursprünge + Radius pro Mesh), damit ein Burst nicht jedes Objekt der Szene anfasst.
+import math
+
+import numpy as np
+from mathutils import Vector
+from mathutils.kdtree import KDTree
+
+from .mesh_profile import PROFILES
+
+RAY_EPSILON = 1e-9
+RAY_CHUNK_ELEMENTS = 1 << 16   # Strahlen * Dreiecke pro Block (begrenzt die (R,T,3)-Zwischenarrays)
+WORLD_UP = np.array((0.0, 0.0, 1.0))
+INDEX_PENDING_MAX = 64         # nachgetragene Objekte, ab denen der KDTree neu gebaut wird
+INDEX_LARGE_RADIUS_FACTOR = 4.0  # Radius > Faktor * Median: Objekt (Boden, Felsen) wird linear geprüft
+
+
+def _origin_radius(obj):
+    """Radius um den Objekt-Ursprung, der die Geometrie einschließt (lokale bound_box, ohne Skalierung)."""
+    return float(np.sqrt((np.array(obj.bound_box, dtype=np.float64) ** 2).sum(axis=1).max()))
+
+
+class SurfaceIndex:
+    """
+    Session-Index der sichtbaren Mesh-Objekte für SurfaceTriangles.gather: KDTree der Ursprünge plus
+    Umkreisradius (pro Mesh gecacht, Objekte mit Modifiern einzeln). Große Objekte liegen außerhalb des
+    Baums in einer kurzen Liste, damit ihr Radius die Abfrage nicht aufbläht. Neue Objekte (materialisierte
+    Proxys) kommen über add() in eine Nachtragsliste; neu gebaut wird erst bei INDEX_PENDING_MAX Nachträgen,
+    nach invalidate() oder wenn sich der Frame geändert hat (Simulation bewegt Objekte).
+    """
+
+    def __init__(self):
+        self._tree = None
+        self._tree_objects = []
+        self._tree_radii = np.empty(0)
+        self._tree_max_radius = 0.0
+        self._large = []          # (obj, radius) außerhalb des Baums
+        self._pending = []        # (obj, radius) seit dem letzten Aufbau
+        self._mesh_radius = {}    # mesh.name_full -> Radius (unmodifizierte Meshes)
+        self._frame = None
+        self._dirty = True
+
+    def invalidate(self):
+        self._dirty = True
+
+    def _radius(self, obj):
+        if len(obj.modifiers):
+            local = _origin_radius(obj)
+        else:
+            local = self._mesh_radius.get(obj.data.name_full)
+            if local is None:
+                local = self._mesh_radius[obj.data.name_full] = _origin_radius(obj)
+        return local * max(abs(s) for s in obj.matrix_world.to_scale())
+
+    def add(self, objects):
+        for obj in objects:
+            if obj is not None and obj.type == 'MESH' and obj.data is not None:
+                self._pending.append((obj, self._radius(obj)))
+        if len(self._pending) > INDEX_PENDING_MAX:
+            self._dirty = True
+
+    def _rebuild(self, context):
+        view_layer = context.view_layer
+        entries = [(obj, self._radius(obj)) for obj in view_layer.objects
+                   if obj.type == 'MESH' and obj.data is not None and obj.visible_get(view_layer=view_layer)]
+        radii = np.array([radius for _, radius in entries], dtype=np.float64)
+        limit = max(float(np.median(radii)), 1e-6) * INDEX_LARGE_RADIUS_FACTOR if len(radii) else 0.0
+        in_tree = [entry for entry in entries if entry[1] <= limit]
+        self._large = [entry for entry in entries if entry[1] > limit]
+        self._tree_objects = [obj for obj, _ in in_tree]
+        self._tree_radii = np.array([radius for _, radius in in_tree], dtype=np.float64)
+        self._tree_max_radius = float(self._tree_radii.max()) if len(in_tree) else 0.0
+        self._tree = KDTree(len(in_tree))
+        for i, obj in enumerate(self._tree_objects):
+            self._tree.insert(obj.matrix_world.translation, i)
+        self._tree.balance()
+        self._pending = []
+        self._frame = context.scene.frame_current
+        self._dirty = False
+
+    def candidates(self, context, center, half_extent):
+        """Objekte, deren Umkreis die Würfel-Box um center (halbe Kantenlänge half_extent) erreichen kann."""
+        if self._dirty or self._tree is None or self._frame != context.scene.frame_current:
+            self._rebuild(context)
+        center = Vector(tuple(center))
+        box_reach = half_extent * math.sqrt(3.0)
+        found = []
+        for _, index, distance in self._tree.find_range(center, box_reach + self._tree_max_radius):
+            if distance <= box_reach + self._tree_radii[index]:
+                found.append(self._tree_objects[index])
+        for obj, radius in self._large + self._pending:
+            try:
+                if (obj.matrix_world.translation - center).length <= box_reach + radius:
+                    found.append(obj)
+            except ReferenceError:
+                continue # inzwischen gelöscht
+        return found
+
+
+def ray_cast_triangles(origins, directions, max_distance, corners):
+    """
+    Möller-Trumbore für R Strahlen gegen T Dreiecke (beidseitig, wie scene.ray_cast).
+    origins/directions (R,3), directions normiert; max_distance Skalar oder (R,); corners (T,3,3) Welt.
+    Rückgabe: hit (R,) bool, locations (R,3), normals (R,3) Flächennormalen, triangle (R,) Index bzw. -1.
+    """
+    origins = np.asarray(origins, dtype=np.float64).reshape(-1, 3)
+    directions = np.asarray(directions, dtype=np.float64).reshape(-1, 3)
+    ray_count = len(origins)
+    max_distance = np.broadcast_to(np.asarray(max_distance, dtype=np.float64), (ray_count,))[:, None]
+    best_t = np.full(ray_count, np.inf)
+    best_tri = np.full(ray_count, -1, dtype=np.int64)
+    rows = np.arange(ray_count)
+    chunk = max(1, RAY_CHUNK_ELEMENTS // max(1, ray_count))
+    for start in range(0, len(corners), chunk):
+        block = corners[start:start + chunk]
+        v0 = block[:, 0]
+        e1 = block[:, 1] - v0
+        e2 = block[:, 2] - v0
+        p = np.cross(directions[:, None, :], e2[None, :, :])
+        det = np.einsum('rtk,tk->rt', p, e1)
+        valid = np.abs(det) > RAY_EPSILON
+        inv_det = np.divide(1.0, det, out=np.zeros_like(det), where=valid)
+        s = origins[:, None, :] - v0[None, :, :]
+        u = np.einsum('rtk,rtk->rt', s, p) * inv_det
+        q = np.cross(s, e1[None, :, :])
+        v = np.einsum('rk,rtk->rt', directions, q) * inv_det
+        t = np.einsum('rtk,tk->rt', q, e2) * inv_det
+        hit = valid & (u >= 0.0) & (v >= 0.0) & (u + v <= 1.0) & (t > RAY_EPSILON) & (t <= max_distance)
+        t = np.where(hit, t, np.inf)
+        nearest = t.argmin(axis=1)
+        nearest_t = t[rows, nearest]
+        better = nearest_t < best_t
+        best_t[better] = nearest_t[better]
+        best_tri[better] = nearest[better] + start
+    hit = best_tri >= 0
+    locations = origins + directions * np.where(hit, best_t, 0.0)[:, None]
+    normals = np.zeros((ray_count, 3))
+    if hit.any():
+        tris = corners[best_tri[hit]]
+        face_normals = np.cross(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0])
+        normals[hit] = face_normals / np.linalg.norm(face_normals, axis=1)[:, None]
+    return hit, locations, normals, best_tri
+
+
+class SurfaceTriangles:
+    """Dreiecke aller sichtbaren Mesh-Objekte in einer Welt-Box, mit Besitzer pro Dreieck."""
+
+    def __init__(self, corners, owners, objects):
+        self.corners = corners   # (T,3,3) Welt
+        self.owners = owners     # (T,) Index in objects
+        self.objects = objects
+
+    def __len__(self):
+        return len(self.corners)
+
+    @classmethod
+    def gather(cls, context, center, half_extent, depsgraph=None, index=None):
+        """
+        Kandidaten aus index (SurfaceIndex; ohne: alle Objekte des View Layers), dann Grobtest über die
+        Bounding Sphere (MeshProfile) und nur die Dreiecke in der Box.
+        """
+        view_layer = context.view_layer
+        candidates = index.candidates(context, center, half_extent) if index is not None else view_layer.objects
+        center = np.array(tuple(center), dtype=np.float64)
+        box_min, box_max = center - half_extent, center + half_extent
+        corner_blocks, owner_blocks, objects = [], [], []
+        for obj in candidates:
+            try:
+                if obj.type != 'MESH' or not obj.visible_get(view_layer=view_layer):
+                    continue
+            except (ReferenceError, RuntimeError):
+                continue # gelöscht oder nicht mehr im View Layer
+            profile = PROFILES.for_object(obj, depsgraph)
+            if profile is None or not profile.vertex_count:
+                continue
+            sphere_center, radius = profile.world_sphere(obj.matrix_world)
+            if np.any(np.abs(np.array(tuple(sphere_center)) - center) > half_extent + radius):
+                continue
+            corners = profile.triangles_in_box(obj.matrix_world, box_min, box_max)
+            if not len(corners):
+                continue
+            corner_blocks.append(corners)
+            owner_blocks.append(np.full(len(corners), len(objects), dtype=np.int32))
+            objects.append(obj)
+        if not corner_blocks:
+            return cls(np.empty((0, 3, 3)), np.empty(0, dtype=np.int32), [])
+        return cls(np.concatenate(corner_blocks), np.concatenate(owner_blocks), objects)
+
+    def ray_cast(self, origins, directions, max_distance, ignore_obj=None):
+        """Wie ray_cast_triangles; ignore_obj wird übersprungen. Viertes Ergebnis: getroffene Objekte (oder None)."""
+        corners, owners = self.corners, self.owners
+        if ignore_obj is not None and ignore_obj in self.objects:
+            keep = owners != self.objects.index(ignore_obj)
+            corners, owners = corners[keep], owners[keep]
+        hit, locations, normals, triangle = ray_cast_triangles(origins, directions, max_distance, corners)
+        hit_objects = [self.objects[owners[index]] if index >= 0 else None for index in triangle]
+        return hit, locations, normals, hit_objects
+
+
+def spread_offsets(count, distance_min, distance_max, plane_x, plane_y, rng):
+    """Gleichmäßig verteilte Winkel (+/-0.1 rad Jitter) und zufällige Abstände in der Ebene (plane_x, plane_y)."""
+    distances = rng.uniform(distance_min, distance_max, count)
+    angles = (2.0 * math.pi / count) * np.arange(count) + rng.uniform(-0.1, 0.1, count)
+    offsets = (np.cos(angles) * distances)[:, None] * np.asarray(plane_x, dtype=np.float64) + \
+              (np.sin(angles) * distances)[:, None] * np.asarray(plane_y, dtype=np.float64)
+    return distances, offsets
+
+
+def downhill_directions(normals, rng):
+    """
+    Hangabtrieb (Weltabwärts in die Tangentialebene projiziert) pro Normale; auf ebenen Flächen eine zufällige
+    horizontale Richtung (in 10% der Fälle keine Bewegung), sonst Null (senkrechte Wände ohne Tangente).
+    """
+    normals = np.asarray(normals, dtype=np.float64)
+    down = -WORLD_UP
+    projected = down - (normals @ down)[:, None] * normals
+    lengths = np.linalg.norm(projected, axis=1)
+    directions = np.zeros_like(normals)
+    sloped = lengths > 0.0001
+    directions[sloped] = projected[sloped] / lengths[sloped, None]
+    flat = ~sloped & (np.abs(normals[:, 2]) > 0.9999)
+    if flat.any():
+        random_xy = rng.uniform(-1.0, 1.0, (int(flat.sum()), 2))
+        random_xy /= np.maximum(np.linalg.norm(random_xy, axis=1), 1e-12)[:, None]
+        random_xy[rng.random(len(random_xy)) <= 0.1] = 0.0
+        directions[flat, :2] = random_xy
+    return directions
+
+
+def roll_parameters(start, ends, normals, object_radius, revolutions):
+    """Rollachse (N,3) und Gesamtwinkel (N,) für die Bewegung start -> ends auf einer Fläche mit normals."""
+    ends = np.asarray(ends, dtype=np.float64)
+    move = ends - np.asarray(tuple(start), dtype=np.float64)
+    distances = np.linalg.norm(move, axis=1)
+    directions = np.zeros_like(move)
+    moving = distances > 0.0001
+    directions[moving] = move[moving] / distances[moving, None]
+    normals = np.array(normals, dtype=np.float64)
+    normals[np.linalg.norm(normals, axis=1) <= 0.001] = WORLD_UP
+    axes = np.cross(normals, directions)
+    axis_lengths = np.linalg.norm(axes, axis=1)
+    valid_axes = moving & (axis_lengths > 0.00001)
+    axes[~valid_axes] = 0.0
+    axes[valid_axes] /= axis_lengths[valid_axes, None]
+    circumference = 2.0 * math.pi * max(0.001, object_radius)
+    radians = np.zeros(len(ends))
+    if revolutions > 0 and circumference > 0.001:
+        rolling = distances > 0.001
+        radians[rolling] = distances[rolling] / circumference * revolutions * (2.0 * math.pi)
+    return axes, radians
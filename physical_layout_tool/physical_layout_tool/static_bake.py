@@ -0,0 +1,104 @@
+# static_bake.py
+# Bulk-Bake für viele Objekte (z.B. ein fertig simulierter Haufen Steine):
+#  - Metadaten inkl. ausgewerteter Weltmatrizen aller Objekte in EINEM Durchgang lesen (object_metadata, (N,4,4))
+#  - Rigid Bodies gesammelt entfernen (rigidbody_bulk.bulk_remove_rigid_bodies)
+#  - Matrizen direkt zurückschreiben (entspricht visual_transform_apply, ohne Operator)
+#  - Mesh-Daten gruppiert single-user machen und alle Objekte in einem Batch in die Static Collection verschieben
+# Ersetzt visual_transform_apply / rigidbody.object_remove / make_single_user pro Objekt.
+import traceback
+from mathutils import Matrix
+
+from .rigidbody_bulk import bulk_remove_rigid_bodies, make_data_single_user
+from .object_metadata import (
+    read_world_matrices,
+    extract_object_records,
+    analyze_static_bake_records,
+    MAX_RECORD_COLLECTIONS,
+)
+from .record_kernels import BAKE_NEEDS_SINGLE_USER, BAKE_REMOVE_RIGIDBODY, BAKE_MOVE_COLLECTION, BAKE_SKIP
+
+_bake_module_name = __name__
+
+
+def write_world_matrices(objects, matrices):
+    """Schreibt (N,4,4)-Matrizen direkt auf matrix_world (Loc/Rot/Scale werden unter Berücksichtigung von Parents zerlegt)."""
+    written = 0
+    for obj, matrix_rows in zip(objects, matrices.tolist()):
+        try:
+            obj.matrix_world = Matrix(matrix_rows)
+            written += 1
+        except (ReferenceError, ValueError) as e:
+            print(f"WARNUNG [{_bake_module_name}]: Matrix konnte nicht geschrieben werden: {e}")
+    return written
+
+
+def bake_visual_transforms(context, objects):
+    """Bulk-Ersatz für ops.object.visual_transform_apply. Gibt die Anzahl der Objekte zurück."""
+    objects = list(objects)
+    matrices = read_world_matrices(context, objects)
+    return write_world_matrices(objects, matrices)
+
+
+def move_objects_to_collection(objects, target_collection):
+    """Verschiebt alle Objekte in target_collection (erst Link, dann Unlink aus allen anderen). Gibt die erfolgreich verschobenen zurück."""
+    target_objects = target_collection.objects
+    moved = []
+    for obj in objects:
+        try:
+            if obj.name not in target_objects:
+                target_objects.link(obj)
+            for col in list(obj.users_collection):
+                if col != target_collection:
+                    col.objects.unlink(obj)
+            moved.append(obj)
+        except (ReferenceError, RuntimeError) as e:
+            print(f"WARNUNG [{_bake_module_name}]: Objekt konnte nicht nach '{target_collection.name}' verschoben werden: {e}")
+    return moved
+
+
+def bake_objects_to_static(context, objects, static_collection):
+    """
+    Backt die aktuelle (simulierte) Lage aller Objekte ein und verschiebt sie in static_collection.
+    Gibt (processed_count, failed_count) zurück.
+    """
+    objects = [obj for obj in objects if obj is not None and obj.type == 'MESH']
+    if not objects:
+        return 0, 0
+
+    # 1) Metadaten + Matrizen lesen, solange die Rigid Bodies noch aktiv sind
+    scene_collection = context.scene.collection
+    mask_collections = [static_collection, scene_collection] + [
+        col for col in scene_collection.children_recursive if col != static_collection]
+    collections_complete = len(mask_collections) <= MAX_RECORD_COLLECTIONS
+    record_set = extract_object_records(context, objects, mask_collections)
+    actions = analyze_static_bake_records(record_set.records, record_set.collection_bit(static_collection.name))
+    if not collections_complete:
+        # Nicht alle Collections in der Bitmaske -> Verschieben für alle prüfen
+        actions[(actions & BAKE_SKIP) == 0] |= BAKE_MOVE_COLLECTION
+
+    # 2) Rigid Bodies gesammelt entfernen (ein Update statt einem Operator pro Objekt)
+    with_rigid_body = record_set.select((actions & BAKE_REMOVE_RIGIDBODY) != 0)
+    if with_rigid_body:
+        try:
+            bulk_remove_rigid_bodies(context, with_rigid_body)
+        except Exception as e_rb:
+            print(f"FEHLER [{_bake_module_name}]: Bulk-Entfernen der Rigid Bodies fehlgeschlagen: {e_rb}")
+            traceback.print_exc()
+
+    # 3) Simulierte Lage zurückschreiben
+    write_world_matrices(record_set.objects, record_set.records["matrix_world"])
+
+    # 4) Eigene Mesh-Daten (gruppiert nach Quell-Mesh) und ein Collection-Batch
+    shared = record_set.select((actions & BAKE_NEEDS_SINGLE_USER) != 0)
+    if shared:
+        make_data_single_user(shared)
+    to_move = record_set.select((actions & BAKE_MOVE_COLLECTION) != 0)
+    moved = move_objects_to_collection(to_move, static_collection) if to_move else []
+
+    try:
+        context.view_layer.update()
+    except Exception as e_upd:
+        print(f"WARNUNG [{_bake_module_name}]: view_layer.update() nach Bake fehlgeschlagen: {e_upd}")
+
+    failed = len(to_move) - len(moved)
+    return len(record_set.objects) - failed, failed